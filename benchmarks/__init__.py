@@ -0,0 +1,5 @@
+"""
+Benchmarks - 핫 패스 성능 측정
+
+사용법은 benchmarks/run.py 참고
+"""
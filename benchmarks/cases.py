@@ -0,0 +1,227 @@
+"""
+Benchmark Cases - 게임 핫 패스 벤치마크
+
+던전 생성, 시야, 탐험 이동, 전투 행동, 세이브 직렬화, 요리 레시피, 아이템 드롭을 측정합니다.
+모든 준비 함수는 런 시드를 고정해 실행마다 같은 입력과 같은 난수 흐름을 사용합니다.
+던전 크기는 world.map_sizes에서 읽으므로 설정을 초기화한 뒤 임포트해야 합니다.
+"""
+
+import random
+from typing import Any, Callable, List, Tuple
+
+from benchmarks.harness import benchmark
+from src.core.config import get_config
+from src.core.rng import set_run_seed
+
+
+SEED = 20240601
+
+# 탐험 벤치마크 층 (적 수 = min(30, 8 + 층 * 2) -> 30마리)
+EXPLORATION_FLOOR = 11
+
+
+def _make_party() -> List[Any]:
+    from src.character.character import Character
+    return [Character("전사", "warrior"), Character("아크메이지", "archmage")]
+
+
+def _generate_dungeon(width: int = 80, height: int = 40, floor_number: int = EXPLORATION_FLOOR) -> Any:
+    from src.world.dungeon_generator import DungeonGenerator
+    set_run_seed(SEED)
+    return DungeonGenerator(width=width, height=height).generate(floor_number)
+
+
+# ===== 월드 =====
+
+def _register_dungeon_sizes() -> None:
+    """world.map_sizes의 크기별 던전 생성 벤치마크 등록"""
+    for size_name, size in get_config().get("world.map_sizes", {}).items():
+        width, height = size["width"], size["height"]
+
+        def setup(width: int = width, height: int = height) -> Callable[[], Any]:
+            from src.world.dungeon_generator import DungeonGenerator
+            generator = DungeonGenerator(width=width, height=height)
+            set_run_seed(SEED)
+            return lambda: generator.generate(1)
+
+        benchmark(f"dungeon.generate[{size_name} {width}x{height}]")(setup)
+
+
+_register_dungeon_sizes()
+
+
+@benchmark("fov.compute_fov")
+def fov_compute() -> Callable[[], Any]:
+    """플레이어가 한 칸씩 오가며 매번 시야를 다시 계산 (캐시 적중/미스 혼합)"""
+    from src.world.fov import FOVSystem
+    from src.world.tile import TileType
+
+    dungeon = _generate_dungeon()
+    fov = FOVSystem(default_radius=8)
+    floors = [
+        (x, y) for x in range(dungeon.width) for y in range(dungeon.height)
+        if dungeon.get_tile(x, y).tile_type == TileType.FLOOR
+    ]
+    positions = random.Random(SEED).sample(floors, min(64, len(floors)))
+    state = {"i": 0}
+
+    def op() -> Any:
+        x, y = positions[state["i"] % len(positions)]
+        state["i"] += 1
+        return fov.compute_fov(dungeon, x, y)
+
+    return op
+
+
+@benchmark("exploration.move_player[30 enemies]")
+def exploration_move() -> Callable[[], Any]:
+    """적 30마리가 있는 층에서 상하좌우로 오가며 이동 (적 AI 이동 포함)"""
+    from src.world.exploration import ExplorationSystem
+
+    dungeon = _generate_dungeon()
+    exploration = ExplorationSystem(dungeon, _make_party(), floor_number=EXPLORATION_FLOOR)
+    directions: Tuple[Tuple[int, int], ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+    state = {"i": 0}
+
+    def op() -> Any:
+        dx, dy = directions[state["i"] % len(directions)]
+        state["i"] += 1
+        return exploration.move_player(dx, dy)
+
+    return op
+
+
+# ===== 전투 =====
+
+def _combat_setup() -> Tuple[Any, Any, Any, Any]:
+    from src.audio import use_null_audio
+    from src.character.character import Character
+    from src.combat.combat_manager import CombatManager
+
+    use_null_audio()
+    set_run_seed(SEED)
+    party = _make_party()
+    enemy = Character("적 전사", "warrior")
+    manager = CombatManager()
+    manager.start_combat(party, [enemy])
+    return manager, party[0], party[1], enemy
+
+
+def _reset(*combatants: Any) -> None:
+    """전투가 끝나지 않도록 HP/MP 회복"""
+    for combatant in combatants:
+        combatant.current_hp = combatant.max_hp
+        combatant.current_mp = combatant.max_mp
+
+
+@benchmark("combat.execute_action[brv]")
+def combat_brv() -> Callable[[], Any]:
+    from src.combat.combat_manager import ActionType
+    manager, hero, _, enemy = _combat_setup()
+
+    def op() -> Any:
+        _reset(hero, enemy)
+        return manager.execute_action(hero, ActionType.BRV_ATTACK, target=enemy)
+
+    return op
+
+
+@benchmark("combat.execute_action[hp]")
+def combat_hp() -> Callable[[], Any]:
+    from src.combat.combat_manager import ActionType
+    manager, hero, _, enemy = _combat_setup()
+
+    def op() -> Any:
+        _reset(hero, enemy)
+        hero.current_brv = 500
+        return manager.execute_action(hero, ActionType.HP_ATTACK, target=enemy)
+
+    return op
+
+
+@benchmark("combat.execute_action[skill]")
+def combat_skill() -> Callable[[], Any]:
+    from src.character.skills.skill_manager import get_skill_manager
+    from src.combat.combat_manager import ActionType
+    manager, hero, _, enemy = _combat_setup()
+    skill = get_skill_manager().get_skill("warrior_war_cry")
+    skill_manager = get_skill_manager()
+
+    def op() -> Any:
+        _reset(hero, enemy)
+        skill_manager._cooldowns.pop(id(hero), None)
+        return manager.execute_action(hero, ActionType.SKILL, target=enemy, skill=skill)
+
+    return op
+
+
+# ===== 세이브 =====
+
+@benchmark("save.serialize_game_state")
+def save_serialize() -> Callable[[], Any]:
+    from src.persistence.save_system import serialize_game_state
+
+    dungeon = _generate_dungeon()
+    party = _make_party()
+    x, y = dungeon.stairs_up or (5, 5)
+    return lambda: serialize_game_state(party, EXPLORATION_FLOOR, dungeon, x, y, [], [], [], [])
+
+
+@benchmark("save.encode_save")
+def save_encode() -> Callable[[], Any]:
+    """게임 상태를 바이너리 세이브로 인코딩 (압축 타일 평면 포함)"""
+    from src.persistence.save_system import serialize_game_state
+    from src.persistence.save_format import encode_save
+
+    dungeon = _generate_dungeon()
+    party = _make_party()
+    x, y = dungeon.stairs_up or (5, 5)
+    game_state = serialize_game_state(party, EXPLORATION_FLOOR, dungeon, x, y, [], [], [], [])
+    return lambda: encode_save(game_state)
+
+
+@benchmark("save.deserialize_dungeon")
+def save_deserialize() -> Callable[[], Any]:
+    from src.persistence.save_system import serialize_dungeon, deserialize_dungeon
+
+    dungeon_data = serialize_dungeon(_generate_dungeon(), compact=True)
+    return lambda: deserialize_dungeon(dungeon_data)
+
+
+# ===== 아이템 / 요리 =====
+
+@benchmark("cooking.find_recipe")
+def cooking_find_recipe() -> Callable[[], Any]:
+    """무작위 재료 조합 64가지를 돌아가며 조회"""
+    from src.cooking.recipe import RecipeDatabase
+    from src.gathering.ingredient import IngredientDatabase
+
+    rng = random.Random(SEED)
+    ingredient_ids = IngredientDatabase.get_all_ingredient_ids()
+    combos = [
+        [IngredientDatabase.get_ingredient(i) for i in rng.sample(ingredient_ids, rng.randint(1, 4))]
+        for _ in range(64)
+    ]
+    RecipeDatabase.initialize()
+    state = {"i": 0}
+
+    def op() -> Any:
+        combo = combos[state["i"] % len(combos)]
+        state["i"] += 1
+        return RecipeDatabase.find_recipe(combo)
+
+    return op
+
+
+@benchmark("items.create_random_drop")
+def item_random_drop() -> Callable[[], Any]:
+    from src.equipment.item_system import ItemGenerator
+
+    set_run_seed(SEED)
+    state = {"i": 0}
+
+    def op() -> Any:
+        state["i"] += 1
+        return ItemGenerator.create_random_drop(1 + state["i"] % 30, boss_drop=state["i"] % 10 == 0)
+
+    return op
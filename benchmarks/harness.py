@@ -0,0 +1,220 @@
+"""
+Benchmark Harness - 벤치마크 등록/측정/비교
+
+각 벤치마크는 준비(setup) 함수로 등록합니다. 준비 함수는 측정할 연산(인자 없는 함수)을 반환하며,
+준비 비용은 측정에 포함되지 않습니다.
+
+    @benchmark("fov.compute_fov")
+    def fov_case():
+        dungeon = ...
+        return lambda: fov.compute_fov(dungeon, x, y)
+"""
+
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+# 이름 -> 준비 함수 (등록 순서 유지)
+BENCHMARKS: Dict[str, Callable[[], Callable[[], Any]]] = {}
+
+# 기본 회귀 판정 기준 (ops/sec가 기준보다 15% 이상 낮으면 회귀)
+DEFAULT_THRESHOLD = 0.15
+
+
+def benchmark(name: str) -> Callable:
+    """벤치마크 등록 데코레이터"""
+    def decorator(setup: Callable[[], Callable[[], Any]]) -> Callable[[], Callable[[], Any]]:
+        if name in BENCHMARKS:
+            raise ValueError(f"이미 등록된 벤치마크: {name}")
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+@dataclass
+class BenchmarkResult:
+    """벤치마크 결과"""
+    name: str
+    ops_per_sec: float
+    mean_us: float
+    peak_kib: float
+    iterations: int
+    rounds: int
+
+
+def measure(op: Callable[[], Any], min_time: float = 0.5, rounds: int = 5) -> BenchmarkResult:
+    """
+    연산 처리량 측정
+
+    한 라운드가 min_time / rounds 이상 걸리도록 반복 횟수를 정한 뒤, rounds번 측정해
+    가장 빠른 라운드를 사용합니다. (다른 프로세스 간섭에 의한 노이즈 제거)
+
+    Returns:
+        이름이 비어 있는 BenchmarkResult (peak_kib는 measure_peak_memory로 채움)
+    """
+    clock = time.perf_counter
+    target = max(min_time / rounds, 1e-3)
+
+    # 반복 횟수 보정 (워밍업 겸)
+    loops = 1
+    while True:
+        start = clock()
+        for _ in range(loops):
+            op()
+        elapsed = clock() - start
+        if elapsed >= target or loops >= 1_000_000:
+            break
+        loops = loops * 10 if elapsed < target / 10 else max(loops + 1, int(loops * target / max(elapsed, 1e-9)))
+
+    best = float("inf")
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = clock()
+            for _ in range(loops):
+                op()
+            best = min(best, clock() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    per_op = best / loops
+    return BenchmarkResult(
+        name="",
+        ops_per_sec=1.0 / per_op if per_op > 0 else float("inf"),
+        mean_us=per_op * 1e6,
+        peak_kib=0.0,
+        iterations=loops,
+        rounds=rounds,
+    )
+
+
+def measure_peak_memory(op: Callable[[], Any], calls: int = 10) -> float:
+    """연산 calls회 동안 새로 할당된 메모리의 최대치 (KiB)"""
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        for _ in range(calls):
+            op()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return max(peak - baseline, 0) / 1024
+
+
+def run_benchmarks(
+    pattern: Optional[str] = None,
+    min_time: float = 0.5,
+    rounds: int = 5,
+    memory_calls: int = 10,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> List[BenchmarkResult]:
+    """
+    등록된 벤치마크 실행
+
+    Args:
+        pattern: 이름에 이 문자열이 포함된 벤치마크만 실행
+        min_time: 벤치마크당 측정 시간 (초)
+        rounds: 측정 라운드 수
+        memory_calls: 메모리 측정 시 호출 횟수
+        on_result: 결과가 나올 때마다 호출 (진행 표시용)
+    """
+    results = []
+    for name, setup in BENCHMARKS.items():
+        if pattern and pattern not in name:
+            continue
+        op = setup()
+        result = measure(op, min_time=min_time, rounds=rounds)
+        result.name = name
+        result.peak_kib = measure_peak_memory(op, calls=memory_calls)
+        results.append(result)
+        if on_result:
+            on_result(result)
+    return results
+
+
+def save_results(results: List[BenchmarkResult], path: Path) -> Path:
+    """결과를 JSON 기준선으로 저장"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def load_results(path: Path) -> Dict[str, Dict[str, Any]]:
+    """JSON 기준선 읽기 (이름 -> 결과 dict)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)["results"]
+
+
+def compare(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Dict[str, Any]]:
+    """
+    기준선과 비교
+
+    Returns:
+        벤치마크별 {"name", "baseline_ops", "ops", "change", "regressed"}
+        (change는 ops/sec 변화율, 기준선에 없는 벤치마크는 baseline_ops가 None)
+    """
+    rows = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            rows.append({"name": result.name, "baseline_ops": None, "ops": result.ops_per_sec,
+                         "change": None, "regressed": False})
+            continue
+        change = result.ops_per_sec / base["ops_per_sec"] - 1.0
+        rows.append({
+            "name": result.name,
+            "baseline_ops": base["ops_per_sec"],
+            "ops": result.ops_per_sec,
+            "change": change,
+            "regressed": change < -threshold,
+        })
+    return rows
+
+
+def format_result(result: BenchmarkResult) -> str:
+    """결과 한 줄"""
+    return (
+        f"{result.name:<40} {result.ops_per_sec:>12,.1f} ops/s "
+        f"{result.mean_us:>12,.1f} us/op {result.peak_kib:>10,.1f} KiB"
+    )
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    """비교 결과 표"""
+    lines = [f"{'벤치마크':<40} {'기준 ops/s':>14} {'현재 ops/s':>14} {'변화':>8}"]
+    for row in rows:
+        if row["baseline_ops"] is None:
+            lines.append(f"{row['name']:<40} {'-':>14} {row['ops']:>14,.1f} {'new':>8}")
+            continue
+        mark = "  ⚠ 회귀" if row["regressed"] else ""
+        lines.append(
+            f"{row['name']:<40} {row['baseline_ops']:>14,.1f} {row['ops']:>14,.1f} "
+            f"{row['change'] * 100:>+7.1f}%{mark}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+벤치마크 실행기 (헤드리스)
+
+    python -m benchmarks.run                         # 전체 실행
+    python -m benchmarks.run -k combat               # 이름에 "combat"이 포함된 것만
+    python -m benchmarks.run --save                  # benchmarks/baselines/baseline.json에 기준선 저장
+    python -m benchmarks.run --compare               # 기준선과 비교 (회귀 시 종료 코드 1)
+    python -m benchmarks.run --compare other.json --threshold 0.10
+
+기준선은 측정한 기기에 따라 달라지므로 같은 기기에서 만든 기준선과 비교하세요.
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+DEFAULT_BASELINE = PROJECT_ROOT / "benchmarks" / "baselines" / "baseline.json"
+
+
+def parse_arguments() -> argparse.Namespace:
+    """명령줄 인자 파싱"""
+    from benchmarks.harness import DEFAULT_THRESHOLD
+
+    parser = argparse.ArgumentParser(description="Dawn of Stellar 벤치마크")
+    parser.add_argument("-k", "--filter", help="이름에 이 문자열이 포함된 벤치마크만 실행")
+    parser.add_argument("--min-time", type=float, default=0.5, help="벤치마크당 측정 시간 (초)")
+    parser.add_argument("--rounds", type=int, default=5, help="측정 라운드 수 (가장 빠른 라운드 사용)")
+    parser.add_argument("--save", nargs="?", const=str(DEFAULT_BASELINE), help="결과를 JSON 기준선으로 저장")
+    parser.add_argument("--compare", nargs="?", const=str(DEFAULT_BASELINE), help="JSON 기준선과 비교")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="회귀 판정 기준 (ops/sec 감소율, 기본 0.15)"
+    )
+    parser.add_argument("--config", default=str(PROJECT_ROOT / "config.yaml"), help="설정 파일 경로")
+    return parser.parse_args()
+
+
+def setup_environment(config_path: str) -> None:
+    """설정 초기화, 로그/오디오 끄기 (측정에 로그 기록 비용이 섞이지 않도록)"""
+    from src.core.config import initialize_config
+    from src.core.logger import configure_logging
+    from src.audio import use_null_audio
+
+    config = initialize_config(config_path)
+    config.set("logging.enabled", False)
+    configure_logging(config)
+    use_null_audio()
+    random.seed(0)
+
+
+def main() -> int:
+    """
+    메인 함수
+
+    Returns:
+        종료 코드 (0: 정상, 1: 회귀 발견)
+    """
+    args = parse_arguments()
+    setup_environment(args.config)
+
+    # 벤치마크 등록 (설정 초기화 후)
+    from benchmarks import cases
+    from benchmarks.harness import (
+        run_benchmarks, save_results, load_results, compare, format_result, format_comparison
+    )
+
+    results = run_benchmarks(
+        pattern=args.filter,
+        min_time=args.min_time,
+        rounds=args.rounds,
+        on_result=lambda result: print(format_result(result), flush=True),
+    )
+    if not results:
+        print("실행할 벤치마크가 없습니다.")
+        return 1
+
+    if args.save:
+        print(f"\n기준선 저장: {save_results(results, Path(args.save))}")
+
+    if args.compare:
+        rows = compare(results, load_results(Path(args.compare)), threshold=args.threshold)
+        print()
+        print(format_comparison(rows))
+        regressed = [row["name"] for row in rows if row["regressed"]]
+        if regressed:
+            print(f"\n⚠ 회귀 {len(regressed)}건 (기준 -{args.threshold * 100:.0f}%): {', '.join(regressed)}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
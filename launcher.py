@@ -8,7 +8,6 @@ TCOD 기반 그래픽 런처
 import os
 import sys
 import subprocess
-import json
 import shutil
 from pathlib import Path
 from datetime import datetime
@@ -24,6 +23,8 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from src.ui.cursor_menu import CursorMenu, MenuItem
 from src.audio import get_audio_manager, play_bgm, play_sfx
 from src.core.config import initialize_config
+from src.persistence.save_manifest import SaveManifest, is_save_file, format_playtime
+from src.core.log_files import list_log_files, tail_lines, is_log_file
 
 
 # 런처용 색상 정의
@@ -217,9 +218,15 @@ class GameLauncher:
 
     def create_save_menu(self) -> CursorMenu:
         """세이브 관리 메뉴 생성"""
-        save_files = sorted(self.saves_dir.glob("*.json"), key=os.path.getmtime, reverse=True)
+        save_files = sorted(
+            [f for f in [*self.saves_dir.glob("*.sav"), *self.saves_dir.glob("*.json")] if is_save_file(f)],
+            key=os.path.getmtime, reverse=True
+        )
         self.submenu_data = list(save_files)
 
+        # 세이브 요약 (매니페스트만 읽음)
+        summaries = {entry["file"]: entry for entry in SaveManifest(self.saves_dir).entries()}
+
         items = []
 
         if not save_files:
@@ -231,13 +238,9 @@ class GameLauncher:
 
                 # 세이브 정보 미리보기
                 preview = ""
-                try:
-                    with open(save_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if 'floor' in data:
-                            preview = f" [{data['floor']}층]"
-                except Exception:
-                    pass
+                summary = summaries.get(save_file.name)
+                if summary:
+                    preview = f" [{summary['floor']}층 | {format_playtime(summary['playtime'])}]"
 
                 desc = f"크기: {size:,} bytes | {mtime.strftime('%Y-%m-%d %H:%M:%S')}{preview}"
                 items.append(MenuItem(save_file.name, value=i, description=desc))
@@ -258,7 +261,7 @@ class GameLauncher:
 
     def create_log_menu(self) -> CursorMenu:
         """로그 확인 메뉴 생성"""
-        log_files = sorted(self.logs_dir.glob("*.log"), key=os.path.getmtime, reverse=True)[:20]
+        log_files = list_log_files(self.logs_dir, limit=20)
         self.submenu_data = list(log_files)
 
         items = []
@@ -421,7 +424,7 @@ class GameLauncher:
         try:
             backup_path.mkdir(parents=True, exist_ok=True)
             count = 0
-            for save_file in self.saves_dir.glob("*.json"):
+            for save_file in [*self.saves_dir.glob("*.sav"), *self.saves_dir.glob("*.json")]:
                 shutil.copy2(save_file, backup_path / save_file.name)
                 count += 1
 
@@ -455,15 +458,13 @@ class GameLauncher:
 
         try:
             save_file = self.submenu_data[index]
-            with open(save_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            summary = SaveManifest(self.saves_dir).get(save_file.stem)
 
             info = f"파일: {save_file.name}"
-            if 'floor' in data:
-                info += f" | 층수: {data['floor']}층"
-            if 'party' in data:
-                party_count = len(data['party'])
-                info += f" | 파티: {party_count}명"
+            if summary:
+                info += f" | 층수: {summary['floor']}층"
+                info += f" | 파티: {summary['party_size']}명"
+                info += f" | 플레이: {format_playtime(summary['playtime'])}"
 
             self.show_message(info, LauncherColors.CYAN, duration=300)
         except Exception as e:
@@ -491,9 +492,10 @@ class GameLauncher:
         """모든 로그 삭제"""
         try:
             count = 0
-            for log_file in self.logs_dir.glob("*.log"):
-                log_file.unlink()
-                count += 1
+            for log_file in self.logs_dir.iterdir():
+                if is_log_file(log_file.name):
+                    log_file.unlink()
+                    count += 1
             self.show_message(f"✓ {count}개의 로그 파일이 삭제되었습니다.", LauncherColors.GREEN)
             self.current_menu = self.create_log_menu()
         except Exception as e:
@@ -505,8 +507,17 @@ class GameLauncher:
             return
 
         log_file = self.submenu_data[index]
-        size = log_file.stat().st_size
-        self.show_message(f"{log_file.name} | 크기: {size:,} bytes", LauncherColors.CYAN, duration=300)
+        try:
+            size = log_file.stat().st_size
+            # 마지막 줄만 끝에서부터 읽음
+            last_line = next(iter(tail_lines(log_file, 1)), "")
+        except Exception as e:
+            self.show_message(f"✗ 로그 읽기 오류: {e}", LauncherColors.RED)
+            return
+        info = f"{log_file.name} | 크기: {size:,} bytes"
+        if last_line:
+            info += f" | {last_line[-80:]}"
+        self.show_message(info, LauncherColors.CYAN, duration=300)
 
     def render(self):
         """화면 렌더링"""
@@ -14,6 +14,9 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict
 
+from src.core.log_files import list_log_files, tail_lines, is_log_file
+from src.persistence.save_manifest import SaveManifest, is_save_file, read_save_summary, format_playtime
+
 
 class Color:
     """터미널 색상 코드"""
@@ -42,6 +45,17 @@ class GameLauncher:
         self.saves_dir.mkdir(exist_ok=True)
         self.logs_dir.mkdir(exist_ok=True)
 
+    def list_save_files(self) -> List[Path]:
+        """세이브 파일 목록 (매니페스트/내보내기 제외, 최근 수정 순)"""
+        save_files = [
+            f for f in [*self.saves_dir.glob("*.sav"), *self.saves_dir.glob("*.json")] if is_save_file(f)
+        ]
+        return sorted(save_files, key=os.path.getmtime, reverse=True)
+
+    def load_save_summaries(self) -> Dict[str, dict]:
+        """세이브 요약 - 파일 이름 -> 매니페스트 항목 (오래되거나 없으면 다시 만듦)"""
+        return {entry["file"]: entry for entry in SaveManifest(self.saves_dir).entries()}
+
     def clear_screen(self):
         """화면 지우기"""
         os.system('cls' if os.name == 'nt' else 'clear')
@@ -112,7 +126,8 @@ class GameLauncher:
             print(f"\n{Color.BOLD}[ 💾 세이브 파일 관리 ]{Color.ENDC}\n")
 
             # 세이브 파일 목록
-            save_files = sorted(self.saves_dir.glob("*.json"), key=os.path.getmtime, reverse=True)
+            save_files = self.list_save_files()
+            save_summaries = self.load_save_summaries()
 
             if not save_files:
                 print(f"{Color.YELLOW}세이브 파일이 없습니다.{Color.ENDC}\n")
@@ -124,17 +139,12 @@ class GameLauncher:
                     print(f"{i}. {Color.GREEN}{save_file.name}{Color.ENDC}")
                     print(f"   크기: {size:,} bytes | 수정: {mtime.strftime('%Y-%m-%d %H:%M:%S')}")
 
-                    # 세이브 정보 미리보기
-                    try:
-                        with open(save_file, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            if 'party' in data:
-                                party_names = [char.get('name', 'Unknown') for char in data['party']]
-                                print(f"   파티: {', '.join(party_names)}")
-                            if 'floor' in data:
-                                print(f"   층수: {data['floor']}층")
-                    except Exception:
-                        pass
+                    # 세이브 정보 미리보기 (매니페스트 요약)
+                    summary = save_summaries.get(save_file.name)
+                    if summary:
+                        party_names = [member.get('name', 'Unknown') for member in summary.get('party', [])]
+                        print(f"   파티: {', '.join(party_names)}")
+                        print(f"   층수: {summary.get('floor', 1)}층 | 플레이: {format_playtime(summary.get('playtime', 0))}")
                     print()
 
             print(f"\n{Color.GREEN}1.{Color.ENDC} 세이브 파일 백업")
@@ -163,7 +173,7 @@ class GameLauncher:
         try:
             backup_path.mkdir(parents=True, exist_ok=True)
             count = 0
-            for save_file in self.saves_dir.glob("*.json"):
+            for save_file in [*self.saves_dir.glob("*.sav"), *self.saves_dir.glob("*.json")]:
                 shutil.copy2(save_file, backup_path / save_file.name)
                 count += 1
 
@@ -217,8 +227,10 @@ class GameLauncher:
                 return
             if 1 <= idx <= len(save_files):
                 save_file = save_files[idx - 1]
-                with open(save_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                # 본문(던전) 대신 매니페스트 요약을 표시, 요약이 없으면 세이브에서 직접 읽음
+                data = SaveManifest(self.saves_dir).get(save_file.stem)
+                if data is None:
+                    data = read_save_summary(save_file)
 
                 print(f"\n{Color.CYAN}{'=' * 60}{Color.ENDC}")
                 print(f"{Color.BOLD}{save_file.name}{Color.ENDC}")
@@ -238,7 +250,7 @@ class GameLauncher:
             print(f"\n{Color.BOLD}[ 📋 로그 확인 ]{Color.ENDC}\n")
 
             # 최근 로그 파일 목록
-            log_files = sorted(self.logs_dir.glob("*.log"), key=os.path.getmtime, reverse=True)[:20]
+            log_files = list_log_files(self.logs_dir, limit=20)
 
             if not log_files:
                 print(f"{Color.YELLOW}로그 파일이 없습니다.{Color.ENDC}\n")
@@ -285,11 +297,9 @@ class GameLauncher:
                 print(f"{Color.BOLD}{log_file.name}{Color.ENDC}")
                 print(f"{Color.CYAN}{'=' * 60}{Color.ENDC}\n")
 
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    # 마지막 50줄만 표시
-                    for line in lines[-50:]:
-                        print(line.rstrip())
+                # 마지막 50줄만 표시 (파일 끝에서부터 읽음)
+                for line in tail_lines(log_file, 50):
+                    print(line)
             else:
                 print(f"\n{Color.RED}✗ 잘못된 번호입니다.{Color.ENDC}")
         except Exception as e:
@@ -326,9 +336,10 @@ class GameLauncher:
         if confirm == 'y':
             try:
                 count = 0
-                for log_file in self.logs_dir.glob("*.log"):
-                    log_file.unlink()
-                    count += 1
+                for log_file in self.logs_dir.iterdir():
+                    if is_log_file(log_file.name):
+                        log_file.unlink()
+                        count += 1
                 print(f"\n{Color.GREEN}✓ {count}개의 로그 파일이 삭제되었습니다.{Color.ENDC}")
             except Exception as e:
                 print(f"\n{Color.RED}✗ 오류 발생: {e}{Color.ENDC}")
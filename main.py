@@ -13,9 +13,15 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.core.config import initialize_config, get_config
-from src.core.logger import get_logger, Loggers
-from src.core.event_bus import event_bus
+# --profile-startup: 게임 모듈 임포트 비용까지 재도록 다른 게임 모듈보다 먼저 측정 시작
+from src.utils.startup_profiler import StartupProfiler
+startup_profiler = StartupProfiler(enabled="--profile-startup" in sys.argv).start()
+
+with startup_profiler.phase("imports"):
+    from src.core.config import initialize_config, get_config
+    from src.core.logger import get_logger, Loggers, configure_logging
+    from src.core.event_bus import event_bus
+    from src.core.rng import get_rng, set_run_seed
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -64,6 +70,19 @@ def parse_arguments() -> argparse.Namespace:
         help="서버 포트 (모바일 서버 모드)"
     )
 
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="시작 단계/임포트별 시간과 메모리를 측정하고 메인 메뉴 전에 종료 (logs/startup_profile_*.json)"
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="새 게임의 런 시드 (같은 시드면 같은 던전/전투 난수)"
+    )
+
     return parser.parse_args()
 
 
@@ -78,16 +97,33 @@ def main() -> int:
     args = parse_arguments()
 
     try:
-        # 설정 초기화
-        config = initialize_config(args.config)
+        with startup_profiler.phase("config"):
+            # 설정 초기화
+            config = initialize_config(args.config)
 
-        # 명령줄 옵션으로 설정 오버라이드
-        if args.dev:
-            config.set("development.enabled", True)
-            config.set("development.unlock_all_classes", True)
+            # 명령줄 옵션으로 설정 오버라이드
+            if args.dev:
+                config.set("development.enabled", True)
+                config.set("development.unlock_all_classes", True)
 
-        if args.debug:
-            config.set("development.debug_mode", True)
+            if args.debug:
+                config.set("development.debug_mode", True)
+
+            # 로깅 설정 반영 (레벨, 카테고리)
+            configure_logging(config)
+
+        # 이벤트 히스토리 (0이면 비활성화)
+        event_bus.set_history_size(config.get("performance.event_history_size", 100))
+
+        # 이벤트 지연 시간 프로파일링 (종료 시 logs/event_profile_*.json/csv 및 요약 표)
+        if config.get("performance.enable_profiling", False):
+            from src.core.event_profiler import register_exit_report
+            register_exit_report(event_bus.enable_profiling())
+
+        # 설정 파일 핫 리로드 (변경 시 전투 상수 등 다시 적용)
+        if config.get("experimental.hot_reload", False):
+            from src.core.config import ConfigWatcher
+            ConfigWatcher(config).start()
 
         # 로거 초기화
         logger = get_logger(Loggers.SYSTEM)
@@ -100,23 +136,37 @@ def main() -> int:
         logger.info("=" * 60)
 
         # TCOD 디스플레이 초기화
-        from src.ui.tcod_display import get_display
-        from src.ui.main_menu import run_main_menu, MenuResult
+        with startup_profiler.phase("ui_imports"):
+            from src.ui.tcod_display import get_display
+            from src.ui.main_menu import run_main_menu, MenuResult
 
-        display = get_display()
+        with startup_profiler.phase("display"):
+            display = get_display()
         logger.info("TCOD 디스플레이 초기화 완료")
 
         # 스킬 시스템 초기화
-        from src.character.skills.skill_initializer import initialize_all_skills
-        if not initialize_all_skills():
-            logger.error("스킬 초기화 실패 - 게임을 종료합니다")
-            return 1
+        with startup_profiler.phase("skills"):
+            from src.character.skills.skill_initializer import initialize_all_skills
+            if not initialize_all_skills():
+                logger.error("스킬 초기화 실패 - 게임을 종료합니다")
+                return 1
 
         # 장비 효과 시스템 초기화
-        from src.equipment.equipment_effects import get_equipment_effect_manager
-        effect_manager = get_equipment_effect_manager()
+        with startup_profiler.phase("equipment_effects"):
+            from src.equipment.equipment_effects import get_equipment_effect_manager
+            effect_manager = get_equipment_effect_manager()
         logger.info("장비 효과 시스템 초기화 완료")
 
+        # 오디오 초기화 (pygame.mixer - 메인 메뉴 BGM 전에 미리)
+        with startup_profiler.phase("audio"):
+            from src.audio import get_audio_manager
+            get_audio_manager()
+
+        # 시작 시간 측정 모드는 메인 메뉴 직전에 결과를 남기고 종료
+        if args.profile_startup:
+            startup_profiler.finish()
+            return 0
+
         # 인트로 스토리 표시 (최초 1회)
         intro_shown = False
         if not intro_shown:
@@ -171,6 +221,12 @@ def main() -> int:
                         logger.error(f"파티 데이터: {loaded_state.get('party', [])}")
                         raise
 
+                    # 난수 상태 복원 (저장 시점에서 이어짐, 이전 세이브는 런 시드만 있거나 없음)
+                    if loaded_state.get("rng_state") is not None:
+                        get_rng().set_state(loaded_state["rng_state"])
+                    elif loaded_state.get("run_seed") is not None:
+                        set_run_seed(loaded_state["run_seed"])
+
                     # 던전 복원
                     dungeon = deserialize_dungeon(loaded_state["dungeon"])
                     floor_number = loaded_state.get("floor_number", 1)
@@ -201,7 +257,8 @@ def main() -> int:
                         "max_floor_reached": loaded_state.get("max_floor_reached", floor_number),
                         "total_gold_earned": loaded_state.get("total_gold_earned", 0),
                         "total_exp_earned": loaded_state.get("total_exp_earned", 0),
-                        "save_slot": loaded_state.get("save_slot", None)
+                        "save_slot": loaded_state.get("save_slot", None),
+                        "playtime": loaded_state.get("playtime", 0)
                     }
 
                     # 탐험 시스템에 게임 통계 전달
@@ -265,8 +322,7 @@ def main() -> int:
                                 if map_enemies:
                                     exploration.game_stats["enemies_defeated"] += len(map_enemies)
                                     for enemy_entity in map_enemies:
-                                        if enemy_entity in exploration.enemies:
-                                            exploration.enemies.remove(enemy_entity)
+                                        exploration.remove_enemy(enemy_entity)
                                     logger.info(f"맵 적 엔티티 {len(map_enemies)}개 제거 (총 격파: {exploration.game_stats['enemies_defeated']}마리)")
 
                                 rewards = RewardCalculator.calculate_combat_rewards(
@@ -466,6 +522,8 @@ def main() -> int:
                             )
 
                             floor_number = 1
+                            rng = set_run_seed(args.seed)
+                            logger.info(f"런 시드: {rng.seed}")
 
                             # 게임 통계 초기화
                             game_stats = {
@@ -473,7 +531,8 @@ def main() -> int:
                                 "max_floor_reached": 1,
                                 "total_gold_earned": 0,
                                 "total_exp_earned": 0,
-                                "save_slot": None
+                                "save_slot": None,
+                                "playtime": 0
                             }
 
                             # 던전 및 탐험 초기화 (층 변경 시에만 재생성)
@@ -541,8 +600,7 @@ def main() -> int:
                                         if map_enemies:
                                             exploration.game_stats["enemies_defeated"] += len(map_enemies)  # 통계 업데이트
                                             for enemy_entity in map_enemies:
-                                                if enemy_entity in exploration.enemies:
-                                                    exploration.enemies.remove(enemy_entity)
+                                                exploration.remove_enemy(enemy_entity)
                                             logger.warning(f"[DEBUG] 맵 적 엔티티 {len(map_enemies)}마리 제거됨 (총 격파: {exploration.game_stats['enemies_defeated']}마리)")
 
                                         # 보상 계산
@@ -5,10 +5,10 @@
 """
 
 from typing import List, Optional, Any
-import random
 
 from src.combat.enemy_skills import EnemySkill, SkillTargetType
 from src.core.logger import get_logger
+from src.core.rng import get_rng, RNGStreams
 
 
 logger = get_logger("enemy_ai")
@@ -29,6 +29,7 @@ class EnemyAI:
         """
         self.enemy = enemy
         self.difficulty = difficulty
+        self.rng = get_rng().stream(RNGStreams.AI)
 
         # 난이도별 스킬 사용 확률 조정
         self.skill_use_multiplier = {
@@ -85,7 +86,7 @@ class EnemyAI:
         if selected_skill:
             # 스킬 사용 확률 체크 (난이도 반영)
             adjusted_probability = selected_skill.use_probability * self.skill_use_multiplier
-            if random.random() < adjusted_probability:
+            if self.rng.random() < adjusted_probability:
                 # 대상 선택
                 target = self._select_target(selected_skill, allies, enemies)
                 if target:
@@ -227,7 +228,7 @@ class EnemyAI:
 
         # 가중치 기반 랜덤 선택
         skills, scores = zip(*skill_scores)
-        selected = random.choices(skills, weights=scores, k=1)[0]
+        selected = self.rng.choices(skills, weights=scores, k=1)[0]
 
         return selected
 
@@ -277,14 +278,14 @@ class EnemyAI:
                 return min(alive_enemies, key=lambda e: getattr(e, 'current_hp', 0))
             else:
                 # 일반 공격: 랜덤 또는 가장 강한 적
-                if random.random() < 0.7:
-                    return random.choice(alive_enemies)
+                if self.rng.random() < 0.7:
+                    return self.rng.choice(alive_enemies)
                 else:
                     return max(alive_enemies, key=lambda e: getattr(e, 'current_hp', 0))
 
         elif skill.target_type == SkillTargetType.RANDOM_ENEMY:
             alive_enemies = [e for e in enemies if getattr(e, 'is_alive', True)]
-            return random.choice(alive_enemies) if alive_enemies else None
+            return self.rng.choice(alive_enemies) if alive_enemies else None
 
         return None
 
@@ -304,7 +305,7 @@ class EnemyAI:
             return {"type": "defend", "target": None}
 
         # 랜덤 대상 선택
-        target = random.choice(alive_enemies)
+        target = self.rng.choice(alive_enemies)
 
         return {
             "type": "attack",
@@ -4,7 +4,9 @@ Audio System
 
 from src.audio.audio_manager import (
     AudioManager,
+    NullAudioManager,
     get_audio_manager,
+    use_null_audio,
     play_bgm,
     stop_bgm,
     play_sfx
@@ -12,7 +14,9 @@ from src.audio.audio_manager import (
 
 __all__ = [
     "AudioManager",
+    "NullAudioManager",
     "get_audio_manager",
+    "use_null_audio",
     "play_bgm",
     "stop_bgm",
     "play_sfx"
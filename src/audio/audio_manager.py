@@ -4,12 +4,17 @@ Audio Manager - 오디오 시스템
 pygame.mixer를 사용한 BGM 및 SFX 재생 관리
 """
 
-import pygame.mixer
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Union
 from src.core.config import get_config
 from src.core.logger import get_logger
 
+try:
+    import pygame.mixer
+except ImportError:
+    # 헤드리스 환경 (시뮬레이션, 서버)에서는 pygame 없이 NullAudioManager 사용
+    pygame = None
+
 
 class AudioManager:
     """
@@ -23,17 +28,19 @@ class AudioManager:
         self.logger = get_logger("audio")
         self.config = get_config()
 
+        snapshot = self.config.snapshot
+
         # 오디오 활성화 여부
-        self.bgm_enabled = self.config.get("audio.bgm.enabled", True)
-        self.sfx_enabled = self.config.get("audio.sfx.enabled", True)
+        self.bgm_enabled = snapshot.bgm_enabled
+        self.sfx_enabled = snapshot.sfx_enabled
 
         # 볼륨 설정
-        self.master_volume = self.config.get("audio.master_volume", 0.8)
-        self.bgm_volume = self.config.get("audio.bgm_volume", 0.6)
-        self.sfx_volume = self.config.get("audio.sfx_volume", 0.7)
+        self.master_volume = snapshot.master_volume
+        self.bgm_volume = snapshot.bgm_volume
+        self.sfx_volume = snapshot.sfx_volume
 
         # 페이드 설정
-        self.fade_duration = self.config.get("audio.bgm.fade_duration", 1.0)
+        self.fade_duration = snapshot.fade_duration
 
         # 현재 재생 중인 BGM
         self.current_bgm: Optional[str] = None
@@ -180,14 +187,14 @@ class AudioManager:
         if not self.sfx_enabled:
             return False
 
-        # config에서 파일명 가져오기
-        file_name = self.config.get(f"audio.sfx.{category}.{sfx_name}")
+        # config에서 파일명 가져오기 (펼쳐진 키 조회 한 번)
+        cache_key = f"{category}.{sfx_name}"
+        file_name = self.config.get(f"audio.sfx.{cache_key}")
         if not file_name:
-            self.logger.debug(f"SFX '{category}.{sfx_name}'이 config.yaml에 정의되지 않음")
+            self.logger.debug("SFX '%s'이 config.yaml에 정의되지 않음", cache_key)
             return False
 
         # 캐시 확인
-        cache_key = f"{category}.{sfx_name}"
         if cache_key in self.sfx_cache:
             sound = self.sfx_cache[cache_key]
         else:
@@ -295,18 +302,71 @@ class AudioManager:
             self.logger.error(f"오디오 시스템 종료 실패: {e}")
 
 
+class NullAudioManager:
+    """
+    무음 오디오 매니저
+
+    AudioManager와 같은 인터페이스를 제공하지만 아무것도 재생하지 않습니다.
+    헤드리스 전투 시뮬레이션이나 pygame이 없는 환경에서 사용합니다.
+    """
+
+    def __init__(self) -> None:
+        self.bgm_enabled = False
+        self.sfx_enabled = False
+        self.current_bgm: Optional[str] = None
+
+    def play_bgm(self, track_name: str, loop: bool = True, fade_in: bool = True) -> bool:
+        return False
+
+    def stop_bgm(self, fade_out: bool = True) -> None:
+        pass
+
+    def pause_bgm(self) -> None:
+        pass
+
+    def resume_bgm(self) -> None:
+        pass
+
+    def play_sfx(self, category: str, sfx_name: str, volume_multiplier: float = 1.0) -> bool:
+        return False
+
+    def set_master_volume(self, volume: float) -> None:
+        pass
+
+    def set_bgm_volume(self, volume: float) -> None:
+        pass
+
+    def set_sfx_volume(self, volume: float) -> None:
+        pass
+
+    def cleanup(self) -> None:
+        pass
+
+
 # 전역 인스턴스
-_audio_manager: Optional[AudioManager] = None
+_audio_manager: Optional[Union[AudioManager, NullAudioManager]] = None
 
 
-def get_audio_manager() -> AudioManager:
+def get_audio_manager() -> Union[AudioManager, NullAudioManager]:
     """전역 오디오 매니저 인스턴스"""
     global _audio_manager
     if _audio_manager is None:
-        _audio_manager = AudioManager()
+        _audio_manager = AudioManager() if pygame is not None else NullAudioManager()
     return _audio_manager
 
 
+def use_null_audio() -> None:
+    """
+    전역 오디오 매니저를 무음 싱크로 교체
+
+    이미 초기화된 AudioManager가 있으면 정리 후 교체합니다.
+    """
+    global _audio_manager
+    if isinstance(_audio_manager, AudioManager):
+        _audio_manager.cleanup()
+    _audio_manager = NullAudioManager()
+
+
 def play_bgm(track_name: str, loop: bool = True, fade_in: bool = True) -> bool:
     """
     BGM 재생 (편의 함수)
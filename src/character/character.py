@@ -5,7 +5,8 @@ StatManager를 통합한 확장 가능한 캐릭터 시스템
 YAML 기반 직업 데이터 로딩
 """
 
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping, Tuple
 from src.character.stats import StatManager, Stats, GrowthType
 from src.character.character_loader import (
     load_character_data,
@@ -20,6 +21,23 @@ from src.core.event_bus import event_bus, Events
 from src.core.logger import get_logger
 
 
+# stat_snapshot() 키 (프로퍼티 이름, 스탯 이름)
+_SNAPSHOT_STATS: Tuple[Tuple[str, str], ...] = (
+    ("max_hp", Stats.HP),
+    ("max_mp", Stats.MP),
+    ("init_brv", Stats.INIT_BRV),
+    ("max_brv", Stats.MAX_BRV),
+    ("strength", Stats.STRENGTH),
+    ("defense", Stats.DEFENSE),
+    ("magic", Stats.MAGIC),
+    ("spirit", Stats.SPIRIT),
+    ("speed", Stats.SPEED),
+    ("luck", Stats.LUCK),
+    ("accuracy", Stats.ACCURACY),
+    ("evasion", Stats.EVASION),
+)
+
+
 class Character:
     """
     게임 캐릭터 클래스
@@ -27,6 +45,12 @@ class Character:
     StatManager를 사용하여 모든 스탯을 관리합니다.
     """
 
+    # stat_snapshot() 캐시 (from_dict가 __init__을 거치지 않으므로 클래스 기본값)
+    _stat_snapshot: Optional[Mapping[str, int]] = None
+    _stat_snapshot_key: Optional[Tuple[StatManager, int]] = None  # (stat_manager, version)
+    # 활성 특성 효과 색인 (activate_trait/deactivate_trait 시 컴파일)
+    _trait_index: Optional[Any] = None
+
     def __init__(
         self,
         name: str,
@@ -477,10 +501,7 @@ class Character:
             return []
 
         # 해당 접두사로 시작하는 스킬 ID 필터링
-        skill_ids = []
-        for skill_id in skill_manager._skills.keys():
-            if skill_id.startswith(skill_prefix):
-                skill_ids.append(skill_id)
+        skill_ids = skill_manager.get_skill_ids(skill_prefix)
 
         if not skill_ids:
             self.logger.warning(f"{character_class}({skill_prefix})의 스킬을 찾을 수 없습니다!")
@@ -563,6 +584,24 @@ class Character:
         """회피율"""
         return int(self.stat_manager.get_value(Stats.EVASION))
 
+    def stat_snapshot(self) -> Mapping[str, int]:
+        """
+        파생 스탯 전체를 한 번에 조회 (전투 엔진용)
+
+        스탯 프로퍼티와 같은 정수 값을 읽기 전용 매핑으로 반환하며,
+        같은 StatManager 객체의 version이 바뀌지 않았으면 이전 스냅샷을 그대로 재사용합니다
+        (세이브 불러오기 등으로 stat_manager가 교체되면 version이 같아도 다시 계산).
+        """
+        stat_manager = self.stat_manager
+        key = self._stat_snapshot_key
+        if key is None or key[0] is not stat_manager or key[1] != stat_manager.version:
+            totals = stat_manager.snapshot()
+            self._stat_snapshot = MappingProxyType({
+                name: int(totals.get(stat_name, 0.0)) for name, stat_name in _SNAPSHOT_STATS
+            })
+            self._stat_snapshot_key = (stat_manager, stat_manager.version)
+        return self._stat_snapshot
+
     # ===== 스킬 관리 =====
 
     @property
@@ -791,7 +830,6 @@ class Character:
         # trait_id가 available_trait_ids에 있거나, passives.yaml에 정의된 패시브 특성이면 허용
         if trait_id not in available_trait_ids:
             # 패시브 특성인지 확인 (passives.yaml의 특성들)
-            from src.character.trait_effects import get_trait_effect_manager
             trait_manager = get_trait_effect_manager()
             if trait_id not in trait_manager.trait_definitions:
                 self.logger.warning(f"특성 {trait_id}는 사용할 수 없습니다")
@@ -799,6 +837,7 @@ class Character:
 
         # 특성 활성화
         self.active_traits.append(trait_id)
+        get_trait_effect_manager().compile_traits(self)
         self.logger.info(f"특성 활성화: {trait_id}")
 
         # 특성 효과 적용 (패시브 스탯 보너스 등)
@@ -820,6 +859,7 @@ class Character:
         for i, trait in enumerate(self.active_traits):
             if (trait if isinstance(trait, str) else trait.get('id')) == trait_id:
                 self.active_traits.pop(i)
+                get_trait_effect_manager().compile_traits(self)
                 self.logger.info(f"특성 비활성화: {trait_id}")
                 return True
 
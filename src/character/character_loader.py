@@ -3,11 +3,11 @@
 
 YAML 파일에서 28개 직업의 스탯과 기믹 정보를 로드합니다.
 """
-import yaml
 import os
 from typing import Dict, Any, Optional
 from pathlib import Path
 from src.core.logger import get_logger
+from src.core.data_cache import get_data_cache
 
 logger = get_logger("character_loader")
 
@@ -72,27 +72,18 @@ def load_character_data(class_name: str) -> Optional[Dict[str, Any]]:
     if not file_name:
         file_name = class_name
 
-    # 파일 경로
-    file_path = CHARACTER_DATA_DIR / f"{file_name}.yaml"
+    # 컴파일된 데이터 캐시에서 조회
+    data = get_data_cache().get(f"characters/{file_name}.yaml")
 
-    if not file_path.exists():
-        logger.warning(f"캐릭터 데이터 파일 없음: {file_path}")
+    if data is None:
+        logger.warning(f"캐릭터 데이터 파일 없음: {CHARACTER_DATA_DIR / f'{file_name}.yaml'}")
         return None
 
-    try:
-        # YAML 로드
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+    # 캐시에 저장
+    _character_data_cache[class_name] = data
 
-        # 캐시에 저장
-        _character_data_cache[class_name] = data
-
-        logger.debug(f"캐릭터 데이터 로드 완료: {class_name}")
-        return data
-
-    except Exception as e:
-        logger.error(f"캐릭터 데이터 로드 실패 ({class_name}): {e}")
-        return None
+    logger.debug(f"캐릭터 데이터 로드 완료: {class_name}")
+    return data
 
 
 def get_base_stats(class_name: str) -> Dict[str, int]:
@@ -204,6 +195,7 @@ def reload_data():
     """캐시를 지우고 데이터를 다시 로드합니다."""
     global _character_data_cache
     _character_data_cache.clear()
+    get_data_cache().refresh()
     logger.info("캐릭터 데이터 캐시 초기화")
 
 
@@ -1,8 +1,7 @@
 """Job Stats Loader - 직업별 스탯 로더"""
-import yaml
-from pathlib import Path
 from typing import Dict, Any
 from src.core.logger import get_logger
+from src.core.data_cache import get_data_cache
 
 class JobStatsLoader:
     """직업 스탯 로더"""
@@ -13,10 +12,10 @@ class JobStatsLoader:
     
     def _load_stats(self):
         """스탯 YAML 로드"""
-        stats_file = Path(__file__).parent.parent.parent / "data" / "jobs" / "stats_base.yaml"
         try:
-            with open(stats_file, 'r', encoding='utf-8') as f:
-                self.stats = yaml.safe_load(f)
+            self.stats = get_data_cache().get("jobs/stats_base.yaml")
+            if self.stats is None:
+                raise FileNotFoundError("data/jobs/stats_base.yaml")
             self.logger.info(f"직업 스탯 {len(self.stats)}개 로드 완료")
         except Exception as e:
             self.logger.error(f"스탯 로드 실패: {e}")
@@ -0,0 +1,433 @@
+"""
+Skill Index - 스킬 ID -> 직업 스킬 모듈 색인
+
+SkillManager가 스킬을 처음 조회할 때 해당 직업 모듈(job_skills/{직업}_skills.py)만 임포트하도록
+미리 만들어 둔 색인입니다. 직업 스킬을 추가/변경하면 build_skill_index() 결과로 갱신하세요.
+(tests/unit/character/test_skill_registry.py가 실제 등록 결과와 일치하는지 확인)
+"""
+
+import importlib
+from typing import Dict, Optional, Tuple
+
+
+JOB_SKILLS_PACKAGE = "src.character.skills.job_skills"
+
+# 직업 -> 등록되는 스킬 ID
+JOB_SKILL_IDS: Dict[str, Tuple[str, ...]] = {
+    "alchemist": (
+        "alchemist_throw_potion",
+        "alchemist_explosive",
+        "alchemist_heal_potion",
+        "alchemist_buff_potion",
+        "alchemist_poison_bomb",
+        "alchemist_gather",
+        "alchemist_mana_potion",
+        "alchemist_chain",
+        "alchemist_ultimate",
+    ),
+    "archer": (
+        "archer_triple_shot",
+        "archer_precision_shot",
+        "archer_support_fire",
+        "archer_piercing_arrow",
+        "archer_focus",
+        "archer_rapid_arrows",
+        "archer_accuracy_up",
+        "archer_headshot",
+        "archer_ultimate",
+    ),
+    "archmage": (
+        "archmage_fireball",
+        "archmage_lightning_bolt",
+        "archmage_ice_storm",
+        "archmage_flame_lightning",
+        "archmage_ice_lightning",
+        "archmage_flame_ice",
+        "archmage_meteor",
+        "archmage_arcane_missile",
+        "archmage_ultimate",
+    ),
+    "assassin": (
+        "assassin_shadow_slash",
+        "assassin_assassinate",
+        "assassin_backstab",
+        "assassin_vanish",
+        "assassin_poison_dart",
+        "assassin_rapid_stab",
+        "assassin_death_mark",
+        "assassin_throat_cut",
+        "assassin_ultimate",
+    ),
+    "bard": (
+        "bard_note_attack",
+        "bard_chord_strike",
+        "bard_scale_up",
+        "bard_healing_song",
+        "bard_crescendo",
+        "bard_resonance",
+        "bard_perfect_harmony",
+        "bard_discord",
+        "bard_ultimate",
+    ),
+    "battle_mage": (
+        "bmage_engrave",
+        "bmage_burst",
+        "bmage_empower",
+        "bmage_chain",
+        "bmage_blade",
+        "bmage_shield",
+        "bmage_storm",
+        "bmage_ancient",
+        "bmage_ultimate",
+    ),
+    "berserker": (
+        "berserker_frenzy_strike",
+        "berserker_blood_flash",
+        "berserker_blood_armor",
+        "berserker_vampiric_strike",
+        "berserker_rampage",
+        "berserker_war_cry",
+        "berserker_life_drain",
+        "berserker_blood_explosion",
+        "berserker_ultimate",
+    ),
+    "breaker": (
+        "breaker_crush",
+        "breaker_break_hit",
+        "breaker_brv_focus",
+        "breaker_multi",
+        "breaker_enhance",
+        "breaker_mega_crush",
+        "breaker_wave",
+        "breaker_total",
+        "breaker_ultimate",
+    ),
+    "cleric": (
+        "cleric_pray",
+        "cleric_holy_attack",
+        "cleric_heal",
+        "cleric_greater_heal",
+        "cleric_mass_heal",
+        "cleric_faith_blessing",
+        "cleric_holy_barrier",
+        "cleric_resurrect",
+        "cleric_ultimate",
+    ),
+    "dark_knight": (
+        "dk_dark_slash",
+        "dk_drain",
+        "dk_dark_aura",
+        "dk_dark_shield",
+        "dk_dark_wave",
+        "dk_dark_blade",
+        "dk_soul_eater",
+        "dk_dark_buster",
+        "dk_dark_explosion",
+        "dk_ultimate",
+    ),
+    "dimensionist": (
+        "dimensionist_dimension_rift",
+        "dimensionist_dimension_cut",
+        "dimensionist_dimension_shift",
+        "dimensionist_dimension_gate",
+        "dimensionist_dimension_warp",
+        "dimensionist_parallel_world",
+        "dimensionist_dimension_collapse",
+        "dimensionist_dimension_master",
+        "dimensionist_ultimate",
+    ),
+    "dragon_knight": (
+        "dragon_knight_flame_slash",
+        "dragon_knight_dragon_dive",
+        "dragon_knight_fire_breath",
+        "dragon_knight_burning_strike",
+        "dragon_knight_dragon_rage",
+        "dragon_knight_dragon_scales",
+        "dragon_knight_inferno_burst",
+        "dragon_knight_dragon_wings",
+        "dragon_knight_ultimate",
+    ),
+    "druid": (
+        "druid_nature_power",
+        "druid_thorn_vine",
+        "druid_bear_form",
+        "druid_cat_form",
+        "druid_healing_forest",
+        "druid_nature_blessing",
+        "druid_eagle_form",
+        "druid_wolf_form",
+        "druid_ultimate",
+    ),
+    "elementalist": (
+        "elementalist_spirit_call",
+        "elementalist_spirit_attack",
+        "elementalist_fire_spirit",
+        "elementalist_water_spirit",
+        "elementalist_wind_spirit",
+        "elementalist_earth_spirit",
+        "elementalist_spirit_fusion",
+        "elementalist_spirit_king",
+        "elementalist_ultimate",
+    ),
+    "engineer": (
+        "engineer_assemble_parts",
+        "engineer_machine_attack",
+        "engineer_turret_deploy",
+        "engineer_repair_drone",
+        "engineer_shield_generator",
+        "engineer_machine_deploy",
+        "engineer_explosive_drone",
+        "engineer_giant_robot",
+        "engineer_ultimate",
+    ),
+    "gladiator": (
+        "gladiator_arena_strike",
+        "gladiator_honor_strike",
+        "gladiator_parry",
+        "gladiator_execute",
+        "gladiator_spirit",
+        "gladiator_blood_thirst",
+        "gladiator_duel_glory",
+        "gladiator_roar",
+        "gladiator_ultimate",
+    ),
+    "hacker": (
+        "hacker_hack",
+        "hacker_overload",
+        "hacker_debuff",
+        "hacker_disrupt",
+        "hacker_virus",
+        "hacker_backdoor",
+        "hacker_system_down",
+        "hacker_rootkit",
+        "hacker_ultimate",
+    ),
+    "knight": (
+        "knight_lance",
+        "knight_duty_strike",
+        "knight_oath",
+        "knight_chivalry",
+        "knight_iron_will",
+        "knight_bash",
+        "knight_last_stand",
+        "knight_devotion",
+        "knight_ultimate",
+    ),
+    "monk": (
+        "monk_rapid_punch",
+        "monk_palm_strike",
+        "monk_chakra_focus",
+        "monk_flying_kick",
+        "monk_inner_fire",
+        "monk_combo_finisher",
+        "monk_meditation",
+        "monk_dragon_strike",
+        "monk_ultimate",
+    ),
+    "necromancer": (
+        "necro_corpse_touch",
+        "necro_soul_drain",
+        "necro_summon_skeleton",
+        "necro_death_bolt",
+        "necro_corpse_explosion",
+        "necro_life_tap",
+        "necro_dark_ritual",
+        "necro_reanimate",
+        "necro_ultimate",
+    ),
+    "paladin": (
+        "paladin_holy_strike",
+        "paladin_judgment",
+        "paladin_divine_shield",
+        "paladin_consecration",
+        "paladin_holy_light",
+        "paladin_hammer",
+        "paladin_blessing",
+        "paladin_wrath",
+        "paladin_ultimate",
+    ),
+    "philosopher": (
+        "philosopher_analyze",
+        "philosopher_logic_strike",
+        "philosopher_insight",
+        "philosopher_pattern_recognition",
+        "philosopher_theory_establish",
+        "philosopher_strategy_plan",
+        "philosopher_logic_burst",
+        "philosopher_perfect_analysis",
+        "philosopher_ultimate",
+    ),
+    "pirate": (
+        "pirate_plunder",
+        "pirate_coin_shot",
+        "pirate_treasure_hunt",
+        "pirate_drink_rum",
+        "pirate_cannon_fire",
+        "pirate_store_treasure",
+        "pirate_gold_bomb",
+        "pirate_pirate_ship_attack",
+        "pirate_ultimate",
+    ),
+    "priest": (
+        "priest_holy_smite",
+        "priest_divine_judgment",
+        "priest_light_bind",
+        "priest_holy_heal",
+        "priest_divine_protection",
+        "priest_judgment_light",
+        "priest_holy_beam",
+        "priest_divine_wrath",
+        "priest_ultimate",
+    ),
+    "rogue": (
+        "rogue_ambush",
+        "rogue_vital_strike",
+        "rogue_steal",
+        "rogue_smoke",
+        "rogue_use_item",
+        "rogue_poison",
+        "rogue_treasure",
+        "rogue_backstab",
+        "rogue_ultimate",
+    ),
+    "samurai": (
+        "samurai_iaido",
+        "samurai_moonlight_slash",
+        "samurai_clear_mind",
+        "samurai_battojutsu",
+        "samurai_samurai_honor",
+        "samurai_musou_ken",
+        "samurai_flying_swallow",
+        "samurai_true_battojutsu",
+        "samurai_ultimate",
+    ),
+    "shaman": (
+        "shaman_curse",
+        "shaman_curse_burst",
+        "shaman_plague",
+        "shaman_curse_transfer",
+        "shaman_curse_accumulate",
+        "shaman_dark_magic",
+        "shaman_soul_drain",
+        "shaman_curse_mark",
+        "shaman_ultimate",
+    ),
+    "sniper": (
+        "sniper_aim",
+        "sniper_headshot",
+        "sniper_perfect_focus",
+        "sniper_penetrate",
+        "sniper_stance",
+        "sniper_weak_spot",
+        "sniper_explosive",
+        "sniper_final_aim",
+        "sniper_ultimate",
+    ),
+    "spellblade": (
+        "spellblade_magic_slash",
+        "spellblade_elemental_slash",
+        "spellblade_fire_infusion",
+        "spellblade_ice_infusion",
+        "spellblade_lightning_infusion",
+        "spellblade_magic_blade_dance",
+        "spellblade_mana_burst",
+        "spellblade_elemental_storm",
+        "spellblade_ultimate",
+    ),
+    "sword_saint": (
+        "sword_saint_kenkizan",
+        "sword_saint_ilseom",
+        "sword_saint_kenki_hadou",
+        "sword_saint_nitoryu",
+        "sword_saint_kenki_bakuhatsu",
+        "sword_saint_rapid_slash",
+        "sword_saint_will",
+        "sword_saint_bisect",
+        "sword_saint_ultimate",
+    ),
+    "time_mage": (
+        "time_mage_time_accel",
+        "time_mage_time_shock",
+        "time_mage_haste",
+        "time_mage_slow",
+        "time_mage_time_rewind",
+        "time_mage_time_stop",
+        "time_mage_future_sight",
+        "time_mage_time_warp",
+        "time_mage_ultimate",
+    ),
+    "vampire": (
+        "vampire_drain",
+        "vampire_lance",
+        "vampire_armor",
+        "vampire_regen",
+        "vampire_explosion",
+        "vampire_frenzy",
+        "vampire_immortal",
+        "vampire_control",
+        "vampire_ultimate",
+    ),
+    "warrior": (
+        "warrior_power_strike",
+        "warrior_shield_bash",
+        "warrior_attack_stance",
+        "warrior_defensive_stance",
+        "warrior_berserker_rage",
+        "warrior_guardian_stance",
+        "warrior_speed_stance",
+        "warrior_war_cry",
+        "warrior_ultimate",
+    ),
+}
+
+# 스킬 ID -> 직업
+SKILL_JOBS: Dict[str, str] = {
+    skill_id: job for job, skill_ids in JOB_SKILL_IDS.items() for skill_id in skill_ids
+}
+
+# 접두사 매칭용 (긴 직업명 우선: "dark_knight"가 "dark"보다 먼저)
+_JOBS_BY_LENGTH = sorted(JOB_SKILL_IDS, key=len, reverse=True)
+
+
+def find_job(skill_id: str) -> Optional[str]:
+    """
+    스킬 ID의 직업
+
+    색인에 없으면 "{직업}_" 접두사로 추정합니다. (색인 갱신 전에 추가된 스킬)
+    """
+    job = SKILL_JOBS.get(skill_id)
+    if job is not None:
+        return job
+    for job in _JOBS_BY_LENGTH:
+        if skill_id.startswith(f"{job}_"):
+            return job
+    return None
+
+
+def load_register_function(job: str):
+    """직업 스킬 모듈의 register_{직업}_skills 함수"""
+    module = importlib.import_module(f"{JOB_SKILLS_PACKAGE}.{job}_skills")
+    return getattr(module, f"register_{job}_skills")
+
+
+def build_skill_index() -> Dict[str, Tuple[str, ...]]:
+    """모든 직업 모듈을 실제로 등록해 색인 생성 (색인 갱신/검증용)"""
+    import pkgutil
+    from src.character.skills import job_skills
+
+    class _Collector:
+        def __init__(self) -> None:
+            self.skill_ids = []
+
+        def register_skill(self, skill) -> None:
+            self.skill_ids.append(skill.skill_id)
+
+    index = {}
+    for module in sorted(pkgutil.iter_modules(job_skills.__path__), key=lambda m: m.name):
+        if not module.name.endswith("_skills"):
+            continue
+        job = module.name[:-len("_skills")]
+        collector = _Collector()
+        load_register_function(job)(collector)
+        index[job] = tuple(collector.skill_ids)
+    return index
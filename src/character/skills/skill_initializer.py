@@ -1,103 +1,39 @@
 """
 Skill Initializer - 스킬 초기화 시스템
 
-게임 시작 시 모든 직업의 스킬을 SkillManager에 등록합니다.
+직업 스킬은 SkillManager가 처음 조회할 때 직업별로 불러옵니다. (skill_index 색인)
+게임 시작 시에는 색인만 확인하고, performance.preload_skills가 켜져 있으면 모든 직업을 미리 등록합니다.
 """
 from src.core.logger import get_logger
 
 logger = get_logger("skill_initializer")
 
 
-def initialize_all_skills():
+def initialize_all_skills(preload: bool = None):
     """
-    모든 직업의 스킬을 등록합니다.
+    스킬 시스템 초기화
 
     게임 시작 시 한 번만 호출되어야 합니다.
+
+    Args:
+        preload: 모든 직업 스킬을 미리 등록할지 여부 (None이면 performance.preload_skills)
     """
     from src.character.skills.skill_manager import get_skill_manager
+    from src.character.skills.skill_index import JOB_SKILL_IDS
     skill_manager = get_skill_manager()
 
-    logger.info("스킬 초기화 시작...")
+    if preload is None:
+        from src.core.config import get_config
+        preload = get_config().get("performance.preload_skills", False)
 
     try:
-        # 각 직업별 스킬 등록
-        from src.character.skills.job_skills.alchemist_skills import register_alchemist_skills
-        from src.character.skills.job_skills.archer_skills import register_archer_skills
-        from src.character.skills.job_skills.archmage_skills import register_archmage_skills
-        from src.character.skills.job_skills.assassin_skills import register_assassin_skills
-        from src.character.skills.job_skills.bard_skills import register_bard_skills
-        from src.character.skills.job_skills.battle_mage_skills import register_battle_mage_skills
-        from src.character.skills.job_skills.berserker_skills import register_berserker_skills
-        from src.character.skills.job_skills.breaker_skills import register_breaker_skills
-        from src.character.skills.job_skills.cleric_skills import register_cleric_skills
-        from src.character.skills.job_skills.dark_knight_skills import register_dark_knight_skills
-        from src.character.skills.job_skills.dimensionist_skills import register_dimensionist_skills
-        from src.character.skills.job_skills.dragon_knight_skills import register_dragon_knight_skills
-        from src.character.skills.job_skills.druid_skills import register_druid_skills
-        from src.character.skills.job_skills.elementalist_skills import register_elementalist_skills
-        from src.character.skills.job_skills.engineer_skills import register_engineer_skills
-        from src.character.skills.job_skills.gladiator_skills import register_gladiator_skills
-        from src.character.skills.job_skills.hacker_skills import register_hacker_skills
-        from src.character.skills.job_skills.knight_skills import register_knight_skills
-        from src.character.skills.job_skills.monk_skills import register_monk_skills
-        from src.character.skills.job_skills.necromancer_skills import register_necromancer_skills
-        from src.character.skills.job_skills.paladin_skills import register_paladin_skills
-        from src.character.skills.job_skills.philosopher_skills import register_philosopher_skills
-        from src.character.skills.job_skills.pirate_skills import register_pirate_skills
-        from src.character.skills.job_skills.priest_skills import register_priest_skills
-        from src.character.skills.job_skills.rogue_skills import register_rogue_skills
-        from src.character.skills.job_skills.samurai_skills import register_samurai_skills
-        from src.character.skills.job_skills.shaman_skills import register_shaman_skills
-        from src.character.skills.job_skills.sniper_skills import register_sniper_skills
-        from src.character.skills.job_skills.spellblade_skills import register_spellblade_skills
-        from src.character.skills.job_skills.sword_saint_skills import register_sword_saint_skills
-        from src.character.skills.job_skills.time_mage_skills import register_time_mage_skills
-        from src.character.skills.job_skills.vampire_skills import register_vampire_skills
-        from src.character.skills.job_skills.warrior_skills import register_warrior_skills
-
-        register_functions = [
-            register_alchemist_skills,
-            register_archer_skills,
-            register_archmage_skills,
-            register_assassin_skills,
-            register_bard_skills,
-            register_battle_mage_skills,
-            register_berserker_skills,
-            register_breaker_skills,
-            register_cleric_skills,
-            register_dark_knight_skills,
-            register_dimensionist_skills,
-            register_dragon_knight_skills,
-            register_druid_skills,
-            register_elementalist_skills,
-            register_engineer_skills,
-            register_gladiator_skills,
-            register_hacker_skills,
-            register_knight_skills,
-            register_monk_skills,
-            register_necromancer_skills,
-            register_paladin_skills,
-            register_philosopher_skills,
-            register_pirate_skills,
-            register_priest_skills,
-            register_rogue_skills,
-            register_samurai_skills,
-            register_shaman_skills,
-            register_sniper_skills,
-            register_spellblade_skills,
-            register_sword_saint_skills,
-            register_time_mage_skills,
-            register_vampire_skills,
-            register_warrior_skills
-        ]
-
-        total_skills = 0
-        for register_func in register_functions:
-            skill_ids = register_func(skill_manager)
-            total_skills += len(skill_ids)
-            logger.debug(f"{register_func.__name__}: {len(skill_ids)}개 스킬 등록")
-
-        logger.info(f"✅ 스킬 초기화 완료: 총 {total_skills}개 스킬 등록됨")
+        if preload:
+            logger.info("스킬 초기화 시작...")
+            total_skills = skill_manager.load_all()
+            logger.info(f"✅ 스킬 초기화 완료: 총 {total_skills}개 스킬 등록됨")
+        else:
+            total_skills = sum(len(skill_ids) for skill_ids in JOB_SKILL_IDS.values())
+            logger.info(f"✅ 스킬 색인 준비 완료: {len(JOB_SKILL_IDS)}개 직업, {total_skills}개 스킬 (사용 시 로드)")
         return True
 
     except Exception as e:
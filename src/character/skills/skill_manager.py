@@ -1,6 +1,11 @@
-"""Skill Manager - 스킬 관리자"""
-from typing import Any, Dict, List, Optional
+"""
+Skill Manager - 스킬 관리자
+
+직업 스킬은 처음 조회될 때 해당 직업 모듈만 임포트해 등록합니다. (skill_index 색인 사용)
+"""
+from typing import Any, Dict, List, Optional, Set
 from src.character.skills.skill import Skill, SkillResult
+from src.character.skills.skill_index import JOB_SKILL_IDS, find_job, load_register_function
 from src.core.event_bus import event_bus, Events
 from src.core.logger import get_logger
 
@@ -10,15 +15,67 @@ class SkillManager:
         self.logger = get_logger("skill_manager")
         self._skills = {}
         self._cooldowns = {}
+        # 스킬을 등록한(또는 등록을 시도한) 직업
+        self._loaded_jobs: Set[str] = set()
 
     def register_skill(self, skill: Skill):
         """스킬 등록"""
         self._skills[skill.skill_id] = skill
-        self.logger.debug(f"스킬 등록: {skill.name}")
+        self.logger.debug("스킬 등록: %s", skill.name)
 
     def get_skill(self, skill_id: str) -> Optional[Skill]:
-        """스킬 가져오기"""
-        return self._skills.get(skill_id)
+        """스킬 가져오기 (등록 전이면 해당 직업 스킬을 불러옴)"""
+        skill = self._skills.get(skill_id)
+        if skill is None:
+            job = find_job(skill_id)
+            if job is not None and job not in self._loaded_jobs:
+                self.load_job(job)
+                skill = self._skills.get(skill_id)
+        return skill
+
+    def load_job(self, job: str) -> List[str]:
+        """
+        직업 스킬 모듈을 임포트해 등록 (직업당 한 번)
+
+        Args:
+            job: 직업 모듈 이름 (예: "warrior", "dark_knight")
+
+        Returns:
+            등록된 스킬 ID 목록 (이미 불러왔거나 실패하면 빈 목록)
+        """
+        if job in self._loaded_jobs:
+            return []
+        self._loaded_jobs.add(job)
+        try:
+            skill_ids = load_register_function(job)(self)
+        except Exception as e:
+            self.logger.error(f"{job} 스킬 로드 실패: {e}")
+            return []
+        self.logger.debug("%s: %d개 스킬 등록", job, len(skill_ids))
+        return skill_ids
+
+    def load_all(self) -> int:
+        """
+        모든 직업 스킬 등록 (전체 목록이 필요한 도구/테스트용)
+
+        Returns:
+            등록된 스킬 수
+        """
+        for job in JOB_SKILL_IDS:
+            self.load_job(job)
+        return len(self._skills)
+
+    def get_skill_ids(self, prefix: str) -> List[str]:
+        """
+        접두사로 시작하는 스킬 ID 목록 (필요한 직업만 불러옴)
+
+        Args:
+            prefix: 스킬 ID 접두사 (예: "warrior_")
+        """
+        for job, skill_ids in JOB_SKILL_IDS.items():
+            if job not in self._loaded_jobs and any(skill_id.startswith(prefix) for skill_id in skill_ids):
+                self.load_job(job)
+        return [skill_id for skill_id in self._skills if skill_id.startswith(prefix)]
 
     def execute_skill(self, skill_id: str, user: Any, target: Any, context: Optional[Dict[str, Any]] = None) -> SkillResult:
         """스킬 실행"""
@@ -4,7 +4,8 @@ Stats - 확장 가능한 스탯 시스템
 완전히 데이터 주도적이고 확장 가능한 스탯 관리
 """
 
-from typing import Dict, Any, Optional, List, Callable
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Callable, Mapping
 from enum import Enum
 import math
 
@@ -22,6 +23,7 @@ class Stat:
     개별 스탯 클래스
 
     각 스탯은 기본값, 보너스, 성장 방식을 가집니다.
+    총 값은 캐시되며 기본값/보너스가 바뀔 때마다 version이 증가합니다.
     """
 
     def __init__(
@@ -45,6 +47,18 @@ class Stat:
         # 보너스 (장비, 버프 등)
         self._bonuses: Dict[str, float] = {}
 
+        # 총 값 캐시 (None이면 재계산)
+        self._total: Optional[float] = None
+        self.version = 0
+        self._manager: Optional["StatManager"] = None
+
+    def _invalidate(self) -> None:
+        """값 변경 시 캐시 무효화 및 버전 증가 (소속 StatManager 버전도 증가)"""
+        self._total = None
+        self.version += 1
+        if self._manager is not None:
+            self._manager.version += 1
+
     @property
     def base_value(self) -> float:
         """기본 값"""
@@ -54,12 +68,15 @@ class Stat:
     def base_value(self, value: float) -> None:
         """기본 값 설정 (최소/최대 제한 적용)"""
         self._base_value = self._clamp(value)
+        self._invalidate()
 
     @property
     def total_value(self) -> float:
         """총 값 (기본 + 모든 보너스)"""
-        total = self._base_value + sum(self._bonuses.values())
-        return self._clamp(total)
+        total = self._total
+        if total is None:
+            total = self._total = self._clamp(self._base_value + sum(self._bonuses.values()))
+        return total
 
     def add_bonus(self, source: str, value: float) -> None:
         """
@@ -70,10 +87,12 @@ class Stat:
             value: 보너스 값
         """
         self._bonuses[source] = value
+        self._invalidate()
 
     def remove_bonus(self, source: str) -> None:
         """보너스 제거"""
-        self._bonuses.pop(source, None)
+        if self._bonuses.pop(source, None) is not None:
+            self._invalidate()
 
     def get_bonus(self, source: str) -> float:
         """특정 출처의 보너스 조회"""
@@ -82,6 +101,7 @@ class Stat:
     def clear_bonuses(self) -> None:
         """모든 보너스 제거"""
         self._bonuses.clear()
+        self._invalidate()
 
     def calculate_growth(self, level: int) -> float:
         """
@@ -131,6 +151,7 @@ class StatManager:
     스탯 매니저
 
     캐릭터의 모든 스탯을 관리하는 중앙 시스템
+    version은 스탯 추가/제거나 어느 스탯의 값이든 바뀔 때마다 증가합니다.
     """
 
     def __init__(self, stats_config: Dict[str, Any]) -> None:
@@ -139,19 +160,28 @@ class StatManager:
             stats_config: 스탯 설정 딕셔너리
         """
         self.stats: Dict[str, Stat] = {}
+        self.version = 0
+        self._snapshot: Optional[Mapping[str, float]] = None
+        self._snapshot_version = -1
         self._initialize_stats(stats_config)
 
+    def _register(self, stat: Stat) -> None:
+        """스탯 등록 (변경 시 매니저 버전이 증가하도록 연결)"""
+        stat._manager = self
+        self.stats[stat.name] = stat
+        self.version += 1
+
     def _initialize_stats(self, config: Dict[str, Any]) -> None:
         """설정에서 스탯 초기화"""
         for stat_name, stat_config in config.items():
-            self.stats[stat_name] = Stat(
+            self._register(Stat(
                 name=stat_name,
                 base_value=stat_config.get("base_value", 0),
                 growth_rate=stat_config.get("growth_rate", 1.0),
                 growth_type=GrowthType(stat_config.get("growth_type", "linear")),
                 min_value=stat_config.get("min_value", 0),
                 max_value=stat_config.get("max_value")
-            )
+            ))
 
     def get(self, stat_name: str) -> Optional[Stat]:
         """스탯 가져오기"""
@@ -168,10 +198,10 @@ class StatManager:
         Returns:
             스탯 값 (스탯이 없으면 0)
         """
-        stat = self.get(stat_name)
+        stat = self.stats.get(stat_name)
         if stat is None:
             return 0.0
-        return stat.total_value if use_total else stat.base_value
+        return stat.total_value if use_total else stat._base_value
 
     def set_base_value(self, stat_name: str, value: float) -> None:
         """기본 값 설정"""
@@ -223,11 +253,14 @@ class StatManager:
             growth_rate: 성장률
             growth_type: 성장 타입
         """
-        self.stats[name] = Stat(name, base_value, growth_rate, growth_type)
+        self._register(Stat(name, base_value, growth_rate, growth_type))
 
     def remove_stat(self, name: str) -> None:
         """스탯 제거"""
-        self.stats.pop(name, None)
+        stat = self.stats.pop(name, None)
+        if stat is not None:
+            stat._manager = None
+            self.version += 1
 
     def has_stat(self, name: str) -> bool:
         """스탯 존재 여부"""
@@ -235,7 +268,18 @@ class StatManager:
 
     def get_all_stats(self) -> Dict[str, float]:
         """모든 스탯의 총 값"""
-        return {name: stat.total_value for name, stat in self.stats.items()}
+        return dict(self.snapshot())
+
+    def snapshot(self) -> Mapping[str, float]:
+        """
+        모든 스탯 총 값의 읽기 전용 스냅샷
+
+        version이 바뀌지 않았으면 이전 스냅샷을 그대로 반환합니다.
+        """
+        if self._snapshot_version != self.version or self._snapshot is None:
+            self._snapshot = MappingProxyType({name: stat.total_value for name, stat in self.stats.items()})
+            self._snapshot_version = self.version
+        return self._snapshot
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환 (저장용)"""
@@ -246,16 +290,15 @@ class StatManager:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "StatManager":
         """딕셔너리에서 복원"""
-        manager = cls.__new__(cls)
-        manager.stats = {}
+        manager = cls({})
 
         for name, stat_data in data.items():
-            manager.stats[name] = Stat(
+            manager._register(Stat(
                 name=stat_data["name"],
                 base_value=stat_data["base_value"],
                 growth_rate=stat_data["growth_rate"],
                 growth_type=GrowthType(stat_data["growth_type"])
-            )
+            ))
             # 보너스 복원
             for source, value in stat_data.get("bonuses", {}).items():
                 manager.stats[name].add_bonus(source, value)
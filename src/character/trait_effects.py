@@ -4,7 +4,7 @@ Trait Effects - 특성 효과 시스템
 특성(Trait)이 실제 게임플레이에 영향을 주도록 구현
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -44,6 +44,120 @@ class TraitEffect:
     metadata: Optional[Dict[str, Any]] = None
 
 
+# 대상 스탯과 무관하게 모든 데미지에 적용되는 DAMAGE_MULTIPLIER 대상
+_ALWAYS_DAMAGE_TARGETS = frozenset({None, "all_attack", "next_attack"})
+
+_STAT_EFFECT_TYPES = (TraitEffectType.STAT_MULTIPLIER, TraitEffectType.STAT_FLAT)
+
+
+def _trait_id_of(trait_data: Any) -> Optional[str]:
+    """active_traits 항목(문자열 또는 dict)에서 특성 ID 추출"""
+    return trait_data if isinstance(trait_data, str) else trait_data.get('id')
+
+
+def _damage_target_applies(target: Optional[str], damage_type: str, context: Dict[str, Any]) -> bool:
+    """DAMAGE_MULTIPLIER 효과의 대상이 이번 데미지에 해당하는지"""
+    return (
+        not target
+        or target in _ALWAYS_DAMAGE_TARGETS
+        or target == damage_type
+        or (target == "elemental" and bool(context.get("is_elemental")))
+    )
+
+
+class TraitIndex:
+    """
+    캐릭터별 특성 효과 색인
+
+    활성 특성의 효과를 (effect_type, target_stat)별로 모아 두고, 조건 없는 효과는
+    미리 곱하거나 더해 둡니다. 호출 시에는 조건부 효과만 조건을 확인합니다.
+    Character.activate_trait/deactivate_trait에서 다시 컴파일되며, active_traits 리스트가
+    교체되거나 길이가 바뀌면 TraitEffectManager.get_trait_index가 다시 만듭니다.
+    """
+
+    def __init__(self, manager: "TraitEffectManager", traits: List[Any]):
+        self.manager = manager
+        self.source = traits
+        self.count = len(traits)
+
+        # 특성 순서대로 나열한 효과 (스탯 보너스는 곱/합 순서가 결과에 영향)
+        self.ordered: List[TraitEffect] = []
+        self.effects: Dict[Tuple[TraitEffectType, Optional[str]], List[TraitEffect]] = {}
+        for trait_data in traits:
+            for effect in manager.get_trait_effects(_trait_id_of(trait_data)):
+                self.ordered.append(effect)
+                self.effects.setdefault((effect.effect_type, effect.target_stat), []).append(effect)
+
+        # 데미지 배율: 항상 적용되는 곱, 대상별 곱, 조건부 효과
+        self.damage_always = 1.0
+        self.damage_by_target: Dict[str, float] = {}
+        self.damage_conditional: List[TraitEffect] = []
+        # MP 소모 감소: 조건 없는 합, 조건부 효과
+        self.mp_reduction = 0.0
+        self.mp_conditional: List[TraitEffect] = []
+
+        for effect in self.ordered:
+            if effect.effect_type == TraitEffectType.DAMAGE_MULTIPLIER:
+                if effect.condition:
+                    self.damage_conditional.append(effect)
+                elif not effect.target_stat or effect.target_stat in _ALWAYS_DAMAGE_TARGETS:
+                    self.damage_always *= effect.value
+                else:
+                    target = effect.target_stat
+                    self.damage_by_target[target] = self.damage_by_target.get(target, 1.0) * effect.value
+            elif effect.effect_type == TraitEffectType.MP_COST_REDUCTION:
+                if effect.condition:
+                    self.mp_conditional.append(effect)
+                else:
+                    self.mp_reduction += effect.value
+
+        # 크리티컬/브레이크 보너스는 조건과 무관하게 합산
+        self.critical_bonus = sum(e.value for e in self.ordered if e.effect_type == TraitEffectType.CRITICAL_BONUS)
+        self.break_bonus = sum(e.value for e in self.ordered if e.effect_type == TraitEffectType.BREAK_BONUS)
+        self.turn_start = [e for e in self.ordered if e.condition == "turn_start"]
+
+        # 스탯별 적용 계획 (처음 조회할 때 생성)
+        self._stat_plans: Dict[str, List[Tuple[float, float, Optional[TraitEffect]]]] = {}
+
+    def matches(self, manager: "TraitEffectManager", traits: List[Any]) -> bool:
+        """색인이 현재 특성 목록에 대한 것인지"""
+        return self.manager is manager and self.source is traits and self.count == len(traits)
+
+    def stat_plan(self, stat_name: str) -> List[Tuple[float, float, Optional[TraitEffect]]]:
+        """
+        스탯 보너스 적용 계획
+
+        연속된 조건 없는 효과는 하나의 (배율, 가산) 단계로 합치고, 조건부 효과는
+        (1.0, 0.0, effect) 단계로 남겨 원래 순서대로 적용합니다.
+        """
+        plan = self._stat_plans.get(stat_name)
+        if plan is not None:
+            return plan
+
+        plan = []
+        multiplier, addend = 1.0, 0.0
+        for effect in self.ordered:
+            if effect.effect_type not in _STAT_EFFECT_TYPES:
+                continue
+            if effect.target_stat and effect.target_stat != stat_name:
+                continue
+            if effect.condition:
+                if multiplier != 1.0 or addend != 0.0:
+                    plan.append((multiplier, addend, None))
+                    multiplier, addend = 1.0, 0.0
+                plan.append((1.0, 0.0, effect))
+            elif effect.effect_type == TraitEffectType.STAT_MULTIPLIER:
+                multiplier *= effect.value
+                addend *= effect.value
+            else:
+                addend += effect.value
+        if multiplier != 1.0 or addend != 0.0:
+            plan.append((multiplier, addend, None))
+
+        self._stat_plans[stat_name] = plan
+        return plan
+
+
 class TraitEffectManager:
     """
     특성 효과 관리자
@@ -398,6 +512,33 @@ class TraitEffectManager:
         """특성 ID로 효과 리스트 가져오기"""
         return self.trait_definitions.get(trait_id, [])
 
+    def compile_traits(self, character: Any) -> Optional[TraitIndex]:
+        """
+        캐릭터의 활성 특성을 색인으로 컴파일해 캐릭터에 저장
+
+        Returns:
+            TraitIndex (active_traits가 없으면 None)
+        """
+        traits = getattr(character, 'active_traits', None)
+        if not isinstance(traits, list):
+            return None
+        index = TraitIndex(self, traits)
+        try:
+            character._trait_index = index
+        except AttributeError:
+            pass
+        return index
+
+    def get_trait_index(self, character: Any) -> Optional[TraitIndex]:
+        """캐릭터의 특성 색인 (없거나 특성 목록이 바뀌었으면 다시 컴파일)"""
+        traits = getattr(character, 'active_traits', None)
+        if not isinstance(traits, list):
+            return None
+        index = getattr(character, '_trait_index', None)
+        if isinstance(index, TraitIndex) and index.matches(self, traits):
+            return index
+        return self.compile_traits(character)
+
     def calculate_stat_bonus(
         self,
         character: Any,
@@ -415,35 +556,27 @@ class TraitEffectManager:
         Returns:
             보너스 적용된 최종 값
         """
-        if not hasattr(character, 'active_traits'):
+        index = self.get_trait_index(character)
+        if index is None:
             return base_value
 
         final_value = base_value
 
-        for trait_data in character.active_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
-
-            for effect in effects:
-                # 조건 확인
-                if effect.condition and not self._check_condition(character, effect.condition):
-                    continue
-
-                # 스탯 타겟 확인
-                if effect.target_stat and effect.target_stat != stat_name:
-                    continue
+        for multiplier, addend, effect in index.stat_plan(stat_name):
+            if effect is None:
+                final_value = final_value * multiplier + addend
+                continue
 
-                # 효과 적용
-                if effect.effect_type == TraitEffectType.STAT_MULTIPLIER:
-                    final_value *= effect.value
-                    self.logger.debug(
-                        f"[{trait_id}] {stat_name} 배율 적용: x{effect.value} → {final_value}"
-                    )
-                elif effect.effect_type == TraitEffectType.STAT_FLAT:
-                    final_value += effect.value
-                    self.logger.debug(
-                        f"[{trait_id}] {stat_name} 고정값 적용: +{effect.value} → {final_value}"
-                    )
+            # 조건부 효과
+            if not self._check_condition(character, effect.condition):
+                continue
+            if effect.effect_type == TraitEffectType.STAT_MULTIPLIER:
+                final_value *= effect.value
+            else:
+                final_value += effect.value
+            self.logger.debug(
+                f"[{effect.trait_id}] {stat_name} 조건부 효과 적용 ({effect.condition}) → {final_value}"
+            )
 
         return final_value
 
@@ -464,42 +597,27 @@ class TraitEffectManager:
         Returns:
             총 데미지 배율 (1.0 = 100%)
         """
-        if not hasattr(character, 'active_traits'):
+        index = self.get_trait_index(character)
+        if index is None:
             return 1.0
 
-        total_multiplier = 1.0
-
-        for trait_data in character.active_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
-
-            for effect in effects:
-                if effect.effect_type != TraitEffectType.DAMAGE_MULTIPLIER:
-                    continue
-
-                # 조건 확인
-                if effect.condition and not self._check_condition(character, effect.condition, context):
-                    continue
-
-                # 타겟 확인
-                if effect.target_stat:
-                    # 데미지 타입이 맞는지 확인
-                    if effect.target_stat == damage_type:
-                        total_multiplier *= effect.value
-                    elif effect.target_stat == "all_attack":
-                        total_multiplier *= effect.value
-                    elif effect.target_stat == "elemental" and context.get("is_elemental"):
-                        total_multiplier *= effect.value
-                    elif effect.target_stat == "next_attack":
-                        # 다음 공격에만 적용
-                        total_multiplier *= effect.value
-                else:
-                    # 타겟이 없으면 모든 데미지에 적용
-                    total_multiplier *= effect.value
-
-                self.logger.debug(
-                    f"[{trait_id}] 데미지 배율 적용: x{effect.value} → 총 x{total_multiplier}"
-                )
+        # 조건 없는 효과 (미리 곱해 둔 값)
+        total_multiplier = index.damage_always
+        if damage_type not in _ALWAYS_DAMAGE_TARGETS:
+            total_multiplier *= index.damage_by_target.get(damage_type, 1.0)
+        if damage_type != "elemental" and context.get("is_elemental"):
+            total_multiplier *= index.damage_by_target.get("elemental", 1.0)
+
+        # 조건부 효과
+        for effect in index.damage_conditional:
+            if not _damage_target_applies(effect.target_stat, damage_type, context):
+                continue
+            if not self._check_condition(character, effect.condition, context):
+                continue
+            total_multiplier *= effect.value
+            self.logger.debug(
+                f"[{effect.trait_id}] 데미지 배율 적용: x{effect.value} → 총 x{total_multiplier}"
+            )
 
         return total_multiplier
 
@@ -515,25 +633,16 @@ class TraitEffectManager:
         Returns:
             최종 MP 소모
         """
-        if not hasattr(character, 'active_traits'):
+        index = self.get_trait_index(character)
+        if index is None:
             return base_cost
 
-        reduction_rate = 0.0
-
-        for trait_data in character.active_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
-
-            for effect in effects:
-                if effect.effect_type != TraitEffectType.MP_COST_REDUCTION:
-                    continue
-
-                # 조건 확인
-                if effect.condition and not self._check_condition(character, effect.condition, context):
-                    continue
+        reduction_rate = index.mp_reduction
 
+        for effect in index.mp_conditional:
+            if self._check_condition(character, effect.condition, context):
                 reduction_rate += effect.value
-                self.logger.debug(f"[{trait_id}] MP 감소: {effect.value * 100}%")
+                self.logger.debug(f"[{effect.trait_id}] MP 감소: {effect.value * 100}%")
 
         # 최대 100% 감소
         reduction_rate = min(1.0, reduction_rate)
@@ -557,21 +666,8 @@ class TraitEffectManager:
         Returns:
             크리티컬 확률 보너스 (0.15 = +15%)
         """
-        if not hasattr(character, 'active_traits'):
-            return 0.0
-
-        bonus = 0.0
-
-        for trait_data in character.active_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
-
-            for effect in effects:
-                if effect.effect_type == TraitEffectType.CRITICAL_BONUS:
-                    bonus += effect.value
-                    self.logger.debug(f"[{trait_id}] 크리티컬 보너스: +{effect.value * 100}%")
-
-        return bonus
+        index = self.get_trait_index(character)
+        return index.critical_bonus if index is not None else 0.0
 
     def calculate_break_bonus(self, character: Any) -> float:
         """
@@ -583,21 +679,8 @@ class TraitEffectManager:
         Returns:
             브레이크 보너스 배율 (1.5 = 150%)
         """
-        if not hasattr(character, 'active_traits'):
-            return 0.0
-
-        bonus = 0.0
-
-        for trait_data in character.active_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
-
-            for effect in effects:
-                if effect.effect_type == TraitEffectType.BREAK_BONUS:
-                    bonus += effect.value
-                    self.logger.debug(f"[{trait_id}] 브레이크 보너스: +{effect.value}")
-
-        return bonus
+        index = self.get_trait_index(character)
+        return index.break_bonus if index is not None else 0.0
 
     def apply_turn_start_effects(self, character: Any):
         """
@@ -606,35 +689,30 @@ class TraitEffectManager:
         Args:
             character: 캐릭터
         """
-        if not hasattr(character, 'active_traits'):
+        index = self.get_trait_index(character)
+        if index is None:
             return
 
-        for trait_data in character.active_traits:
-            trait_id = trait_data if isinstance(trait_data, str) else trait_data.get('id')
-            effects = self.get_trait_effects(trait_id)
-
-            for effect in effects:
-                # 턴 시작 조건 확인
-                if effect.condition != "turn_start":
-                    continue
-
-                # HP 회복
-                if effect.effect_type == TraitEffectType.HP_REGEN:
-                    heal_amount = int(character.max_hp * effect.value)
-                    if hasattr(character, 'heal'):
-                        actual = character.heal(heal_amount)
-                        self.logger.info(
-                            f"[{trait_id}] {character.name} HP 회복: {actual} ({effect.value * 100}%)"
-                        )
-
-                # MP 회복
-                elif effect.effect_type == TraitEffectType.MP_REGEN:
-                    mp_amount = int(character.max_mp * effect.value)
-                    if hasattr(character, 'restore_mp'):
-                        actual = character.restore_mp(mp_amount)
-                        self.logger.info(
-                            f"[{trait_id}] {character.name} MP 회복: {actual} ({effect.value * 100}%)"
-                        )
+        for effect in index.turn_start:
+            trait_id = effect.trait_id
+
+            # HP 회복
+            if effect.effect_type == TraitEffectType.HP_REGEN:
+                heal_amount = int(character.max_hp * effect.value)
+                if hasattr(character, 'heal'):
+                    actual = character.heal(heal_amount)
+                    self.logger.info(
+                        f"[{trait_id}] {character.name} HP 회복: {actual} ({effect.value * 100}%)"
+                    )
+
+            # MP 회복
+            elif effect.effect_type == TraitEffectType.MP_REGEN:
+                mp_amount = int(character.max_mp * effect.value)
+                if hasattr(character, 'restore_mp'):
+                    actual = character.restore_mp(mp_amount)
+                    self.logger.info(
+                        f"[{trait_id}] {character.name} MP 회복: {actual} ({effect.value * 100}%)"
+                    )
 
     def _check_condition(
         self,
@@ -0,0 +1,274 @@
+"""
+ATB Scheduler - 이벤트 기반 ATB 스케줄러
+
+프레임마다 게이지를 조금씩 올리는 ATBSystem.update 대신,
+각 전투원이 행동 임계값(또는 캐스팅 완료)에 도달하는 시각을 해석적으로 계산하고
+우선순위 큐로 다음 행동자까지 시간을 한 번에 건너뜁니다.
+
+게이지 증가 속도는 ATBSystem.update와 동일 (effective_speed / 5.0 per time unit)
+헤이스트/슬로우/기절, BREAK 리셋, 캐스팅 시작/종료 등 게이지 상태 변화는
+매 스케줄링 시점에 시그니처 비교로 감지하여 해당 전투원만 재계산합니다.
+"""
+
+import heapq
+import math
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
+
+from src.core.logger import get_logger
+from src.core.event_bus import event_bus, Events
+from src.combat.atb_system import ATBSystem, ATBGauge
+
+
+# ATBSystem.update의 게이지 증가 보정값 (effective_speed * delta_time / 5.0)
+ATB_TIME_SCALE = 5.0
+
+# 부동소수점 오차 허용치
+_EPSILON = 1e-6
+
+
+@dataclass
+class _ScheduleEntry:
+    """전투원별 스케줄 정보"""
+    base_time: float  # 계산 기준 시각
+    base_value: float  # 기준 시각의 게이지 (캐스팅 중이면 축적 ATB)
+    rate: float  # 시간당 증가량
+    is_casting: bool
+    ready_time: float  # 임계값 도달 예정 시각 (도달 불가면 inf)
+    version: int
+
+
+class ATBScheduler:
+    """
+    이벤트 기반 ATB 스케줄러
+
+    ATBSystem의 게이지를 그대로 사용하며, 다음 행동 가능 시각으로 시계를 점프시킵니다.
+    행동 수에 비례하는 비용(O(actions))으로 전투를 진행할 수 있어 헤드리스 시뮬레이션과
+    AI 턴 처리에 사용합니다. UI는 predicted_gauge()로 중간 게이지를 보간할 수 있습니다.
+    """
+
+    def __init__(self, atb: ATBSystem) -> None:
+        self.logger = get_logger("atb")
+        self.atb = atb
+
+        # 스케줄러 시계 (ATBSystem.update의 delta_time 단위)
+        self.clock: float = 0.0
+
+        self._entries: Dict[Any, _ScheduleEntry] = {}
+        self._heap: List[Tuple[float, int, int, Any]] = []
+        self._sequence = 0
+
+        # 진행 가능한 이벤트가 없음 (전원 기절 등)
+        self.stalled = False
+
+    def reset(self) -> None:
+        """스케줄 초기화 (전투 시작 시)"""
+        self.clock = 0.0
+        self.stalled = False
+        self._entries.clear()
+        self._heap.clear()
+        self._sequence = 0
+
+    def invalidate(self, combatant: Optional[Any] = None) -> None:
+        """
+        스케줄 강제 재계산
+
+        Args:
+            combatant: 대상 전투원 (None이면 전체)
+        """
+        if combatant is None:
+            self._entries.clear()
+            self._heap.clear()
+        else:
+            self._entries.pop(combatant, None)
+
+    def _get_casting_info(self, combatant: Any) -> Optional[Any]:
+        """캐스팅 정보 가져오기"""
+        from src.combat.casting_system import get_casting_system
+        return get_casting_system().get_cast_info(combatant)
+
+    def _current_value(self, gauge: ATBGauge, cast_info: Optional[Any]) -> float:
+        """현재 게이지 (캐스팅 중이면 축적 ATB)"""
+        if cast_info is not None:
+            return float(cast_info.accumulated_atb)
+        return float(gauge.current)
+
+    def _compute_ready_time(self, gauge: ATBGauge, cast_info: Optional[Any], rate: float) -> float:
+        """임계값(또는 캐스팅 완료) 도달 시각 계산"""
+        if cast_info is not None:
+            remaining = cast_info.required_atb - cast_info.accumulated_atb
+            if remaining <= 0:
+                return self.clock
+        elif gauge.can_act:
+            return self.clock
+        else:
+            remaining = gauge.threshold - gauge.current
+            if remaining <= 0:
+                # 임계값 이상이지만 행동 불가 (전투 불능/기절/수면) - 상태가 바뀔 때 재계산
+                return math.inf
+
+        if rate <= 0:
+            return math.inf
+        return self.clock + remaining / rate
+
+    def _is_stale(self, entry: _ScheduleEntry, gauge: ATBGauge, cast_info: Optional[Any], rate: float) -> bool:
+        """스케줄 정보가 게이지 상태와 어긋났는지 확인"""
+        if entry.rate != rate or entry.is_casting != (cast_info is not None):
+            return True
+
+        expected = entry.base_value + entry.rate * (self.clock - entry.base_time)
+        if cast_info is None:
+            expected = min(expected, gauge.max_gauge)
+        return abs(expected - self._current_value(gauge, cast_info)) > 0.5
+
+    def _refresh(self) -> None:
+        """게이지 상태가 바뀐 전투원의 스케줄 재계산"""
+        for combatant in list(self._entries):
+            if combatant not in self.atb.gauges:
+                del self._entries[combatant]
+
+        for combatant, gauge in self.atb.gauges.items():
+            cast_info = self._get_casting_info(combatant)
+            # 행동 대기 중인 게이지는 더 이상 증가하지 않음 (ATBSystem.update와 동일)
+            if cast_info is None and gauge.can_act:
+                rate = 0.0
+            else:
+                rate = gauge.get_effective_speed() / ATB_TIME_SCALE
+            entry = self._entries.get(combatant)
+
+            if entry is not None and not self._is_stale(entry, gauge, cast_info, rate):
+                continue
+
+            version = entry.version + 1 if entry is not None else 0
+            ready_time = self._compute_ready_time(gauge, cast_info, rate)
+            self._entries[combatant] = _ScheduleEntry(
+                base_time=self.clock,
+                base_value=self._current_value(gauge, cast_info),
+                rate=rate,
+                is_casting=cast_info is not None,
+                ready_time=ready_time,
+                version=version
+            )
+
+            if ready_time != math.inf:
+                self._sequence += 1
+                heapq.heappush(self._heap, (ready_time, self._sequence, version, combatant))
+
+    def _peek(self) -> Optional[Tuple[float, Any]]:
+        """가장 빠른 유효 이벤트 (시각, 전투원)"""
+        while self._heap:
+            ready_time, _, version, combatant = self._heap[0]
+            entry = self._entries.get(combatant)
+            if entry is None or entry.version != version:
+                heapq.heappop(self._heap)
+                continue
+            return ready_time, combatant
+        return None
+
+    def time_to_ready(self, combatant: Any) -> float:
+        """
+        행동 가능(또는 캐스팅 완료)까지 남은 시간
+
+        Args:
+            combatant: 전투원
+
+        Returns:
+            남은 시간 (도달 불가면 inf)
+        """
+        self._refresh()
+        entry = self._entries.get(combatant)
+        if entry is None:
+            return math.inf
+        return max(0.0, entry.ready_time - self.clock)
+
+    def predicted_gauge(self, combatant: Any, elapsed: float) -> float:
+        """
+        현재 시각에서 elapsed 만큼 지난 뒤의 예상 게이지 (UI 보간용)
+
+        Args:
+            combatant: 전투원
+            elapsed: 경과 시간
+
+        Returns:
+            예상 게이지 값
+        """
+        gauge = self.atb.get_gauge(combatant)
+        if gauge is None:
+            return 0.0
+        if gauge.can_act or gauge.is_casting:
+            return float(gauge.current)
+
+        rate = gauge.get_effective_speed() / ATB_TIME_SCALE
+        return min(gauge.current + rate * elapsed, float(gauge.max_gauge))
+
+    def advance(self, delta_time: float) -> None:
+        """
+        시계를 delta_time만큼 진행하고 모든 게이지에 반영
+
+        Args:
+            delta_time: 경과 시간
+        """
+        if delta_time < 0:
+            return
+
+        from src.combat.casting_system import get_casting_system
+        casting_system = get_casting_system()
+
+        self._refresh()
+        target_time = self.clock + delta_time
+
+        for combatant, gauge in self.atb.gauges.items():
+            entry = self._entries[combatant]
+            increase = entry.rate * delta_time
+
+            if entry.is_casting:
+                gauge.is_casting = True
+                cast_info = casting_system.get_cast_info(combatant)
+                remaining = cast_info.required_atb - cast_info.accumulated_atb if cast_info else 0
+                if target_time + _EPSILON >= entry.ready_time:
+                    # 완료 시각 도달 - 반올림 오차로 완료가 누락되지 않도록 남은 양 전부 반영
+                    casting_system.update(combatant, max(remaining, int(round(increase))))
+                else:
+                    casting_system.update(combatant, min(int(round(increase)), max(0, remaining - 1)))
+                gauge.is_casting = casting_system.is_casting(combatant)
+                continue
+
+            if gauge.can_act:
+                continue
+
+            gauge.increase(increase)
+            if target_time + _EPSILON >= entry.ready_time and gauge.current < gauge.threshold:
+                # 부동소수점 오차 보정
+                gauge.current = gauge.threshold
+
+            if gauge.can_act:
+                event_bus.publish(Events.COMBAT_TURN_START, {
+                    "combatant": combatant,
+                    "atb_gauge": gauge.current
+                })
+
+        self.clock = target_time
+
+    def advance_to_next(self) -> Optional[float]:
+        """
+        다음 행동 가능 또는 캐스팅 완료 시각까지 시계를 점프
+
+        이미 행동 가능한 전투원이 있으면 시간을 진행하지 않습니다.
+
+        Returns:
+            경과한 시간 (진행할 이벤트가 없으면 None - 전원 기절 등)
+        """
+        self.stalled = False
+        if self.atb.get_action_order():
+            return 0.0
+
+        self._refresh()
+        next_event = self._peek()
+        if next_event is None:
+            self.stalled = True
+            return None
+
+        ready_time, _ = next_event
+        elapsed = max(0.0, ready_time - self.clock)
+        self.advance(elapsed)
+        return elapsed
@@ -9,7 +9,7 @@ ATB 증가량 = (해당 전투원의 SPD / 모든 전투원의 평균 SPD) * bas
 """
 
 from typing import List, Dict, Any, Optional
-from src.core.config import get_config
+from src.core.config import get_config, ConfigSnapshot
 from src.core.logger import get_logger
 from src.core.event_bus import event_bus, Events
 
@@ -103,12 +103,9 @@ class ATBSystem:
         self.logger = get_logger("atb")
         self.config = get_config()
 
-        # 설정 로드
-        self.enabled = self.config.get("combat.atb.enabled", True)
-        self.max_gauge = self.config.get("combat.atb.max_gauge", 2000)
-        self.threshold = self.config.get("combat.atb.action_threshold", 1000)
-        self.base_rate = self.config.get("combat.atb.base_rate", 50)
-        self.player_turn_enemy_rate = self.config.get("combat.atb.player_turn_enemy_atb_rate", 0.3)
+        # 설정 로드 (핫 리로드 시 다시 적용)
+        self.apply_config(self.config.snapshot)
+        self.config.subscribe(self.apply_config)
 
         # ATB 게이지 저장소
         self.gauges: Dict[Any, ATBGauge] = {}
@@ -122,6 +119,14 @@ class ATBSystem:
         # BREAK 이벤트 구독 (BREAK 시 ATB 초기화)
         event_bus.subscribe("brave.break", self._on_break)
 
+    def apply_config(self, snapshot: ConfigSnapshot) -> None:
+        """설정 스냅샷의 ATB 상수 적용"""
+        self.enabled = snapshot.atb_enabled
+        self.max_gauge = snapshot.atb_max_gauge
+        self.threshold = snapshot.atb_action_threshold
+        self.base_rate = snapshot.atb_base_rate
+        self.player_turn_enemy_rate = snapshot.atb_player_turn_enemy_rate
+
     def register_combatant(self, combatant: Any) -> None:
         """
         전투원 등록
@@ -12,7 +12,7 @@ Final Fantasy Dissidia/Opera Omnia 스타일의 BRV/HP 시스템
 """
 
 from typing import Dict, Any, Optional
-from src.core.config import get_config
+from src.core.config import get_config, ConfigSnapshot
 from src.core.logger import get_logger
 from src.core.event_bus import event_bus, Events
 from src.combat.damage_calculator import get_damage_calculator
@@ -29,16 +29,21 @@ class BraveSystem:
         self.logger = get_logger("brave")
         self.config = get_config()
 
-        # 설정 로드
-        self.base_brv = self.config.get("combat.brave.base_brv", 100)
-        self.max_brv_multiplier = self.config.get("combat.brave.max_brv_multiplier", 3.0)
-        self.break_bonus = self.config.get("combat.brave.break_bonus", 1.5)
-        self.break_stun_duration = self.config.get("combat.brave.break_stun_duration", 1)
+        # 설정 로드 (핫 리로드 시 다시 적용)
+        self.apply_config(self.config.snapshot)
+        self.config.subscribe(self.apply_config)
 
         # BRV 효율 및 저항
         self.brv_efficiency_default = 1.0
         self.brv_loss_resistance_default = 1.0
 
+    def apply_config(self, snapshot: ConfigSnapshot) -> None:
+        """설정 스냅샷의 브레이브 상수 적용"""
+        self.base_brv = snapshot.base_brv
+        self.max_brv_multiplier = snapshot.max_brv_multiplier
+        self.break_bonus = snapshot.brave_break_bonus
+        self.break_stun_duration = snapshot.break_stun_duration
+
     def calculate_int_brv(self, character: Any) -> int:
         """
         INT BRV 계산 (초기 BRV)
@@ -11,6 +11,7 @@ from typing import Dict, Any, Optional
 from enum import Enum
 
 from src.core.logger import get_logger, Loggers
+from src.core.rng import get_rng, RNGStreams
 
 
 logger = get_logger(Loggers.COMBAT)
@@ -173,8 +174,7 @@ class CastingSystem:
         # 중단 확률 (데미지가 클수록 높음)
         interrupt_chance = min(0.9, damage / 100.0)
 
-        import random
-        if random.random() < interrupt_chance:
+        if get_rng().stream(RNGStreams.COMBAT).random() < interrupt_chance:
             self.cancel_cast(caster, f"데미지 {damage}로 인한 중단")
 
     def is_casting(self, caster: Any) -> bool:
@@ -9,8 +9,10 @@ from enum import Enum
 
 from src.core.config import get_config
 from src.core.logger import get_logger
-from src.core.event_bus import event_bus, Events
+from src.core.rng import get_rng, RNGStreams
+from src.core.event_bus import event_bus, Events, merge_value_change
 from src.combat.atb_system import get_atb_system, ATBSystem
+from src.combat.atb_scheduler import ATBScheduler
 from src.combat.brave_system import get_brave_system, BraveSystem
 from src.combat.damage_calculator import get_damage_calculator, DamageCalculator
 from src.combat.status_effects import StatusManager, StatusEffect, StatusType
@@ -55,6 +57,24 @@ class CombatManager:
         self.brave: BraveSystem = get_brave_system()
         self.damage_calc: DamageCalculator = get_damage_calculator()
 
+        # 이벤트 기반 ATB 스케줄러 (헤드리스 시뮬레이션/AI 턴용)
+        self.scheduler = ATBScheduler(self.atb)
+
+        # 지연 이벤트 모드: 행동 중 발행된 이벤트를 턴 종료 시 한 번에 전달
+        self.defer_events: bool = self.config.get("combat.deferred_events", False)
+        self._events_deferred = False
+        if self.defer_events:
+            # 같은 캐릭터의 BRV 변화는 행동당 한 번으로 병합
+            event_bus.set_coalescing(
+                Events.CHARACTER_BRV_CHANGE,
+                key=lambda data: id(data["character"]),
+                merge=merge_value_change
+            )
+
+        # 리플레이 기록 (start_combat의 record 인자로 전투별 지정 가능)
+        self.record_replay: bool = self.config.get("combat.record_replay", False)
+        self.recorder: Optional[Any] = None
+
         # 전투 상태
         self.state: CombatState = CombatState.NOT_STARTED
         self.turn_count = 0
@@ -69,16 +89,23 @@ class CombatManager:
         self.on_turn_start: Optional[Callable[[Any], None]] = None
         self.on_action_complete: Optional[Callable[[Any, Dict], None]] = None
 
-    def start_combat(self, allies: List[Any], enemies: List[Any]) -> None:
+    def start_combat(self, allies: List[Any], enemies: List[Any], record: Optional[bool] = None) -> None:
         """
         전투 시작
 
         Args:
             allies: 아군 리스트
             enemies: 적군 리스트
+            record: 리플레이 저널 기록 여부 (None이면 combat.record_replay 설정)
         """
         self.logger.info("전투 시작!")
 
+        # 리플레이 기록 시작 (BRV 초기화 전 상태 스냅샷, 전투 난수 스트림 재시드)
+        self.recorder = None
+        if self.record_replay if record is None else record:
+            from src.combat.combat_replay import CombatRecorder
+            self.recorder = CombatRecorder(allies, enemies)
+
         # 전투원 설정
         self.allies = allies
         self.enemies = enemies
@@ -94,6 +121,8 @@ class CombatManager:
             self.atb.register_combatant(enemy)
             self.brave.initialize_brv(enemy)
 
+        self.scheduler.reset()
+
         # 캐스팅 시스템 초기화
         from src.combat.casting_system import get_casting_system
         casting_system = get_casting_system()
@@ -129,6 +158,31 @@ class CombatManager:
         # 승리/패배 판정
         self._check_battle_end()
 
+    def advance_to_next_action(self) -> List[Any]:
+        """
+        이벤트 기반 진행 - 다음 행동 가능 시각까지 ATB 시간을 건너뜀
+
+        프레임 단위 update() 대신 사용하며, 캐스팅 완료와 승리/패배 판정도 처리합니다.
+
+        Returns:
+            행동 가능한 전투원 리스트 (진행할 이벤트가 없으면 빈 리스트)
+        """
+        if self.state not in [CombatState.IN_PROGRESS, CombatState.PLAYER_TURN, CombatState.ENEMY_TURN]:
+            return []
+
+        self.scheduler.advance_to_next()
+
+        # 완료된 캐스팅 처리
+        self._process_completed_casts()
+
+        # 승리/패배 판정
+        self._check_battle_end()
+
+        if self.state not in [CombatState.IN_PROGRESS, CombatState.PLAYER_TURN, CombatState.ENEMY_TURN]:
+            return []
+
+        return self.atb.get_action_order()
+
     def execute_action(
         self,
         actor: Any,
@@ -153,43 +207,54 @@ class CombatManager:
         self.current_actor = actor
         result = {}
 
-        # 턴 시작 처리
-        # 1. BREAK 상태 해제
-        if self.brave.is_broken(actor):
-            self.logger.debug(f"{actor.name}의 BREAK 상태 해제")
-            self.brave.clear_break_state(actor)
+        if self.defer_events:
+            event_bus.begin_deferred()
+            self._events_deferred = True
 
-        # 2. INT BRV 회복
-        int_brv_recovered = self.brave.recover_int_brv(actor)
-        if int_brv_recovered > 0:
-            self.logger.debug(f"{actor.name}이(가) INT BRV {int_brv_recovered} 회복")
-
-        self.logger.debug(
-            f"행동 실행: {actor.name} → {action_type.value}",
-            {"target": getattr(target, "name", None) if target else None}
-        )
+        try:
+            # 턴 시작 처리
+            # 1. BREAK 상태 해제
+            if self.brave.is_broken(actor):
+                self.logger.debug(f"{actor.name}의 BREAK 상태 해제")
+                self.brave.clear_break_state(actor)
+
+            # 2. INT BRV 회복
+            int_brv_recovered = self.brave.recover_int_brv(actor)
+            if int_brv_recovered > 0:
+                self.logger.debug(f"{actor.name}이(가) INT BRV {int_brv_recovered} 회복")
+
+            self.logger.debug(
+                f"행동 실행: {actor.name} → {action_type.value}",
+                {"target": getattr(target, "name", None) if target else None}
+            )
 
-        # 행동 타입별 처리
-        if action_type == ActionType.BRV_ATTACK:
-            result = self._execute_brv_attack(actor, target, skill, **kwargs)
-        elif action_type == ActionType.HP_ATTACK:
-            result = self._execute_hp_attack(actor, target, skill, **kwargs)
-        elif action_type == ActionType.BRV_HP_ATTACK:
-            result = self._execute_brv_hp_attack(actor, target, skill, **kwargs)
-        elif action_type == ActionType.SKILL:
-            result = self._execute_skill(actor, target, skill, **kwargs)
-        elif action_type == ActionType.ITEM:
-            result = self._execute_item(actor, target, **kwargs)
-        elif action_type == ActionType.DEFEND:
-            result = self._execute_defend(actor, **kwargs)
-        elif action_type == ActionType.FLEE:
-            result = self._execute_flee(actor, **kwargs)
-
-        # ATB 소비
-        self.atb.consume_atb(actor)
-
-        # 턴 종료 처리
-        self._on_turn_end(actor)
+            # 행동 타입별 처리
+            if action_type == ActionType.BRV_ATTACK:
+                result = self._execute_brv_attack(actor, target, skill, **kwargs)
+            elif action_type == ActionType.HP_ATTACK:
+                result = self._execute_hp_attack(actor, target, skill, **kwargs)
+            elif action_type == ActionType.BRV_HP_ATTACK:
+                result = self._execute_brv_hp_attack(actor, target, skill, **kwargs)
+            elif action_type == ActionType.SKILL:
+                result = self._execute_skill(actor, target, skill, **kwargs)
+            elif action_type == ActionType.ITEM:
+                result = self._execute_item(actor, target, **kwargs)
+            elif action_type == ActionType.DEFEND:
+                result = self._execute_defend(actor, **kwargs)
+            elif action_type == ActionType.FLEE:
+                result = self._execute_flee(actor, **kwargs)
+
+            # ATB 소비
+            self.atb.consume_atb(actor)
+
+            # 턴 종료 처리
+            self._on_turn_end(actor)
+        finally:
+            # 예외로 턴 종료 처리에 도달하지 못해도 쌓인 이벤트는 전달
+            self._flush_deferred_events()
+
+        if self.recorder is not None:
+            self.recorder.record_action(actor, action_type.value, target, skill, kwargs)
 
         # 콜백 호출
         if self.on_action_complete:
@@ -710,8 +775,7 @@ class CombatManager:
         """도망"""
         # 도망 확률 계산
         flee_chance = 0.5  # 기본 50%
-        import random
-        if random.random() < flee_chance:
+        if get_rng().stream(RNGStreams.COMBAT).random() < flee_chance:
             self.state = CombatState.FLED
             return {
                 "action": "flee",
@@ -733,6 +797,9 @@ class CombatManager:
         # 턴 종료 시에는 BRV 회복하지 않음 (HP 공격 후 BRV가 0인 상태 유지)
         # BRV 회복은 다음 턴 시작 시에 처리됨
 
+        # 행동 중 쌓인 이벤트 전달 (지연 모드)
+        self._flush_deferred_events()
+
         # 이벤트 발행
         event_bus.publish(Events.COMBAT_TURN_END, {
             "actor": actor,
@@ -741,6 +808,12 @@ class CombatManager:
 
         self.turn_count += 1
 
+    def _flush_deferred_events(self) -> None:
+        """지연 모드로 쌓인 이벤트 전달 (한 행동에 한 번만 동작)"""
+        if self._events_deferred:
+            self._events_deferred = False
+            event_bus.end_deferred()
+
     def _process_completed_casts(self) -> None:
         """완료된 캐스팅 처리"""
         from src.combat.casting_system import get_casting_system
@@ -789,6 +862,9 @@ class CombatManager:
                     "result": result
                 })
 
+            if self.recorder is not None:
+                self.recorder.record_cast(caster, target, skill)
+
     def _check_battle_end(self) -> None:
         """승리/패배 판정"""
         # 모든 적이 죽었는가?
@@ -820,6 +896,9 @@ class CombatManager:
 
         self.logger.info(f"전투 종료: {state.value}")
 
+        if self.recorder is not None:
+            self.recorder.finish(state.value)
+
         # 이벤트 발행
         event_bus.publish(Events.COMBAT_END, {
             "state": state.value,
@@ -833,6 +912,11 @@ class CombatManager:
         # 시스템 정리
         self.atb.clear()
 
+    @property
+    def journal(self) -> Optional[Any]:
+        """현재(또는 마지막) 전투의 리플레이 저널 (기록하지 않았으면 None)"""
+        return self.recorder.journal if self.recorder is not None else None
+
     def get_action_order(self) -> List[Any]:
         """
         현재 행동 순서 가져오기
@@ -0,0 +1,534 @@
+"""
+Combat Replay - 결정적 전투 기록/재생
+
+CombatManager가 전투 시드, 시작 시점 전투원 스냅샷, 행동별 (행동자, 행동 타입, 대상, 스킬 ID)
+기록을 작은 저널로 남기고, ReplayPlayer가 이를 헤드리스로 최대 속도 또는 한 단계씩 재실행하며
+HP/BRV 체크섬을 검증합니다. 버그 리포트 첨부나 회귀 테스트 코퍼스용
+
+    manager.start_combat(allies, enemies, record=True)
+    ...
+    manager.journal.save("bug_1234.replay.json.gz")
+
+    result = ReplayPlayer(CombatJournal.load("bug_1234.replay.json.gz")).run()
+    assert result.ok, result.first_mismatch
+"""
+
+import gzip
+import json
+import logging
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from src.core.logger import get_logger, Loggers
+from src.core.rng import get_rng, RNGStreams
+
+
+logger = get_logger(Loggers.COMBAT)
+
+# 저널 형식 버전
+REPLAY_FORMAT = 1
+
+# 전투 중 결과에 영향을 주는 난수 스트림 (저널 시드로 다시 시작)
+REPLAY_STREAMS = (RNGStreams.COMBAT, RNGStreams.AI)
+
+# 캐스팅 완료 기록의 행동 이름 (ActionType 값과 겹치지 않음)
+CAST_ACTION = "cast"
+
+# 행동 기록: [행동자, 행동, 대상, 스킬 ID, 추가 인자, 행동 후 체크섬]
+ACTOR, ACTION, TARGET, SKILL, EXTRA, CHECKSUM = range(6)
+
+# SimpleEnemy 스냅샷 필드 (템플릿 값 위에 덮어씀)
+_ENEMY_FIELDS = (
+    "name", "level", "max_hp", "current_hp", "max_mp", "current_mp",
+    "physical_attack", "physical_defense", "magic_attack", "magic_defense",
+    "speed", "luck", "accuracy", "evasion", "max_brv", "current_brv",
+)
+
+_ACTIVE_STATES = ("in_progress", "player_turn", "enemy_turn")
+
+
+class ReplayError(Exception):
+    """리플레이 저널 오류 (형식 불일치, 복원 불가 전투원 등)"""
+    pass
+
+
+def state_checksum(combatants: Iterable[Any]) -> int:
+    """전투원 순서대로 (HP, BRV)를 묶은 CRC32 체크섬"""
+    data = ";".join(
+        f"{getattr(c, 'current_hp', 0)},{getattr(c, 'current_brv', 0)}" for c in combatants
+    )
+    return zlib.crc32(data.encode("ascii"))
+
+
+def snapshot_combatant(combatant: Any) -> Dict[str, Any]:
+    """
+    전투 시작 시점 전투원 스냅샷
+
+    Character는 세이브와 같은 직렬화, SimpleEnemy는 템플릿 ID + 스탯을 기록합니다.
+    그 외 객체는 이름과 HP/BRV만 기록하며 재생 시 전투원을 직접 넘겨야 합니다.
+    """
+    if hasattr(combatant, "stat_manager"):
+        from src.persistence.save_system import serialize_party_member
+
+        return {"kind": "character", **serialize_party_member(combatant)}
+
+    from src.world.enemy_generator import ENEMY_TEMPLATES
+
+    enemy_id = getattr(combatant, "enemy_id", None)
+    if enemy_id in ENEMY_TEMPLATES:
+        return {
+            "kind": "enemy",
+            "enemy_id": enemy_id,
+            "stats": {name: getattr(combatant, name) for name in _ENEMY_FIELDS if hasattr(combatant, name)},
+            "skills": [skill.skill_id for skill in getattr(combatant, "skills", []) if hasattr(skill, "skill_id")],
+        }
+
+    return {
+        "kind": "custom",
+        "name": getattr(combatant, "name", "Unknown"),
+        "current_hp": getattr(combatant, "current_hp", 0),
+        "current_brv": getattr(combatant, "current_brv", 0),
+    }
+
+
+def restore_combatant(data: Dict[str, Any]) -> Any:
+    """snapshot_combatant() 결과로 전투원 복원"""
+    kind = data.get("kind")
+
+    if kind == "character":
+        from src.persistence.save_system import deserialize_party_member
+
+        return deserialize_party_member(data)
+
+    if kind == "enemy":
+        from src.combat.enemy_skills import EnemySkillDatabase
+        from src.world.enemy_generator import ENEMY_TEMPLATES, SimpleEnemy
+
+        enemy = SimpleEnemy(ENEMY_TEMPLATES[data["enemy_id"]])
+        for name, value in data.get("stats", {}).items():
+            setattr(enemy, name, value)
+        enemy.is_alive = enemy.current_hp > 0
+        skills = (EnemySkillDatabase.get_skill(skill_id) for skill_id in data.get("skills", []))
+        enemy.skills = [skill for skill in skills if skill is not None]
+        return enemy
+
+    raise ReplayError(
+        f"복원할 수 없는 전투원입니다: {data.get('name')} ({kind}). "
+        "ReplayPlayer에 combatants를 직접 전달하세요."
+    )
+
+
+@dataclass
+class CombatJournal:
+    """
+    전투 저널
+
+    actions의 각 원소는 [행동자, 행동, 대상, 스킬 ID, 추가 인자, 체크섬] 리스트입니다.
+    행동자/대상은 allies + enemies 순서의 인덱스(대상이 여럿이면 인덱스 리스트),
+    행동은 ActionType 값 또는 캐스팅 완료를 뜻하는 "cast"입니다.
+    """
+    seed: int
+    allies: List[Dict[str, Any]]
+    enemies: List[Dict[str, Any]]
+    initial_checksum: int = 0
+    actions: List[List[Any]] = field(default_factory=list)
+    final_state: Optional[str] = None
+    final_checksum: Optional[int] = None
+    version: int = REPLAY_FORMAT
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CombatJournal":
+        """딕셔너리에서 복원"""
+        version = data.get("version", REPLAY_FORMAT)
+        if version != REPLAY_FORMAT:
+            raise ReplayError(f"지원하지 않는 리플레이 형식 버전: {version}")
+        return cls(**data)
+
+    def to_json(self) -> str:
+        """공백 없는 JSON 문자열"""
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text: str) -> "CombatJournal":
+        """JSON 문자열에서 복원"""
+        return cls.from_dict(json.loads(text))
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """파일로 저장 (.gz 확장자면 gzip 압축)"""
+        path = Path(path)
+        data = self.to_json().encode("utf-8")
+        if path.suffix == ".gz":
+            data = gzip.compress(data)
+        path.write_bytes(data)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "CombatJournal":
+        """파일에서 불러오기"""
+        path = Path(path)
+        data = path.read_bytes()
+        if path.suffix == ".gz":
+            data = gzip.decompress(data)
+        return cls.from_json(data.decode("utf-8"))
+
+
+class CombatRecorder:
+    """
+    전투 기록기
+
+    CombatManager.start_combat(record=True)에서 생성됩니다. 전투 결과에 영향을 주는
+    난수 스트림을 저널 시드로 다시 시작하므로 같은 저널이면 같은 난수열이 재현됩니다.
+    """
+
+    def __init__(self, allies: Sequence[Any], enemies: Sequence[Any], seed: Optional[int] = None) -> None:
+        """
+        Args:
+            allies: 아군 리스트
+            enemies: 적군 리스트
+            seed: 전투 시드 (None이면 전투 스트림에서 뽑음, 런 시드가 같으면 같은 값)
+        """
+        self.combatants = list(allies) + list(enemies)
+        self._indices = {id(c): i for i, c in enumerate(self.combatants)}
+
+        if seed is None:
+            seed = get_rng().stream(RNGStreams.COMBAT).getrandbits(63)
+        get_rng().reseed_streams(seed, *REPLAY_STREAMS)
+
+        self.journal = CombatJournal(
+            seed=seed,
+            allies=[snapshot_combatant(c) for c in allies],
+            enemies=[snapshot_combatant(c) for c in enemies],
+            initial_checksum=state_checksum(self.combatants),
+        )
+
+    def _index(self, target: Any) -> Any:
+        """전투원 -> 인덱스 (리스트면 인덱스 리스트, 전투원이 아니면 None)"""
+        if target is None:
+            return None
+        if isinstance(target, (list, tuple)):
+            return [self._indices.get(id(t)) for t in target]
+        return self._indices.get(id(target))
+
+    def _extra(self, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """execute_action 추가 인자 중 저장 가능한 것 (아이템은 직렬화)"""
+        extra = {}
+        for key, value in kwargs.items():
+            if key == "item" and value is not None:
+                from src.persistence.save_system import serialize_item
+
+                extra["item"] = serialize_item(value)
+            elif value is None or isinstance(value, (bool, int, float, str)):
+                extra[key] = value
+            else:
+                logger.debug(f"리플레이에 기록할 수 없는 인자 생략: {key}")
+        return extra or None
+
+    def record_action(self, actor: Any, action: str, target: Any, skill: Any, kwargs: Dict[str, Any]) -> None:
+        """행동 1회 기록 (행동 처리 후 호출)"""
+        self.journal.actions.append([
+            self._indices.get(id(actor)),
+            action,
+            self._index(target),
+            getattr(skill, "skill_id", None),
+            self._extra(kwargs),
+            state_checksum(self.combatants),
+        ])
+
+    def record_cast(self, caster: Any, target: Any, skill: Any) -> None:
+        """캐스팅 완료로 발동한 스킬 기록"""
+        self.record_action(caster, CAST_ACTION, target, skill, {})
+
+    def finish(self, state: str) -> None:
+        """전투 종료 기록"""
+        self.journal.final_state = state
+        self.journal.final_checksum = state_checksum(self.combatants)
+
+
+@dataclass
+class ReplayStep:
+    """재생 1단계 결과"""
+    index: int
+    action: str
+    actor: Optional[str]
+    expected_checksum: int
+    actual_checksum: int
+    result: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def matches(self) -> bool:
+        """기록된 체크섬과 일치 여부"""
+        return self.expected_checksum == self.actual_checksum
+
+
+@dataclass
+class ReplayResult:
+    """리플레이 검증 결과"""
+    ok: bool
+    actions_replayed: int
+    total_actions: int
+    first_mismatch: Optional[int] = None  # 체크섬이 처음 달라진 행동 인덱스 (-1이면 시작 상태)
+    expected_state: Optional[str] = None
+    final_state: Optional[str] = None
+    final_checksum: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return asdict(self)
+
+
+class ReplayPlayer:
+    """
+    리플레이 재생기
+
+    ATB 진행 없이 기록된 순서대로 행동을 바로 실행합니다 (적 AI도 다시 돌리지 않음).
+    step()으로 한 단계씩, run()으로 끝까지 재생합니다.
+    """
+
+    def __init__(
+        self,
+        journal: CombatJournal,
+        combatants: Optional[Tuple[List[Any], List[Any]]] = None,
+        quiet: bool = True
+    ) -> None:
+        """
+        Args:
+            journal: 전투 저널
+            combatants: (아군, 적군) 리스트 (None이면 저널 스냅샷에서 복원)
+            quiet: 재생 중 로그 출력 억제
+        """
+        self.journal = journal
+        self.quiet = quiet
+        self._combatants = combatants
+        self.manager: Optional[Any] = None
+        self.combatants: List[Any] = []
+        self.position = 0
+        self.first_mismatch: Optional[int] = None
+
+    @property
+    def started(self) -> bool:
+        """start() 호출 여부"""
+        return self.manager is not None
+
+    @property
+    def finished(self) -> bool:
+        """모든 행동을 재생했는지 여부"""
+        return self.started and self.position >= len(self.journal.actions)
+
+    def start(self) -> None:
+        """전투원 복원, 난수 스트림 재시드, 전투 시작"""
+        from src.combat.combat_manager import CombatManager
+
+        with self._quiet():
+            if self._combatants is not None:
+                allies, enemies = (list(group) for group in self._combatants)
+            else:
+                allies = [restore_combatant(data) for data in self.journal.allies]
+                enemies = [restore_combatant(data) for data in self.journal.enemies]
+
+            self.combatants = allies + enemies
+            if state_checksum(self.combatants) != self.journal.initial_checksum:
+                self.first_mismatch = -1
+
+            get_rng().reseed_streams(self.journal.seed, *REPLAY_STREAMS)
+            self.manager = CombatManager()
+            self.manager.start_combat(allies, enemies, record=False)
+            self.position = 0
+
+    def step(self) -> ReplayStep:
+        """
+        다음 행동 1개 재생
+
+        Returns:
+            ReplayStep (체크섬 비교 포함)
+        """
+        if not self.started:
+            self.start()
+        if self.finished:
+            raise ReplayError("더 이상 재생할 행동이 없습니다")
+
+        entry = self.journal.actions[self.position]
+        with self._quiet():
+            result = self._execute(entry)
+            self.manager._check_battle_end()
+
+        actor = self.combatants[entry[ACTOR]] if entry[ACTOR] is not None else None
+        step = ReplayStep(
+            index=self.position,
+            action=entry[ACTION],
+            actor=getattr(actor, "name", None),
+            expected_checksum=entry[CHECKSUM],
+            actual_checksum=state_checksum(self.combatants),
+            result=result or {},
+        )
+        if not step.matches and self.first_mismatch is None:
+            self.first_mismatch = step.index
+
+        self.position += 1
+        if self.finished:
+            self._release()
+        return step
+
+    def run(self, stop_on_mismatch: bool = False) -> ReplayResult:
+        """
+        남은 행동을 끝까지 재생하고 검증
+
+        Args:
+            stop_on_mismatch: 체크섬이 처음 달라지면 바로 중단
+        """
+        if not self.started:
+            self.start()
+
+        while not self.finished:
+            if stop_on_mismatch and self.first_mismatch is not None:
+                break
+            self.step()
+
+        self._release()
+        return self.result()
+
+    def _release(self) -> None:
+        """전투가 끝나지 않은 채 재생을 마친 경우 (시간 초과 기록, 중단) _end_combat 대신 ATB 직접 정리"""
+        if self.manager.state.value in _ACTIVE_STATES:
+            self.manager.atb.clear()
+
+    def result(self) -> ReplayResult:
+        """현재까지의 검증 결과"""
+        state = self.manager.state.value if self.manager is not None else None
+        final_state = None if state in _ACTIVE_STATES else state
+        checksum = state_checksum(self.combatants)
+
+        ok = self.first_mismatch is None and self.finished
+        if ok and self.journal.final_checksum is not None:
+            ok = checksum == self.journal.final_checksum and final_state == self.journal.final_state
+
+        return ReplayResult(
+            ok=ok,
+            actions_replayed=self.position,
+            total_actions=len(self.journal.actions),
+            first_mismatch=self.first_mismatch,
+            expected_state=self.journal.final_state,
+            final_state=final_state,
+            final_checksum=checksum,
+        )
+
+    def _resolve(self, index: Any) -> Any:
+        """인덱스 -> 전투원 (리스트면 전투원 리스트)"""
+        if index is None:
+            return None
+        if isinstance(index, list):
+            return [self.combatants[i] for i in index if i is not None]
+        return self.combatants[index]
+
+    def _resolve_skill(self, actor: Any, skill_id: Optional[str]) -> Any:
+        """스킬 ID -> 스킬 (행동자 보유 스킬, 적 스킬 DB, 플레이어 스킬 순)"""
+        if skill_id is None:
+            return None
+
+        for skill in getattr(actor, "skills", None) or []:
+            if getattr(skill, "skill_id", None) == skill_id:
+                return skill
+
+        from src.combat.enemy_skills import EnemySkillDatabase
+
+        skill = EnemySkillDatabase.get_skill(skill_id)
+        if skill is None:
+            from src.character.skills.skill_manager import get_skill_manager
+
+            skill = get_skill_manager().get_skill(skill_id)
+        if skill is None:
+            raise ReplayError(f"스킬을 찾을 수 없습니다: {skill_id}")
+        return skill
+
+    def _execute(self, entry: List[Any]) -> Optional[Dict[str, Any]]:
+        """저널 기록 1개 실행"""
+        from src.combat.casting_system import get_casting_system
+        from src.combat.combat_manager import ActionType
+
+        actor = self._resolve(entry[ACTOR])
+        target = self._resolve(entry[TARGET])
+
+        if entry[ACTION] == CAST_ACTION:
+            # ATB를 진행하지 않으므로 기록된 시점에 캐스팅을 바로 완료시킴
+            casting_system = get_casting_system()
+            cast_info = casting_system.get_cast_info(actor)
+            if cast_info is None:
+                raise ReplayError(f"{getattr(actor, 'name', actor)}의 캐스팅 정보가 없습니다 (행동 {self.position})")
+            casting_system.update(actor, max(0, cast_info.required_atb - cast_info.accumulated_atb))
+            self.manager._process_completed_casts()
+            return None
+
+        kwargs = dict(entry[EXTRA] or {})
+        if "item" in kwargs:
+            from src.persistence.save_system import deserialize_item
+
+            kwargs["item"] = deserialize_item(kwargs["item"])
+
+        return self.manager.execute_action(
+            actor,
+            ActionType(entry[ACTION]),
+            target=target,
+            skill=self._resolve_skill(actor, entry[SKILL]),
+            **kwargs
+        )
+
+    def _quiet(self):
+        return _quiet_logging(self.quiet)
+
+
+@contextmanager
+def _quiet_logging(enabled: bool) -> Iterator[None]:
+    """enabled면 블록 안에서 로그 출력 억제"""
+    if not enabled:
+        yield
+        return
+
+    previous = logging.root.manager.disable
+    logging.disable(logging.CRITICAL)
+    try:
+        yield
+    finally:
+        logging.disable(previous)
+
+
+def replay(journal: Union[CombatJournal, str, Path], **kwargs) -> ReplayResult:
+    """
+    저널(또는 저널 파일)을 끝까지 재생하고 검증 (편의 함수)
+
+    Args:
+        journal: CombatJournal 또는 파일 경로
+        **kwargs: ReplayPlayer 옵션
+    """
+    if not isinstance(journal, CombatJournal):
+        journal = CombatJournal.load(journal)
+    return ReplayPlayer(journal, **kwargs).run()
+
+
+def run_corpus(paths: Iterable[Union[str, Path]]) -> Dict[str, ReplayResult]:
+    """
+    리플레이 코퍼스 회귀 검사
+
+    Args:
+        paths: 저널 파일 경로 (디렉터리면 안의 *.replay.json, *.replay.json.gz 전체)
+
+    Returns:
+        {파일 경로: ReplayResult}
+    """
+    from src.audio import use_null_audio
+
+    use_null_audio()
+
+    files: List[Path] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.glob("*.replay.json")) + sorted(path.glob("*.replay.json.gz")))
+        else:
+            files.append(path)
+
+    return {str(path): replay(path) for path in files}
@@ -0,0 +1,351 @@
+"""
+Combat Simulator - 헤드리스 전투 시뮬레이터
+
+tcod, pygame 오디오, CombatUI 없이 CombatManager 전투를 끝까지 실행합니다.
+밸런스 조정용 대량 시뮬레이션 (프로세스 풀 분산 실행) 지원
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional, Callable, Tuple
+
+from src.core.config import get_config, initialize_config
+from src.core.rng import set_run_seed
+from src.combat.combat_manager import CombatManager, CombatState, ActionType
+
+
+# 행동 결정 함수: (manager, actor) -> (행동 타입, 대상, 스킬)
+ActionPolicy = Callable[[CombatManager, Any], Tuple[ActionType, Optional[Any], Optional[Any]]]
+
+# 전투원 생성 함수 (프로세스 풀 사용 시 모듈 최상위 함수여야 함)
+CombatantFactory = Callable[[], List[Any]]
+
+_ACTIVE_STATES = (CombatState.IN_PROGRESS, CombatState.PLAYER_TURN, CombatState.ENEMY_TURN)
+
+_WINNER_BY_STATE = {
+    CombatState.VICTORY: "allies",
+    CombatState.DEFEAT: "enemies",
+    CombatState.FLED: "fled",
+}
+
+
+@dataclass
+class SimulationResult:
+    """전투 시뮬레이션 결과 (프로세스 간 전달 가능한 간결한 레코드)"""
+    winner: str  # allies, enemies, fled, timeout
+    turns: int
+    frames: int
+    ally_brv_damage: int = 0
+    ally_hp_damage: int = 0
+    enemy_brv_damage: int = 0
+    enemy_hp_damage: int = 0
+    breaks: int = 0
+    allies_alive: int = 0
+    enemies_alive: int = 0
+    seed: Optional[int] = None
+    journal: Optional[Dict[str, Any]] = None  # record=True일 때 리플레이 저널
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return asdict(self)
+
+
+def default_ally_policy(
+    manager: CombatManager,
+    actor: Any
+) -> Tuple[ActionType, Optional[Any], Optional[Any]]:
+    """
+    기본 아군 행동 정책
+
+    HP가 가장 낮은 적을 노리고, BREAK 상태이거나 BRV가 MAX BRV의 절반 이상이면
+    HP 공격, 아니면 BRV 공격을 선택합니다.
+    """
+    targets = manager.get_valid_targets(actor, ActionType.BRV_ATTACK)
+    if not targets:
+        return ActionType.DEFEND, None, None
+
+    target = min(targets, key=lambda t: getattr(t, "current_hp", 0))
+
+    current_brv = getattr(actor, "current_brv", 0)
+    max_brv = getattr(actor, "max_brv", 0) or 1
+    if current_brv > 0 and (manager.brave.is_broken(target) or current_brv >= max_brv * 0.5):
+        return ActionType.HP_ATTACK, target, None
+
+    return ActionType.BRV_ATTACK, target, None
+
+
+class CombatSimulator:
+    """
+    헤드리스 전투 시뮬레이터
+
+    ATB 루프를 직접 구동하고 아군은 정책 함수, 적군은 execute_enemy_turn(AI)으로
+    행동시켜 전투를 종료까지 진행합니다.
+    """
+
+    def __init__(
+        self,
+        ally_policy: Optional[ActionPolicy] = None,
+        enemy_policy: Optional[ActionPolicy] = None,
+        max_turns: int = 500,
+        max_frames: int = 200000,
+        delta_time: float = 1.0,
+        event_driven: bool = True,
+        quiet: bool = True,
+        record: bool = False
+    ) -> None:
+        """
+        Args:
+            ally_policy: 아군 행동 결정 함수 (None이면 default_ally_policy)
+            enemy_policy: 적군 행동 결정 함수 (None이면 execute_enemy_turn의 AI 사용)
+            max_turns: 최대 행동 수 (초과 시 timeout)
+            max_frames: 최대 ATB 프레임(이벤트 기반이면 스케줄러 이벤트) 수 (초과 시 timeout)
+            delta_time: ATB 업데이트 1회당 경과 시간 (프레임 기반 모드)
+            event_driven: True면 ATBScheduler로 다음 행동자까지 바로 건너뜀
+            quiet: 시뮬레이션 중 로그 출력 억제
+            record: 전투마다 리플레이 저널 기록 (SimulationResult.journal)
+        """
+        self.ally_policy = ally_policy or default_ally_policy
+        self.enemy_policy = enemy_policy
+        self.max_turns = max_turns
+        self.max_frames = max_frames
+        self.delta_time = delta_time
+        self.event_driven = event_driven
+        self.quiet = quiet
+        self.record = record
+
+    def run(
+        self,
+        allies: List[Any],
+        enemies: List[Any],
+        seed: Optional[int] = None
+    ) -> SimulationResult:
+        """
+        전투 1회 실행
+
+        Args:
+            allies: 아군 리스트
+            enemies: 적군 리스트
+            seed: 런 시드 (None이면 시드 고정 안 함)
+
+        Returns:
+            SimulationResult
+        """
+        if seed is not None:
+            set_run_seed(seed)
+
+        previous_disable = logging.root.manager.disable
+        if self.quiet:
+            logging.disable(logging.CRITICAL)
+
+        try:
+            return self._run(allies, enemies, seed)
+        finally:
+            if self.quiet:
+                logging.disable(previous_disable)
+
+    def _run(self, allies: List[Any], enemies: List[Any], seed: Optional[int]) -> SimulationResult:
+        """전투 루프"""
+        manager = CombatManager()
+        manager.start_combat(allies, enemies, record=self.record)
+
+        result = SimulationResult(winner="timeout", turns=0, frames=0, seed=seed)
+
+        while manager.state in _ACTIVE_STATES:
+            if result.turns >= self.max_turns or result.frames >= self.max_frames:
+                break
+
+            if self.event_driven:
+                ready = manager.advance_to_next_action()
+            else:
+                manager.update(self.delta_time)
+                ready = manager.get_action_order()
+            result.frames += 1
+
+            if manager.state not in _ACTIVE_STATES:
+                break
+
+            if not ready:
+                if self.event_driven and manager.scheduler.stalled:
+                    # 더 이상 진행할 수 없음 (전원 행동 불가)
+                    break
+                continue
+
+            actor = ready[0]
+            is_ally = actor in manager.allies
+            policy = self.ally_policy if is_ally else self.enemy_policy
+
+            if policy is not None:
+                action_type, target, skill = policy(manager, actor)
+                action_result = manager.execute_action(actor, action_type, target=target, skill=skill)
+            else:
+                action_result = manager.execute_enemy_turn(actor)
+
+            self._record(result, action_result, is_ally)
+
+            result.turns += 1
+
+        if manager.state in _ACTIVE_STATES:
+            # 시간 초과 - _end_combat이 호출되지 않았으므로 ATB 직접 정리
+            manager.atb.clear()
+        else:
+            result.winner = _WINNER_BY_STATE.get(manager.state, manager.state.value)
+
+        result.allies_alive = sum(1 for a in allies if not manager._is_defeated(a))
+        result.enemies_alive = sum(1 for e in enemies if not manager._is_defeated(e))
+        if manager.journal is not None:
+            result.journal = manager.journal.to_dict()
+        return result
+
+    def _record(self, result: SimulationResult, action_result: Optional[Dict[str, Any]], is_ally: bool) -> None:
+        """행동 결과를 데미지 합계에 반영"""
+        if not action_result:
+            return
+
+        brv_damage = action_result.get("damage", 0) + action_result.get("brv_damage", 0)
+        hp_damage = action_result.get("hp_damage", 0)
+
+        # 적 스킬은 대상별 결과를 가짐
+        for target_result in action_result.get("targets", []):
+            if isinstance(target_result, dict):
+                brv_damage += target_result.get("brv_damage", 0)
+                hp_damage += target_result.get("hp_damage", 0)
+
+        if action_result.get("is_break") or action_result.get("brv_is_break"):
+            result.breaks += 1
+
+        if is_ally:
+            result.ally_brv_damage += brv_damage
+            result.ally_hp_damage += hp_damage
+        else:
+            result.enemy_brv_damage += brv_damage
+            result.enemy_hp_damage += hp_damage
+
+
+def simulate_battle(
+    allies: List[Any],
+    enemies: List[Any],
+    seed: Optional[int] = None,
+    **kwargs
+) -> SimulationResult:
+    """
+    전투 1회 시뮬레이션 (편의 함수)
+
+    Args:
+        allies: 아군 리스트
+        enemies: 적군 리스트
+        seed: 난수 시드
+        **kwargs: CombatSimulator 옵션
+
+    Returns:
+        SimulationResult
+    """
+    return CombatSimulator(**kwargs).run(allies, enemies, seed)
+
+
+def _init_worker(config_path: str) -> None:
+    """프로세스 풀 워커 초기화 (설정 로드 + 무음 오디오)"""
+    from src.audio import use_null_audio
+
+    initialize_config(config_path)
+    use_null_audio()
+
+
+def _run_chunk(
+    allies_factory: CombatantFactory,
+    enemies_factory: CombatantFactory,
+    seeds: List[Optional[int]],
+    options: Dict[str, Any]
+) -> List[SimulationResult]:
+    """워커에서 여러 전투를 연속 실행"""
+    simulator = CombatSimulator(**options)
+
+    # 전투원 생성 로그도 억제
+    previous_disable = logging.root.manager.disable
+    if simulator.quiet:
+        logging.disable(logging.CRITICAL)
+
+    try:
+        return [simulator.run(allies_factory(), enemies_factory(), seed) for seed in seeds]
+    finally:
+        if simulator.quiet:
+            logging.disable(previous_disable)
+
+
+def run_batch(
+    allies_factory: CombatantFactory,
+    enemies_factory: CombatantFactory,
+    battles: int,
+    workers: int = 1,
+    base_seed: Optional[int] = None,
+    chunk_size: int = 50,
+    **kwargs
+) -> List[SimulationResult]:
+    """
+    대량 전투 시뮬레이션
+
+    전투마다 factory로 새 전투원을 생성합니다. workers > 1이면 프로세스 풀로 분산하며,
+    이 경우 factory와 행동 정책 함수는 pickle 가능한 모듈 최상위 함수여야 합니다.
+
+    Args:
+        allies_factory: 아군 리스트 생성 함수
+        enemies_factory: 적군 리스트 생성 함수
+        battles: 전투 횟수
+        workers: 워커 프로세스 수 (1이면 현재 프로세스에서 실행)
+        base_seed: 기준 시드 (전투 i의 시드 = base_seed + i)
+        chunk_size: 워커 1회 작업당 전투 수
+        **kwargs: CombatSimulator 옵션
+
+    Returns:
+        SimulationResult 리스트 (전투 순서 유지)
+    """
+    seeds = [base_seed + i if base_seed is not None else None for i in range(battles)]
+
+    if workers <= 1:
+        from src.audio import use_null_audio
+
+        use_null_audio()
+        return _run_chunk(allies_factory, enemies_factory, seeds, kwargs)
+
+    config_path = str(get_config().config_path)
+    chunks = [seeds[i:i + chunk_size] for i in range(0, battles, chunk_size)]
+
+    results: List[SimulationResult] = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config_path,)) as pool:
+        futures = [
+            pool.submit(_run_chunk, allies_factory, enemies_factory, chunk, kwargs)
+            for chunk in chunks
+        ]
+        for future in futures:
+            results.extend(future.result())
+
+    return results
+
+
+def summarize(results: List[SimulationResult]) -> Dict[str, Any]:
+    """
+    시뮬레이션 결과 요약
+
+    Args:
+        results: SimulationResult 리스트
+
+    Returns:
+        승률, 평균 턴 수, 평균 데미지 등
+    """
+    total = len(results)
+    if total == 0:
+        return {"battles": 0}
+
+    winners: Dict[str, int] = {}
+    for r in results:
+        winners[r.winner] = winners.get(r.winner, 0) + 1
+
+    return {
+        "battles": total,
+        "win_rate": winners.get("allies", 0) / total,
+        "winners": winners,
+        "avg_turns": sum(r.turns for r in results) / total,
+        "avg_ally_hp_damage": sum(r.ally_hp_damage for r in results) / total,
+        "avg_enemy_hp_damage": sum(r.enemy_hp_damage for r in results) / total,
+        "avg_breaks": sum(r.breaks for r in results) / total,
+    }
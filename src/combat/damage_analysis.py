@@ -0,0 +1,509 @@
+"""
+Damage Analysis - 몬테카를로 데미지 분포 분석기
+
+DamageCalculator의 BRV/HP 데미지 공식(명중 판정, 0.9~1.1 분산, 크리티컬,
+BREAK 보너스)을 NumPy 배열 연산으로 한 번에 수백만 회 샘플링합니다.
+config.yaml의 combat.damage 값 밸런스 조정용 (평균, 백분위, 처치 소요 행동 수)
+
+    python -m src.combat.damage_analysis --jobs warrior archmage --samples 20000
+"""
+
+from dataclasses import dataclass, asdict, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.core.config import get_config, ConfigSnapshot
+from src.core.rng import derive_seed, get_rng
+
+
+DEFAULT_PERCENTILES: Tuple[float, ...] = (5, 25, 50, 75, 95)
+
+# HP 공격 시점 (default_ally_policy와 같이 BRV가 MAX BRV의 절반 이상이면 HP 공격)
+HP_ATTACK_BRV_RATIO = 0.5
+
+ArrayLike = Union[float, np.ndarray]
+
+
+@dataclass(frozen=True)
+class StatVector:
+    """
+    전투원 스탯 벡터
+
+    각 필드는 길이 N의 배열이며, i번째 원소가 i번째 전투원의 스탯입니다.
+    """
+    names: Tuple[str, ...]
+    attack: np.ndarray
+    defense: np.ndarray
+    magic: np.ndarray
+    spirit: np.ndarray
+    accuracy: np.ndarray
+    evasion: np.ndarray
+    luck: np.ndarray
+    max_hp: np.ndarray
+    max_brv: np.ndarray
+    init_brv: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_combatants(cls, combatants: Sequence[Any]) -> "StatVector":
+        """
+        전투원 객체 목록에서 스탯 벡터 생성
+
+        스탯 속성명 탐색은 DamageCalculator와 동일합니다.
+        (Character: strength/defense/..., SimpleEnemy: physical_attack/...)
+        """
+        from src.combat.damage_calculator import get_damage_calculator
+
+        calc = get_damage_calculator()
+        rows = [
+            (
+                calc._get_attack_stat(c),
+                calc._get_defense_stat(c),
+                calc._get_magic_stat(c),
+                calc._get_spirit_stat(c),
+                calc._get_accuracy_stat(c),
+                calc._get_evasion_stat(c),
+                getattr(c, "luck", 5),
+                getattr(c, "max_hp", 1),
+                getattr(c, "max_brv", 0),
+                # SimpleEnemy는 init_brv 대신 시작 BRV를 current_brv로 가짐
+                getattr(c, "init_brv", getattr(c, "current_brv", 0)),
+            )
+            for c in combatants
+        ]
+        columns = np.array(rows, dtype=np.float64).reshape(len(rows), 10).T
+        names = tuple(getattr(c, "job_id", None) or getattr(c, "enemy_id", None) or c.name for c in combatants)
+        return cls(names, *columns)
+
+    def take(self, indices: np.ndarray) -> "StatVector":
+        """인덱스 배열로 전투원 선택 (대진 조합 구성용)"""
+        return StatVector(
+            tuple(self.names[i] for i in indices),
+            *(getattr(self, name)[indices] for name in _STAT_FIELDS)
+        )
+
+
+_STAT_FIELDS = (
+    "attack", "defense", "magic", "spirit", "accuracy", "evasion",
+    "luck", "max_hp", "max_brv", "init_brv",
+)
+
+
+@dataclass
+class DamageDistribution:
+    """데미지(또는 행동 수) 샘플 요약"""
+    mean: float
+    std: float
+    minimum: float
+    maximum: float
+    percentiles: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return asdict(self)
+
+
+@dataclass
+class MatchupResult:
+    """직업 vs 적 대진 분석 결과"""
+    attacker: str
+    defender: str
+    hit_rate: float
+    critical_rate: float
+    brv_damage: DamageDistribution
+    hp_damage: DamageDistribution
+    kill_rate: float  # max_actions 안에 처치한 비율
+    actions_to_kill: Optional[DamageDistribution]  # 처치한 샘플만 집계
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return asdict(self)
+
+
+def make_generator(seed: Optional[int] = None) -> np.random.Generator:
+    """
+    NumPy 난수 생성기
+
+    seed가 없으면 런 시드에서 분석 전용 시드를 파생합니다 (게임 스트림은 소비하지 않음).
+    """
+    if seed is None:
+        seed = derive_seed(get_rng().seed, "damage_analysis")
+    return np.random.default_rng(seed)
+
+
+def _column(values: np.ndarray) -> np.ndarray:
+    """(N,) 스탯 배열을 (N, 1)로 바꿔 샘플 축으로 브로드캐스트"""
+    return np.asarray(values, dtype=np.float64).reshape(-1, 1)
+
+
+def _critical_mask(
+    attacker: StatVector,
+    shape: Tuple[int, int],
+    rng: np.random.Generator,
+    snapshot: ConfigSnapshot
+) -> np.ndarray:
+    """크리티컬 판정 (기본 확률 + 행운/100)"""
+    chance = snapshot.critical_base_chance + _column(attacker.luck) / 100.0
+    return rng.random(shape) < chance
+
+
+def hit_chance(attacker: StatVector, defender: StatVector) -> np.ndarray:
+    """명중률 (명중 - 회피, 5%~95%)"""
+    return np.clip(attacker.accuracy - defender.evasion, 5, 95) / 100.0
+
+
+def sample_brv_damage(
+    attacker: StatVector,
+    defender: StatVector,
+    skill_multiplier: ArrayLike = 1.0,
+    samples: int = 10000,
+    rng: Optional[np.random.Generator] = None,
+    snapshot: Optional[ConfigSnapshot] = None,
+    ignore_evasion: bool = False,
+    return_masks: bool = False
+) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    BRV 데미지 샘플링 (DamageCalculator.calculate_brv_damage와 같은 공식)
+
+    Args:
+        attacker: 공격자 스탯 벡터 (길이 N)
+        defender: 방어자 스탯 벡터 (길이 N, 또는 1이면 모든 공격자에 적용)
+        skill_multiplier: 스킬 배율 (스칼라 또는 (N, 1)로 브로드캐스트 가능한 배열)
+        samples: 대진당 샘플 수
+        rng: NumPy 난수 생성기 (None이면 make_generator())
+        snapshot: 설정 스냅샷 (None이면 현재 설정)
+        ignore_evasion: 회피 무시
+        return_masks: True면 (데미지, 명중 마스크, 크리티컬 마스크) 반환
+
+    Returns:
+        (N, samples) 정수 배열 (회피 시 0)
+    """
+    rng = rng if rng is not None else make_generator()
+    snapshot = snapshot or get_config().snapshot
+    rows = max(len(attacker), len(defender))
+    shape = (rows, samples)
+
+    stat_modifier = _column(attacker.attack) / (_column(defender.defense) + 1.0)
+    base_damage = np.maximum(1.0, np.floor(stat_modifier * skill_multiplier * snapshot.brv_damage_multiplier))
+
+    damage = base_damage * rng.uniform(0.9, 1.1, shape)
+    critical = _critical_mask(attacker, shape, rng, snapshot)
+    damage = np.where(critical, damage * snapshot.critical_multiplier, damage)
+    damage = np.maximum(1, damage.astype(np.int64))
+
+    if ignore_evasion:
+        hit = np.ones(shape, dtype=bool)
+    else:
+        hit = rng.random(shape) < _column(hit_chance(attacker, defender))
+        damage = np.where(hit, damage, 0)
+
+    if return_masks:
+        return damage, hit, critical & hit
+    return damage
+
+
+def sample_hp_damage(
+    attacker: StatVector,
+    defender: StatVector,
+    brv_points: ArrayLike,
+    hp_multiplier: ArrayLike = 1.0,
+    is_break: Union[bool, np.ndarray] = False,
+    damage_type: str = "physical",
+    samples: int = 10000,
+    rng: Optional[np.random.Generator] = None,
+    snapshot: Optional[ConfigSnapshot] = None
+) -> np.ndarray:
+    """
+    HP 데미지 샘플링 (DamageCalculator.calculate_hp_damage와 같은 공식)
+
+    HP 공격에는 명중 판정이 없으며, 크리티컬과 BREAK 보너스는 각각 정수로 절사됩니다.
+
+    Args:
+        brv_points: 소비할 BRV (스칼라, (N, 1) 또는 (N, samples) 배열)
+        is_break: BREAK 상태 여부 (bool 또는 브로드캐스트 가능한 배열)
+        damage_type: "physical" 또는 "magical"
+
+    Returns:
+        (N, samples) 정수 배열 (최소 5)
+    """
+    rng = rng if rng is not None else make_generator()
+    snapshot = snapshot or get_config().snapshot
+    rows = max(len(attacker), len(defender))
+    shape = (rows, samples)
+
+    if damage_type == "magical":
+        stat_modifier = _column(attacker.magic) / (_column(defender.spirit) + 1.0)
+    else:
+        stat_modifier = _column(attacker.attack) / (_column(defender.defense) + 1.0)
+
+    damage = np.floor(
+        np.broadcast_to(brv_points, shape) * hp_multiplier * stat_modifier * snapshot.hp_damage_multiplier
+    )
+
+    critical = _critical_mask(attacker, shape, rng, snapshot)
+    damage = np.where(critical, np.floor(damage * snapshot.critical_multiplier), damage)
+    damage = np.where(is_break, np.floor(damage * snapshot.break_damage_bonus), damage)
+
+    return np.maximum(5, damage.astype(np.int64))
+
+
+def sample_actions_to_kill(
+    attacker: StatVector,
+    defender: StatVector,
+    skill_multiplier: float = 1.0,
+    hp_multiplier: float = 1.0,
+    damage_type: str = "physical",
+    samples: int = 2000,
+    max_actions: int = 100,
+    rng: Optional[np.random.Generator] = None,
+    snapshot: Optional[ConfigSnapshot] = None
+) -> np.ndarray:
+    """
+    처치까지 걸리는 공격자 행동 수 샘플링
+
+    공격자는 default_ally_policy와 같이 BRV가 MAX BRV의 절반 이상이거나 상대가
+    BREAK(BRV 0)이면 HP 공격, 아니면 BRV 공격을 합니다. BRV 탈취/BREAK 규칙은
+    BraveSystem.brv_attack을 따르며, BRV가 0이면 행동 전에 INT BRV로 회복합니다.
+    방어자는 반격이나 BRV 회복을 하지 않는 1:1 근사입니다.
+
+    Returns:
+        (N, samples) 실수 배열 (max_actions 안에 처치하지 못하면 inf)
+    """
+    rng = rng if rng is not None else make_generator()
+    snapshot = snapshot or get_config().snapshot
+    rows = max(len(attacker), len(defender))
+    shape = (rows, samples)
+
+    max_brv = np.broadcast_to(_column(attacker.max_brv), shape)
+    init_brv = np.broadcast_to(_column(attacker.init_brv), shape)
+    hp_threshold = max_brv * HP_ATTACK_BRV_RATIO
+
+    attacker_brv = init_brv.copy()
+    defender_brv = np.broadcast_to(_column(defender.init_brv), shape).copy()
+    defender_hp = np.broadcast_to(_column(defender.max_hp), shape).copy()
+    actions = np.full(shape, np.inf)
+
+    for action in range(1, max_actions + 1):
+        alive = np.isinf(actions)
+        if not alive.any():
+            break
+
+        attacker_brv = np.where(attacker_brv <= 0, init_brv, attacker_brv)
+        is_break = defender_brv <= 0
+        use_hp = alive & (attacker_brv > 0) & (is_break | (attacker_brv >= hp_threshold))
+        use_brv = alive & ~use_hp
+
+        # BRV 공격: 상대 BRV를 깎고 훔친 만큼 획득 (BREAK 상태면 가한 만큼 획득)
+        brv_damage = sample_brv_damage(
+            attacker, defender, skill_multiplier, samples, rng=rng, snapshot=snapshot
+        )
+        stolen = np.where(is_break, brv_damage, np.minimum(brv_damage, defender_brv))
+        defender_brv = np.where(use_brv, np.maximum(0, defender_brv - brv_damage), defender_brv)
+        attacker_brv = np.where(use_brv, np.minimum(attacker_brv + stolen, max_brv), attacker_brv)
+
+        # HP 공격: 축적한 BRV 전부 소비
+        hp_damage = sample_hp_damage(
+            attacker, defender, attacker_brv, hp_multiplier, is_break, damage_type,
+            samples, rng=rng, snapshot=snapshot
+        )
+        defender_hp = np.where(use_hp, defender_hp - hp_damage, defender_hp)
+        attacker_brv = np.where(use_hp, 0, attacker_brv)
+
+        actions[use_hp & (defender_hp <= 0)] = action
+
+    return actions
+
+
+def summarize(
+    samples: np.ndarray,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES
+) -> List[DamageDistribution]:
+    """
+    (N, samples) 배열을 행별 분포 요약으로 변환
+
+    inf/nan은 제외하고 집계하며, 유효한 값이 없는 행은 모두 nan입니다.
+    """
+    data = np.where(np.isfinite(samples), samples, np.nan).astype(np.float64)
+    valid = ~np.isnan(data).all(axis=1)
+    means = np.full(len(data), np.nan)
+    stds = np.full(len(data), np.nan)
+    mins = np.full(len(data), np.nan)
+    maxs = np.full(len(data), np.nan)
+    points = np.full((len(percentiles), len(data)), np.nan)
+    if valid.any():
+        rows = data[valid]
+        means[valid] = np.nanmean(rows, axis=1)
+        stds[valid] = np.nanstd(rows, axis=1)
+        mins[valid] = np.nanmin(rows, axis=1)
+        maxs[valid] = np.nanmax(rows, axis=1)
+        points[:, valid] = np.nanpercentile(rows, percentiles, axis=1)
+
+    return [
+        DamageDistribution(
+            mean=float(means[i]),
+            std=float(stds[i]),
+            minimum=float(mins[i]),
+            maximum=float(maxs[i]),
+            percentiles={f"p{p:g}": float(points[j, i]) for j, p in enumerate(percentiles)},
+        )
+        for i in range(len(data))
+    ]
+
+
+def job_stat_vector(jobs: Optional[Sequence[str]] = None, level: int = 1) -> StatVector:
+    """직업 목록의 스탯 벡터 (None이면 전체 33개 직업)"""
+    from src.character.character import Character
+    from src.character.skills.skill_index import JOB_SKILL_IDS
+
+    jobs = list(jobs) if jobs is not None else list(JOB_SKILL_IDS)
+    return StatVector.from_combatants([Character(job_id, job_id, level=level) for job_id in jobs])
+
+
+def enemy_stat_vector(enemies: Optional[Sequence[str]] = None, level_modifier: float = 1.0) -> StatVector:
+    """적 템플릿 목록의 스탯 벡터 (None이면 ENEMY_TEMPLATES 전체)"""
+    from src.world.enemy_generator import ENEMY_TEMPLATES, SimpleEnemy
+
+    enemies = list(enemies) if enemies is not None else list(ENEMY_TEMPLATES)
+    return StatVector.from_combatants(
+        [SimpleEnemy(ENEMY_TEMPLATES[enemy_id], level_modifier) for enemy_id in enemies]
+    )
+
+
+def analyze_matchups(
+    jobs: Optional[Sequence[str]] = None,
+    enemies: Optional[Sequence[str]] = None,
+    level: int = 1,
+    level_modifier: float = 1.0,
+    skill_multiplier: float = 1.0,
+    hp_multiplier: float = 1.0,
+    damage_type: str = "physical",
+    samples: int = 10000,
+    ttk_samples: int = 1000,
+    max_actions: int = 100,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    seed: Optional[int] = None,
+    snapshot: Optional[ConfigSnapshot] = None
+) -> List[MatchupResult]:
+    """
+    직업 x 적 템플릿 전체 대진의 데미지 분포 분석
+
+    모든 대진을 한 배열로 묶어 BRV/HP 데미지를 대진당 samples회 샘플링합니다.
+    HP 데미지는 HP 공격 시점(MAX BRV의 절반)의 BRV를 소비한다고 보고 계산합니다.
+
+    Args:
+        jobs: 직업 ID 목록 (None이면 전체)
+        enemies: 적 템플릿 ID 목록 (None이면 전체)
+        level: 직업 캐릭터 레벨
+        level_modifier: 적 레벨 보정
+        skill_multiplier: BRV 스킬 배율
+        hp_multiplier: HP 스킬 배율
+        damage_type: HP 공격 데미지 타입
+        samples: 대진당 데미지 샘플 수
+        ttk_samples: 대진당 처치 시뮬레이션 횟수
+        max_actions: 처치 시뮬레이션 최대 행동 수
+        percentiles: 계산할 백분위
+        seed: 난수 시드 (None이면 런 시드에서 파생)
+        snapshot: 설정 스냅샷 (None이면 현재 설정, 조정안 비교 시 dataclasses.replace로 생성)
+
+    Returns:
+        MatchupResult 목록 (직업 순서 x 적 순서)
+    """
+    rng = make_generator(seed)
+    snapshot = snapshot or get_config().snapshot
+
+    job_stats = job_stat_vector(jobs, level)
+    enemy_stats = enemy_stat_vector(enemies, level_modifier)
+    attacker = job_stats.take(np.repeat(np.arange(len(job_stats)), len(enemy_stats)))
+    defender = enemy_stats.take(np.tile(np.arange(len(enemy_stats)), len(job_stats)))
+
+    brv_damage, hit, critical = sample_brv_damage(
+        attacker, defender, skill_multiplier, samples, rng=rng, snapshot=snapshot, return_masks=True
+    )
+    hp_brv = np.maximum(1.0, np.floor(_column(attacker.max_brv) * HP_ATTACK_BRV_RATIO))
+    hp_damage = sample_hp_damage(
+        attacker, defender, hp_brv, hp_multiplier, False, damage_type, samples, rng=rng, snapshot=snapshot
+    )
+    actions = sample_actions_to_kill(
+        attacker, defender, skill_multiplier, hp_multiplier, damage_type,
+        ttk_samples, max_actions, rng=rng, snapshot=snapshot
+    )
+
+    brv_summary = summarize(brv_damage, percentiles)
+    hp_summary = summarize(hp_damage, percentiles)
+    ttk_summary = summarize(actions, percentiles)
+    hit_rates = hit.mean(axis=1)
+    critical_rates = critical.sum(axis=1) / np.maximum(1, hit.sum(axis=1))
+    kill_rates = np.isfinite(actions).mean(axis=1)
+
+    return [
+        MatchupResult(
+            attacker=attacker.names[i],
+            defender=defender.names[i],
+            hit_rate=float(hit_rates[i]),
+            critical_rate=float(critical_rates[i]),
+            brv_damage=brv_summary[i],
+            hp_damage=hp_summary[i],
+            kill_rate=float(kill_rates[i]),
+            actions_to_kill=ttk_summary[i] if kill_rates[i] > 0 else None,
+        )
+        for i in range(len(attacker))
+    ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """명령줄 실행 (대진별 요약 표 또는 JSON 출력)"""
+    import argparse
+    import json
+    import logging
+
+    from src.core.config import initialize_config
+
+    parser = argparse.ArgumentParser(description="몬테카를로 데미지 분포 분석")
+    parser.add_argument("--jobs", nargs="*", help="직업 ID (기본: 전체)")
+    parser.add_argument("--enemies", nargs="*", help="적 템플릿 ID (기본: 전체)")
+    parser.add_argument("--level", type=int, default=1, help="직업 레벨")
+    parser.add_argument("--level-modifier", type=float, default=1.0, help="적 레벨 보정")
+    parser.add_argument("--skill-multiplier", type=float, default=1.0, help="BRV 스킬 배율")
+    parser.add_argument("--hp-multiplier", type=float, default=1.0, help="HP 스킬 배율")
+    parser.add_argument("--magical", action="store_true", help="HP 공격을 마법 데미지로 계산")
+    parser.add_argument("--samples", type=int, default=10000, help="대진당 데미지 샘플 수")
+    parser.add_argument("--ttk-samples", type=int, default=1000, help="대진당 처치 시뮬레이션 횟수")
+    parser.add_argument("--seed", type=int, help="난수 시드")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    parser.add_argument("--config", default="config.yaml", help="설정 파일 경로")
+    args = parser.parse_args(argv)
+
+    initialize_config(args.config)
+    logging.disable(logging.INFO)
+
+    results = analyze_matchups(
+        jobs=args.jobs,
+        enemies=args.enemies,
+        level=args.level,
+        level_modifier=args.level_modifier,
+        skill_multiplier=args.skill_multiplier,
+        hp_multiplier=args.hp_multiplier,
+        damage_type="magical" if args.magical else "physical",
+        samples=args.samples,
+        ttk_samples=args.ttk_samples,
+        seed=args.seed,
+    )
+
+    if args.json:
+        print(json.dumps([r.to_dict() for r in results], ensure_ascii=False, indent=2))
+        return
+
+    print(f"{'직업':<16}{'적':<18}{'명중':>6}{'BRV 평균':>10}{'BRV p95':>9}{'HP 평균':>9}{'처치율':>8}{'행동 수':>8}")
+    for r in results:
+        ttk = f"{r.actions_to_kill.mean:.1f}" if r.actions_to_kill else "-"
+        print(
+            f"{r.attacker:<16}{r.defender:<18}{r.hit_rate:>6.0%}{r.brv_damage.mean:>10.1f}"
+            f"{r.brv_damage.percentiles['p95']:>9.0f}{r.hp_damage.mean:>9.1f}{r.kill_rate:>8.0%}{ttk:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
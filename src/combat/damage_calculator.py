@@ -7,10 +7,10 @@ BRV 데미지, HP 데미지, 상처 데미지 계산
 
 from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
-import random
 
-from src.core.config import get_config
+from src.core.config import get_config, ConfigSnapshot
 from src.core.logger import get_logger
+from src.core.rng import get_rng, RNGStreams
 
 
 @dataclass
@@ -34,14 +34,20 @@ class DamageCalculator:
     def __init__(self) -> None:
         self.logger = get_logger("damage")
         self.config = get_config()
+        self.rng = get_rng().stream(RNGStreams.COMBAT)
 
-        # 밸런스 설정
-        self.brv_damage_multiplier = self.config.get("combat.damage.brv_multiplier", 1.5)
-        self.hp_damage_multiplier = self.config.get("combat.damage.hp_multiplier", 0.15)
-        self.break_damage_bonus = self.config.get("combat.damage.break_bonus", 1.5)
-        self.wound_damage_rate = self.config.get("combat.damage.wound_rate", 0.25)
-        self.critical_multiplier = self.config.get("combat.damage.critical_multiplier", 1.5)
-        self.critical_base_chance = self.config.get("combat.damage.critical_chance", 0.1)
+        # 밸런스 설정 (핫 리로드 시 다시 적용)
+        self.apply_config(self.config.snapshot)
+        self.config.subscribe(self.apply_config)
+
+    def apply_config(self, snapshot: ConfigSnapshot) -> None:
+        """설정 스냅샷의 데미지 상수 적용"""
+        self.brv_damage_multiplier = snapshot.brv_damage_multiplier
+        self.hp_damage_multiplier = snapshot.hp_damage_multiplier
+        self.break_damage_bonus = snapshot.break_damage_bonus
+        self.wound_damage_rate = snapshot.wound_damage_rate
+        self.critical_multiplier = snapshot.critical_multiplier
+        self.critical_base_chance = snapshot.critical_base_chance
 
     def calculate_brv_damage(
         self,
@@ -86,7 +92,7 @@ class DamageCalculator:
         base_damage = max(1, int(stat_modifier * skill_multiplier * self.brv_damage_multiplier))
 
         # 랜덤 변수 (90% ~ 110%)
-        variance = random.uniform(0.9, 1.1)
+        variance = self.rng.uniform(0.9, 1.1)
         damage = base_damage * variance
 
         # 크리티컬 판정
@@ -164,7 +170,7 @@ class DamageCalculator:
         # hp_damage_multiplier: HP 데미지 조정 계수 (config에서 설정)
         base_damage = int(brv_points * hp_multiplier * stat_modifier * self.hp_damage_multiplier)
 
-        self.logger.warning(f"[HP 데미지 계산] BRV:{brv_points} × 스킬계수:{hp_multiplier:.2f} × 스탯배율:{stat_modifier:.2f} × HP배율:{self.hp_damage_multiplier} = {base_damage}")
+        self.logger.debug("[HP 데미지 계산] BRV:%s × 스킬계수:%.2f × 스탯배율:%.2f × HP배율:%s = %s", brv_points, hp_multiplier, stat_modifier, self.hp_damage_multiplier, base_damage)
 
         damage = base_damage
 
@@ -273,7 +279,7 @@ class DamageCalculator:
         base_damage = max(1, int(stat_modifier * skill_multiplier * self.brv_damage_multiplier * element_bonus))
 
         # 랜덤 변수
-        variance = random.uniform(0.9, 1.1)
+        variance = self.rng.uniform(0.9, 1.1)
         damage = base_damage * variance
 
         # 크리티컬 판정
@@ -365,7 +371,7 @@ class DamageCalculator:
         # 확률 변환 (0.0 ~ 1.0)
         hit_chance_pct = hit_chance / 100.0
 
-        is_hit = random.random() < hit_chance_pct
+        is_hit = self.rng.random() < hit_chance_pct
 
         if not is_hit:
             self.logger.debug(f"공격 회피! {defender.name}가 {attacker.name}의 공격을 피했다")
@@ -388,7 +394,7 @@ class DamageCalculator:
         # 크리티컬 확률 = 기본 확률 + (행운 / 100)
         critical_chance = self.critical_base_chance + (luck / 100.0)
 
-        return random.random() < critical_chance
+        return self.rng.random() < critical_chance
 
     def _get_element_bonus(self, defender: Any, element: str) -> float:
         """
@@ -8,6 +8,7 @@ from typing import List, Dict, Any
 import math
 
 from src.core.logger import get_logger, Loggers
+from src.core.rng import get_rng, RNGStreams
 
 
 logger = get_logger(Loggers.COMBAT)
@@ -187,11 +188,11 @@ class RewardCalculator:
 
         # 골드 계산
         # 기본 골드: 적 레벨 * 10 ~ 20
-        import random
+        rng = get_rng().stream(RNGStreams.LOOT)
         total_gold = 0
         for enemy in enemies:
             enemy_level = getattr(enemy, 'level', floor_number)
-            enemy_gold = random.randint(enemy_level * 10, enemy_level * 20)
+            enemy_gold = rng.randint(enemy_level * 10, enemy_level * 20)
             if is_boss_fight:
                 enemy_gold *= 5  # 보스는 5배
             total_gold += enemy_gold
@@ -202,13 +203,13 @@ class RewardCalculator:
 
         if is_boss_fight:
             # 보스는 무조건 2~4개 드롭
-            drop_count = random.randint(2, 4)
+            drop_count = rng.randint(2, 4)
             for _ in range(drop_count):
                 items.append(RewardCalculator._generate_drop(floor_number, is_boss=True))
         else:
             # 일반 적: 각 적마다 20% 확률
             for enemy in enemies:
-                if random.random() < 0.2:  # 20%
+                if rng.random() < 0.2:  # 20%
                     enemy_level = getattr(enemy, 'level', floor_number)
                     items.append(RewardCalculator._generate_drop(enemy_level))
 
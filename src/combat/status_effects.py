@@ -4,7 +4,7 @@ Status Effects - 상태 효과 시스템
 Dawn of Stellar의 모든 상태 이상 및 버프/디버프를 관리합니다.
 """
 
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from enum import Enum
 from dataclasses import dataclass
 from src.core.event_bus import event_bus, Events
@@ -203,11 +203,72 @@ class StatusEffect:
                 f"intensity={self.intensity}, stacks={self.stack_count}/{self.max_stacks})")
 
 
+# === 스탯 배율 테이블 ===
+
+# get_stat_modifiers가 반환하는 스탯 키
+STAT_KEYS: Tuple[str, ...] = (
+    'physical_attack', 'magic_attack', 'physical_defense', 'magic_defense',
+    'speed', 'accuracy', 'evasion', 'critical_rate',
+)
+
+# 강도 비례 배율: 스탯 *= 1 + (강도 × 스택) × 계수 (디버프는 음수 계수)
+SCALED_STAT_MODIFIERS: Dict[StatusType, Dict[str, float]] = {
+    # 버프
+    StatusType.BOOST_ATK: {'physical_attack': 0.2, 'magic_attack': 0.2},
+    StatusType.BOOST_DEF: {'physical_defense': 0.2, 'magic_defense': 0.2},
+    StatusType.BOOST_SPD: {'speed': 0.3},
+    StatusType.BOOST_ACCURACY: {'accuracy': 0.15},
+    StatusType.BOOST_CRIT: {'critical_rate': 0.25},
+    StatusType.BOOST_DODGE: {'evasion': 0.2},
+    StatusType.BOOST_MAGIC_ATK: {'magic_attack': 0.25},
+    StatusType.BOOST_MAGIC_DEF: {'magic_defense': 0.25},
+    StatusType.BOOST_ALL_STATS: {key: 0.15 for key in STAT_KEYS},
+
+    # 디버프 (REDUCE_SPEED는 REDUCE_SPD의 별칭)
+    StatusType.REDUCE_ATK: {'physical_attack': -0.2, 'magic_attack': -0.2},
+    StatusType.REDUCE_DEF: {'physical_defense': -0.2, 'magic_defense': -0.2},
+    StatusType.REDUCE_SPD: {'speed': -0.3},
+    StatusType.REDUCE_ACCURACY: {'accuracy': -0.15},
+    StatusType.REDUCE_MAGIC_ATK: {'magic_attack': -0.25},
+    StatusType.REDUCE_MAGIC_DEF: {'magic_defense': -0.25},
+    StatusType.REDUCE_ALL_STATS: {key: -0.15 for key in STAT_KEYS},
+}
+
+# 고정 배율: 강도/스택과 무관
+FIXED_STAT_MODIFIERS: Dict[StatusType, Dict[str, float]] = {
+    StatusType.VULNERABLE: {'physical_defense': 0.5, 'magic_defense': 0.5},
+    StatusType.EXPOSED: {'evasion': 0.3},
+    StatusType.WEAKNESS: {'physical_attack': 0.7, 'magic_attack': 0.7},
+    StatusType.HASTE: {'speed': 1.5},
+    StatusType.SLOW: {'speed': 0.6},
+    StatusType.FOCUS: {'accuracy': 1.3, 'critical_rate': 1.2},
+    StatusType.RAGE: {'physical_attack': 1.4, 'physical_defense': 0.8},
+    StatusType.BERSERK: {
+        'physical_attack': 1.6, 'magic_attack': 1.6,
+        'physical_defense': 0.6, 'magic_defense': 0.6,
+        'accuracy': 0.8,
+    },
+    StatusType.BLIND: {'accuracy': 0.3},
+    StatusType.TERROR: {'physical_attack': 0.6, 'magic_attack': 0.6, 'speed': 0.7},
+}
+
+# 행동/스킬/제어 판정용 상태 집합
+ACTION_BLOCKING_STATUSES = frozenset({
+    StatusType.STUN, StatusType.SLEEP, StatusType.FREEZE,
+    StatusType.PETRIFY, StatusType.PARALYZE, StatusType.TIME_STOP,
+})
+SILENCING_STATUSES = frozenset({StatusType.SILENCE, StatusType.MADNESS})
+CONTROL_STATUSES = frozenset({StatusType.CHARM, StatusType.DOMINATE, StatusType.CONFUSION})
+INVINCIBLE_STATUSES = frozenset({StatusType.INVINCIBLE, StatusType.TEMPORARY_INVINCIBLE})
+
+
 class StatusManager:
     """
     상태 효과 관리자
 
     캐릭터의 모든 상태 효과를 관리합니다.
+    상태 효과는 StatusType별로 하나씩 색인하고, 스탯 배율은 (타입, 강도, 스택) 시그니처가
+    바뀔 때만 다시 계산합니다.
     """
 
     def __init__(self, owner_name: str = "Unknown") -> None:
@@ -216,8 +277,19 @@ class StatusManager:
             owner_name: 상태 효과의 소유자 이름 (로깅용)
         """
         self.owner_name = owner_name
-        self.status_effects: List[StatusEffect] = []
-        self.effects = self.status_effects  # 호환성을 위한 별칭
+        self._effects: Dict[StatusType, StatusEffect] = {}  # 추가 순서 유지
+        self._modifiers: Dict[str, float] = {}
+        self._modifier_signature: Optional[Tuple] = None  # 마지막 계산 시점의 시그니처
+
+    @property
+    def status_effects(self) -> List[StatusEffect]:
+        """현재 상태 효과 리스트 (추가 순서)"""
+        return list(self._effects.values())
+
+    @property
+    def effects(self) -> List[StatusEffect]:
+        """status_effects 별칭 (호환성)"""
+        return list(self._effects.values())
 
     def add_status(
         self,
@@ -234,7 +306,7 @@ class StatusManager:
         Returns:
             새로운 효과가 추가되었으면 True, 기존 효과를 갱신했으면 False
         """
-        existing = self.get_status(status_effect.status_type)
+        existing = self._effects.get(status_effect.status_type)
 
         if existing:
             if existing.is_stackable and existing.stack_count < existing.max_stacks:
@@ -264,8 +336,7 @@ class StatusManager:
             return False
         else:
             # 새로운 효과 추가
-            self.status_effects.append(status_effect)
-            self.effects = self.status_effects
+            self._effects[status_effect.status_type] = status_effect
 
             logger.info(
                 f"{self.owner_name}: {status_effect.name} 추가 "
@@ -291,10 +362,9 @@ class StatusManager:
         Returns:
             제거 성공 여부
         """
-        effect = self.get_status(status_type)
+        effect = self._effects.get(status_type)
         if effect:
-            self.status_effects.remove(effect)
-            self.effects = self.status_effects
+            del self._effects[status_type]
 
             logger.info(f"{self.owner_name}: {effect.name} 제거")
 
@@ -317,10 +387,7 @@ class StatusManager:
         Returns:
             해당하는 StatusEffect 또는 None
         """
-        for effect in self.status_effects:
-            if effect.status_type == status_type:
-                return effect
-        return None
+        return self._effects.get(status_type)
 
     def has_status(self, status_type: StatusType) -> bool:
         """
@@ -332,7 +399,7 @@ class StatusManager:
         Returns:
             보유 여부
         """
-        return self.get_status(status_type) is not None
+        return status_type in self._effects
 
     def update_duration(self) -> List[StatusEffect]:
         """
@@ -343,12 +410,12 @@ class StatusManager:
         """
         expired: List[StatusEffect] = []
 
-        for effect in self.status_effects[:]:
+        for effect in list(self._effects.values()):
             effect.duration -= 1
 
             if effect.duration <= 0:
                 expired.append(effect)
-                self.status_effects.remove(effect)
+                del self._effects[effect.status_type]
 
                 logger.debug(f"{self.owner_name}: {effect.name} 효과 만료")
 
@@ -359,14 +426,12 @@ class StatusManager:
                     "expired": True
                 })
 
-        self.effects = self.status_effects
         return expired
 
     def clear_all_effects(self) -> None:
         """모든 상태 효과 제거"""
-        cleared = self.status_effects.copy()
-        self.status_effects.clear()
-        self.effects = self.status_effects
+        cleared = list(self._effects.values())
+        self._effects.clear()
 
         logger.info(f"{self.owner_name}: 모든 상태 효과 제거 ({len(cleared)}개)")
 
@@ -384,19 +449,7 @@ class StatusManager:
         Returns:
             행동 가능하면 True, 불가능하면 False
         """
-        blocking_states = [
-            StatusType.STUN,
-            StatusType.SLEEP,
-            StatusType.FREEZE,
-            StatusType.PETRIFY,
-            StatusType.PARALYZE,
-            StatusType.TIME_STOP
-        ]
-
-        return not any(
-            effect.status_type in blocking_states
-            for effect in self.status_effects
-        )
+        return self._effects.keys().isdisjoint(ACTION_BLOCKING_STATUSES)
 
     def can_use_skills(self) -> bool:
         """
@@ -405,15 +458,7 @@ class StatusManager:
         Returns:
             스킬 사용 가능하면 True, 불가능하면 False
         """
-        silencing_states = [
-            StatusType.SILENCE,
-            StatusType.MADNESS
-        ]
-
-        return not any(
-            effect.status_type in silencing_states
-            for effect in self.status_effects
-        )
+        return self._effects.keys().isdisjoint(SILENCING_STATUSES)
 
     def is_controlled(self) -> bool:
         """
@@ -422,122 +467,65 @@ class StatusManager:
         Returns:
             제어 불가 상태면 True
         """
-        control_states = [
-            StatusType.CHARM,
-            StatusType.DOMINATE,
-            StatusType.CONFUSION
-        ]
-
-        return any(
-            effect.status_type in control_states
-            for effect in self.status_effects
-        )
+        return not self._effects.keys().isdisjoint(CONTROL_STATUSES)
 
     def has_stealth(self) -> bool:
         """은신 상태 확인"""
-        return self.has_status(StatusType.STEALTH)
+        return StatusType.STEALTH in self._effects
 
     def has_invincibility(self) -> bool:
         """무적 상태 확인"""
-        return (self.has_status(StatusType.INVINCIBLE) or
-                self.has_status(StatusType.TEMPORARY_INVINCIBLE))
+        return not self._effects.keys().isdisjoint(INVINCIBLE_STATUSES)
+
+    def _compute_stat_modifiers(self) -> Dict[str, float]:
+        """SCALED/FIXED_STAT_MODIFIERS 테이블로 스탯 배율 계산 (효과 추가 순서대로 곱함)"""
+        modifiers = dict.fromkeys(STAT_KEYS, 1.0)
+
+        for status_type, effect in self._effects.items():
+            scaled = SCALED_STAT_MODIFIERS.get(status_type)
+            if scaled is not None:
+                intensity = effect.intensity * effect.stack_count
+                for key, coefficient in scaled.items():
+                    modifiers[key] *= (1.0 + intensity * coefficient)
+                continue
+
+            fixed = FIXED_STAT_MODIFIERS.get(status_type)
+            if fixed is not None:
+                for key, multiplier in fixed.items():
+                    modifiers[key] *= multiplier
+
+        return modifiers
+
+    def _current_modifiers(self) -> Dict[str, float]:
+        """캐시된 배율 (효과 구성/강도/스택이 바뀌었으면 재계산)"""
+        signature = tuple(
+            (status_type, effect.intensity, effect.stack_count) for status_type, effect in self._effects.items()
+        )
+        if signature != self._modifier_signature:
+            self._modifiers = self._compute_stat_modifiers()
+            self._modifier_signature = signature
+        return self._modifiers
 
     def get_stat_modifiers(self) -> Dict[str, float]:
         """
         스탯 수정치 반환 (곱셈용 배율)
 
         Returns:
-            스탯별 배율 딕셔너리
+            스탯별 배율 딕셔너리 (사본)
         """
-        modifiers: Dict[str, float] = {
-            'physical_attack': 1.0,
-            'magic_attack': 1.0,
-            'physical_defense': 1.0,
-            'magic_defense': 1.0,
-            'speed': 1.0,
-            'accuracy': 1.0,
-            'evasion': 1.0,
-            'critical_rate': 1.0
-        }
-
-        for effect in self.status_effects:
-            intensity = effect.intensity * effect.stack_count
-
-            # 버프
-            if effect.status_type == StatusType.BOOST_ATK:
-                modifiers['physical_attack'] *= (1.0 + intensity * 0.2)
-                modifiers['magic_attack'] *= (1.0 + intensity * 0.2)
-            elif effect.status_type == StatusType.BOOST_DEF:
-                modifiers['physical_defense'] *= (1.0 + intensity * 0.2)
-                modifiers['magic_defense'] *= (1.0 + intensity * 0.2)
-            elif effect.status_type == StatusType.BOOST_SPD:
-                modifiers['speed'] *= (1.0 + intensity * 0.3)
-            elif effect.status_type == StatusType.BOOST_ACCURACY:
-                modifiers['accuracy'] *= (1.0 + intensity * 0.15)
-            elif effect.status_type == StatusType.BOOST_CRIT:
-                modifiers['critical_rate'] *= (1.0 + intensity * 0.25)
-            elif effect.status_type == StatusType.BOOST_DODGE:
-                modifiers['evasion'] *= (1.0 + intensity * 0.2)
-            elif effect.status_type == StatusType.BOOST_MAGIC_ATK:
-                modifiers['magic_attack'] *= (1.0 + intensity * 0.25)
-            elif effect.status_type == StatusType.BOOST_MAGIC_DEF:
-                modifiers['magic_defense'] *= (1.0 + intensity * 0.25)
-            elif effect.status_type == StatusType.BOOST_ALL_STATS:
-                for key in modifiers:
-                    modifiers[key] *= (1.0 + intensity * 0.15)
-
-            # 디버프
-            elif effect.status_type == StatusType.REDUCE_ATK:
-                modifiers['physical_attack'] *= (1.0 - intensity * 0.2)
-                modifiers['magic_attack'] *= (1.0 - intensity * 0.2)
-            elif effect.status_type == StatusType.REDUCE_DEF:
-                modifiers['physical_defense'] *= (1.0 - intensity * 0.2)
-                modifiers['magic_defense'] *= (1.0 - intensity * 0.2)
-            elif effect.status_type in [StatusType.REDUCE_SPD, StatusType.REDUCE_SPEED]:
-                modifiers['speed'] *= (1.0 - intensity * 0.3)
-            elif effect.status_type == StatusType.REDUCE_ACCURACY:
-                modifiers['accuracy'] *= (1.0 - intensity * 0.15)
-            elif effect.status_type == StatusType.REDUCE_MAGIC_ATK:
-                modifiers['magic_attack'] *= (1.0 - intensity * 0.25)
-            elif effect.status_type == StatusType.REDUCE_MAGIC_DEF:
-                modifiers['magic_defense'] *= (1.0 - intensity * 0.25)
-            elif effect.status_type == StatusType.REDUCE_ALL_STATS:
-                for key in modifiers:
-                    modifiers[key] *= (1.0 - intensity * 0.15)
-
-            # 특수 상태
-            elif effect.status_type == StatusType.VULNERABLE:
-                modifiers['physical_defense'] *= 0.5
-                modifiers['magic_defense'] *= 0.5
-            elif effect.status_type == StatusType.EXPOSED:
-                modifiers['evasion'] *= 0.3
-            elif effect.status_type == StatusType.WEAKNESS:
-                modifiers['physical_attack'] *= 0.7
-                modifiers['magic_attack'] *= 0.7
-            elif effect.status_type == StatusType.HASTE:
-                modifiers['speed'] *= 1.5
-            elif effect.status_type == StatusType.SLOW:
-                modifiers['speed'] *= 0.6
-            elif effect.status_type == StatusType.FOCUS:
-                modifiers['accuracy'] *= 1.3
-                modifiers['critical_rate'] *= 1.2
-            elif effect.status_type == StatusType.RAGE:
-                modifiers['physical_attack'] *= 1.4
-                modifiers['physical_defense'] *= 0.8
-            elif effect.status_type == StatusType.BERSERK:
-                modifiers['physical_attack'] *= 1.6
-                modifiers['magic_attack'] *= 1.6
-                modifiers['physical_defense'] *= 0.6
-                modifiers['magic_defense'] *= 0.6
-                modifiers['accuracy'] *= 0.8
-            elif effect.status_type == StatusType.BLIND:
-                modifiers['accuracy'] *= 0.3
-            elif effect.status_type == StatusType.TERROR:
-                modifiers['physical_attack'] *= 0.6
-                modifiers['magic_attack'] *= 0.6
-                modifiers['speed'] *= 0.7
+        return dict(self._current_modifiers())
 
-        return modifiers
+    def get_stat_modifier(self, stat: str) -> float:
+        """
+        단일 스탯 배율 (전투 중 데미지/속도 계산용, 캐시된 값 조회)
+
+        Args:
+            stat: STAT_KEYS 중 하나
+
+        Returns:
+            배율 (알 수 없는 스탯이면 1.0)
+        """
+        return self._current_modifiers().get(stat, 1.0)
 
     def get_active_effects(self) -> List[str]:
         """
@@ -546,7 +534,7 @@ class StatusManager:
         Returns:
             상태 효과 이름 리스트
         """
-        return [effect.name for effect in self.status_effects]
+        return [effect.name for effect in self._effects.values()]
 
     def get_status_display(self) -> str:
         """
@@ -555,11 +543,11 @@ class StatusManager:
         Returns:
             상태 효과 요약 문자열
         """
-        if not self.status_effects:
+        if not self._effects:
             return "상태 효과 없음"
 
         effects_str = []
-        for effect in self.status_effects:
+        for effect in self._effects.values():
             stack_info = f"x{effect.stack_count}" if effect.is_stackable and effect.stack_count > 1 else ""
             effects_str.append(f"{effect.name}({effect.duration}){stack_info}")
 
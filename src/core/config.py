@@ -2,11 +2,118 @@
 Config - 설정 관리 시스템
 
 YAML 기반 설정 로딩 및 관리
+
+로드할 때 한 번 모든 점 경로("combat.atb.max_gauge")를 펼친 불변 스냅샷(ConfigSnapshot)을 만들어
+get()은 dict 조회 한 번으로 끝나고, 전투/오디오에서 자주 읽는 값은 타입이 지정된 속성으로 제공합니다.
+experimental.hot_reload가 켜져 있으면 ConfigWatcher가 파일 변경 시 새 설정을 읽어 대기시키고,
+게임 루프가 apply_pending()을 호출할 때 새 스냅샷으로 교체해 subscribe()로 등록한 구독자에게 알립니다.
 """
 
+import threading
+import weakref
 import yaml
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType, MethodType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+
+def _flatten(data: Dict[str, Any], prefix: str, out: Dict[str, Any]) -> Dict[str, Any]:
+    """중첩 dict를 점 경로 -> 값으로 펼침 (중간 섹션도 포함)"""
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        out[path] = value
+        if isinstance(value, dict):
+            _flatten(value, f"{path}.", out)
+    return out
+
+
+# 스냅샷 속성 -> (설정 키, 기본값) - 기본값은 기존 config.get() 호출부와 동일
+_SNAPSHOT_KEYS: Dict[str, Tuple[str, Any]] = {
+    "development_mode": ("development.enabled", False),
+    "debug_mode": ("development.debug_mode", False),
+    # ATB
+    "atb_enabled": ("combat.atb.enabled", True),
+    "atb_max_gauge": ("combat.atb.max_gauge", 2000),
+    "atb_action_threshold": ("combat.atb.action_threshold", 1000),
+    "atb_base_rate": ("combat.atb.base_rate", 50),
+    "atb_player_turn_enemy_rate": ("combat.atb.player_turn_enemy_atb_rate", 0.3),
+    # 데미지
+    "brv_damage_multiplier": ("combat.damage.brv_multiplier", 1.5),
+    "hp_damage_multiplier": ("combat.damage.hp_multiplier", 0.15),
+    "break_damage_bonus": ("combat.damage.break_bonus", 1.5),
+    "wound_damage_rate": ("combat.damage.wound_rate", 0.25),
+    "critical_multiplier": ("combat.damage.critical_multiplier", 1.5),
+    "critical_base_chance": ("combat.damage.critical_chance", 0.1),
+    # 브레이브
+    "base_brv": ("combat.brave.base_brv", 100),
+    "max_brv_multiplier": ("combat.brave.max_brv_multiplier", 3.0),
+    "brave_break_bonus": ("combat.brave.break_bonus", 1.5),
+    "break_stun_duration": ("combat.brave.break_stun_duration", 1),
+    # 오디오
+    "bgm_enabled": ("audio.bgm.enabled", True),
+    "sfx_enabled": ("audio.sfx.enabled", True),
+    "master_volume": ("audio.master_volume", 0.8),
+    "bgm_volume": ("audio.bgm_volume", 0.6),
+    "sfx_volume": ("audio.sfx_volume", 0.7),
+    "fade_duration": ("audio.bgm.fade_duration", 1.0),
+}
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    설정 스냅샷 (불변)
+
+    자주 읽는 값은 속성으로, 나머지는 values(점 경로 -> 값)로 조회합니다.
+    설정이 바뀌면 스냅샷을 수정하지 않고 새로 만들어 통째로 교체합니다.
+    """
+
+    values: Mapping[str, Any]
+
+    development_mode: bool
+    debug_mode: bool
+
+    atb_enabled: bool
+    atb_max_gauge: int
+    atb_action_threshold: int
+    atb_base_rate: float
+    atb_player_turn_enemy_rate: float
+
+    brv_damage_multiplier: float
+    hp_damage_multiplier: float
+    break_damage_bonus: float
+    wound_damage_rate: float
+    critical_multiplier: float
+    critical_base_chance: float
+
+    base_brv: int
+    max_brv_multiplier: float
+    brave_break_bonus: float
+    break_stun_duration: int
+
+    bgm_enabled: bool
+    sfx_enabled: bool
+    master_volume: float
+    bgm_volume: float
+    sfx_volume: float
+    fade_duration: float
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ConfigSnapshot":
+        """설정 dict로 스냅샷 생성"""
+        flat = _flatten(data or {}, "", {})
+        typed = {}
+        for field in fields(cls):
+            if field.name == "values":
+                continue
+            key, default = _SNAPSHOT_KEYS[field.name]
+            value = flat.get(key, default)
+            # YAML의 정수/실수 표기 차이 보정 (예: base_rate: 50 -> 50.0)
+            if field.type in (int, float) and isinstance(value, (int, float)) and not isinstance(value, bool):
+                value = field.type(value)
+            typed[field.name] = value
+        return cls(values=MappingProxyType(flat), **typed)
 
 
 class Config:
@@ -19,15 +126,111 @@ class Config:
     def __init__(self, config_path: str = "config.yaml") -> None:
         self.config_path = Path(config_path)
         self._config: Dict[str, Any] = {}
+        self.snapshot = ConfigSnapshot.from_dict({})
+        self._values: Mapping[str, Any] = self.snapshot.values
+        # set()으로 바꾼 값 (명령줄 옵션 등) - 다시 로드해도 유지
+        self._overrides: Dict[str, Any] = {}
+        self._subscribers: List[Callable[[], Optional[Callable[[ConfigSnapshot], None]]]] = []
+        self._subscribers_lock = threading.Lock()
+        # ConfigWatcher가 읽어 둔, 아직 적용하지 않은 설정
+        self._pending: Optional[Dict[str, Any]] = None
+        self._pending_lock = threading.Lock()
         self.load()
 
-    def load(self) -> None:
-        """설정 파일 로드"""
+    def _read(self) -> Dict[str, Any]:
+        """설정 파일 파싱 (set()으로 바꾼 값 포함)"""
         if not self.config_path.exists():
             raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {self.config_path}")
 
         with open(self.config_path, "r", encoding="utf-8") as f:
-            self._config = yaml.safe_load(f)
+            data = yaml.safe_load(f) or {}
+
+        for key_path, value in self._overrides.items():
+            self._assign(data, key_path, value)
+        return data
+
+    def load(self) -> None:
+        """설정 파일 로드"""
+        self._swap(self._read())
+
+    def _swap(self, data: Dict[str, Any]) -> None:
+        """새 스냅샷으로 교체 (다른 스레드의 get()은 이전 또는 새 스냅샷 중 하나를 봄)"""
+        snapshot = ConfigSnapshot.from_dict(data)
+        self._config = data
+        self.snapshot = snapshot
+        self._values = snapshot.values
+
+    def reload(self) -> ConfigSnapshot:
+        """
+        설정 파일을 다시 읽고 구독자에게 알림
+
+        Returns:
+            새 스냅샷
+        """
+        self.load()
+        return self._notify()
+
+    def queue_reload(self) -> None:
+        """
+        설정 파일을 읽어 대기시킴 (ConfigWatcher 스레드용)
+
+        스냅샷 교체와 구독자 호출은 게임 루프의 apply_pending()에서 이루어집니다.
+        """
+        data = self._read()
+        with self._pending_lock:
+            self._pending = data
+
+    def apply_pending(self) -> bool:
+        """
+        대기 중인 설정 적용 (게임 루프에서 매 프레임 호출)
+
+        Returns:
+            적용했으면 True
+        """
+        if self._pending is None:
+            return False
+        with self._pending_lock:
+            data, self._pending = self._pending, None
+        if data is None:
+            return False
+        self._swap(data)
+        self._notify()
+        return True
+
+    def _notify(self) -> ConfigSnapshot:
+        """현재 스냅샷을 구독자에게 전달"""
+        snapshot = self.snapshot
+        for callback in self._live_subscribers():
+            callback(snapshot)
+        return snapshot
+
+    def subscribe(self, callback: Callable[[ConfigSnapshot], None]) -> None:
+        """
+        설정 다시 로드 시 호출될 콜백 등록
+
+        바운드 메서드는 약한 참조로 보관하므로 객체가 사라지면 자동으로 해제됩니다.
+        (핫 리로드 시 게임 루프의 apply_pending()에서 호출됨)
+
+        Args:
+            callback: 새 스냅샷을 받는 콜백
+        """
+        if isinstance(callback, MethodType):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback
+        with self._subscribers_lock:
+            self._subscribers.append(ref)
+
+    def unsubscribe(self, callback: Callable[[ConfigSnapshot], None]) -> None:
+        """콜백 등록 해제"""
+        with self._subscribers_lock:
+            self._subscribers = [ref for ref in self._subscribers if ref() not in (None, callback)]
+
+    def _live_subscribers(self) -> List[Callable[[ConfigSnapshot], None]]:
+        with self._subscribers_lock:
+            live = [(ref, ref()) for ref in self._subscribers]
+            self._subscribers = [ref for ref, callback in live if callback is not None]
+        return [callback for _, callback in live if callback is not None]
 
     def save(self) -> None:
         """설정 파일 저장"""
@@ -45,16 +248,7 @@ class Config:
         Returns:
             설정 값
         """
-        keys = key_path.split(".")
-        value = self._config
-
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-
-        return value
+        return self._values.get(key_path, default)
 
     def set(self, key_path: str, value: Any) -> None:
         """
@@ -64,13 +258,21 @@ class Config:
             key_path: 점으로 구분된 키 경로
             value: 설정할 값
         """
+        data = dict(self._config)
+        self._assign(data, key_path, value)
+        self._overrides[key_path] = value
+        self._swap(data)
+
+    @staticmethod
+    def _assign(data: Dict[str, Any], key_path: str, value: Any) -> None:
+        """중첩 dict에 값 기록 (경로의 섹션은 복사해 이전 스냅샷과 공유하지 않음)"""
         keys = key_path.split(".")
-        config = self._config
+        config = data
 
         # 마지막 키 전까지 딕셔너리 탐색
         for key in keys[:-1]:
-            if key not in config:
-                config[key] = {}
+            section = config.get(key)
+            config[key] = dict(section) if isinstance(section, dict) else {}
             config = config[key]
 
         # 마지막 키에 값 설정
@@ -93,12 +295,12 @@ class Config:
     @property
     def development_mode(self) -> bool:
         """개발 모드 활성화 여부"""
-        return self.get("development.enabled", False)
+        return self.snapshot.development_mode
 
     @property
     def debug_mode(self) -> bool:
         """디버그 모드 활성화 여부"""
-        return self.get("development.debug_mode", False)
+        return self.snapshot.debug_mode
 
     @property
     def window_width(self) -> int:
@@ -118,12 +320,12 @@ class Config:
     @property
     def atb_enabled(self) -> bool:
         """ATB 시스템 활성화 여부"""
-        return self.get("combat.atb.enabled", True)
+        return self.snapshot.atb_enabled
 
     @property
     def atb_max_gauge(self) -> int:
         """ATB 최대 게이지"""
-        return self.get("combat.atb.max_gauge", 2000)
+        return self.snapshot.atb_max_gauge
 
     @property
     def difficulty(self) -> str:
@@ -133,17 +335,17 @@ class Config:
     @property
     def master_volume(self) -> float:
         """마스터 볼륨"""
-        return self.get("audio.master_volume", 0.8)
+        return self.snapshot.master_volume
 
     @property
     def bgm_volume(self) -> float:
         """BGM 볼륨"""
-        return self.get("audio.bgm_volume", 0.6)
+        return self.snapshot.bgm_volume
 
     @property
     def sfx_volume(self) -> float:
         """SFX 볼륨"""
-        return self.get("audio.sfx_volume", 0.7)
+        return self.snapshot.sfx_volume
 
     @property
     def auto_save_enabled(self) -> bool:
@@ -156,6 +358,74 @@ class Config:
         return self.get("game.language", "ko")
 
 
+class ConfigWatcher:
+    """
+    설정 파일 감시 (experimental.hot_reload)
+
+    백그라운드 스레드가 주기적으로 파일 수정 시각을 확인하고, 바뀌면 Config.queue_reload()로
+    새 설정을 읽어 대기시킵니다. 적용은 게임 루프의 Config.apply_pending()에서 하므로 구독자는
+    항상 메인 스레드에서 호출됩니다. 저장 도중이라 파싱에 실패하면 이전 스냅샷을 유지합니다.
+    """
+
+    def __init__(self, config: "Config", interval: float = 1.0) -> None:
+        """
+        Args:
+            config: 감시할 Config
+            interval: 확인 주기 (초)
+        """
+        self.config = config
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._mtime_ns = self._current_mtime()
+
+    def _current_mtime(self) -> Optional[int]:
+        try:
+            return self.config.config_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def check(self) -> bool:
+        """
+        파일이 바뀌었으면 다시 읽어 대기시킴
+
+        Returns:
+            새 설정을 대기시켰으면 True
+        """
+        mtime_ns = self._current_mtime()
+        if mtime_ns is None or mtime_ns == self._mtime_ns:
+            return False
+        self._mtime_ns = mtime_ns
+
+        from src.core.logger import get_logger, Loggers
+        logger = get_logger(Loggers.SYSTEM)
+        try:
+            self.config.queue_reload()
+        except Exception as e:
+            logger.warning(f"설정 다시 로드 실패, 이전 설정 유지: {e}")
+            return False
+        logger.info(f"설정 변경 감지, 다음 프레임에 적용: {self.config.config_path}")
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def start(self) -> "ConfigWatcher":
+        """감시 시작"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """감시 중지"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
 # 전역 설정 인스턴스
 config: Optional[Config] = None
 
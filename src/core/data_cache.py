@@ -0,0 +1,222 @@
+"""
+Data Cache - 컴파일된 게임 데이터 캐시
+
+data/ 아래의 YAML(직업, 스킬, 패시브 등)을 한 번에 파싱해 pickle 하나로 저장합니다.
+다음 실행부터는 파일 크기/수정 시각만 비교하고, 달라진 파일도 내용 해시가 같으면 재사용하며
+실제로 바뀐 파일만 다시 파싱합니다. PyYAML의 C 로더(libyaml)가 있으면 사용합니다.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+import yaml
+
+from src.core.config import get_config
+from src.core.logger import get_logger, Loggers
+
+
+logger = get_logger(Loggers.SYSTEM)
+
+# 프로젝트 루트 기준 경로
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
+DEFAULT_CACHE_PATH = PROJECT_ROOT / ".cache" / "data_cache.pickle"
+
+# 캐시 구조가 바뀌면 올림 (이전 캐시는 무시하고 다시 빌드)
+CACHE_VERSION = 1
+
+# C 로더 우선
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _file_hash(path: Path) -> str:
+    """파일 내용 해시"""
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def _parse_yaml(path: Path) -> Any:
+    """YAML 파싱 (C 로더 사용 가능 시 C 로더)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+class DataCache:
+    """
+    컴파일된 데이터 캐시
+
+    키는 data/ 기준 상대 경로입니다. (예: "characters/warrior.yaml", "passives.yaml")
+    """
+
+    def __init__(
+        self,
+        data_dir: Path = DATA_DIR,
+        cache_path: Optional[Path] = None,
+        enabled: Optional[bool] = None
+    ):
+        """
+        Args:
+            data_dir: 데이터 디렉토리
+            cache_path: 캐시 파일 경로 (None이면 performance.data_cache_path)
+            enabled: 캐시 파일 사용 여부 (None이면 performance.cache_enabled)
+        """
+        config = get_config()
+        self.data_dir = Path(data_dir)
+        if cache_path is None:
+            configured = config.get("performance.data_cache_path")
+            cache_path = PROJECT_ROOT / configured if configured else DEFAULT_CACHE_PATH
+        self.cache_path = Path(cache_path)
+        self.enabled = config.get("performance.cache_enabled", True) if enabled is None else enabled
+
+        # 상대 경로 -> 파싱 결과
+        self._data: Dict[str, Any] = {}
+        # 상대 경로 -> (크기, 수정 시각 ns, 내용 해시)
+        self._sources: Dict[str, Tuple[int, int, str]] = {}
+        self._loaded = False
+
+        # 마지막 빌드 통계 (재사용/재파싱 파일 수)
+        self.reused = 0
+        self.parsed = 0
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.refresh()
+
+    def refresh(self) -> bool:
+        """
+        소스 파일과 대조해 캐시 갱신
+
+        Returns:
+            YAML을 하나라도 다시 파싱했거나 삭제된 파일이 있으면 True
+        """
+        cached_data, cached_sources = self._read_cache_file() if self.enabled else ({}, {})
+        # 이미 메모리에 있는 결과도 재사용
+        cached_data = {**cached_data, **self._data}
+        cached_sources = {**cached_sources, **self._sources}
+
+        data: Dict[str, Any] = {}
+        sources: Dict[str, Tuple[int, int, str]] = {}
+        reused = parsed = 0
+        changed = False
+
+        for path in sorted(self.data_dir.rglob("*.yaml")):
+            key = path.relative_to(self.data_dir).as_posix()
+            try:
+                stat = path.stat()
+                previous = cached_sources.get(key)
+
+                if previous and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                    data[key] = cached_data[key]
+                    sources[key] = previous
+                    reused += 1
+                    continue
+
+                digest = _file_hash(path)
+                if previous and previous[2] == digest:
+                    # 수정 시각만 바뀜 (체크아웃, 복사 등)
+                    data[key] = cached_data[key]
+                    reused += 1
+                else:
+                    data[key] = _parse_yaml(path)
+                    parsed += 1
+                sources[key] = (stat.st_size, stat.st_mtime_ns, digest)
+                changed = True
+
+            except Exception as e:
+                logger.error(f"데이터 파일 로드 실패 ({key}): {e}")
+
+        if cached_sources.keys() - sources.keys():
+            changed = True
+
+        self._data = data
+        self._sources = sources
+        self._loaded = True
+        self.reused, self.parsed = reused, parsed
+
+        if changed and self.enabled:
+            self._write_cache_file()
+
+        logger.debug(f"데이터 캐시: {len(data)}개 파일 (재사용 {reused}, 파싱 {parsed})")
+        return parsed > 0 or changed
+
+    def _read_cache_file(self) -> Tuple[Dict[str, Any], Dict[str, Tuple[int, int, str]]]:
+        """캐시 파일 읽기 (없거나 버전이 다르거나 손상되면 빈 캐시)"""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                payload = pickle.load(f)
+            if payload.get("version") != CACHE_VERSION:
+                return {}, {}
+            return payload["data"], payload["sources"]
+        except FileNotFoundError:
+            return {}, {}
+        except Exception as e:
+            logger.warning(f"데이터 캐시 읽기 실패, 다시 빌드합니다: {e}")
+            return {}, {}
+
+    def _write_cache_file(self) -> None:
+        """캐시 파일 기록 (임시 파일 + rename)"""
+        temp_path = self.cache_path.with_name(f"{self.cache_path.name}.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                pickle.dump(
+                    {"version": CACHE_VERSION, "data": self._data, "sources": self._sources},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(temp_path, self.cache_path)
+        except Exception as e:
+            logger.warning(f"데이터 캐시 기록 실패: {e}")
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+    def get(self, relative_path: str) -> Optional[Any]:
+        """
+        데이터 파일 내용
+
+        Args:
+            relative_path: data/ 기준 상대 경로 (예: "characters/warrior.yaml")
+
+        Returns:
+            파싱된 YAML (파일이 없으면 None)
+        """
+        self._ensure_loaded()
+        return self._data.get(relative_path)
+
+    def has(self, relative_path: str) -> bool:
+        """데이터 파일 존재 여부"""
+        self._ensure_loaded()
+        return relative_path in self._data
+
+    def get_directory(self, directory: str) -> Dict[str, Any]:
+        """
+        디렉토리의 모든 데이터 (하위 디렉토리 제외)
+
+        Args:
+            directory: data/ 기준 디렉토리 (예: "characters")
+
+        Returns:
+            파일 이름(확장자 제외) -> 파싱된 YAML (이름 순)
+        """
+        self._ensure_loaded()
+        prefix = f"{directory.rstrip('/')}/"
+        result = {}
+        for key, value in self._data.items():
+            if key.startswith(prefix) and "/" not in key[len(prefix):]:
+                result[key[len(prefix):-len(".yaml")]] = value
+        return result
+
+
+# 전역 인스턴스
+_data_cache: Optional[DataCache] = None
+
+
+def get_data_cache() -> DataCache:
+    """전역 데이터 캐시 인스턴스"""
+    global _data_cache
+    if _data_cache is None:
+        _data_cache = DataCache()
+    return _data_cache
@@ -4,8 +4,12 @@ Event Bus - 이벤트 기반 통신 시스템
 모든 시스템 간 통신은 이벤트를 통해 이루어집니다.
 """
 
-from typing import Callable, Dict, List, Any
-from collections import defaultdict
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Any, Optional, Tuple, Deque, Hashable, Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.core.event_profiler import EventProfiler
 
 
 class EventBus:
@@ -13,12 +17,69 @@ class EventBus:
     이벤트 버스 - Pub/Sub 패턴 구현
 
     시스템 간 느슨한 결합을 위한 중앙 이벤트 관리자
+
+    이벤트별 구독자 튜플을 구독/해제 시점에만 다시 만들어 두므로, 발행은 dict 조회 한 번과
+    튜플 순회만 합니다. 구독자가 없는 이벤트 발행은 히스토리 기록 외에 아무 일도 하지 않습니다.
+    발행 중에 구독/해제해도 현재 발행은 시작 시점의 구독자 목록으로 전달됩니다.
+
+    지연 모드 (begin_deferred/end_deferred 또는 with deferred()):
+        - 발행된 이벤트는 큐에 쌓였다가 end_deferred()/flush() 때 한 번에 전달됩니다.
+        - 전달 순서는 발행 순서와 같습니다.
+        - set_coalescing()으로 병합 키를 등록한 이벤트는 같은 키끼리 하나로 합쳐져
+          처음 발행된 위치에서 한 번만 전달됩니다. (데이터는 merge 결과, 기본은 마지막 데이터)
+        - 전달 대상은 발행 시점이 아니라 전달 시점의 구독자입니다.
+        - 히스토리는 병합 전 원본이 발행 시점에 기록됩니다.
+        - 전달 중 구독자가 발행한 이벤트는 지연 모드가 끝났으면 즉시 전달되고,
+          아직 지연 중이면(flush 호출) 같은 flush 안에서 큐 끝에 이어 전달됩니다.
     """
 
-    def __init__(self) -> None:
-        self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
-        self._event_history: List[tuple] = []
-        self._max_history = 100
+    def __init__(self, max_history: int = 100) -> None:
+        """
+        Args:
+            max_history: 보관할 이벤트 히스토리 수 (0이면 히스토리 비활성화)
+        """
+        self._subscribers: Dict[str, List[Callable]] = {}
+        # 이벤트 이름 -> 구독자 튜플 (발행용, 구독자가 있는 이벤트만)
+        self._dispatch: Dict[str, Tuple[Callable, ...]] = {}
+        self._event_history: Optional[Deque[tuple]] = None
+        self._max_history = 0
+        self.set_history_size(max_history)
+
+        # 지연 모드
+        self._deferred_depth = 0
+        self._queue: List[list] = []  # [이벤트 이름, 데이터]
+        self._queue_index: Dict[Tuple[str, Hashable], int] = {}  # (이벤트, 병합 키) -> 큐 위치
+        self._coalescers: Dict[str, Tuple[Callable[[Any], Hashable], Optional[Callable[[Any, Any], Any]]]] = {}
+
+        # 프로파일링 (켜면 _deliver를 측정 버전으로 교체하므로 꺼져 있을 때는 비용 없음)
+        self.profiler: Optional["EventProfiler"] = None
+
+    def set_history_size(self, max_history: int) -> None:
+        """
+        히스토리 크기 변경 (0이면 기록하지 않음)
+
+        Args:
+            max_history: 보관할 이벤트 수
+        """
+        self._max_history = max(0, int(max_history))
+        if self._max_history == 0:
+            self._event_history = None
+        else:
+            self._event_history = deque(self._event_history or (), maxlen=self._max_history)
+
+    @property
+    def history_enabled(self) -> bool:
+        """히스토리 기록 여부"""
+        return self._event_history is not None
+
+    def _rebuild(self, event_name: str) -> None:
+        """이벤트의 발행용 구독자 튜플 갱신"""
+        callbacks = self._subscribers.get(event_name)
+        if callbacks:
+            self._dispatch[event_name] = tuple(callbacks)
+        else:
+            self._subscribers.pop(event_name, None)
+            self._dispatch.pop(event_name, None)
 
     def subscribe(self, event_name: str, callback: Callable[[Any], None]) -> None:
         """
@@ -28,8 +89,10 @@ class EventBus:
             event_name: 이벤트 이름 (예: "combat.start")
             callback: 이벤트 발생 시 호출될 콜백 함수
         """
-        if callback not in self._subscribers[event_name]:
-            self._subscribers[event_name].append(callback)
+        callbacks = self._subscribers.setdefault(event_name, [])
+        if callback not in callbacks:
+            callbacks.append(callback)
+            self._rebuild(event_name)
 
     def unsubscribe(self, event_name: str, callback: Callable[[Any], None]) -> None:
         """
@@ -39,8 +102,19 @@ class EventBus:
             event_name: 이벤트 이름
             callback: 제거할 콜백 함수
         """
-        if callback in self._subscribers[event_name]:
-            self._subscribers[event_name].remove(callback)
+        callbacks = self._subscribers.get(event_name)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+            self._rebuild(event_name)
+
+    def has_subscribers(self, event_name: str) -> bool:
+        """
+        구독자 존재 여부 (이벤트 데이터 생성 비용이 클 때 발행 전 확인용)
+
+        Args:
+            event_name: 이벤트 이름
+        """
+        return event_name in self._dispatch
 
     def publish(self, event_name: str, data: Any = None) -> None:
         """
@@ -50,18 +124,151 @@ class EventBus:
             event_name: 이벤트 이름
             data: 이벤트 데이터
         """
-        # 이벤트 히스토리 기록
-        self._event_history.append((event_name, data))
-        if len(self._event_history) > self._max_history:
-            self._event_history.pop(0)
+        # 이벤트 히스토리 기록 (링 버퍼)
+        if self._event_history is not None:
+            self._event_history.append((event_name, data))
 
-        # 구독자들에게 이벤트 전달
-        for callback in self._subscribers[event_name]:
+        if self._deferred_depth:
+            self._enqueue(event_name, data)
+            return
+
+        self._deliver(event_name, data)
+
+    def _deliver(self, event_name: str, data: Any) -> None:
+        """구독자들에게 이벤트 전달"""
+        callbacks = self._dispatch.get(event_name)
+        if callbacks is None:
+            return
+
+        for callback in callbacks:
             try:
                 callback(data)
             except Exception as e:
-                # 콜백 실행 실패 시 로그 (Logger 순환 참조 방지를 위해 print 사용)
-                print(f"[EventBus] 이벤트 콜백 실행 실패: {event_name} - {str(e)}")
+                self._report_error(event_name, callback, e)
+
+    def _deliver_profiled(self, event_name: str, data: Any) -> None:
+        """구독자들에게 이벤트 전달 (이벤트/구독자별 시간 기록)"""
+        profiler = self.profiler
+        clock = profiler.clock
+        callbacks = self._dispatch.get(event_name, ())
+
+        event_start = clock()
+        for callback in callbacks:
+            start = clock()
+            try:
+                callback(data)
+            except Exception as e:
+                self._report_error(event_name, callback, e)
+            profiler.record_callback(callback, clock() - start)
+        profiler.record_event(event_name, clock() - event_start, len(callbacks))
+
+    def enable_profiling(self, profiler: Optional["EventProfiler"] = None) -> "EventProfiler":
+        """
+        지연 시간 프로파일링 시작
+
+        Args:
+            profiler: 사용할 EventProfiler (None이면 새로 생성)
+
+        Returns:
+            EventProfiler (report/dump_json/dump_csv/summary_table)
+        """
+        from src.core.event_profiler import EventProfiler
+
+        self.profiler = profiler or self.profiler or EventProfiler()
+        self._deliver = self._deliver_profiled
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        """프로파일링 중지 (수집한 결과는 self.profiler에 남음)"""
+        self.__dict__.pop("_deliver", None)
+
+    def _report_error(self, event_name: str, callback: Callable, error: Exception) -> None:
+        """콜백 실행 실패 기록 (나머지 구독자에게는 계속 전달)"""
+        # 순환 참조 방지를 위해 지연 임포트
+        from src.core.logger import get_logger, Loggers
+
+        name = getattr(callback, "__qualname__", repr(callback))
+        get_logger(Loggers.SYSTEM).error(f"[EventBus] 이벤트 콜백 실행 실패: {event_name} -> {name} - {error}")
+
+    def _enqueue(self, event_name: str, data: Any) -> None:
+        """지연 큐에 추가 (병합 대상이면 기존 항목과 합침)"""
+        coalescer = self._coalescers.get(event_name)
+        if coalescer is None:
+            self._queue.append([event_name, data])
+            return
+
+        key_func, merge = coalescer
+        index_key = (event_name, key_func(data))
+        index = self._queue_index.get(index_key)
+        if index is None:
+            self._queue_index[index_key] = len(self._queue)
+            self._queue.append([event_name, data])
+        else:
+            entry = self._queue[index]
+            entry[1] = merge(entry[1], data) if merge else data
+
+    def set_coalescing(
+        self,
+        event_name: str,
+        key: Callable[[Any], Hashable],
+        merge: Optional[Callable[[Any, Any], Any]] = None
+    ) -> None:
+        """
+        지연 모드에서 이벤트 병합 규칙 등록
+
+        Args:
+            event_name: 이벤트 이름
+            key: 이벤트 데이터 -> 병합 키 (같은 키끼리 병합)
+            merge: (이전 데이터, 새 데이터) -> 병합된 데이터 (None이면 새 데이터로 교체)
+        """
+        self._coalescers[event_name] = (key, merge)
+
+    def clear_coalescing(self, event_name: str = None) -> None:
+        """
+        병합 규칙 제거
+
+        Args:
+            event_name: 이벤트 이름 (None이면 모든 규칙 제거)
+        """
+        if event_name:
+            self._coalescers.pop(event_name, None)
+        else:
+            self._coalescers.clear()
+
+    @property
+    def is_deferred(self) -> bool:
+        """지연 모드 여부"""
+        return self._deferred_depth > 0
+
+    def begin_deferred(self) -> None:
+        """지연 모드 시작 (중첩 가능, 가장 바깥 end_deferred에서 전달)"""
+        self._deferred_depth += 1
+
+    def end_deferred(self) -> None:
+        """지연 모드 종료 (가장 바깥 단계면 쌓인 이벤트 전달)"""
+        if self._deferred_depth == 0:
+            return
+        self._deferred_depth -= 1
+        if self._deferred_depth == 0:
+            self.flush()
+
+    @contextmanager
+    def deferred(self) -> Iterator["EventBus"]:
+        """with 블록 동안 지연 모드 (예외가 나도 쌓인 이벤트는 전달)"""
+        self.begin_deferred()
+        try:
+            yield self
+        finally:
+            self.end_deferred()
+
+    def flush(self) -> None:
+        """쌓인 이벤트를 발행 순서대로 전달"""
+        while self._queue:
+            queue = self._queue
+            self._queue = []
+            self._queue_index = {}
+            for event_name, data in queue:
+                self._deliver(event_name, data)
 
     def clear_subscribers(self, event_name: str = None) -> None:
         """
@@ -71,9 +278,11 @@ class EventBus:
             event_name: 이벤트 이름 (None이면 모든 구독자 제거)
         """
         if event_name:
-            self._subscribers[event_name].clear()
+            self._subscribers.pop(event_name, None)
+            self._dispatch.pop(event_name, None)
         else:
             self._subscribers.clear()
+            self._dispatch.clear()
 
     def get_event_history(self, event_name: str = None) -> List[tuple]:
         """
@@ -83,11 +292,29 @@ class EventBus:
             event_name: 이벤트 이름 (None이면 전체 히스토리)
 
         Returns:
-            이벤트 히스토리 리스트
+            이벤트 히스토리 리스트 (히스토리 비활성화 시 빈 리스트)
         """
+        if self._event_history is None:
+            return []
         if event_name:
             return [(name, data) for name, data in self._event_history if name == event_name]
-        return self._event_history.copy()
+        return list(self._event_history)
+
+
+def merge_value_change(previous: Dict[str, Any], latest: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    HP/MP/BRV 변화 이벤트 병합 ("change"는 합산, 나머지는 마지막 값)
+
+    Args:
+        previous: 먼저 발행된 데이터
+        latest: 나중에 발행된 데이터
+
+    Returns:
+        병합된 데이터
+    """
+    merged = dict(latest)
+    merged["change"] = previous.get("change", 0) + latest.get("change", 0)
+    return merged
 
 
 # 전역 이벤트 버스 인스턴스
@@ -0,0 +1,193 @@
+"""
+Event Profiler - 이벤트 버스 지연 시간 측정
+
+이벤트 이름별/구독자별 호출 수, 누적 시간, p99 시간과 이벤트당 구독자 수(fan-out)를 기록합니다.
+EventBus.enable_profiling()으로 켰을 때만 측정 경로가 사용되므로 꺼져 있으면 비용이 없습니다.
+"""
+
+import atexit
+import csv
+import json
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Deque
+
+
+# p99 계산용으로 보관할 최근 측정값 수
+DEFAULT_SAMPLE_SIZE = 4096
+
+
+def callback_name(callback: Callable) -> str:
+    """콜백 표시 이름 (모듈.클래스.메서드)"""
+    module = getattr(callback, "__module__", None) or ""
+    name = getattr(callback, "__qualname__", None) or repr(callback)
+    return f"{module}.{name}" if module else name
+
+
+class TimingStats:
+    """한 대상의 호출 통계"""
+
+    __slots__ = ("count", "total", "max", "samples")
+
+    def __init__(self, sample_size: int = DEFAULT_SAMPLE_SIZE):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: Deque[float] = deque(maxlen=sample_size)
+
+    def add(self, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        self.samples.append(elapsed)
+
+    def percentile(self, q: float) -> float:
+        """최근 측정값 기준 백분위 (초)"""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(q / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000.0,
+            "mean_ms": (self.total / self.count * 1000.0) if self.count else 0.0,
+            "p99_ms": self.percentile(99) * 1000.0,
+            "max_ms": self.max * 1000.0,
+        }
+
+
+class EventProfiler:
+    """이벤트/구독자별 지연 시간 수집기"""
+
+    def __init__(self, sample_size: int = DEFAULT_SAMPLE_SIZE, clock: Callable[[], float] = time.perf_counter):
+        """
+        Args:
+            sample_size: p99 계산용으로 대상별 보관할 최근 측정값 수
+            clock: 시간 함수 (테스트용)
+        """
+        self.sample_size = sample_size
+        self.clock = clock
+        self.events: Dict[str, TimingStats] = {}
+        self.callbacks: Dict[str, TimingStats] = {}
+        # 이벤트 이름 -> [발행 수, 전달한 구독자 수 합계, 최대 구독자 수]
+        self.fan_out: Dict[str, List[int]] = {}
+
+    def _stats(self, table: Dict[str, TimingStats], key: str) -> TimingStats:
+        stats = table.get(key)
+        if stats is None:
+            stats = table[key] = TimingStats(self.sample_size)
+        return stats
+
+    def record_event(self, event_name: str, elapsed: float, subscriber_count: int) -> None:
+        """이벤트 한 번 전달 기록 (모든 구독자 포함 시간)"""
+        self._stats(self.events, event_name).add(elapsed)
+        fan_out = self.fan_out.get(event_name)
+        if fan_out is None:
+            fan_out = self.fan_out[event_name] = [0, 0, 0]
+        fan_out[0] += 1
+        fan_out[1] += subscriber_count
+        if subscriber_count > fan_out[2]:
+            fan_out[2] = subscriber_count
+
+    def record_callback(self, callback: Callable, elapsed: float) -> None:
+        """구독자 한 번 호출 기록"""
+        self._stats(self.callbacks, callback_name(callback)).add(elapsed)
+
+    def reset(self) -> None:
+        """측정값 초기화"""
+        self.events.clear()
+        self.callbacks.clear()
+        self.fan_out.clear()
+
+    def report(self) -> Dict[str, Any]:
+        """
+        측정 결과
+
+        Returns:
+            {"events": {이름: 통계}, "callbacks": {이름: 통계}}
+            (이벤트 통계에는 fan-out 평균/최대 포함, 누적 시간 내림차순)
+        """
+        events = {}
+        for name, stats in sorted(self.events.items(), key=lambda item: -item[1].total):
+            publishes, delivered, max_fan_out = self.fan_out.get(name, [0, 0, 0])
+            events[name] = {
+                **stats.to_dict(),
+                "fan_out_mean": delivered / publishes if publishes else 0.0,
+                "fan_out_max": max_fan_out,
+            }
+        callbacks = {
+            name: stats.to_dict()
+            for name, stats in sorted(self.callbacks.items(), key=lambda item: -item[1].total)
+        }
+        return {"events": events, "callbacks": callbacks}
+
+    def dump_json(self, path: str) -> Path:
+        """JSON으로 저장"""
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+        return output
+
+    def dump_csv(self, path: str) -> Path:
+        """CSV로 저장 (kind 열: event/callback)"""
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        report = self.report()
+        fields = ["kind", "name", "count", "total_ms", "mean_ms", "p99_ms", "max_ms", "fan_out_mean", "fan_out_max"]
+        with open(output, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fields, restval="")
+            writer.writeheader()
+            for kind, table in (("event", report["events"]), ("callback", report["callbacks"])):
+                for name, stats in table.items():
+                    writer.writerow({"kind": kind, "name": name, **stats})
+        return output
+
+    def summary_table(self, limit: int = 15) -> str:
+        """누적 시간 상위 이벤트/구독자 요약 표"""
+        report = self.report()
+        lines = []
+
+        lines.append(f"{'이벤트':<32} {'호출':>8} {'누적ms':>10} {'p99ms':>8} {'fan-out':>8}")
+        for name, stats in list(report["events"].items())[:limit]:
+            lines.append(
+                f"{name:<32} {stats['count']:>8} {stats['total_ms']:>10.2f} "
+                f"{stats['p99_ms']:>8.3f} {stats['fan_out_mean']:>8.1f}"
+            )
+
+        lines.append("")
+        lines.append(f"{'구독자':<60} {'호출':>8} {'누적ms':>10} {'p99ms':>8}")
+        for name, stats in list(report["callbacks"].items())[:limit]:
+            lines.append(f"{name[-60:]:<60} {stats['count']:>8} {stats['total_ms']:>10.2f} {stats['p99_ms']:>8.3f}")
+
+        return "\n".join(lines)
+
+
+def register_exit_report(profiler: EventProfiler, output_dir: str = "logs") -> None:
+    """
+    종료 시 결과를 JSON/CSV로 저장하고 요약 표를 로그에 기록
+
+    Args:
+        profiler: EventProfiler
+        output_dir: 저장 디렉토리
+    """
+    def _report() -> None:
+        from src.core.logger import get_logger, Loggers
+
+        if not profiler.events:
+            return
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base = Path(output_dir) / f"event_profile_{stamp}"
+        json_path = profiler.dump_json(f"{base}.json")
+        profiler.dump_csv(f"{base}.csv")
+
+        logger = get_logger(Loggers.SYSTEM)
+        logger.info(f"이벤트 프로파일 저장: {json_path}\n{profiler.summary_table()}")
+
+    atexit.register(_report)
@@ -0,0 +1,128 @@
+"""
+Log Files - 로그 파일 관리
+
+로테이션된 로그 세그먼트 압축, 오래된 세션 로그 정리, 로그 목록/끝부분 읽기를 담당합니다.
+런처에서도 사용하므로 게임 모듈(설정, 로거)을 임포트하지 않습니다.
+"""
+
+import gzip
+import heapq
+import os
+import shutil
+from collections import deque
+from pathlib import Path
+from typing import List, Tuple
+
+
+# 끝에서부터 읽을 때 블록 크기
+_TAIL_BLOCK_SIZE = 8192
+
+
+def is_log_file(name: str) -> bool:
+    """로그 파일 여부 (압축 세그먼트 포함, 압축 중인 임시 파일 제외)"""
+    return name.endswith(".log") or (".log." in name and name.endswith(".gz"))
+
+
+def gzip_file(source: str, dest: str) -> None:
+    """
+    파일을 gzip으로 압축하고 원본 삭제
+
+    임시 파일에 쓴 뒤 rename하므로 압축 도중의 .gz 파일이 보이지 않습니다.
+    """
+    temp_path = f"{dest}.tmp"
+    with open(source, 'rb') as src, gzip.open(temp_path, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    os.replace(temp_path, dest)
+    os.remove(source)
+
+
+def list_log_files(log_dir: Path, limit: int = 20) -> List[Path]:
+    """
+    최근 수정 순 로그 파일 목록
+
+    Args:
+        log_dir: 로그 디렉토리
+        limit: 최대 개수
+
+    Returns:
+        로그 파일 경로 목록 (디렉토리 항목을 한 번만 훑고 상위 limit개만 정렬)
+    """
+    entries: List[Tuple[float, str]] = []
+    try:
+        with os.scandir(log_dir) as it:
+            for entry in it:
+                if is_log_file(entry.name) and entry.is_file():
+                    entries.append((entry.stat().st_mtime, entry.path))
+    except FileNotFoundError:
+        return []
+    return [Path(path) for _, path in heapq.nlargest(limit, entries)]
+
+
+def tail_lines(path: Path, count: int = 50) -> List[str]:
+    """
+    파일의 마지막 count줄
+
+    일반 파일은 끝에서부터 블록 단위로 필요한 만큼만 읽고, .gz는 압축을 풀면서 흘려보내
+    마지막 count줄만 메모리에 유지합니다.
+    """
+    if count <= 0:
+        return []
+
+    path = Path(path)
+    if path.suffix == ".gz":
+        with gzip.open(path, 'rt', encoding='utf-8', errors='replace') as f:
+            return [line.rstrip("\r\n") for line in deque(f, maxlen=count)]
+
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        blocks: List[bytes] = []
+        newlines = 0
+        # 마지막 줄 끝의 줄바꿈은 줄 수에 포함하지 않도록 count + 1개를 찾음
+        while position > 0 and newlines <= count:
+            size = min(_TAIL_BLOCK_SIZE, position)
+            position -= size
+            f.seek(position)
+            block = f.read(size)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+
+    data = b"".join(reversed(blocks))
+    lines = data.decode('utf-8', errors='replace').splitlines()
+    return lines[-count:]
+
+
+def prune_session_logs(log_dir: Path, name: str, keep: int, current_session: str = "") -> int:
+    """
+    카테고리의 오래된 세션 로그 삭제
+
+    로그 파일 이름은 "{카테고리}_{세션ID}.log[.N.gz]"이며, 현재 세션을 제외하고
+    세션 ID가 최신인 keep개 세션만 남깁니다.
+
+    Returns:
+        삭제한 파일 수
+    """
+    prefix = f"{name}_"
+    sessions = {}
+    try:
+        with os.scandir(log_dir) as it:
+            for entry in it:
+                if not (entry.name.startswith(prefix) and is_log_file(entry.name)):
+                    continue
+                session_id = entry.name[len(prefix):].split(".", 1)[0]
+                # 다른 카테고리 (예: "combat"과 "combat_ai")
+                if not session_id[:1].isdigit() or session_id == current_session:
+                    continue
+                sessions.setdefault(session_id, []).append(entry.path)
+    except FileNotFoundError:
+        return 0
+
+    removed = 0
+    for session_id in sorted(sessions, reverse=True)[max(keep, 0):]:
+        for path in sessions[session_id]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+    return removed
@@ -2,13 +2,182 @@
 Logger - 로깅 시스템
 
 구조화된 로깅을 위한 로거 클래스
+
+게임 스레드는 로그 레코드를 큐에 넣기만 하고, 포맷팅과 콘솔/파일 기록은 백그라운드
+리스너 스레드가 처리합니다. 메시지는 %-스타일 인자로 넘기면 실제로 기록될 때만 포맷됩니다.
+
+    logger.debug("피해 계산: %s → %d", target.name, damage)
+
+설정(logging.levels, logging.categories)에 따라 꺼진 레벨/카테고리의 호출은 비교 한 번으로 끝납니다.
+logging.rotation이 켜져 있으면 파일이 max_size_mb를 넘을 때 gzip 세그먼트로 로테이션하고,
+카테고리별로 최근 max_files개 세션의 로그만 남깁니다.
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
+import re
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
+from src.core.log_files import gzip_file, prune_session_logs
+
+
+# %-스타일 포맷 지시자 (인자 없이 dict 하나만 넘긴 기존 호출 판별용)
+_FORMAT_DIRECTIVE = re.compile(r"%(\(\w+\))?[-#0 +]*\d*(\.\d+)?[diouxXeEfFgGcrsa%]")
+
+# 기록하지 않음 (CRITICAL보다 높은 임계값)
+_DISABLED = logging.CRITICAL + 1
+
+# 로깅 설정 (configure_logging()으로 config.yaml 값 반영)
+_settings: Dict[str, Any] = {
+    "enabled": True,
+    "console_level": logging.INFO,
+    "file_level": logging.DEBUG,
+    "categories": {},
+    # 크기 기반 로테이션 (logging.rotation)
+    "rotation_enabled": True,
+    "max_bytes": 10 * 1024 * 1024,
+    "max_files": 5,
+}
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    레코드를 포맷하지 않고 그대로 큐에 넣는 핸들러
+
+    기본 QueueHandler는 호출 스레드에서 메시지를 포맷하므로, 포맷은 리스너 스레드로 미룹니다.
+    (로그 인자로 넘긴 객체를 직후에 변경하면 변경된 값이 기록될 수 있음)
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _CompressingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    크기 기반 로테이션 파일 핸들러
+
+    파일이 max_bytes를 넘으면 "{이름}.1.gz", "{이름}.2.gz" ... 로 밀어내고, 떼어낸 세그먼트의
+    gzip 압축은 별도 스레드에서 처리해 로그 기록이 압축을 기다리지 않게 합니다.
+    """
+
+    def __init__(self, filename: Path, max_bytes: int, backup_count: int) -> None:
+        super().__init__(
+            filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True
+        )
+        self._compressor: Optional[threading.Thread] = None
+
+    def rotation_filename(self, default_name: str) -> str:
+        return f"{default_name}.gz"
+
+    def rotate(self, source: str, dest: str) -> None:
+        if not os.path.exists(source):
+            return
+        pending = f"{source}.rotating"
+        os.replace(source, pending)
+        # 종료 시에도 압축을 마치도록 데몬이 아닌 스레드 사용
+        self._compressor = threading.Thread(
+            target=self._compress, args=(pending, dest), name="log-compress", daemon=False
+        )
+        self._compressor.start()
+
+    @staticmethod
+    def _compress(source: str, dest: str) -> None:
+        try:
+            gzip_file(source, dest)
+        except OSError as e:
+            sys.stderr.write(f"로그 압축 실패 ({source}): {e}\n")
+
+    def wait_compression(self) -> None:
+        """진행 중인 압축 완료 대기"""
+        if self._compressor is not None:
+            self._compressor.join()
+            self._compressor = None
+
+    def doRollover(self) -> None:
+        # 이전 세그먼트 압축이 끝나야 .N.gz 번호를 밀어낼 수 있음 (로테이션 주기에 비해 드묾)
+        self.wait_compression()
+        super().doRollover()
+
+    def close(self) -> None:
+        self.wait_compression()
+        super().close()
+
+
+class _CategoryRouter(logging.Handler):
+    """리스너 스레드에서 레코드를 카테고리(로거 이름)별 핸들러로 전달"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._handlers: Dict[str, List[logging.Handler]] = {}
+
+    def set_handlers(self, name: str, handlers: List[logging.Handler]) -> None:
+        old = self._handlers.get(name, [])
+        self._handlers[name] = handlers
+        for handler in old:
+            handler.close()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        for handler in self._handlers.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def flush(self) -> None:
+        for handlers in list(self._handlers.values()):
+            for handler in handlers:
+                try:
+                    handler.flush()
+                except (OSError, ValueError):
+                    # 종료 중 이미 닫힌 스트림
+                    pass
+
+    def close(self) -> None:
+        for handlers in self._handlers.values():
+            for handler in handlers:
+                handler.close()
+        super().close()
+
+
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_router = _CategoryRouter()
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def _ensure_listener() -> None:
+    """백그라운드 리스너 시작 (최초 1회, 종료 시 남은 로그 기록)"""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = logging.handlers.QueueListener(_log_queue, _router)
+            _listener.start()
+            atexit.register(shutdown_logging)
+
+
+def flush_logging() -> None:
+    """큐에 쌓인 로그를 모두 기록할 때까지 대기 (테스트/종료 직전용)"""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener.start()
+    _router.flush()
+
+
+def shutdown_logging() -> None:
+    """리스너 종료 (남은 로그 기록 후 파일 닫기)"""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+    _router.flush()
 
 
 class Logger:
@@ -35,55 +204,128 @@ class Logger:
         if self.logger.handlers:
             self.logger.handlers.clear()
 
+        # 큐 핸들러 (실제 기록은 리스너 스레드의 콘솔/파일 핸들러)
+        self.logger.addHandler(_DeferredQueueHandler(_log_queue))
+        self._threshold = _DISABLED
+        self.apply_settings()
+        _ensure_listener()
+
+    def apply_settings(self) -> None:
+        """현재 로깅 설정으로 핸들러와 레벨 임계값 갱신"""
+        console_level = _settings["console_level"]
+        file_level = _settings["file_level"]
+
         # 콘솔 핸들러
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
+        console_handler.setLevel(console_level)
         console_format = logging.Formatter(
             "[%(levelname)s] %(name)s: %(message)s"
         )
         console_handler.setFormatter(console_format)
-        self.logger.addHandler(console_handler)
 
-        # 파일 핸들러
-        log_file = self.log_dir / f"{name}_{self.session_id}.log"
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
-        file_handler.setLevel(logging.DEBUG)
+        # 파일 핸들러 (로테이션 설정 시 크기 제한 + 오래된 세션 정리)
+        log_file = self.log_dir / f"{self.name}_{self.session_id}.log"
+        if _settings["rotation_enabled"]:
+            max_files = _settings["max_files"]
+            file_handler: logging.Handler = _CompressingRotatingFileHandler(
+                log_file, _settings["max_bytes"], max(max_files - 1, 0)
+            )
+            prune_session_logs(self.log_dir, self.name, max_files - 1, current_session=self.session_id)
+        else:
+            file_handler = logging.FileHandler(log_file, encoding="utf-8", delay=True)
+        file_handler.setLevel(file_level)
         file_format = logging.Formatter(
             "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
         )
         file_handler.setFormatter(file_format)
-        self.logger.addHandler(file_handler)
 
-    def debug(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
-        """디버그 로그"""
+        _router.set_handlers(self.name, [console_handler, file_handler])
+        self._threshold = _category_threshold(self.name, min(console_level, file_level))
+
+    def is_enabled_for(self, level: int) -> bool:
+        """해당 레벨이 기록되는지 (비싼 로그 인자 생성 전 확인용)"""
+        return level >= self._threshold and self.logger.isEnabledFor(level)
+
+    def _log(self, level: int, message: str, args: tuple, extra: Optional[Dict[str, Any]]) -> None:
+        if not self.logger.isEnabledFor(level):
+            return
+        # 기존 호출 형태 logger.debug("메시지", {...}) 지원
+        if extra is None and len(args) == 1 and isinstance(args[0], dict) and not _FORMAT_DIRECTIVE.search(message):
+            extra, args = args[0], ()
         if extra:
-            message = f"{message} | {extra}"
-        self.logger.debug(message)
+            suffix = f" | {extra}"
+            message = message + (suffix.replace("%", "%%") if args else suffix)
+        self.logger.log(level, message, *args)
 
-    def info(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def debug(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
+        """디버그 로그"""
+        if self._threshold <= logging.DEBUG:
+            self._log(logging.DEBUG, message, args, extra)
+
+    def info(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """정보 로그"""
-        if extra:
-            message = f"{message} | {extra}"
-        self.logger.info(message)
+        if self._threshold <= logging.INFO:
+            self._log(logging.INFO, message, args, extra)
 
-    def warning(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def warning(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """경고 로그"""
-        if extra:
-            message = f"{message} | {extra}"
-        self.logger.warning(message)
+        if self._threshold <= logging.WARNING:
+            self._log(logging.WARNING, message, args, extra)
 
-    def error(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def error(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """에러 로그"""
-        if extra:
-            message = f"{message} | {extra}"
-        self.logger.error(message)
+        if self._threshold <= logging.ERROR:
+            self._log(logging.ERROR, message, args, extra)
 
-    def critical(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def critical(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """치명적 에러 로그"""
-        if extra:
-            message = f"{message} | {extra}"
-        self.logger.critical(message)
+        if self._threshold <= logging.CRITICAL:
+            self._log(logging.CRITICAL, message, args, extra)
+
+
+def _category_threshold(name: str, level: int) -> int:
+    """
+    카테고리 설정을 반영한 최소 기록 레벨
+
+    logging.enabled가 false면 기록하지 않고, logging.categories에서 꺼진 카테고리는
+    categories.error가 켜져 있으면 ERROR 이상만 기록합니다. (목록에 없는 카테고리는 켜짐)
+    """
+    if not _settings["enabled"]:
+        return _DISABLED
+    categories = _settings["categories"]
+    if categories.get(name, True):
+        return level
+    return max(level, logging.ERROR) if categories.get("error", True) else _DISABLED
+
+
+def _parse_level(value: Any, default: int) -> int:
+    """"DEBUG" 등 레벨 이름 -> 숫자"""
+    if isinstance(value, int):
+        return value
+    level = logging.getLevelName(str(value).upper())
+    return level if isinstance(level, int) else default
+
+
+def configure_logging(config: Any) -> None:
+    """
+    config.yaml의 logging 설정을 모든 로거에 반영
+
+    로거는 모듈 임포트 시점(설정 초기화 전)에 만들어지므로, initialize_config() 직후에 호출합니다.
+
+    Args:
+        config: Config 인스턴스
+    """
+    _settings["enabled"] = bool(config.get("logging.enabled", True))
+    _settings["console_level"] = _parse_level(config.get("logging.levels.console", "INFO"), logging.INFO)
+    _settings["file_level"] = _parse_level(config.get("logging.levels.file", "DEBUG"), logging.DEBUG)
+    _settings["categories"] = dict(config.get("logging.categories", {}) or {})
+    _settings["rotation_enabled"] = bool(config.get("logging.rotation.enabled", True))
+    _settings["max_bytes"] = int(float(config.get("logging.rotation.max_size_mb", 10)) * 1024 * 1024)
+    _settings["max_files"] = int(config.get("logging.rotation.max_files", 5))
+
+    for logger in _loggers.values():
+        logger.apply_settings()
 
 
 # 전역 로거 저장소
@@ -0,0 +1,144 @@
+"""
+RNG - 결정적 난수 서비스
+
+하나의 런 시드에서 서브시스템별로 독립된 random.Random 스트림을 만들어 나눠 줍니다.
+전역 random 모듈을 공유하지 않으므로 한 서브시스템이 난수를 더 쓰거나 덜 써도 다른 서브시스템의
+결과가 바뀌지 않고, 같은 런 시드로 던전 생성/전투/벤치마크를 그대로 재현할 수 있습니다.
+
+    rng = get_rng().stream(RNGStreams.COMBAT)          # 런 동안 이어지는 스트림
+    rng = get_rng().derive(RNGStreams.DUNGEON, floor)  # 같은 층은 항상 같은 결과
+
+런 시드와 스트림별 진행 상태는 세이브에 "rng_state"로 저장되고, 불러오면 저장 시점의 난수열에서 이어집니다.
+"""
+
+import base64
+import hashlib
+import random
+import secrets
+import struct
+from typing import Any, Dict, List, Optional
+
+
+class RNGStreams:
+    """난수 스트림 이름"""
+    COMBAT = "combat"          # 데미지 분산, 명중, 치명타, 도주, 캐스팅 방해
+    AI = "ai"                  # 적 AI 행동/대상 선택
+    DUNGEON = "dungeon"        # 던전 생성 (층별 derive)
+    SPAWN = "spawn"            # 적 배치/조우 구성
+    LOOT = "loot"              # 아이템 드롭, 전투 보상
+    GATHERING = "gathering"    # 채집 결과
+    COSMETIC = "cosmetic"      # BGM 선택 등 게임 결과와 무관한 연출
+
+
+def derive_seed(seed: int, *keys: object) -> int:
+    """런 시드와 키로 64비트 하위 시드 생성 (키 순서/값이 같으면 항상 같은 시드)"""
+    material = ":".join([str(seed), *(str(key) for key in keys)]).encode("utf-8")
+    return int.from_bytes(hashlib.sha256(material).digest()[:8], "big")
+
+
+def _pack_state(state: tuple) -> List[Any]:
+    """Random.getstate()를 JSON으로 저장할 수 있는 형태로 변환 ([버전, base64(uint32 배열), gauss_next])"""
+    version, internal, gauss_next = state
+    return [version, base64.b64encode(struct.pack(f"<{len(internal)}I", *internal)).decode("ascii"), gauss_next]
+
+
+def _unpack_state(packed: List[Any]) -> tuple:
+    """_pack_state()의 역변환"""
+    version, encoded, gauss_next = packed
+    raw = base64.b64decode(encoded)
+    return version, struct.unpack(f"<{len(raw) // 4}I", raw), gauss_next
+
+
+class RNGService:
+    """서브시스템별 시드 스트림 관리"""
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: 런 시드 (None이면 무작위)
+        """
+        self.seed = seed if seed is not None else secrets.randbits(63)
+        self._streams: Dict[str, random.Random] = {}
+
+    def stream(self, name: str) -> random.Random:
+        """
+        이름별 스트림 (같은 이름은 같은 객체)
+
+        reseed() 시 객체를 바꾸지 않고 다시 시드하므로 참조를 보관해도 됩니다.
+        """
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = self._streams[name] = random.Random(derive_seed(self.seed, name))
+        return rng
+
+    def derive(self, name: str, *keys: object) -> random.Random:
+        """
+        키별 새 스트림 (호출할 때마다 처음부터 시작)
+
+        예: derive(RNGStreams.DUNGEON, floor_number) - 같은 런 시드와 층이면 같은 던전
+        """
+        return random.Random(derive_seed(self.seed, name, *keys))
+
+    def spawn(self, name: str) -> "RNGService":
+        """독립된 하위 서비스 (병렬 시뮬레이션 등 전역 상태를 공유하면 안 되는 경우)"""
+        return RNGService(derive_seed(self.seed, "spawn", name))
+
+    def reseed(self, seed: int) -> None:
+        """런 시드 변경 (기존 스트림은 새 시드로 처음부터 다시 시작)"""
+        self.seed = seed
+        for name, rng in self._streams.items():
+            rng.seed(derive_seed(seed, name))
+
+    def reseed_streams(self, seed: int, *names: str) -> None:
+        """
+        지정한 스트림만 seed에서 다시 시작 (런 시드와 다른 스트림은 그대로)
+
+        RNGService(seed).stream(name)과 같은 난수열이 됩니다. 전투 리플레이처럼
+        일부 구간만 작은 시드로 재현해야 할 때 사용합니다.
+        """
+        for name in names:
+            self.stream(name).seed(derive_seed(seed, name))
+
+    def get_state(self) -> Dict[str, Any]:
+        """런 시드와 스트림별 진행 상태 (세이브 저장용, JSON 직렬화 가능)"""
+        return {
+            "seed": self.seed,
+            "streams": {name: _pack_state(rng.getstate()) for name, rng in self._streams.items()},
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        get_state()로 저장한 상태 복원 (저장 시점의 난수열에서 이어짐)
+
+        저장 당시 쓰이지 않은 스트림은 런 시드에서 처음부터 시작합니다.
+        """
+        self.reseed(state["seed"])
+        for name, packed in state.get("streams", {}).items():
+            self.stream(name).setstate(_unpack_state(packed))
+
+
+# 전역 인스턴스
+_rng_service: Optional[RNGService] = None
+
+
+def get_rng() -> RNGService:
+    """전역 난수 서비스 인스턴스"""
+    global _rng_service
+    if _rng_service is None:
+        _rng_service = RNGService()
+    return _rng_service
+
+
+def set_run_seed(seed: Optional[int] = None) -> RNGService:
+    """
+    런 시드 설정 (새 게임 시작, 세이브 불러오기, 벤치마크/시뮬레이션)
+
+    Args:
+        seed: 런 시드 (None이면 새 무작위 시드)
+
+    Returns:
+        전역 난수 서비스
+    """
+    service = get_rng()
+    service.reseed(seed if seed is not None else secrets.randbits(63))
+    return service
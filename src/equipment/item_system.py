@@ -7,7 +7,8 @@
 from enum import Enum
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
-import random
+
+from src.core.rng import get_rng, RNGStreams
 
 # Equipment effects 임포트 (순환 참조 방지를 위해 lazy import 사용)
 from typing import TYPE_CHECKING
@@ -2344,7 +2345,8 @@ class ItemGenerator:
 
         # 랜덤 접사 선택
         available_affixes = list(AFFIX_POOL.values())
-        selected = random.sample(available_affixes, min(count, len(available_affixes)))
+        rng = get_rng().stream(RNGStreams.LOOT)
+        selected = rng.sample(available_affixes, min(count, len(available_affixes)))
 
         return selected
 
@@ -2530,7 +2532,8 @@ class ItemGenerator:
             }
 
         # 등급 결정
-        roll = random.random()
+        rng = get_rng().stream(RNGStreams.LOOT)
+        roll = rng.random()
         cumulative = 0.0
         chosen_rarity = ItemRarity.COMMON
 
@@ -2551,7 +2554,7 @@ class ItemGenerator:
             # 적합한 템플릿 없으면 소비 아이템
             return ItemGenerator.create_consumable("health_potion")
 
-        template_id, template = random.choice(suitable_templates)
+        template_id, template = rng.choice(suitable_templates)
 
         # 타입에 따라 생성
         if template_id in WEAPON_TEMPLATES:
@@ -6,10 +6,11 @@
 
 from enum import Enum
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import random
 
 from src.gathering.ingredient import IngredientDatabase
+from src.core.rng import get_rng, RNGStreams
 
 
 class HarvestableType(Enum):
@@ -124,9 +125,10 @@ class HarvestableObject:
 
         self.harvested = True
         results = {}
+        rng = get_rng().stream(RNGStreams.GATHERING)
 
         for ingredient_id, min_qty, max_qty in self.loot_table:
-            qty = random.randint(min_qty, max_qty)
+            qty = rng.randint(min_qty, max_qty)
             if qty > 0:
                 results[ingredient_id] = results.get(ingredient_id, 0) + qty
 
@@ -141,13 +143,18 @@ class HarvestableGenerator:
     """채집 오브젝트 생성기"""
 
     @staticmethod
-    def generate_for_floor(floor_number: int, count: int = 5) -> List[HarvestableObject]:
+    def generate_for_floor(
+        floor_number: int,
+        count: int = 5,
+        rng: Optional[random.Random] = None
+    ) -> List[HarvestableObject]:
         """
         층별 채집 오브젝트 생성
 
         Args:
             floor_number: 던전 층
             count: 생성할 개수
+            rng: 난수 스트림 (None이면 채집 스트림)
 
         Returns:
             채집 오브젝트 리스트
@@ -187,9 +194,10 @@ class HarvestableGenerator:
         # 가중치 기반 랜덤 선택
         types = [t for t, w in types_weights]
         weights = [w for t, w in types_weights]
+        rng = rng or get_rng().stream(RNGStreams.GATHERING)
 
         for _ in range(count):
-            obj_type = random.choices(types, weights=weights)[0]
+            obj_type = rng.choices(types, weights=weights)[0]
             # 위치는 나중에 던전 생성 시 배치
             obj = HarvestableObject(
                 object_type=obj_type,
@@ -79,20 +79,19 @@ class MetaProgress:
         ]
 
         # 각 직업의 특성 목록 로드 및 기본 2개 해금
-        import yaml
+        from src.core.data_cache import get_data_cache
+        data_cache = get_data_cache()
         for job_id in all_jobs:
             if job_id not in self.unlocked_traits:
-                yaml_path = Path(f"data/characters/{job_id}.yaml")
+                data = data_cache.get(f"characters/{job_id}.yaml")
 
-                if yaml_path.exists():
+                if data is not None:
                     try:
-                        with open(yaml_path, 'r', encoding='utf-8') as f:
-                            data = yaml.safe_load(f)
-                            traits = data.get('traits', [])
+                        traits = data.get('traits', [])
 
-                            # 처음 2개 특성 해금
-                            default_unlocked = [trait['id'] for trait in traits[:2]]
-                            self.unlocked_traits[job_id] = default_unlocked
+                        # 처음 2개 특성 해금
+                        default_unlocked = [trait['id'] for trait in traits[:2]]
+                        self.unlocked_traits[job_id] = default_unlocked
                     except:
                         # 실패 시 빈 리스트
                         self.unlocked_traits[job_id] = []
@@ -0,0 +1,273 @@
+"""
+바이너리 세이브 포맷
+
+파일 구조 (리틀 엔디언):
+    헤더: 매직 b"DOSS" | 포맷 버전 uint16 | 플래그 uint16 | 섹션 수 uint32
+    섹션: 태그 4바이트 | 길이 uint32 | 내용
+
+섹션:
+    META  zlib(JSON) - 던전을 제외한 게임 상태 (파티, 인벤토리, 통계 등)
+    TILE  width uint16 | height uint16 | zlib(타일 타입 uint8 평면)
+    EXPL  zlib(비트 패킹된 explored 플래그)
+    VISI  zlib(비트 패킹된 visible 플래그)
+    LOCK  zlib(비트 패킹된 locked 플래그)
+    SPRS  zlib(JSON) - 희소 테이블 (열쇠, 잠긴 문, 텔레포터, 전리품, 함정, 계단)
+
+알 수 없는 섹션은 건너뛰므로 이후 버전에서 섹션을 추가해도 이전 로더가 동작합니다.
+"""
+
+import json
+import struct
+import zlib
+from typing import Dict, Any, List, Tuple, Optional
+
+import numpy as np
+
+from src.world.tile import TileType
+
+
+MAGIC = b"DOSS"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHI")
+_SECTION = struct.Struct("<4sI")
+_DIMENSIONS = struct.Struct("<HH")
+
+# 던전 그리드 딕셔너리 표시 (serialize_dungeon(compact=True) 결과)
+GRID_FORMAT = "grid"
+
+
+class SaveFormatError(Exception):
+    """세이브 파일 형식 오류"""
+    pass
+
+
+def _pack_bits(mask: np.ndarray) -> bytes:
+    """bool 마스크 -> 압축된 비트열"""
+    return zlib.compress(np.packbits(mask, axis=None).tobytes())
+
+
+def _unpack_bits(data: bytes, shape: Tuple[int, int]) -> np.ndarray:
+    """압축된 비트열 -> bool 마스크"""
+    count = shape[0] * shape[1]
+    bits = np.unpackbits(np.frombuffer(zlib.decompress(data), dtype=np.uint8), count=count)
+    return bits.reshape(shape).astype(bool)
+
+
+def _positions(table: Dict[Tuple[int, int], Any]) -> List[List[Any]]:
+    """좌표 키 dict -> [x, y, 값] 리스트"""
+    return [[x, y, value] for (x, y), value in sorted(table.items())]
+
+
+def pack_dungeon(dungeon: Any) -> Dict[str, Any]:
+    """
+    던전을 평면(plane) 단위 그리드 딕셔너리로 변환
+
+    Args:
+        dungeon: DungeonMap
+
+    Returns:
+        {"format": "grid", ...} 딕셔너리 (평면은 bytes)
+    """
+    from src.world.tile_grid import TILE_TYPES
+
+    grid = dungeon.grid
+    return {
+        "format": GRID_FORMAT,
+        "width": dungeon.width,
+        "height": dungeon.height,
+        "tile_types": zlib.compress(grid.types.tobytes()),
+        "explored": _pack_bits(grid.explored),
+        "visible": _pack_bits(grid.visible),
+        "locked": _pack_bits(grid.locked),
+        "sparse": {
+            # 타입 인덱스 -> 이름 (TileType 순서가 바뀌어도 복원 가능)
+            "type_names": [tile_type.value for tile_type in TILE_TYPES],
+            "key_ids": _positions(grid.key_ids),
+            "trap_damage": _positions(grid.trap_damage),
+            "teleport_targets": _positions(grid.teleport_targets),
+            "loot_ids": _positions(grid.loot_ids),
+            "stairs_up": dungeon.stairs_up,
+            "stairs_down": dungeon.stairs_down,
+            "keys": dungeon.keys,
+            "locked_doors": dungeon.locked_doors,
+            "teleporters": [[src[0], src[1], dst[0], dst[1]] for src, dst in dungeon.teleporters.items()],
+        },
+    }
+
+
+def unpack_dungeon(data: Dict[str, Any]) -> Any:
+    """
+    그리드 딕셔너리를 DungeonMap으로 복원
+
+    Args:
+        data: pack_dungeon 결과
+
+    Returns:
+        DungeonMap
+    """
+    from src.world.dungeon_generator import DungeonMap
+    from src.world.tile_grid import (
+        TILE_TYPE_INDEX, DEFAULT_WALKABLE, DEFAULT_TRANSPARENT, VOID_INDEX
+    )
+
+    width, height = data["width"], data["height"]
+    shape = (height, width)
+    sparse = data["sparse"]
+
+    dungeon = DungeonMap(width, height)
+    grid = dungeon.grid
+
+    # 저장 당시 타입 인덱스 -> 현재 인덱스
+    remap = np.array(
+        [TILE_TYPE_INDEX.get(_tile_type_or_none(name), VOID_INDEX) for name in sparse["type_names"]],
+        dtype=np.uint8
+    )
+    saved_types = np.frombuffer(zlib.decompress(data["tile_types"]), dtype=np.uint8).reshape(shape)
+    grid.types[:] = remap[saved_types]
+    grid.walkable[:] = DEFAULT_WALKABLE[grid.types]
+    grid.transparent[:] = DEFAULT_TRANSPARENT[grid.types]
+    grid.explored[:] = _unpack_bits(data["explored"], shape)
+    grid.visible[:] = _unpack_bits(data["visible"], shape)
+    grid.locked[:] = _unpack_bits(data["locked"], shape)
+
+    grid.key_ids = {(x, y): value for x, y, value in sparse["key_ids"]}
+    grid.trap_damage = {(x, y): value for x, y, value in sparse["trap_damage"]}
+    grid.teleport_targets = {(x, y): tuple(value) for x, y, value in sparse["teleport_targets"]}
+    grid.loot_ids = {(x, y): value for x, y, value in sparse["loot_ids"]}
+    grid.version += 1
+
+    dungeon.stairs_up = tuple(sparse["stairs_up"]) if sparse.get("stairs_up") else None
+    dungeon.stairs_down = tuple(sparse["stairs_down"]) if sparse.get("stairs_down") else None
+    dungeon.keys = [tuple(k) for k in sparse.get("keys", [])]
+    dungeon.locked_doors = [tuple(d) for d in sparse.get("locked_doors", [])]
+    dungeon.teleporters = {(sx, sy): (dx, dy) for sx, sy, dx, dy in sparse.get("teleporters", [])}
+
+    return dungeon
+
+
+def _tile_type_or_none(name: str) -> Optional[TileType]:
+    """이름으로 TileType 찾기 (없으면 None)"""
+    try:
+        return TileType(name)
+    except ValueError:
+        return None
+
+
+def encode_save(game_state: Dict[str, Any]) -> bytes:
+    """
+    게임 상태를 바이너리 세이브로 인코딩
+
+    game_state["dungeon"]이 그리드 딕셔너리면 평면 섹션으로, 아니면(구 JSON 타일 목록)
+    META에 그대로 포함합니다.
+
+    Args:
+        game_state: 게임 상태 딕셔너리
+
+    Returns:
+        세이브 파일 바이트
+    """
+    state = dict(game_state)
+    sections: List[Tuple[bytes, bytes]] = []
+
+    dungeon = state.get("dungeon")
+    if isinstance(dungeon, dict) and dungeon.get("format") == GRID_FORMAT:
+        del state["dungeon"]
+        sections.append((b"TILE", _DIMENSIONS.pack(dungeon["width"], dungeon["height"]) + dungeon["tile_types"]))
+        sections.append((b"EXPL", dungeon["explored"]))
+        sections.append((b"VISI", dungeon["visible"]))
+        sections.append((b"LOCK", dungeon["locked"]))
+        sparse = json.dumps(dungeon["sparse"], ensure_ascii=False, separators=(",", ":"))
+        sections.append((b"SPRS", zlib.compress(sparse.encode("utf-8"))))
+
+    meta = json.dumps(state, ensure_ascii=False, separators=(",", ":"))
+    sections.insert(0, (b"META", zlib.compress(meta.encode("utf-8"))))
+
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(sections))]
+    for tag, payload in sections:
+        parts.append(_SECTION.pack(tag, len(payload)))
+        parts.append(payload)
+    return b"".join(parts)
+
+
+def _read_sections(data: bytes, wanted: Optional[Tuple[bytes, ...]] = None) -> Dict[bytes, bytes]:
+    """헤더 검증 후 섹션 읽기"""
+    if len(data) < _HEADER.size:
+        raise SaveFormatError("세이브 파일이 너무 짧습니다")
+
+    magic, version, _flags, count = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise SaveFormatError("바이너리 세이브 파일이 아닙니다")
+    if version > FORMAT_VERSION:
+        raise SaveFormatError(f"지원하지 않는 세이브 버전: {version} (최대 {FORMAT_VERSION})")
+
+    sections: Dict[bytes, bytes] = {}
+    offset = _HEADER.size
+    for _ in range(count):
+        if offset + _SECTION.size > len(data):
+            raise SaveFormatError("세이브 파일이 손상되었습니다 (섹션 헤더)")
+        tag, length = _SECTION.unpack_from(data, offset)
+        offset += _SECTION.size
+        if offset + length > len(data):
+            raise SaveFormatError(f"세이브 파일이 손상되었습니다 ({tag!r} 섹션)")
+        if wanted is None or tag in wanted:
+            sections[tag] = data[offset:offset + length]
+        offset += length
+
+    return sections
+
+
+def is_binary_save(data: bytes) -> bool:
+    """바이너리 세이브 여부"""
+    return data[:len(MAGIC)] == MAGIC
+
+
+def decode_save(data: bytes) -> Dict[str, Any]:
+    """
+    바이너리 세이브를 게임 상태 딕셔너리로 디코딩
+
+    던전은 그리드 딕셔너리({"format": "grid", ...})로 복원되며 deserialize_dungeon이 처리합니다.
+
+    Args:
+        data: 세이브 파일 바이트
+
+    Returns:
+        게임 상태 딕셔너리
+    """
+    sections = _read_sections(data)
+    if b"META" not in sections:
+        raise SaveFormatError("META 섹션이 없습니다")
+
+    state = json.loads(zlib.decompress(sections[b"META"]).decode("utf-8"))
+
+    if b"TILE" in sections:
+        tile_section = sections[b"TILE"]
+        width, height = _DIMENSIONS.unpack_from(tile_section, 0)
+        state["dungeon"] = {
+            "format": GRID_FORMAT,
+            "width": width,
+            "height": height,
+            "tile_types": tile_section[_DIMENSIONS.size:],
+            "explored": sections[b"EXPL"],
+            "visible": sections[b"VISI"],
+            "locked": sections[b"LOCK"],
+            "sparse": json.loads(zlib.decompress(sections[b"SPRS"]).decode("utf-8")),
+        }
+
+    return state
+
+
+def read_metadata(data: bytes) -> Dict[str, Any]:
+    """
+    던전 섹션을 풀지 않고 META만 읽기 (목록 표시용)
+
+    Args:
+        data: 세이브 파일 바이트
+
+    Returns:
+        던전을 제외한 게임 상태
+    """
+    sections = _read_sections(data, wanted=(b"META",))
+    if b"META" not in sections:
+        raise SaveFormatError("META 섹션이 없습니다")
+    return json.loads(zlib.decompress(sections[b"META"]).decode("utf-8"))
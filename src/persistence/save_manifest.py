@@ -0,0 +1,188 @@
+"""
+세이브 매니페스트 - 슬롯 목록용 요약 인덱스
+
+저장할 때마다 saves/index.json에 슬롯별 요약(파티, 층, 플레이 시간, 저장 시각)을 기록합니다.
+불러오기 화면과 런처는 세이브 본문을 풀지 않고 이 파일만 읽어 목록을 그립니다.
+
+매니페스트는 언제든 세이브 파일로부터 다시 만들 수 있는 캐시입니다. 항목의 파일 크기/수정 시각이
+실제 파일과 다르면(외부 복사, 구 버전 세이브 등) 해당 세이브만 다시 읽어 갱신합니다.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from src.core.logger import get_logger, Loggers
+from src.persistence.save_format import read_metadata, is_binary_save
+
+
+logger = get_logger(Loggers.SYSTEM)
+
+MANIFEST_NAME = "index.json"
+MANIFEST_VERSION = 1
+
+# 세이브 파일 확장자 (바이너리, 구 JSON) - save_system과 동일
+SAVE_EXTENSIONS = (".sav", ".json")
+
+# 워커 스레드와 게임 스레드가 같은 매니페스트를 갱신할 수 있음
+_manifest_lock = threading.RLock()
+
+
+def is_save_file(path: Path) -> bool:
+    """세이브 파일 여부 (매니페스트, JSON 내보내기, 백업, 임시 파일 제외)"""
+    return (
+        path.suffix in SAVE_EXTENSIONS
+        and path.name != MANIFEST_NAME
+        and not path.name.endswith(".export.json")
+    )
+
+
+def read_save_summary(save_file: Path) -> Dict[str, Any]:
+    """세이브 파일에서 던전을 제외한 상태 읽기 (바이너리는 META 섹션만)"""
+    data = save_file.read_bytes()
+    if is_binary_save(data):
+        return read_metadata(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def build_entry(save_name: str, game_state: Dict[str, Any], save_path: Path) -> Dict[str, Any]:
+    """
+    게임 상태로 매니페스트 항목 생성
+
+    Args:
+        save_name: 저장 파일 이름
+        game_state: 게임 상태 (던전 포함 여부 무관)
+        save_path: 기록된 세이브 파일 경로
+
+    Returns:
+        매니페스트 항목
+    """
+    party = game_state.get("party", [])
+    stat = save_path.stat()
+    return {
+        "name": save_name,
+        "file": save_path.name,
+        "format": "binary" if save_path.suffix == ".sav" else "json",
+        "save_time": game_state.get("save_time", "Unknown"),
+        "floor": game_state.get("floor_number", 1),
+        "max_floor": game_state.get("max_floor_reached", game_state.get("floor_number", 1)),
+        "playtime": game_state.get("playtime", 0),
+        "party_size": len(party),
+        "party": [
+            {
+                "name": member.get("name", "Unknown"),
+                "job_name": member.get("job_name", "Unknown"),
+                "level": member.get("level", 1),
+            }
+            for member in party
+        ],
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+class SaveManifest:
+    """세이브 디렉토리의 index.json 관리"""
+
+    def __init__(self, save_dir: Path):
+        """
+        Args:
+            save_dir: 세이브 디렉토리
+        """
+        self.save_dir = Path(save_dir)
+        self.path = self.save_dir / MANIFEST_NAME
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """매니페스트 읽기 (없거나 손상되면 빈 dict)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != MANIFEST_VERSION:
+                return {}
+            return data.get("saves", {})
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"세이브 매니페스트 읽기 실패, 다시 만듭니다: {e}")
+            return {}
+
+    def _write(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """매니페스트 기록 (임시 파일 + rename)"""
+        temp_path = self.path.with_name(f"{MANIFEST_NAME}.tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": MANIFEST_VERSION, "saves": entries}, f, ensure_ascii=False, indent=1)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logger.warning(f"세이브 매니페스트 기록 실패: {e}")
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+    def update(self, save_name: str, game_state: Dict[str, Any], save_path: Path) -> None:
+        """세이브 기록 직후 항목 갱신"""
+        with _manifest_lock:
+            entries = self._read()
+            entries[save_name] = build_entry(save_name, game_state, save_path)
+            self._write(entries)
+
+    def remove(self, save_name: str) -> None:
+        """항목 삭제"""
+        with _manifest_lock:
+            entries = self._read()
+            if entries.pop(save_name, None) is not None:
+                self._write(entries)
+
+    def get(self, save_name: str) -> Optional[Dict[str, Any]]:
+        """이름으로 항목 조회 (파일과 맞지 않으면 갱신)"""
+        for entry in self.entries():
+            if entry["name"] == save_name:
+                return entry
+        return None
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """
+        슬롯 목록 (최근 저장 순)
+
+        디렉토리의 세이브 파일과 대조해 삭제된 항목은 빼고, 새로 생겼거나 바뀐 파일만 다시 읽습니다.
+        같은 이름의 .sav와 .json이 있으면 .sav를 사용합니다.
+        """
+        with _manifest_lock:
+            entries = self._read()
+            current: Dict[str, Dict[str, Any]] = {}
+            changed = False
+
+            for extension in SAVE_EXTENSIONS:
+                for save_file in self.save_dir.glob(f"*{extension}"):
+                    if save_file.stem in current or not is_save_file(save_file):
+                        continue
+
+                    entry = entries.get(save_file.stem)
+                    try:
+                        stat = save_file.stat()
+                        if (
+                            entry is None
+                            or entry.get("file") != save_file.name
+                            or entry.get("size") != stat.st_size
+                            or entry.get("mtime_ns") != stat.st_mtime_ns
+                        ):
+                            entry = build_entry(save_file.stem, read_save_summary(save_file), save_file)
+                            changed = True
+                    except Exception as e:
+                        logger.warning(f"저장 파일 읽기 실패: {save_file}, {e}")
+                        continue
+
+                    current[save_file.stem] = entry
+
+            if changed or current.keys() != entries.keys():
+                self._write(current)
+
+        return sorted(current.values(), key=lambda x: x["save_time"], reverse=True)
+
+
+def format_playtime(seconds: float) -> str:
+    """플레이 시간 표시 (H:MM:SS)"""
+    seconds = int(seconds or 0)
+    return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
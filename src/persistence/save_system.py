@@ -1,30 +1,127 @@
 """
 저장/로드 시스템
 
-모든 게임 상태를 JSON으로 저장
+게임 상태를 바이너리 세이브(.sav)로 저장 (구 JSON 세이브 로드 및 JSON 내보내기 지원)
 """
 
+import copy
 import json
+import os
+import shutil
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from datetime import datetime
 
+from src.core.config import get_config
 from src.core.logger import get_logger, Loggers
+from src.core.rng import get_rng
+from src.persistence.save_format import (
+    encode_save, decode_save, is_binary_save, pack_dungeon, unpack_dungeon, GRID_FORMAT
+)
+from src.persistence.save_manifest import SaveManifest
+
+
+if TYPE_CHECKING:
+    from src.persistence.save_worker import SaveJob
 
 
 logger = get_logger(Loggers.SYSTEM)
 
+# 세이브 파일 확장자 (바이너리, 구 JSON)
+BINARY_EXTENSION = ".sav"
+JSON_EXTENSION = ".json"
+
+# 게임 스레드(save_game)와 SaveWorker 스레드가 같은 슬롯을 동시에 기록할 수 있음
+_path_locks: Dict[Path, threading.Lock] = {}
+_path_locks_guard = threading.Lock()
+
+
+def _lock_for(save_path: Path) -> threading.Lock:
+    """세이브 경로별 잠금 (백업 회전 + 교체를 한 번에 하나만)"""
+    key = save_path.resolve()
+    with _path_locks_guard:
+        lock = _path_locks.get(key)
+        if lock is None:
+            lock = _path_locks[key] = threading.Lock()
+        return lock
+
 
 class SaveSystem:
     """저장 시스템"""
 
-    def __init__(self, save_directory: str = "saves"):
+    def __init__(
+        self,
+        save_directory: str = "saves",
+        binary: bool = True,
+        backup_enabled: Optional[bool] = None,
+        max_backups: Optional[int] = None
+    ):
+        """
+        Args:
+            save_directory: 저장 디렉토리
+            binary: True면 바이너리(.sav), False면 JSON으로 저장
+            backup_enabled: 덮어쓰기 전 이전 세이브 백업 (None이면 save.backup_enabled)
+            max_backups: 보관할 백업 수 (None이면 save.max_backups)
+        """
         self.save_dir = Path(save_directory)
         self.save_dir.mkdir(exist_ok=True)
+        self.binary = binary
+        self.manifest = SaveManifest(self.save_dir)
+
+        config = get_config()
+        self.backup_enabled = config.get("save.backup_enabled", True) if backup_enabled is None else backup_enabled
+        self.max_backups = config.get("save.max_backups", 3) if max_backups is None else max_backups
+
+    def _find_save(self, save_name: str) -> Optional[Path]:
+        """저장 파일 경로 (바이너리 우선, 없으면 구 JSON)"""
+        for extension in (BINARY_EXTENSION, JSON_EXTENSION):
+            save_path = self.save_dir / f"{save_name}{extension}"
+            if save_path.exists():
+                return save_path
+        return None
 
     def save_game(self, save_name: str, game_state: Dict[str, Any]) -> bool:
         """
-        게임 저장
+        게임 저장 (현재 스레드에서 즉시 기록)
+
+        Args:
+            save_name: 저장 파일 이름
+            game_state: 전체 게임 상태 딕셔너리
+
+        Returns:
+            성공 여부
+        """
+        self._stamp(game_state)
+        return self.write_save(save_name, game_state)
+
+    def save_game_async(self, save_name: str, game_state: Dict[str, Any]) -> "SaveJob":
+        """
+        게임 저장 (백그라운드 워커에서 직렬화/기록)
+
+        호출 스레드에서는 상태 스냅샷(깊은 복사)만 만들고 바로 반환합니다.
+
+        Args:
+            save_name: 저장 파일 이름
+            game_state: 전체 게임 상태 딕셔너리
+
+        Returns:
+            SaveJob (job.wait()로 완료 대기 가능)
+        """
+        from src.persistence.save_worker import get_save_worker
+
+        self._stamp(game_state)
+        return get_save_worker().submit(self, save_name, copy.deepcopy(game_state))
+
+    def _stamp(self, game_state: Dict[str, Any]) -> None:
+        """저장 시간/버전 기록"""
+        game_state["save_time"] = datetime.now().isoformat()
+        game_state["version"] = "5.0.0"
+
+    def write_save(self, save_name: str, game_state: Dict[str, Any]) -> bool:
+        """
+        직렬화 후 원자적으로 기록 (임시 파일 + fsync + rename, 기존 파일은 백업으로 회전)
 
         Args:
             save_name: 저장 파일 이름
@@ -34,14 +131,21 @@ class SaveSystem:
             성공 여부
         """
         try:
-            save_path = self.save_dir / f"{save_name}.json"
+            if self.binary:
+                save_path = self.save_dir / f"{save_name}{BINARY_EXTENSION}"
+                data = encode_save(game_state)
+            else:
+                save_path = self.save_dir / f"{save_name}{JSON_EXTENSION}"
+                data = json.dumps(to_json_state(game_state), ensure_ascii=False).encode('utf-8')
 
-            # 저장 시간 추가
-            game_state["save_time"] = datetime.now().isoformat()
-            game_state["version"] = "5.0.0"
+            self._write_atomic(save_path, data)
+            self.manifest.update(save_name, game_state, save_path)
 
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(game_state, f, indent=2, ensure_ascii=False)
+            if self.binary:
+                # 같은 이름의 구 JSON 세이브 정리
+                legacy_path = self.save_dir / f"{save_name}{JSON_EXTENSION}"
+                if legacy_path.exists():
+                    legacy_path.unlink()
 
             logger.info(f"게임 저장 완료: {save_path}")
             return True
@@ -50,6 +154,60 @@ class SaveSystem:
             logger.error(f"게임 저장 실패: {e}")
             return False
 
+    def _write_atomic(self, save_path: Path, data: bytes) -> None:
+        """
+        임시 파일에 기록 후 rename으로 교체 (중간에 종료돼도 기존 세이브 보존)
+
+        임시 파일은 기록마다 고유한 이름을 쓰고, 백업 회전과 교체는 경로별 잠금 안에서 수행합니다.
+        """
+        f = tempfile.NamedTemporaryFile(dir=save_path.parent, prefix=f"{save_path.name}.", suffix=".tmp", delete=False)
+        temp_path = Path(f.name)
+        try:
+            with f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+            with _lock_for(save_path):
+                if self.backup_enabled and save_path.exists():
+                    self._rotate_backups(save_path)
+                os.replace(temp_path, save_path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+    def _rotate_backups(self, save_path: Path) -> None:
+        """
+        백업 회전: name.sav.1(가장 최근) ... name.sav.N
+
+        현재 세이브는 복사로 백업하므로 rename 전까지 원본이 항상 남아 있습니다.
+        """
+        if self.max_backups <= 0:
+            return
+
+        oldest = save_path.with_name(f"{save_path.name}.{self.max_backups}")
+        if oldest.exists():
+            oldest.unlink()
+
+        for index in range(self.max_backups - 1, 0, -1):
+            backup = save_path.with_name(f"{save_path.name}.{index}")
+            if backup.exists():
+                os.replace(backup, save_path.with_name(f"{save_path.name}.{index + 1}"))
+
+        shutil.copy2(save_path, save_path.with_name(f"{save_path.name}.1"))
+
+    def get_backups(self, save_name: str) -> List[Path]:
+        """세이브 백업 목록 (최근 순)"""
+        save_path = self._find_save(save_name)
+        if save_path is None:
+            return []
+        backups = []
+        for index in range(1, self.max_backups + 1):
+            backup = save_path.with_name(f"{save_path.name}.{index}")
+            if backup.exists():
+                backups.append(backup)
+        return backups
+
     def load_game(self, save_name: str) -> Optional[Dict[str, Any]]:
         """
         게임 로드
@@ -61,14 +219,17 @@ class SaveSystem:
             게임 상태 딕셔너리 또는 None
         """
         try:
-            save_path = self.save_dir / f"{save_name}.json"
+            save_path = self._find_save(save_name)
 
-            if not save_path.exists():
-                logger.warning(f"저장 파일 없음: {save_path}")
+            if save_path is None:
+                logger.warning(f"저장 파일 없음: {self.save_dir / save_name}")
                 return None
 
-            with open(save_path, 'r', encoding='utf-8') as f:
-                game_state = json.load(f)
+            data = save_path.read_bytes()
+            if is_binary_save(data):
+                game_state = decode_save(data)
+            else:
+                game_state = json.loads(data.decode('utf-8'))
 
             logger.info(f"게임 로드 완료: {save_path}")
             return game_state
@@ -77,36 +238,57 @@ class SaveSystem:
             logger.error(f"게임 로드 실패: {e}")
             return None
 
-    def list_saves(self) -> List[Dict[str, Any]]:
-        """저장 파일 목록"""
-        saves = []
+    def export_json(self, save_name: str, export_path: Optional[str] = None) -> Optional[Path]:
+        """
+        세이브를 읽기 쉬운 JSON으로 내보내기 (디버깅용)
 
-        for save_file in self.save_dir.glob("*.json"):
-            try:
-                with open(save_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+        Args:
+            save_name: 저장 파일 이름
+            export_path: 내보낼 경로 (None이면 저장 디렉토리의 {save_name}.export.json)
+
+        Returns:
+            내보낸 파일 경로 (실패 시 None)
+        """
+        game_state = self.load_game(save_name)
+        if game_state is None:
+            return None
 
-                saves.append({
-                    "name": save_file.stem,
-                    "save_time": data.get("save_time", "Unknown"),
-                    "floor": data.get("floor_number", 1),
-                    "party_size": len(data.get("party", []))
-                })
+        path = Path(export_path) if export_path else self.save_dir / f"{save_name}.export{JSON_EXTENSION}"
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(to_json_state(game_state), f, indent=2, ensure_ascii=False)
+            logger.info(f"세이브 JSON 내보내기: {path}")
+            return path
+        except Exception as e:
+            logger.error(f"세이브 JSON 내보내기 실패: {e}")
+            return None
 
-            except Exception as e:
-                logger.warning(f"저장 파일 읽기 실패: {save_file}, {e}")
+    def list_saves(self) -> List[Dict[str, Any]]:
+        """
+        저장 파일 목록 (매니페스트 사용, 세이브 본문은 바뀐 파일만 읽음)
 
-        return sorted(saves, key=lambda x: x["save_time"], reverse=True)
+        Returns:
+            최근 저장 순 요약 목록 (name, save_time, floor, party_size, party, playtime 등)
+        """
+        return self.manifest.entries()
 
     def delete_save(self, save_name: str) -> bool:
         """저장 파일 삭제"""
         try:
-            save_path = self.save_dir / f"{save_name}.json"
-            if save_path.exists():
-                save_path.unlink()
-                logger.info(f"저장 파일 삭제: {save_path}")
-                return True
-            return False
+            deleted = False
+            for extension in (BINARY_EXTENSION, JSON_EXTENSION):
+                save_path = self.save_dir / f"{save_name}{extension}"
+                if save_path.exists():
+                    save_path.unlink()
+                    logger.info(f"저장 파일 삭제: {save_path}")
+                    deleted = True
+
+                # 회전 백업도 함께 삭제
+                for backup in self.save_dir.glob(f"{save_name}{extension}.[0-9]*"):
+                    backup.unlink()
+
+            self.manifest.remove(save_name)
+            return deleted
 
         except Exception as e:
             logger.error(f"저장 파일 삭제 실패: {e}")
@@ -122,8 +304,16 @@ class SaveSystem:
         Returns:
             저장 파일이 존재하면 True, 없으면 False
         """
-        save_path = self.save_dir / f"save_slot_{slot}.json"
-        return save_path.exists()
+        return self._find_save(f"save_slot_{slot}") is not None
+
+
+def to_json_state(game_state: Dict[str, Any]) -> Dict[str, Any]:
+    """그리드 던전을 JSON 타일 목록으로 바꾼 게임 상태 (JSON 저장/내보내기용)"""
+    dungeon = game_state.get("dungeon")
+    if isinstance(dungeon, dict) and dungeon.get("format") == GRID_FORMAT:
+        game_state = dict(game_state)
+        game_state["dungeon"] = serialize_dungeon(unpack_dungeon(dungeon))
+    return game_state
 
 
 def serialize_party_member(member: Any) -> Dict[str, Any]:
@@ -189,33 +379,41 @@ def serialize_item(item: Any) -> Dict[str, Any]:
     }
 
 
-def serialize_dungeon(dungeon: Any) -> Dict[str, Any]:
-    """던전 직렬화"""
-    from src.world.tile import TileType
+def serialize_dungeon(dungeon: Any, compact: bool = False) -> Dict[str, Any]:
+    """
+    던전 직렬화
 
-    # 타일 데이터 압축 (변경된 타일만 저장)
-    tiles_data = []
+    Args:
+        dungeon: DungeonMap
+        compact: True면 바이너리 세이브용 그리드 딕셔너리 (타일 평면 + 희소 테이블)
+    """
+    import numpy as np
 
-    for y in range(dungeon.height):
-        for x in range(dungeon.width):
-            tile = dungeon.get_tile(x, y)
-
-            # 기본 VOID 타일은 저장 안 함
-            if tile.tile_type == TileType.VOID and not tile.explored:
-                continue
-
-            tiles_data.append({
-                "x": x,
-                "y": y,
-                "type": tile.tile_type.value,
-                "explored": tile.explored,
-                "visible": tile.visible,
-                "locked": tile.locked,
-                "key_id": tile.key_id,
-                "trap_damage": tile.trap_damage,
-                "teleport_target": tile.teleport_target,
-                "loot_id": tile.loot_id
-            })
+    if compact:
+        return pack_dungeon(dungeon)
+
+    from src.world.tile_grid import TILE_TYPES, VOID_INDEX
+
+    grid = dungeon.grid
+
+    # 타일 데이터 압축 (변경된 타일만 저장) - 기본 VOID 타일은 저장 안 함
+    saved_y, saved_x = np.nonzero((grid.types != VOID_INDEX) | grid.explored)
+
+    tiles_data = []
+    for x, y in zip(saved_x.tolist(), saved_y.tolist()):
+        pos = (x, y)
+        tiles_data.append({
+            "x": x,
+            "y": y,
+            "type": TILE_TYPES[grid.types[y, x]].value,
+            "explored": bool(grid.explored[y, x]),
+            "visible": bool(grid.visible[y, x]),
+            "locked": bool(grid.locked[y, x]),
+            "key_id": grid.key_ids.get(pos),
+            "trap_damage": grid.trap_damage.get(pos, 0),
+            "teleport_target": grid.teleport_targets.get(pos),
+            "loot_id": grid.loot_ids.get(pos)
+        })
 
     return {
         "width": dungeon.width,
@@ -246,7 +444,7 @@ def serialize_game_state(
     party_data = [serialize_party_member(member) for member in party]
 
     # 던전
-    dungeon_data = serialize_dungeon(dungeon)
+    dungeon_data = serialize_dungeon(dungeon, compact=True)
 
     # 인벤토리
     inventory_data = [serialize_item(item) for item in inventory]
@@ -284,11 +482,54 @@ def serialize_game_state(
         "keys": player_keys,
         "traits": traits_data,
         "passives": passives_data,
+        "run_seed": get_rng().seed,
+        "rng_state": get_rng().get_state(),
+    }
+
+
+def snapshot_game_state(exploration: Any, party: List[Any], inventory: Any) -> Dict[str, Any]:
+    """
+    탐험 중인 게임의 저장용 상태 (저장 메뉴/자동 저장 공용)
+
+    Args:
+        exploration: ExplorationSystem
+        party: 파티원 리스트
+        inventory: 인벤토리
+
+    Returns:
+        게임 상태 딕셔너리
+    """
+    return {
+        "party": [serialize_party_member(m) for m in party] if party else [],
+        "floor_number": exploration.floor_number,
+        "dungeon": serialize_dungeon(exploration.dungeon, compact=True),
+        "player_position": {
+            "x": exploration.player.x,
+            "y": exploration.player.y
+        },
+        "inventory": {
+            "gold": inventory.gold if inventory and hasattr(inventory, 'gold') else 0,
+            "items": [serialize_item(slot.item) for slot in inventory.slots] if inventory and hasattr(inventory, 'slots') else []
+        },
+        "keys": list(exploration.player_keys) if hasattr(exploration, 'player_keys') else [],
+        # 게임 통계 (로그라이크 정산용)
+        "enemies_defeated": exploration.game_stats.get("enemies_defeated", 0),
+        "max_floor_reached": exploration.game_stats.get("max_floor_reached", exploration.floor_number),
+        "total_gold_earned": exploration.game_stats.get("total_gold_earned", 0),
+        "total_exp_earned": exploration.game_stats.get("total_exp_earned", 0),
+        "save_slot": exploration.game_stats.get("save_slot", None),
+        "playtime": exploration.game_stats.get("playtime", 0),
+        # 런 시드와 스트림 진행 상태 (불러오면 저장 시점의 난수열에서 이어짐)
+        "run_seed": get_rng().seed,
+        "rng_state": get_rng().get_state(),
     }
 
 
 def deserialize_dungeon(dungeon_data: Dict[str, Any]) -> Any:
-    """던전 역직렬화"""
+    """던전 역직렬화 (그리드 딕셔너리 또는 구 JSON 타일 목록)"""
+    if dungeon_data.get("format") == GRID_FORMAT:
+        return unpack_dungeon(dungeon_data)
+
     from src.world.dungeon_generator import DungeonMap
     from src.world.tile import TileType
 
@@ -321,7 +562,7 @@ def deserialize_dungeon(dungeon_data: Dict[str, Any]) -> Any:
     # 텔레포터 (문자열 키를 튜플로 변환)
     teleporters = {}
     for k_str, v in dungeon_data.get("teleporters", {}).items():
-        key = eval(k_str)  # "(x, y)" 문자열을 튜플로
+        key = tuple(int(v) for v in k_str.strip("()").split(","))  # "(x, y)" 문자열을 튜플로
         teleporters[key] = tuple(v)
     dungeon.teleporters = teleporters
 
@@ -0,0 +1,229 @@
+"""
+Save Worker - 백그라운드 저장 및 자동 저장
+
+게임 스레드는 상태 스냅샷만 만들고, 직렬화/압축/fsync/rename은 워커 스레드에서 처리합니다.
+같은 세이브에 대한 요청이 밀려 있으면 최신 스냅샷 하나만 기록합니다.
+"""
+
+import atexit
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Callable, Tuple, TYPE_CHECKING
+
+from src.core.config import get_config
+from src.core.logger import get_logger, Loggers
+
+if TYPE_CHECKING:
+    from src.persistence.save_system import SaveSystem
+
+
+logger = get_logger(Loggers.SYSTEM)
+
+
+class SaveJob:
+    """저장 요청 (완료 여부/결과 확인용)"""
+
+    def __init__(self, save_name: str):
+        self.save_name = save_name
+        self.success: Optional[bool] = None
+        self._done = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        """완료 여부"""
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        완료 대기
+
+        Returns:
+            저장 성공 여부 (시간 초과면 False)
+        """
+        if not self._done.wait(timeout):
+            return False
+        return bool(self.success)
+
+    def _finish(self, success: bool) -> None:
+        self.success = success
+        self._done.set()
+
+
+class SaveWorker:
+    """백그라운드 저장 워커 (단일 데몬 스레드)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Condition()
+        # (저장 디렉토리, 이름) -> (SaveSystem, 상태, 대기 중인 job 목록)
+        self._pending: "OrderedDict[Tuple[str, str], Tuple[Any, Dict[str, Any], list]]" = OrderedDict()
+        self._busy = False
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="SaveWorker", daemon=True)
+        self._thread.start()
+
+    def submit(self, save_system: "SaveSystem", save_name: str, game_state: Dict[str, Any]) -> SaveJob:
+        """
+        저장 요청 등록
+
+        Args:
+            save_system: 기록할 SaveSystem
+            save_name: 저장 파일 이름
+            game_state: 상태 스냅샷 (호출 후 변경하지 말 것)
+
+        Returns:
+            SaveJob
+        """
+        job = SaveJob(str(save_name))
+        key = (str(save_system.save_dir), str(save_name))
+
+        with self._lock:
+            if self._stopped:
+                job._finish(False)
+                return job
+
+            if key in self._pending:
+                # 아직 기록 전이면 최신 스냅샷으로 교체
+                _, _, jobs = self._pending.pop(key)
+                jobs.append(job)
+            else:
+                jobs = [job]
+            self._pending[key] = (save_system, game_state, jobs)
+            self._lock.notify()
+
+        return job
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        대기 중인 저장이 모두 끝날 때까지 대기
+
+        Returns:
+            시간 내 완료 여부
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while self._pending or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._lock.wait(remaining)
+        return True
+
+    def shutdown(self, timeout: Optional[float] = 10.0) -> None:
+        """남은 저장을 기록하고 워커 종료"""
+        self.flush(timeout)
+        with self._lock:
+            self._stopped = True
+            self._lock.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._pending and not self._stopped:
+                    self._lock.wait()
+                if not self._pending:
+                    return
+                _, (save_system, game_state, jobs) = self._pending.popitem(last=False)
+                self._busy = True
+
+            success = False
+            try:
+                success = save_system.write_save(jobs[-1].save_name, game_state)
+            except Exception as e:
+                logger.error(f"백그라운드 저장 실패: {e}")
+            finally:
+                for job in jobs:
+                    job._finish(success)
+                with self._lock:
+                    self._busy = False
+                    self._lock.notify_all()
+
+
+class AutoSaveManager:
+    """
+    시간 기반 자동 저장
+
+    게임 루프에서 tick()을 호출하면 save.auto_save_interval(초)마다
+    스냅샷 함수를 호출해 백그라운드로 저장합니다.
+    """
+
+    def __init__(
+        self,
+        save_system: "SaveSystem",
+        interval: Optional[float] = None,
+        enabled: Optional[bool] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            save_system: 저장에 사용할 SaveSystem
+            interval: 자동 저장 간격 초 (None이면 save.auto_save_interval)
+            enabled: 활성화 여부 (None이면 save.auto_save_enabled 및 설정 화면의 save.auto_save)
+            clock: 시간 함수 (테스트용)
+        """
+        config = get_config()
+        self.save_system = save_system
+        self.interval = config.get("save.auto_save_interval", 300) if interval is None else interval
+        if enabled is None:
+            enabled = config.get("save.auto_save_enabled", True) and config.get("save.auto_save", True)
+        self.enabled = enabled
+        self._clock = clock
+        self._last_save = clock()
+        self.last_job: Optional[SaveJob] = None
+
+    def reset_timer(self) -> None:
+        """타이머 초기화 (수동 저장 직후 등)"""
+        self._last_save = self._clock()
+
+    def tick(self, save_name: str, snapshot: Callable[[], Dict[str, Any]]) -> Optional[SaveJob]:
+        """
+        자동 저장 시간이 되었으면 저장 요청
+
+        Args:
+            save_name: 저장 파일 이름
+            snapshot: 현재 게임 상태 딕셔너리를 만드는 함수 (게임 스레드에서 호출)
+
+        Returns:
+            저장 요청 시 SaveJob, 아니면 None
+        """
+        if not self.enabled or self._clock() - self._last_save < self.interval:
+            return None
+
+        self._last_save = self._clock()
+        if self.last_job is not None and not self.last_job.done:
+            # 이전 자동 저장이 아직 진행 중이면 이번 주기는 건너뜀
+            return None
+
+        self.last_job = self.save_system.save_game_async(save_name, snapshot())
+        logger.info(f"자동 저장 요청: {save_name}")
+        return self.last_job
+
+
+# 전역 인스턴스
+_save_worker: Optional[SaveWorker] = None
+_save_worker_lock = threading.Lock()
+
+
+def get_save_worker() -> SaveWorker:
+    """전역 저장 워커 인스턴스 (종료 시 남은 저장을 기록)"""
+    global _save_worker
+    with _save_worker_lock:
+        if _save_worker is None:
+            _save_worker = SaveWorker()
+            atexit.register(_save_worker.shutdown)
+        return _save_worker
+
+
+_autosave_manager: Optional[AutoSaveManager] = None
+
+
+def get_autosave_manager() -> AutoSaveManager:
+    """전역 자동 저장 매니저 인스턴스 (save.save_directory 사용)"""
+    global _autosave_manager
+    if _autosave_manager is None:
+        from src.persistence.save_system import SaveSystem
+
+        save_directory = get_config().get("save.save_directory", "saves/")
+        _autosave_manager = AutoSaveManager(SaveSystem(save_directory.rstrip("/") or "saves"))
+    return _autosave_manager
@@ -9,14 +9,15 @@ from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import tcod
-import random
 
 from src.ui.input_handler import InputHandler, GameAction
 from src.ui.cursor_menu import CursorMenu, MenuItem
 from src.ui.gauge_renderer import GaugeRenderer
 from src.combat.combat_manager import CombatManager, CombatState, ActionType
 from src.combat.casting_system import get_casting_system, CastingSystem
+from src.core.config import get_config
 from src.core.logger import get_logger, Loggers
+from src.core.rng import get_rng, RNGStreams
 from src.audio import play_sfx, play_bgm
 
 
@@ -512,13 +513,12 @@ class CombatUI:
     def _execute_enemy_turn(self, enemy: Any):
         """적 턴 실행 (간단한 AI)"""
         # 간단한 AI: 랜덤 대상에게 BRV 공격 또는 HP 공격
-        import random
 
         allies_alive = [a for a in self.combat_manager.allies if a.is_alive]
         if not allies_alive:
             return
 
-        target = random.choice(allies_alive)
+        target = get_rng().stream(RNGStreams.AI).choice(allies_alive)
 
         # BRV가 충분하면 HP 공격, 아니면 BRV 공격
         if enemy.current_brv > 500:
@@ -1078,7 +1078,7 @@ def run_combat(
     elif is_boss:
         # 보스전: 2개 중 랜덤
         boss_bgm_tracks = ["battle_jenova", "battle_birth_of_god"]
-        selected_bgm = random.choice(boss_bgm_tracks)
+        selected_bgm = get_rng().stream(RNGStreams.COSMETIC).choice(boss_bgm_tracks)
     else:
         # 일반 전투: 3개 중 랜덤
         battle_bgm_tracks = [
@@ -1086,7 +1086,7 @@ def run_combat(
             "battle_jenova_absolute",   # 85-Jenova Absolute
             "battle_normal"             # 11-Fighting
         ]
-        selected_bgm = random.choice(battle_bgm_tracks)
+        selected_bgm = get_rng().stream(RNGStreams.COSMETIC).choice(battle_bgm_tracks)
 
     play_bgm(selected_bgm, loop=True, fade_in=True)
 
@@ -1102,6 +1102,9 @@ def run_combat(
 
     # 전투 루프
     while not ui.battle_ended:
+        # 핫 리로드된 설정 적용 (전투 중에도 ATB/데미지 상수를 메인 스레드에서 반영)
+        get_config().apply_pending()
+
         # 업데이트
         ui.update(delta_time=1.0)
 
@@ -8,7 +8,6 @@ import tcod.console
 import tcod.event
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
-import yaml
 from pathlib import Path
 
 from src.ui.cursor_menu import CursorMenu, MenuItem, TextInputBox
@@ -18,6 +17,7 @@ from src.core.logger import get_logger
 from src.core.config import get_config
 from src.persistence.meta_progress import get_meta_progress
 from src.audio import play_bgm
+from src.core.data_cache import get_data_cache
 import random
 
 
@@ -93,21 +93,20 @@ class PartySetup:
 
         for yaml_file in sorted(characters_dir.glob("*.yaml")):
             try:
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                    job_id = yaml_file.stem
-
-                    # 개발 모드이거나 메타 진행에서 해금된 직업인지 확인
-                    is_unlocked = dev_mode or meta.is_job_unlocked(job_id)
-
-                    jobs.append({
-                        'id': job_id,
-                        'name': data.get('class_name', job_id),
-                        'description': data.get('description', ''),
-                        'archetype': data.get('archetype', ''),
-                        'stats': data.get('base_stats', {}),
-                        'unlocked': is_unlocked
-                    })
+                data = get_data_cache().get(f"characters/{yaml_file.name}")
+                job_id = yaml_file.stem
+
+                # 개발 모드이거나 메타 진행에서 해금된 직업인지 확인
+                is_unlocked = dev_mode or meta.is_job_unlocked(job_id)
+
+                jobs.append({
+                    'id': job_id,
+                    'name': data.get('class_name', job_id),
+                    'description': data.get('description', ''),
+                    'archetype': data.get('archetype', ''),
+                    'stats': data.get('base_stats', {}),
+                    'unlocked': is_unlocked
+                })
             except Exception as e:
                 self.logger.error(f"직업 로드 실패: {yaml_file.name}: {e}")
 
@@ -8,12 +8,12 @@
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-import yaml
 import tcod
 
 from src.ui.input_handler import InputHandler, GameAction
 from src.core.logger import get_logger, Loggers
 from src.core.config import get_config
+from src.core.data_cache import get_data_cache
 
 
 logger = get_logger(Loggers.UI)
@@ -77,8 +77,7 @@ class PassiveSelectionUI:
             return []
 
         try:
-            with open(yaml_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = get_data_cache().get("passives.yaml")
 
             # 개발 모드 확인
             config = get_config()
@@ -11,6 +11,7 @@ from datetime import datetime
 from enum import Enum
 
 from src.persistence.save_system import SaveSystem
+from src.persistence.save_manifest import format_playtime
 from src.ui.tcod_display import Colors
 from src.ui.input_handler import GameAction, InputHandler
 from src.ui.cursor_menu import CursorMenu, MenuItem, TextInputBox
@@ -265,6 +266,7 @@ class SaveLoadUI:
                 save_time = save_info["save_time"]
                 floor = save_info.get("floor", 1)
                 party_size = save_info.get("party_size", 0)
+                playtime = format_playtime(save_info.get("playtime", 0))
 
                 # 이름
                 console.print(
@@ -275,7 +277,10 @@ class SaveLoadUI:
                 )
 
                 # 정보
-                info_text = f"  {floor}층, 파티 {party_size}명"
+                info_text = f"  {floor}층, 파티 {party_size}명, 플레이 {playtime}"
+                leader = save_info.get("party", [])[:1]
+                if leader:
+                    info_text += f" - {leader[0]['name']} Lv.{leader[0]['level']}"
                 console.print(
                     15,
                     y + 1,
@@ -7,12 +7,12 @@
 from enum import Enum
 from typing import List, Optional, Tuple
 import tcod
-import yaml
 from pathlib import Path
 
 from src.ui.input_handler import InputHandler, GameAction
 from src.core.logger import get_logger, Loggers
 from src.persistence.meta_progress import get_meta_progress, save_meta_progress
+from src.core.data_cache import get_data_cache
 
 
 logger = get_logger(Loggers.UI)
@@ -78,19 +78,18 @@ def get_job_unlock_items() -> List[ShopItem]:
         yaml_path = Path(f"data/characters/{job_id}.yaml")
         if yaml_path.exists():
             try:
-                with open(yaml_path, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                    description = data.get('description', '')
-                    archetype = data.get('archetype', '')
-
-                    items.append(ShopItem(
-                        name=f"[직업] {job_name_kr}",
-                        description=f"{archetype} - {description}",
-                        price=1000,  # 직업 해금 가격
-                        category=ShopCategory.JOB_UNLOCKS,
-                        item_id=f"job_{job_id}",
-                        job_id=job_id
-                    ))
+                data = get_data_cache().get(f"characters/{job_id}.yaml")
+                description = data.get('description', '')
+                archetype = data.get('archetype', '')
+
+                items.append(ShopItem(
+                    name=f"[직업] {job_name_kr}",
+                    description=f"{archetype} - {description}",
+                    price=1000,  # 직업 해금 가격
+                    category=ShopCategory.JOB_UNLOCKS,
+                    item_id=f"job_{job_id}",
+                    job_id=job_id
+                ))
             except Exception as e:
                 logger.error(f"직업 정보 로드 실패 ({job_id}): {e}")
 
@@ -124,27 +123,26 @@ def get_trait_unlock_items() -> List[ShopItem]:
 
         if yaml_path.exists():
             try:
-                with open(yaml_path, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                    traits = data.get('traits', [])
-
-                    # 3번째, 4번째, 5번째 특성 해금 아이템 생성
-                    for i, trait in enumerate(traits[2:5], start=3):  # 인덱스 2, 3, 4
-                        trait_id = trait.get('id', '')
-                        trait_name = trait.get('name', '')
-
-                        # 이미 해금되었는지 확인
-                        is_unlocked = meta.is_trait_unlocked(job_id, trait_id)
-
-                        items.append(ShopItem(
-                            name=f"[{job_name_kr}] {trait_name}",
-                            description=trait.get('description', '') + f" (특성 {i}/5)",
-                            price=100 * i,  # 3번째 300, 4번째 400, 5번째 500
-                            category=ShopCategory.TRAIT_UNLOCKS,
-                            item_id=f"{job_id}_{trait_id}",
-                            job_id=job_id,
-                            trait_id=trait_id
-                        ))
+                data = get_data_cache().get(f"characters/{job_id}.yaml")
+                traits = data.get('traits', [])
+
+                # 3번째, 4번째, 5번째 특성 해금 아이템 생성
+                for i, trait in enumerate(traits[2:5], start=3):  # 인덱스 2, 3, 4
+                    trait_id = trait.get('id', '')
+                    trait_name = trait.get('name', '')
+
+                    # 이미 해금되었는지 확인
+                    is_unlocked = meta.is_trait_unlocked(job_id, trait_id)
+
+                    items.append(ShopItem(
+                        name=f"[{job_name_kr}] {trait_name}",
+                        description=trait.get('description', '') + f" (특성 {i}/5)",
+                        price=100 * i,  # 3번째 300, 4번째 400, 5번째 500
+                        category=ShopCategory.TRAIT_UNLOCKS,
+                        item_id=f"{job_id}_{trait_id}",
+                        job_id=job_id,
+                        trait_id=trait_id
+                    ))
             except Exception as e:
                 logger.error(f"특성 로드 실패 ({job_id}): {e}")
 
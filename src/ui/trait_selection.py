@@ -9,7 +9,6 @@ import tcod.console
 import tcod.event
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
-import yaml
 from pathlib import Path
 
 from src.ui.cursor_menu import CursorMenu, MenuItem
@@ -18,6 +17,7 @@ from src.ui.input_handler import GameAction, InputHandler
 from src.core.logger import get_logger
 from src.core.config import get_config
 from src.persistence.meta_progress import get_meta_progress
+from src.core.data_cache import get_data_cache
 
 
 @dataclass
@@ -94,28 +94,27 @@ class TraitSelection:
             return
 
         try:
-            with open(yaml_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                traits_data = data.get('traits', [])
+            data = get_data_cache().get(f"characters/{job_id}.yaml")
+            traits_data = data.get('traits', [])
 
-                self.available_traits = []
-                meta = get_meta_progress()
-
-                for trait_data in traits_data[:5]:  # 최대 5개
-                    trait = Trait(
-                        id=trait_data.get('id', ''),
-                        name=trait_data.get('name', ''),
-                        description=trait_data.get('description', ''),
-                        type=trait_data.get('type', 'passive')
-                    )
+            self.available_traits = []
+            meta = get_meta_progress()
+
+            for trait_data in traits_data[:5]:  # 최대 5개
+                trait = Trait(
+                    id=trait_data.get('id', ''),
+                    name=trait_data.get('name', ''),
+                    description=trait_data.get('description', ''),
+                    type=trait_data.get('type', 'passive')
+                )
 
-                    # 해금 여부 확인 및 추가
-                    # (메타 진행에서 해금 여부를 확인하되, 여기선 모든 특성 로드)
-                    self.available_traits.append(trait)
+                # 해금 여부 확인 및 추가
+                # (메타 진행에서 해금 여부를 확인하되, 여기선 모든 특성 로드)
+                self.available_traits.append(trait)
 
-                self.logger.info(
-                    f"{member.job_name} 특성 {len(self.available_traits)}개 로드"
-                )
+            self.logger.info(
+                f"{member.job_name} 특성 {len(self.available_traits)}개 로드"
+            )
 
         except Exception as e:
             self.logger.error(f"특성 로드 실패: {e}")
@@ -4,6 +4,7 @@
 플레이어가 던전을 돌아다니는 화면
 """
 
+import time
 from typing import List, Optional
 import tcod
 
@@ -11,8 +12,11 @@ from src.world.exploration import ExplorationSystem, ExplorationEvent, Explorati
 from src.world.map_renderer import MapRenderer
 from src.ui.input_handler import InputHandler, GameAction
 from src.ui.gauge_renderer import GaugeRenderer
+from src.core.config import get_config
 from src.core.logger import get_logger, Loggers
 from src.audio.audio_manager import play_bgm
+from src.persistence.save_system import snapshot_game_state
+from src.persistence.save_worker import get_autosave_manager
 
 
 logger = get_logger(Loggers.UI)
@@ -69,7 +73,7 @@ class WorldUI:
         Returns:
             True면 종료
         """
-        logger.warning(f"[DEBUG] handle_input 호출됨: action={action}")
+        logger.debug("[DEBUG] handle_input 호출됨: action=%s", action)
 
         # 종료 확인 모드
         if self.quit_confirm_mode:
@@ -98,10 +102,10 @@ class WorldUI:
 
         # 메뉴 열기 (M키)
         if action == GameAction.MENU:
-            logger.warning(f"[DEBUG] 메뉴 열기 요청")
+            logger.debug("[DEBUG] 메뉴 열기 요청")
             if self.inventory is not None and self.party is not None and console is not None and context is not None:
                 from src.ui.game_menu import open_game_menu, MenuOption
-                logger.warning("[DEBUG] 게임 메뉴 열기")
+                logger.debug("[DEBUG] 게임 메뉴 열기")
                 result = open_game_menu(console, context, self.inventory, self.party, self.exploration)
                 if result == MenuOption.QUIT:
                     self.quit_requested = True
@@ -116,10 +120,10 @@ class WorldUI:
 
         # 인벤토리 열기 (I키)
         if action == GameAction.OPEN_INVENTORY:
-            logger.warning(f"[DEBUG] 인벤토리 열기 요청")
+            logger.debug("[DEBUG] 인벤토리 열기 요청")
             if self.inventory is not None and self.party is not None and console is not None and context is not None:
                 from src.ui.inventory_ui import open_inventory
-                logger.warning("[DEBUG] 인벤토리 열기 시도")
+                logger.debug("[DEBUG] 인벤토리 열기 시도")
                 open_inventory(console, context, self.inventory, self.party)
                 return False
             else:
@@ -139,11 +143,11 @@ class WorldUI:
 
         if dx != 0 or dy != 0:
             result = self.exploration.move_player(dx, dy)
-            logger.warning(f"[DEBUG] 이동 결과: event={result.event}")
+            logger.debug("[DEBUG] 이동 결과: event=%s", result.event)
             self._handle_exploration_result(result)
             # 전투가 트리거되면 즉시 루프 탈출
             if self.combat_requested:
-                logger.warning(f"[DEBUG] 전투 요청됨! 루프 탈출")
+                logger.debug("[DEBUG] 전투 요청됨! 루프 탈출")
                 return True
 
         # 계단 이동
@@ -168,22 +172,22 @@ class WorldUI:
 
     def _handle_exploration_result(self, result: ExplorationResult):
         """탐험 결과 처리"""
-        logger.warning(f"[DEBUG] 탐험 결과: event={result.event}, message={result.message}")
+        logger.debug("[DEBUG] 탐험 결과: event=%s, message=%s", result.event, result.message)
 
         if result.message:
             self.add_message(result.message)
 
         if result.event == ExplorationEvent.COMBAT:
-            logger.warning(f"[DEBUG] 전투 이벤트 감지! combat_requested를 True로 설정")
+            logger.debug("[DEBUG] 전투 이벤트 감지! combat_requested를 True로 설정")
             self.combat_requested = True
             # 전투에 참여할 적들 저장
             if result.data:
                 if "num_enemies" in result.data:
                     self.combat_num_enemies = result.data["num_enemies"]
-                    logger.warning(f"[DEBUG] 전투 적 수: {self.combat_num_enemies}마리")
+                    logger.debug("[DEBUG] 전투 적 수: %s마리", self.combat_num_enemies)
                 if "enemies" in result.data:
                     self.combat_enemies = result.data["enemies"]
-                    logger.warning(f"[DEBUG] 맵 적 엔티티: {len(self.combat_enemies)}개")
+                    logger.debug("[DEBUG] 맵 적 엔티티: %s개", len(self.combat_enemies))
 
         elif result.event == ExplorationEvent.TRAP_TRIGGERED:
             # 함정 데미지는 exploration 시스템에서 이미 적용됨
@@ -379,6 +383,7 @@ def run_exploration(
     """
     ui = WorldUI(console.width, console.height, exploration, inventory, party)
     handler = InputHandler()
+    autosave = get_autosave_manager()
 
     logger.info(f"탐험 시작: {exploration.floor_number}층")
 
@@ -401,6 +406,8 @@ def run_exploration(
             # 후반 층: 위험한 분위기
             play_bgm("danger")
 
+    last_tick = time.monotonic()
+
     while True:
         # 렌더링
         ui.render(console)
@@ -411,11 +418,11 @@ def run_exploration(
             action = handler.dispatch(event)
 
             if action:
-                logger.warning(f"[DEBUG] 액션 수신: {action}")
+                logger.debug("[DEBUG] 액션 수신: %s", action)
                 done = ui.handle_input(action, console, context)
-                logger.warning(f"[DEBUG] handle_input 반환값: {done}")
+                logger.debug("[DEBUG] handle_input 반환값: %s", done)
                 if done:
-                    logger.warning(f"[DEBUG] 루프 탈출 - done=True")
+                    logger.debug("[DEBUG] 루프 탈출 - done=True")
                     break
             else:
                 # action이 None인 경우 (키 입력 없음)
@@ -426,12 +433,27 @@ def run_exploration(
             if isinstance(event, tcod.event.Quit):
                 return ("quit", None)
 
+        # 플레이 시간 누적 (세이브 목록 표시용)
+        now = time.monotonic()
+        exploration.game_stats["playtime"] = exploration.game_stats.get("playtime", 0) + (now - last_tick)
+        last_tick = now
+
+        # 자동 저장 (스냅샷만 만들고 기록은 백그라운드)
+        save_slot = exploration.game_stats.get("save_slot")
+        autosave.tick(
+            str(save_slot) if save_slot is not None else "autosave",
+            lambda: snapshot_game_state(exploration, party, inventory)
+        )
+
+        # 핫 리로드된 설정 적용 (ConfigWatcher가 읽어 둔 설정을 메인 스레드에서 반영)
+        get_config().apply_pending()
+
         # 상태 체크
-        logger.warning(f"[DEBUG] 상태 체크: quit={ui.quit_requested}, combat={ui.combat_requested}, floor_change={ui.floor_change_requested}")
+        logger.debug("[DEBUG] 상태 체크: quit=%s, combat=%s, floor_change=%s", ui.quit_requested, ui.combat_requested, ui.floor_change_requested)
         if ui.quit_requested:
             return ("quit", None)
         elif ui.combat_requested:
-            logger.warning(f"[DEBUG] 전투 반환! 적 {ui.combat_num_enemies}마리 (맵 엔티티: {len(ui.combat_enemies) if ui.combat_enemies else 0}개)")
+            logger.debug("[DEBUG] 전투 반환! 적 %s마리 (맵 엔티티: %s개)", ui.combat_num_enemies, len(ui.combat_enemies) if ui.combat_enemies else 0)
             # 전투 데이터 반환: (적 수, 맵 적 엔티티)
             combat_data = {
                 "num_enemies": ui.combat_num_enemies,
@@ -0,0 +1,198 @@
+"""
+Startup Profiler - 시작 시간 측정 (main.py --profile-startup)
+
+시작 단계(설정, 디스플레이, 스킬 등)별 경과 시간과 tracemalloc 최대 메모리, 그리고 새로 로드된
+모듈별 임포트 시간(하위 임포트 포함/제외)을 기록합니다. 결과는 정렬된 요약 표와 JSON으로 남겨
+시작 시간 회귀를 추적할 수 있게 합니다.
+
+main.py가 다른 모듈보다 먼저 임포트하므로 표준 라이브러리만 사용합니다.
+(tracemalloc 추적 자체가 측정 시간을 늘리므로 절대값보다 단계/버전 간 비교용입니다)
+"""
+
+import builtins
+import importlib.util
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class StartupProfiler:
+    """시작 단계/임포트 시간 수집기"""
+
+    def __init__(self, enabled: bool = True, clock: Callable[[], float] = time.perf_counter, track_memory: bool = True):
+        """
+        Args:
+            enabled: False면 phase()가 아무것도 측정하지 않음
+            clock: 시간 함수 (테스트용)
+            track_memory: tracemalloc으로 단계별 최대 메모리 측정
+        """
+        self.enabled = enabled
+        self.clock = clock
+        self.track_memory = track_memory
+
+        self.phases: List[Dict[str, Any]] = []
+        # 새로 로드된 모듈: 이름, 포함/자체 시간(초), 깊이(0이면 최상위 임포트), 단계
+        self.imports: List[Dict[str, Any]] = []
+
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._current_phase = "imports"
+        self._import_stack: List[float] = []
+        self._original_import: Optional[Callable] = None
+
+    # ===== 수집 =====
+
+    def start(self) -> "StartupProfiler":
+        """측정 시작 (임포트 후킹, tracemalloc 시작)"""
+        if not self.enabled or self._started_at is not None:
+            return self
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+        self._started_at = self.clock()
+        return self
+
+    def stop(self) -> None:
+        """측정 종료 (임포트 후킹 해제)"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+        if self._started_at is not None and self._finished_at is None:
+            self._finished_at = self.clock()
+        if self.track_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        시작 단계 측정
+
+            with profiler.phase("skills"):
+                initialize_all_skills()
+        """
+        if not self.enabled:
+            yield
+            return
+
+        previous_phase, self._current_phase = self._current_phase, name
+        memory = self.track_memory and tracemalloc.is_tracing()
+        if memory:
+            tracemalloc.reset_peak()
+        imports_before = len(self.imports)
+        start = self.clock()
+        try:
+            yield
+        finally:
+            elapsed = self.clock() - start
+            self.phases.append({
+                "name": name,
+                "seconds": elapsed,
+                "peak_kib": tracemalloc.get_traced_memory()[1] / 1024 if memory else None,
+                "imports": len(self.imports) - imports_before,
+            })
+            self._current_phase = previous_phase
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """builtins.__import__ 대체 - 처음 로드되는 모듈만 시간 기록"""
+        original = self._original_import
+        fullname = name
+        if level:
+            try:
+                fullname = importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__"))
+            except (ImportError, ValueError):
+                fullname = None
+        if fullname is None or fullname in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+
+        self._import_stack.append(0.0)
+        start = self.clock()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = self.clock() - start
+            nested = self._import_stack.pop()
+            if self._import_stack:
+                self._import_stack[-1] += elapsed
+            self.imports.append({
+                "module": fullname,
+                "inclusive_s": elapsed,
+                "self_s": elapsed - nested,
+                "depth": len(self._import_stack),
+                "phase": self._current_phase,
+            })
+
+    # ===== 결과 =====
+
+    def report(self) -> Dict[str, Any]:
+        """
+        측정 결과
+
+        Returns:
+            {"total_s", "phases"(시간 내림차순), "top_level_imports"(포함 시간 내림차순),
+             "imports"(자체 시간 내림차순)}
+        """
+        end = self._finished_at if self._finished_at is not None else self.clock()
+        total = end - self._started_at if self._started_at is not None else 0.0
+        return {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "total_s": total,
+            "phases": sorted(self.phases, key=lambda p: -p["seconds"]),
+            "top_level_imports": sorted(
+                (entry for entry in self.imports if entry["depth"] == 0),
+                key=lambda e: -e["inclusive_s"]
+            ),
+            "imports": sorted(self.imports, key=lambda e: -e["self_s"]),
+        }
+
+    def dump_json(self, path: str) -> Path:
+        """JSON으로 저장"""
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+        return output
+
+    def summary_table(self, limit: int = 15) -> str:
+        """단계별 시간과 임포트 비용 상위 항목 요약 표"""
+        report = self.report()
+        lines = [f"시작 시간 합계: {report['total_s'] * 1000:.1f}ms", ""]
+
+        lines.append(f"{'단계':<24} {'ms':>10} {'peak KiB':>10} {'임포트':>6}")
+        for phase in report["phases"]:
+            peak = f"{phase['peak_kib']:>10.0f}" if phase["peak_kib"] is not None else f"{'-':>10}"
+            lines.append(f"{phase['name']:<24} {phase['seconds'] * 1000:>10.1f} {peak} {phase['imports']:>6}")
+
+        lines.append("")
+        lines.append(f"{'최상위 임포트':<48} {'포함ms':>10} {'단계':<16}")
+        for entry in report["top_level_imports"][:limit]:
+            lines.append(f"{entry['module'][-48:]:<48} {entry['inclusive_s'] * 1000:>10.1f} {entry['phase']:<16}")
+
+        lines.append("")
+        lines.append(f"{'모듈 (자체 시간)':<48} {'자체ms':>10} {'포함ms':>10}")
+        for entry in report["imports"][:limit]:
+            lines.append(
+                f"{entry['module'][-48:]:<48} {entry['self_s'] * 1000:>10.1f} {entry['inclusive_s'] * 1000:>10.1f}"
+            )
+
+        return "\n".join(lines)
+
+    def finish(self, output_dir: str = "logs") -> Path:
+        """
+        측정 종료 후 JSON 저장 및 요약 표 출력
+
+        Returns:
+            저장된 JSON 경로 (logs/startup_profile_YYYYmmdd_HHMMSS.json)
+        """
+        self.stop()
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = self.dump_json(str(Path(output_dir) / f"startup_profile_{stamp}.json"))
+        print(self.summary_table())
+        print(f"\n시작 프로파일 저장: {path}")
+        return path
@@ -8,8 +8,13 @@ from typing import List, Tuple, Optional, Dict, Any
 from dataclasses import dataclass
 import random
 
-from src.world.tile import Tile, TileType
+import numpy as np
+
+from src.world.tile import TileType
+from src.world.tile_grid import TileGrid, TileView, TileRows, TILE_TYPE_INDEX
+from src.world.occupancy import OccupancyIndex
 from src.core.logger import get_logger, Loggers
+from src.core.rng import get_rng, RNGStreams
 
 
 logger = get_logger(Loggers.WORLD)
@@ -69,7 +74,7 @@ class DungeonMap:
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.tiles: List[List[Tile]] = []
+        self.grid = TileGrid(width, height)
         self.rooms: List[Rect] = []
         self.corridors: List[Tuple[int, int]] = []
 
@@ -83,32 +88,57 @@ class DungeonMap:
 
         # 채집 오브젝트
         self.harvestables: List[Any] = []  # HarvestableObject 리스트
+        self.harvestable_index = OccupancyIndex()  # 좌표 -> 채집 오브젝트
 
         # 타일 초기화
         self._initialize_tiles()
 
     def _initialize_tiles(self):
         """타일 초기화 (모두 VOID로)"""
-        self.tiles = [
-            [Tile(TileType.VOID, x, y) for x in range(self.width)]
-            for y in range(self.height)
-        ]
+        self.grid = TileGrid(self.width, self.height)
+
+    @property
+    def tiles(self) -> TileRows:
+        """tiles[y][x] 호환 접근자 (TileView 반환)"""
+        return TileRows(self.grid)
 
-    def get_tile(self, x: int, y: int) -> Optional[Tile]:
+    def get_tile(self, x: int, y: int) -> Optional[TileView]:
         """타일 가져오기"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.tiles[y][x]
+            return TileView(self.grid, x, y)
+        return None
+
+    def get_tile_type(self, x: int, y: int) -> Optional[TileType]:
+        """타일 타입 가져오기 (뷰 생성 없이)"""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.grid.get_type(x, y)
         return None
 
     def set_tile(self, x: int, y: int, tile_type: TileType, **kwargs):
         """타일 설정"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.tiles[y][x] = Tile(tile_type, x, y, **kwargs)
+            self.grid.set(x, y, tile_type, **kwargs)
+
+    def add_harvestable(self, harvestable: Any):
+        """채집 오브젝트 추가"""
+        self.harvestables.append(harvestable)
+        self.harvestable_index.add(harvestable)
+
+    def remove_harvestable(self, harvestable: Any):
+        """채집 오브젝트 제거"""
+        if harvestable in self.harvestables:
+            self.harvestables.remove(harvestable)
+            self.harvestable_index.remove(harvestable)
+
+    def get_harvestable_at(self, x: int, y: int) -> Optional[Any]:
+        """특정 위치의 채집 오브젝트"""
+        return self.harvestable_index.get(x, y)
 
     def is_walkable(self, x: int, y: int) -> bool:
         """이동 가능 여부"""
-        tile = self.get_tile(x, y)
-        return tile is not None and tile.walkable and not tile.locked
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return bool(self.grid.walkable[y, x] and not self.grid.locked[y, x])
+        return False
 
 
 class DungeonGenerator:
@@ -120,24 +150,34 @@ class DungeonGenerator:
         height: int = 50,
         min_room_size: int = 5,
         max_room_size: int = 12,
-        max_depth: int = 4
+        max_depth: int = 4,
+        rng: Optional[random.Random] = None
     ):
+        """
+        Args:
+            rng: 사용할 난수 스트림 (None이면 층마다 런 시드에서 derive)
+        """
         self.width = width
         self.height = height
         self.min_room_size = min_room_size
         self.max_room_size = max_room_size
         self.max_depth = max_depth
+        self._fixed_rng = rng
+        self.rng = rng or random.Random()
 
     def generate(self, floor_number: int = 1) -> DungeonMap:
         """
         던전 생성
 
+        같은 런 시드와 층 번호면 항상 같은 던전을 생성합니다.
+
         Args:
             floor_number: 층 번호
 
         Returns:
             DungeonMap
         """
+        self.rng = self._fixed_rng or get_rng().derive(RNGStreams.DUNGEON, floor_number)
         logger.info(f"던전 생성 시작: {self.width}x{self.height}, 층 {floor_number}")
 
         dungeon = DungeonMap(self.width, self.height)
@@ -181,7 +221,7 @@ class DungeonGenerator:
 
         # 분할 방향 결정
         if can_split_horizontally and can_split_vertically:
-            split_horizontally = random.choice([True, False])
+            split_horizontally = self.rng.choice([True, False])
         elif can_split_horizontally:
             split_horizontally = True
         else:
@@ -190,7 +230,7 @@ class DungeonGenerator:
         # 분할
         if split_horizontally:
             # 수평 분할
-            split_pos = random.randint(
+            split_pos = self.rng.randint(
                 rect.y + self.min_room_size,
                 rect.y + rect.height - self.min_room_size
             )
@@ -198,7 +238,7 @@ class DungeonGenerator:
             node.right = BSPNode(Rect(rect.x, split_pos, rect.width, rect.y + rect.height - split_pos))
         else:
             # 수직 분할
-            split_pos = random.randint(
+            split_pos = self.rng.randint(
                 rect.x + self.min_room_size,
                 rect.x + rect.width - self.min_room_size
             )
@@ -228,15 +268,15 @@ class DungeonGenerator:
             max_width = max(self.min_room_size, min(self.max_room_size, rect.width - 2))
             max_height = max(self.min_room_size, min(self.max_room_size, rect.height - 2))
 
-            room_width = random.randint(self.min_room_size, max_width)
-            room_height = random.randint(self.min_room_size, max_height)
+            room_width = self.rng.randint(self.min_room_size, max_width)
+            room_height = self.rng.randint(self.min_room_size, max_height)
 
             # 방 위치 랜덤 (경계 체크)
             max_x_offset = max(1, rect.width - room_width - 1)
             max_y_offset = max(1, rect.height - room_height - 1)
 
-            room_x = rect.x + random.randint(1, max_x_offset)
-            room_y = rect.y + random.randint(1, max_y_offset)
+            room_x = rect.x + self.rng.randint(1, max_x_offset)
+            room_y = rect.y + self.rng.randint(1, max_y_offset)
 
             room = Rect(room_x, room_y, room_width, room_height)
             node.room = room
@@ -282,7 +322,7 @@ class DungeonGenerator:
         x2, y2 = end
 
         # 중간 지점 결정 (L자)
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # 수평 먼저
             for x in range(min(x1, x2), max(x1, x2) + 1):
                 if dungeon.get_tile(x, y1).tile_type == TileType.VOID:
@@ -307,17 +347,19 @@ class DungeonGenerator:
 
     def _create_walls(self, dungeon: DungeonMap):
         """벽 생성 (바닥 주변)"""
-        for y in range(dungeon.height):
-            for x in range(dungeon.width):
-                tile = dungeon.get_tile(x, y)
-                if tile.tile_type == TileType.VOID:
-                    # 인접한 타일 중 바닥이 있으면 벽으로
-                    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                        nx, ny = x + dx, y + dy
-                        neighbor = dungeon.get_tile(nx, ny)
-                        if neighbor and neighbor.tile_type in [TileType.FLOOR, TileType.DOOR]:
-                            dungeon.set_tile(x, y, TileType.WALL)
-                            break
+        types = dungeon.grid.types
+        open_mask = (types == TILE_TYPE_INDEX[TileType.FLOOR]) | (types == TILE_TYPE_INDEX[TileType.DOOR])
+
+        # 인접한(상하좌우) 타일 중 바닥이 있는 VOID 타일은 벽으로
+        near_open = np.zeros_like(open_mask)
+        near_open[1:, :] |= open_mask[:-1, :]
+        near_open[:-1, :] |= open_mask[1:, :]
+        near_open[:, 1:] |= open_mask[:, :-1]
+        near_open[:, :-1] |= open_mask[:, 1:]
+
+        wall_y, wall_x = np.nonzero((types == TILE_TYPE_INDEX[TileType.VOID]) & near_open)
+        for x, y in zip(wall_x.tolist(), wall_y.tolist()):
+            dungeon.set_tile(x, y, TileType.WALL)
 
     def _place_stairs(self, dungeon: DungeonMap):
         """계단 배치"""
@@ -368,7 +410,7 @@ class DungeonGenerator:
             self._place_lava(dungeon, floor_number)
 
         # 치유의 샘
-        if random.random() < 0.3:
+        if self.rng.random() < 0.3:
             self._place_healing_spring(dungeon)
 
         # 보스룸 (마지막 층 또는 5층마다)
@@ -381,7 +423,7 @@ class DungeonGenerator:
             key_id = f"key_{i}"
 
             # 랜덤 방에 열쇠 배치
-            key_room = random.choice(dungeon.rooms[:-2])  # 마지막 2개 방 제외
+            key_room = self.rng.choice(dungeon.rooms[:-2])  # 마지막 2개 방 제외
             key_pos = self._get_random_floor_pos(dungeon, key_room)
             if key_pos:
                 dungeon.set_tile(key_pos[0], key_pos[1], TileType.KEY, key_id=key_id)
@@ -389,7 +431,7 @@ class DungeonGenerator:
 
             # 복도에 잠긴 문 배치
             if len(dungeon.corridors) > 10:
-                lock_pos = random.choice(dungeon.corridors[-len(dungeon.corridors)//2:])
+                lock_pos = self.rng.choice(dungeon.corridors[-len(dungeon.corridors)//2:])
                 dungeon.set_tile(
                     lock_pos[0], lock_pos[1],
                     TileType.LOCKED_DOOR,
@@ -401,16 +443,16 @@ class DungeonGenerator:
     def _place_traps(self, dungeon: DungeonMap, num_traps: int):
         """함정 배치"""
         for _ in range(num_traps):
-            room = random.choice(dungeon.rooms)
+            room = self.rng.choice(dungeon.rooms)
             pos = self._get_random_floor_pos(dungeon, room)
             if pos:
-                damage = random.randint(5, 20)
+                damage = self.rng.randint(5, 20)
                 dungeon.set_tile(pos[0], pos[1], TileType.TRAP, trap_damage=damage)
 
     def _place_chests(self, dungeon: DungeonMap, num_chests: int):
         """보물상자 배치"""
         for i in range(num_chests):
-            room = random.choice(dungeon.rooms)
+            room = self.rng.choice(dungeon.rooms)
             pos = self._get_random_floor_pos(dungeon, room)
             if pos:
                 loot_id = f"chest_{i}"
@@ -419,7 +461,7 @@ class DungeonGenerator:
     def _place_items(self, dungeon: DungeonMap, num_items: int):
         """떨어진 아이템/장비 배치"""
         for i in range(num_items):
-            room = random.choice(dungeon.rooms)
+            room = self.rng.choice(dungeon.rooms)
             pos = self._get_random_floor_pos(dungeon, room)
             if pos:
                 item_id = f"item_{i}"
@@ -432,7 +474,7 @@ class DungeonGenerator:
                 break
 
             # 두 방 선택
-            room1, room2 = random.sample(dungeon.rooms, 2)
+            room1, room2 = self.rng.sample(dungeon.rooms, 2)
 
             pos1 = self._get_random_floor_pos(dungeon, room1)
             pos2 = self._get_random_floor_pos(dungeon, room2)
@@ -447,24 +489,24 @@ class DungeonGenerator:
         """용암 배치"""
         num_lava = min(5, floor_number // 2)
         for _ in range(num_lava):
-            room = random.choice(dungeon.rooms)
+            room = self.rng.choice(dungeon.rooms)
             # 방 가장자리에 용암
-            if random.choice([True, False]):
+            if self.rng.choice([True, False]):
                 # 가로
-                y = random.choice([room.y1, room.y2 - 1])
+                y = self.rng.choice([room.y1, room.y2 - 1])
                 for x in range(room.x1, room.x2):
-                    if random.random() < 0.5:
+                    if self.rng.random() < 0.5:
                         dungeon.set_tile(x, y, TileType.LAVA)
             else:
                 # 세로
-                x = random.choice([room.x1, room.x2 - 1])
+                x = self.rng.choice([room.x1, room.x2 - 1])
                 for y in range(room.y1, room.y2):
-                    if random.random() < 0.5:
+                    if self.rng.random() < 0.5:
                         dungeon.set_tile(x, y, TileType.LAVA)
 
     def _place_healing_spring(self, dungeon: DungeonMap):
         """치유의 샘 배치"""
-        room = random.choice(dungeon.rooms)
+        room = self.rng.choice(dungeon.rooms)
         pos = self._get_random_floor_pos(dungeon, room)
         if pos:
             dungeon.set_tile(pos[0], pos[1], TileType.HEALING_SPRING)
@@ -491,8 +533,8 @@ class DungeonGenerator:
         """방 안의 랜덤 바닥 위치"""
         attempts = 0
         while attempts < 20:
-            x = random.randint(room.x1, room.x2 - 1)
-            y = random.randint(room.y1, room.y2 - 1)
+            x = self.rng.randint(room.x1, room.x2 - 1)
+            y = self.rng.randint(room.y1, room.y2 - 1)
 
             tile = dungeon.get_tile(x, y)
             if tile and tile.tile_type == TileType.FLOOR:
@@ -519,10 +561,10 @@ class DungeonGenerator:
             from src.gathering.harvestable import HarvestableGenerator, HarvestableType, HarvestableObject
 
             # 층별 개수 결정 (12~20개로 대폭 증가) → 식재료 10개 이상 보장
-            count = random.randint(12, 20)
+            count = self.rng.randint(12, 20)
 
             # 채집 오브젝트 생성
-            harvestables = HarvestableGenerator.generate_for_floor(floor_number, count)
+            harvestables = HarvestableGenerator.generate_for_floor(floor_number, count, rng=self.rng)
 
             # 방에 배치
             for harvestable in harvestables:
@@ -530,16 +572,16 @@ class DungeonGenerator:
                     break
 
                 # 랜덤 방 선택
-                room = random.choice(dungeon.rooms)
+                room = self.rng.choice(dungeon.rooms)
                 pos = self._get_random_floor_pos(dungeon, room, avoid_center=True)
 
                 if pos:
                     harvestable.x, harvestable.y = pos
-                    dungeon.harvestables.append(harvestable)
+                    dungeon.add_harvestable(harvestable)
 
             # 요리솥 배치 (층마다 최소 1개 보장)
             # 기본 1개는 무조건 배치
-            room = random.choice(dungeon.rooms) if dungeon.rooms else None
+            room = self.rng.choice(dungeon.rooms) if dungeon.rooms else None
             if room:
                 pos = self._get_random_floor_pos(dungeon, room, avoid_center=False)
                 if pos:
@@ -548,12 +590,12 @@ class DungeonGenerator:
                         x=pos[0],
                         y=pos[1]
                     )
-                    dungeon.harvestables.append(cooking_pot)
+                    dungeon.add_harvestable(cooking_pot)
                     logger.info(f"요리솥 배치 (기본): {pos}")
 
             # 20% 확률로 추가 요리솥 1개 더 배치
-            if random.random() < 0.2 and len(dungeon.rooms) > 1:
-                room = random.choice(dungeon.rooms)
+            if self.rng.random() < 0.2 and len(dungeon.rooms) > 1:
+                room = self.rng.choice(dungeon.rooms)
                 pos = self._get_random_floor_pos(dungeon, room, avoid_center=False)
                 if pos:
                     cooking_pot = HarvestableObject(
@@ -561,7 +603,7 @@ class DungeonGenerator:
                         x=pos[0],
                         y=pos[1]
                     )
-                    dungeon.harvestables.append(cooking_pot)
+                    dungeon.add_harvestable(cooking_pot)
                     logger.info(f"요리솥 배치 (추가): {pos}")
 
             logger.info(f"채집 오브젝트 {len(dungeon.harvestables)}개 배치")
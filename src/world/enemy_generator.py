@@ -5,7 +5,8 @@
 """
 
 from typing import List, Dict, Any
-import random
+
+from src.core.rng import get_rng, RNGStreams
 
 
 class EnemyTemplate:
@@ -350,6 +351,8 @@ class EnemyGenerator:
         Returns:
             적 리스트
         """
+        rng = get_rng().stream(RNGStreams.SPAWN)
+
         if num_enemies is None:
             # config에서 적 수 범위 가져오기
             from src.core.config import get_config
@@ -358,7 +361,7 @@ class EnemyGenerator:
             max_enemies = config.get("world.dungeon.enemy_count.max_enemies", 4)
 
             # 랜덤하게 1~4마리 생성
-            num_enemies = random.randint(min_enemies, max_enemies)
+            num_enemies = rng.randint(min_enemies, max_enemies)
 
         # 층수에 맞는 적 ID 가져오기
         suitable_enemy_ids = EnemyGenerator.get_suitable_enemies_for_floor(floor_number)
@@ -366,7 +369,7 @@ class EnemyGenerator:
         # 랜덤 선택
         enemies = []
         for _ in range(num_enemies):
-            enemy_id = random.choice(suitable_enemy_ids)
+            enemy_id = rng.choice(suitable_enemy_ids)
             template = ENEMY_TEMPLATES[enemy_id]
 
             # 레벨 스케일링 계수 (층수에 비례)
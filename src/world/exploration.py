@@ -7,12 +7,14 @@
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
-import random
 
 from src.world.dungeon_generator import DungeonMap
 from src.world.tile import Tile, TileType
 from src.world.fov import FOVSystem
+from src.world.pathfinding import PathfindingService
+from src.world.occupancy import OccupancyIndex
 from src.core.logger import get_logger, Loggers
+from src.core.rng import get_rng, RNGStreams
 
 
 logger = get_logger(Loggers.WORLD)
@@ -100,9 +102,11 @@ class ExplorationSystem:
             party=party
         )
         self.fov_system = FOVSystem(default_radius=3)
+        self.pathfinding = PathfindingService(dungeon)
         self.floor_number = floor_number
         self.explored_tiles = set()
         self.enemies: List[Enemy] = []  # 적 리스트
+        self.enemy_index = OccupancyIndex()  # 좌표 -> 적
         self.inventory = inventory  # 인벤토리 추가
 
         # 게임 통계 (로그라이크 정산용)
@@ -111,7 +115,8 @@ class ExplorationSystem:
             "max_floor_reached": floor_number,
             "total_gold_earned": 0,
             "total_exp_earned": 0,
-            "save_slot": None
+            "save_slot": None,
+            "playtime": 0  # 탐험 화면에서 보낸 시간 (초)
         }
 
         # 인벤토리 초기화 확인 로그
@@ -131,10 +136,7 @@ class ExplorationSystem:
 
     def update_fov(self):
         """시야 업데이트"""
-        # 이전 visible 초기화
-        self.fov_system.clear_visibility(self.dungeon)
-
-        # FOV 계산
+        # FOV 계산 (이전 시야와 달라진 타일만 visible 갱신)
         visible = self.fov_system.compute_fov(
             self.dungeon,
             self.player.x,
@@ -179,12 +181,12 @@ class ExplorationSystem:
 
         # 적과의 충돌 확인 (이동 전에!)
         enemy = self.get_enemy_at(new_x, new_y)
-        logger.warning(f"[DEBUG] 적 충돌 체크 at ({new_x}, {new_y}): enemy={enemy is not None}")
+        logger.debug("[DEBUG] 적 충돌 체크 at (%d, %d): enemy=%s", new_x, new_y, enemy is not None)
         if enemy:
-            logger.warning(f"[DEBUG] 적 발견! 전투 트리거 at ({enemy.x}, {enemy.y})")
+            logger.debug("[DEBUG] 적 발견! 전투 트리거 at (%d, %d)", enemy.x, enemy.y)
             # 플레이어는 이동하지 않고 전투만 트리거
             combat_result = self._trigger_combat_with_enemy(enemy)
-            logger.warning(f"[DEBUG] 전투 결과: event={combat_result.event}")
+            logger.debug("[DEBUG] 전투 결과: event=%s", combat_result.event)
             return combat_result
 
         # 이동
@@ -204,7 +206,7 @@ class ExplorationSystem:
         # 적 움직임 후 플레이어 위치에 적이 있는지 다시 체크
         enemy_at_player = self.get_enemy_at(self.player.x, self.player.y)
         if enemy_at_player:
-            logger.warning(f"[DEBUG] 적이 플레이어에게 접근! 전투 시작")
+            logger.debug("[DEBUG] 적이 플레이어에게 접근! 전투 시작")
             return self._trigger_combat_with_enemy(enemy_at_player)
 
         return result
@@ -494,7 +496,7 @@ class ExplorationSystem:
             distance = abs(other_enemy.x - enemy.x) + abs(other_enemy.y - enemy.y)
             if distance <= combat_range:
                 combat_enemies.append(other_enemy)
-                logger.warning(f"[DEBUG] 주변 적 추가: ({other_enemy.x}, {other_enemy.y}), 거리={distance}")
+                logger.debug("[DEBUG] 주변 적 추가: (%d, %d), 거리=%d", other_enemy.x, other_enemy.y, distance)
                 # 최대 4마리까지만
                 if len(combat_enemies) >= 4:
                     break
@@ -502,7 +504,7 @@ class ExplorationSystem:
         num_enemies = len(combat_enemies)
         has_boss = any(e.is_boss for e in combat_enemies)
 
-        logger.warning(f"[DEBUG] 전투 생성: 충돌한 적 1마리 + 주변 적 {len(combat_enemies) - 1}마리 = 총 {num_enemies}마리")
+        logger.debug("[DEBUG] 전투 생성: 충돌한 적 1마리 + 주변 적 %d마리 = 총 %d마리", num_enemies - 1, num_enemies)
         logger.info(f"적과 조우! {num_enemies}마리 (레벨 {enemy.level})")
 
         return ExplorationResult(
@@ -548,30 +550,31 @@ class ExplorationSystem:
                     abs(x - self.player.x) > 3 and abs(y - self.player.y) > 3):
                     possible_positions.append((x, y))
 
-        # 랜덤하게 적 배치
+        # 랜덤하게 적 배치 (같은 런 시드와 층이면 같은 배치)
         if possible_positions:
-            spawn_positions = random.sample(possible_positions, min(num_enemies, len(possible_positions)))
+            rng = get_rng().derive(RNGStreams.SPAWN, self.floor_number)
+            spawn_positions = rng.sample(possible_positions, min(num_enemies, len(possible_positions)))
             for x, y in spawn_positions:
                 enemy = Enemy(x=x, y=y, level=self.floor_number)
                 self.enemies.append(enemy)
+                self.enemy_index.add(enemy)
+
+            # 추적을 포기한 적의 복귀 경로를 층 진입 시 미리 계산 (이동 턴에 몰리지 않도록)
+            self.pathfinding.warm_spawn_fields(spawn_positions)
 
-        logger.warning(f"[DEBUG] 적 {len(self.enemies)}마리 배치 완료")
+        logger.debug("[DEBUG] 적 %d마리 배치 완료", len(self.enemies))
         for i, enemy in enumerate(self.enemies[:5]):  # 처음 5마리만 로그
-            logger.warning(f"[DEBUG] 적 {i+1}: 위치 ({enemy.x}, {enemy.y})")
+            logger.debug("[DEBUG] 적 %d: 위치 (%d, %d)", i + 1, enemy.x, enemy.y)
 
     def get_enemy_at(self, x: int, y: int) -> Optional[Enemy]:
         """특정 위치의 적 가져오기"""
-        logger.warning(f"[DEBUG] get_enemy_at({x}, {y}) 호출 - 현재 적 {len(self.enemies)}마리")
-        for enemy in self.enemies:
-            if enemy.x == x and enemy.y == y:
-                logger.warning(f"[DEBUG] 적 발견! at ({x}, {y})")
-                return enemy
-        return None
+        return self.enemy_index.get(x, y)
 
     def remove_enemy(self, enemy: Enemy):
         """적 제거 (전투 승리 후)"""
         if enemy in self.enemies:
             self.enemies.remove(enemy)
+            self.enemy_index.remove(enemy)
             logger.info(f"적 제거: ({enemy.x}, {enemy.y})")
 
     def _move_all_enemies(self):
@@ -616,36 +619,19 @@ class ExplorationSystem:
                 self._move_enemy_towards(enemy, enemy.spawn_x, enemy.spawn_y)
 
     def _move_enemy_towards(self, enemy: Enemy, target_x: int, target_y: int):
-        """적을 목표 위치로 한 칸 이동"""
-        # 이동 방향 결정 (맨하탄 거리 기반)
-        dx = 0
-        dy = 0
-
-        if enemy.x < target_x:
-            dx = 1
-        elif enemy.x > target_x:
-            dx = -1
-
-        if enemy.y < target_y:
-            dy = 1
-        elif enemy.y > target_y:
-            dy = -1
-
-        # 대각선 이동 or 직선 이동 선택
-        # 50% 확률로 X축 우선, 50% 확률로 Y축 우선
-        if random.random() < 0.5 and dx != 0:
-            new_x, new_y = enemy.x + dx, enemy.y
-        elif dy != 0:
-            new_x, new_y = enemy.x, enemy.y + dy
-        elif dx != 0:
-            new_x, new_y = enemy.x + dx, enemy.y
+        """적을 목표 위치로 한 칸 이동 (공유 거리 맵을 따라 내려감)"""
+        if target_x == self.player.x and target_y == self.player.y:
+            field = self.pathfinding.player_field(target_x, target_y)
         else:
-            return  # 이미 목표 위치에 도착
-
-        # 이동 가능 여부 확인
-        if self.dungeon.is_walkable(new_x, new_y):
-            # 다른 적과 겹치지 않는지 확인
-            # 플레이어 위치도 피함 (적이 플레이어 위로 이동하면 전투가 트리거되므로)
-            if not self.get_enemy_at(new_x, new_y) and not (new_x == self.player.x and new_y == self.player.y):
-                enemy.x = new_x
-                enemy.y = new_y
+            field = self.pathfinding.field_to((target_x, target_y))
+
+        # 다른 적과 겹치지 않도록, 플레이어 위치도 피함 (적이 플레이어 위로 이동하면 전투가 트리거되므로)
+        step = self.pathfinding.next_step(field, enemy.x, enemy.y, blocked=self._is_blocked_for_enemy)
+        if step:
+            self.enemy_index.move(enemy, *step)
+
+    def _is_blocked_for_enemy(self, x: int, y: int) -> bool:
+        """적 이동을 막는 칸인지 확인"""
+        if x == self.player.x and y == self.player.y:
+            return True
+        return self.get_enemy_at(x, y) is not None
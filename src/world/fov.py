@@ -2,26 +2,174 @@
 FOV (Field of View) 시스템
 
 플레이어 주변 시야 계산 (레이캐스팅)
+
+이전 시야 집합을 기억해 바뀐 타일만 visible 플래그를 토글하고,
+(원점, 반지름, 맵 버전)별 결과를 캐시하여 같은 칸을 다시 방문하면 재계산하지 않습니다.
 """
 
-from typing import Set, Tuple
-import math
+from collections import OrderedDict
+from typing import Set, Tuple, FrozenSet, List, Optional, Sequence, Any
 
 from src.world.dungeon_generator import DungeonMap
 from src.world.tile import TileType
 
 
+# 팔분면별 좌표 변환 계수 (xx, xy, yx, yy): mx = cx + dx*xx + dy*xy, my = cy + dx*yx + dy*yy
+_OCTANT_TRANSFORMS = (
+    (1, 0, 0, -1),
+    (0, 1, -1, 0),
+    (0, -1, -1, 0),
+    (-1, 0, 0, -1),
+    (-1, 0, 0, 1),
+    (0, -1, 1, 0),
+    (0, 1, 1, 0),
+    (1, 0, 0, 1),
+)
+
+# 캐시할 시야 결과 수 (층 하나에서 자주 오가는 칸들)
+DEFAULT_CACHE_SIZE = 512
+
+
+def compute_fov_from_array(
+    transparent: Any,
+    origin_x: int,
+    origin_y: int,
+    radius: int
+) -> Set[Tuple[int, int]]:
+    """
+    투명도 배열 기반 FOV 계산 (Shadowcasting)
+
+    Args:
+        transparent: [y][x] 인덱싱 가능한 시야 통과 여부 (NumPy bool 배열 또는 중첩 리스트)
+        origin_x: 원점 X
+        origin_y: 원점 Y
+        radius: 시야 반지름
+
+    Returns:
+        보이는 타일 좌표 set
+    """
+    if hasattr(transparent, "tolist"):
+        transparent = transparent.tolist()
+
+    visible: Set[Tuple[int, int]] = {(origin_x, origin_y)}
+    height = len(transparent)
+    width = len(transparent[0]) if height else 0
+
+    for transform in _OCTANT_TRANSFORMS:
+        _cast_light(
+            transparent, width, height, visible,
+            origin_x, origin_y, radius,
+            1, 1.0, 0.0, transform
+        )
+
+    return visible
+
+
+def _cast_light(
+    transparent: Sequence[Sequence[bool]],
+    width: int,
+    height: int,
+    visible: Set[Tuple[int, int]],
+    cx: int,
+    cy: int,
+    radius: int,
+    row: int,
+    start_slope: float,
+    end_slope: float,
+    transform: Tuple[int, int, int, int]
+) -> None:
+    """
+    Shadowcasting 재귀 함수
+
+    Args:
+        cx, cy: 중심 좌표
+        radius: 반지름
+        row: 현재 행
+        start_slope: 시작 기울기
+        end_slope: 끝 기울기
+        transform: 팔분면 좌표 변환 계수
+    """
+    if start_slope < end_slope:
+        return
+
+    xx, xy, yx, yy = transform
+    radius_squared = radius * radius
+
+    for j in range(row, radius + 1):
+        dx = -j - 1
+        dy = -j
+        blocked = False
+        new_start = 0.0
+
+        while dx <= 0:
+            dx += 1
+
+            # 좌표 변환 (octant에 따라)
+            mx = cx + dx * xx + dy * xy
+            my = cy + dx * yx + dy * yy
+
+            # 범위 체크
+            if not (0 <= mx < width and 0 <= my < height):
+                continue
+
+            # 거리 체크
+            if dx * dx + dy * dy > radius_squared:
+                continue
+
+            l_slope = (dx - 0.5) / (dy + 0.5)
+            r_slope = (dx + 0.5) / (dy - 0.5)
+
+            if start_slope < r_slope:
+                continue
+            elif end_slope > l_slope:
+                break
+
+            # 타일 보이게
+            visible.add((mx, my))
+
+            # 블록 체크
+            if not transparent[my][mx]:
+                if blocked:
+                    new_start = r_slope
+                else:
+                    blocked = True
+                    _cast_light(
+                        transparent, width, height, visible,
+                        cx, cy, radius,
+                        j + 1, start_slope, l_slope, transform
+                    )
+                    new_start = r_slope
+            else:
+                if blocked:
+                    blocked = False
+                    start_slope = new_start
+
+        if blocked:
+            break
+
+
 class FOVSystem:
     """시야 시스템"""
 
-    def __init__(self, default_radius: int = 3):
+    def __init__(self, default_radius: int = 3, cache_size: int = DEFAULT_CACHE_SIZE):
         """
         Args:
             default_radius: 기본 시야 반지름
+            cache_size: 캐시할 시야 결과 수 (0이면 캐시 안 함)
         """
         self.default_radius = default_radius
+        self.cache_size = cache_size
         self.visible_tiles: Set[Tuple[int, int]] = set()
 
+        # 시야 결과 캐시: (x, y, radius) -> 보이는 좌표 (맵/버전이 바뀌면 비움)
+        self._cache: "OrderedDict[Tuple[int, int, int], FrozenSet[Tuple[int, int]]]" = OrderedDict()
+        self._cache_grid: Optional[Any] = None
+        self._cache_version = -1
+        self._transparent_rows: Optional[List[List[bool]]] = None
+
+        # visible 플래그를 마지막으로 반영한 그리드
+        self._marked_grid: Optional[Any] = None
+
     def compute_fov(
         self,
         dungeon: DungeonMap,
@@ -32,6 +180,8 @@ class FOVSystem:
         """
         FOV 계산 (Shadowcasting 알고리즘)
 
+        이전 시야와의 차이만 타일 visible 플래그에 반영합니다.
+
         Args:
             dungeon: 던전 맵
             origin_x: 플레이어 X 위치
@@ -44,147 +194,65 @@ class FOVSystem:
         if radius is None:
             radius = self.default_radius
 
-        self.visible_tiles.clear()
-
-        # 플레이어 위치는 항상 보임
-        self.visible_tiles.add((origin_x, origin_y))
-
-        # 8방향 스캔
-        for octant in range(8):
-            self._cast_light(
-                dungeon,
-                origin_x,
-                origin_y,
-                radius,
-                1,  # start row
-                1.0,  # start slope
-                0.0,  # end slope
-                octant
-            )
-
-        # 탐험 마크 업데이트
-        for x, y in self.visible_tiles:
-            tile = dungeon.get_tile(x, y)
-            if tile:
-                tile.explored = True
-                tile.visible = True
-
+        grid = dungeon.grid
+        visible = self._lookup(grid, origin_x, origin_y, radius)
+
+        if self._marked_grid is not grid:
+            # 처음 보는 맵 (새 층, 불러온 세이브) - 남아 있는 visible 플래그 정리
+            grid.clear_visible()
+            previous: Set[Tuple[int, int]] = set()
+            self._marked_grid = grid
+        else:
+            previous = self.visible_tiles
+
+        # 바뀐 타일만 토글 (탐험 마크 포함)
+        hidden = previous - visible
+        if hidden:
+            grid.mark_hidden(hidden)
+        revealed = visible - previous
+        if revealed:
+            grid.mark_visible(revealed)
+
+        self.visible_tiles = set(visible)
         return self.visible_tiles
 
-    def _cast_light(
-        self,
-        dungeon: DungeonMap,
-        cx: int,
-        cy: int,
-        radius: int,
-        row: int,
-        start_slope: float,
-        end_slope: float,
-        octant: int
-    ):
-        """
-        Shadowcasting 재귀 함수
+    def _lookup(self, grid: Any, origin_x: int, origin_y: int, radius: int) -> FrozenSet[Tuple[int, int]]:
+        """캐시된 시야 결과 (없으면 계산)"""
+        if self._cache_grid is not grid or self._cache_version != grid.version:
+            self._cache.clear()
+            self._transparent_rows = None
+            self._cache_grid = grid
+            self._cache_version = grid.version
 
-        Args:
-            cx, cy: 중심 좌표
-            radius: 반지름
-            row: 현재 행
-            start_slope: 시작 기울기
-            end_slope: 끝 기울기
-            octant: 팔분면 (0-7)
-        """
-        if start_slope < end_slope:
-            return
-
-        radius_squared = radius * radius
-
-        for j in range(row, radius + 1):
-            dx = -j - 1
-            dy = -j
-            blocked = False
-            new_start = 0.0
-
-            while dx <= 0:
-                dx += 1
-
-                # 좌표 변환 (octant에 따라)
-                mx, my = self._transform_octant(cx, cy, dx, dy, octant)
-
-                # 범위 체크
-                if not (0 <= mx < dungeon.width and 0 <= my < dungeon.height):
-                    continue
-
-                # 거리 체크
-                distance = dx * dx + dy * dy
-                if distance > radius_squared:
-                    continue
-
-                l_slope = (dx - 0.5) / (dy + 0.5)
-                r_slope = (dx + 0.5) / (dy - 0.5)
-
-                if start_slope < r_slope:
-                    continue
-                elif end_slope > l_slope:
-                    break
-
-                # 타일 보이게
-                self.visible_tiles.add((mx, my))
-
-                # 블록 체크
-                tile = dungeon.get_tile(mx, my)
-                if tile and not tile.transparent:
-                    if blocked:
-                        new_start = r_slope
-                    else:
-                        blocked = True
-                        self._cast_light(
-                            dungeon, cx, cy, radius,
-                            j + 1, start_slope, l_slope, octant
-                        )
-                        new_start = r_slope
-                else:
-                    if blocked:
-                        blocked = False
-                        start_slope = new_start
+        key = (origin_x, origin_y, radius)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
 
-            if blocked:
-                break
+        if self._transparent_rows is None:
+            self._transparent_rows = grid.transparent.tolist()
 
-    def _transform_octant(
-        self,
-        cx: int,
-        cy: int,
-        dx: int,
-        dy: int,
-        octant: int
-    ) -> Tuple[int, int]:
-        """팔분면에 따른 좌표 변환"""
-        if octant == 0:
-            return (cx + dx, cy - dy)
-        elif octant == 1:
-            return (cx + dy, cy - dx)
-        elif octant == 2:
-            return (cx - dy, cy - dx)
-        elif octant == 3:
-            return (cx - dx, cy - dy)
-        elif octant == 4:
-            return (cx - dx, cy + dy)
-        elif octant == 5:
-            return (cx - dy, cy + dx)
-        elif octant == 6:
-            return (cx + dy, cy + dx)
-        elif octant == 7:
-            return (cx + dx, cy + dy)
-
-        return (cx, cy)
+        visible = frozenset(compute_fov_from_array(self._transparent_rows, origin_x, origin_y, radius))
+
+        if self.cache_size > 0:
+            self._cache[key] = visible
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return visible
 
     def clear_visibility(self, dungeon: DungeonMap):
         """현재 프레임 가시성 초기화"""
-        for y in range(dungeon.height):
-            for x in range(dungeon.width):
-                tile = dungeon.get_tile(x, y)
-                if tile:
-                    tile.visible = False
+        dungeon.grid.clear_visible()
+        self.visible_tiles = set()
+        self._marked_grid = dungeon.grid
+
+    def clear_cache(self) -> None:
+        """시야 캐시 비우기"""
+        self._cache.clear()
+        self._cache_grid = None
+        self._transparent_rows = None
 
     def get_visible_radius_with_modifiers(self, base_radius: int, modifiers: dict) -> int:
         """
@@ -42,40 +42,39 @@ class MapRenderer:
             view_width: 표시 너비
             view_height: 표시 높이
         """
-        # 표시 범위 계산
-        start_x = max(0, camera_x)
-        start_y = max(0, camera_y)
-        end_x = min(dungeon.width, camera_x + view_width)
-        end_y = min(dungeon.height, camera_y + view_height)
-
-        # 타일 렌더링
-        for map_y in range(start_y, end_y):
-            for map_x in range(start_x, end_x):
-                tile = dungeon.get_tile(map_x, map_y)
-
-                # 화면 좌표 계산
-                screen_x = self.map_x + (map_x - camera_x)
-                screen_y = self.map_y + (map_y - camera_y)
-
-                # 범위 체크
-                if not (0 <= screen_x < console.width and 0 <= screen_y < console.height):
-                    continue
-
-                # 탐험되지 않은 타일은 표시 안 함
-                if not tile.explored:
-                    continue
-
-                # 타일 표시
-                char = tile.char
-                fg = tile.fg_color
-                bg = tile.bg_color
-
-                # 탐험됐지만 현재 보이지 않는 경우 어둡게
-                if not tile.visible:
-                    fg = tuple(c // 4 for c in fg)
-                    bg = tuple(c // 4 for c in bg)
-
-                console.print(screen_x, screen_y, char, fg=fg, bg=bg)
+        # 표시 범위 계산 (콘솔 밖으로 나가는 부분 제외)
+        start_x = max(0, camera_x, camera_x - self.map_x)
+        start_y = max(0, camera_y, camera_y - self.map_y)
+        end_x = min(dungeon.width, camera_x + view_width, camera_x - self.map_x + console.width)
+        end_y = min(dungeon.height, camera_y + view_height, camera_y - self.map_y + console.height)
+
+        if start_x >= end_x or start_y >= end_y:
+            return
+
+        grid = dungeon.grid
+        map_rows = slice(start_y, end_y)
+        map_cols = slice(start_x, end_x)
+
+        # 탐험되지 않은 타일은 표시 안 함
+        explored = grid.explored[map_rows, map_cols]
+        if not explored.any():
+            return
+
+        chars = grid.char_codes(map_rows, map_cols)
+        fg, bg = grid.colors(map_rows, map_cols)
+
+        # 탐험됐지만 현재 보이지 않는 경우 어둡게
+        hidden = ~grid.visible[map_rows, map_cols]
+        fg[hidden] //= 4
+        bg[hidden] //= 4
+
+        # 화면 영역에 한 번에 기록
+        screen_x = self.map_x + (start_x - camera_x)
+        screen_y = self.map_y + (start_y - camera_y)
+        screen = console.rgb[screen_y:screen_y + (end_y - start_y), screen_x:screen_x + (end_x - start_x)]
+        screen["ch"][explored] = chars[explored]
+        screen["fg"][explored] = fg[explored]
+        screen["bg"][explored] = bg[explored]
 
     def render_minimap(
         self,
@@ -0,0 +1,85 @@
+"""
+점유 인덱스 - 좌표별 엔티티 조회
+
+적, 채집 오브젝트 등 x/y 속성을 가진 엔티티를 좌표 키 dict로 관리하여
+"이 칸에 무엇이 있나" 조회를 리스트 전체 탐색 없이 O(1)로 처리합니다.
+엔티티 좌표는 반드시 move()로 바꿔야 인덱스가 맞게 유지됩니다.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+Position = Tuple[int, int]
+
+
+class OccupancyIndex:
+    """좌표 -> 엔티티 목록 인덱스"""
+
+    def __init__(self, entities: Optional[Iterable[Any]] = None):
+        self._cells: Dict[Position, List[Any]] = {}
+        if entities:
+            for entity in entities:
+                self.add(entity)
+
+    def __len__(self) -> int:
+        return sum(len(entities) for entities in self._cells.values())
+
+    def __contains__(self, position: Position) -> bool:
+        return position in self._cells
+
+    def add(self, entity: Any) -> None:
+        """엔티티 등록 (현재 x, y 기준)"""
+        self._cells.setdefault((entity.x, entity.y), []).append(entity)
+
+    def remove(self, entity: Any) -> bool:
+        """
+        엔티티 제거
+
+        Returns:
+            제거 여부
+        """
+        return self._discard(entity, (entity.x, entity.y))
+
+    def move(self, entity: Any, x: int, y: int) -> None:
+        """
+        엔티티 이동 (좌표 갱신 + 인덱스 갱신)
+
+        Args:
+            entity: 엔티티
+            x, y: 새 좌표
+        """
+        self._discard(entity, (entity.x, entity.y))
+        entity.x = x
+        entity.y = y
+        self.add(entity)
+
+    def get(self, x: int, y: int) -> Optional[Any]:
+        """좌표의 첫 번째 엔티티"""
+        entities = self._cells.get((x, y))
+        return entities[0] if entities else None
+
+    def get_all(self, x: int, y: int) -> List[Any]:
+        """좌표의 모든 엔티티"""
+        return list(self._cells.get((x, y), ()))
+
+    def rebuild(self, entities: Iterable[Any]) -> None:
+        """엔티티 목록으로 인덱스 재구성"""
+        self._cells.clear()
+        for entity in entities:
+            self.add(entity)
+
+    def clear(self) -> None:
+        """인덱스 비우기"""
+        self._cells.clear()
+
+    def _discard(self, entity: Any, position: Position) -> bool:
+        entities = self._cells.get(position)
+        if not entities:
+            return False
+        for i, existing in enumerate(entities):
+            if existing is entity:
+                del entities[i]
+                if not entities:
+                    del self._cells[position]
+                return True
+        return False
@@ -0,0 +1,166 @@
+"""
+경로 탐색 - Dijkstra 흐름장(Flow Field)
+
+목표 지점(플레이어, 적 생성 위치)까지의 거리 맵을 한 번 계산해 모든 적이 공유합니다.
+적은 현재 칸보다 거리가 작은 이웃 칸으로 내려가기만 하면 되므로 한 걸음이 O(1)입니다.
+
+- 플레이어 거리 맵: 플레이어 위치가 바뀐 뒤 처음 요청될 때 계산
+- 생성 위치 거리 맵: 위치별로 캐시
+- 지형 버전(TileGrid.version)이 바뀌면(문 잠금 해제, 타일 변경) 전부 무효화
+"""
+
+from typing import Dict, List, Optional, Tuple, Iterable, Any
+
+import numpy as np
+import tcod.path
+
+from src.world.dungeon_generator import DungeonMap
+
+
+Position = Tuple[int, int]
+
+# 상하좌우 이동
+CARDINAL_DIRECTIONS: Tuple[Position, ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+class FlowField:
+    """목표 지점까지의 거리 맵"""
+
+    def __init__(self, goal: Position, distance: np.ndarray, unreachable: int):
+        self.goal = goal
+        self.distance = distance  # [y, x]
+        self.unreachable = unreachable
+
+    def distance_at(self, x: int, y: int) -> Optional[int]:
+        """목표까지 거리 (도달 불가/범위 밖이면 None)"""
+        height, width = self.distance.shape
+        if not (0 <= x < width and 0 <= y < height):
+            return None
+        value = int(self.distance[y, x])
+        return None if value >= self.unreachable else value
+
+    def downhill_steps(self, x: int, y: int) -> List[Position]:
+        """
+        목표에 가까워지는 이웃 칸 목록 (가까운 순)
+
+        Args:
+            x, y: 현재 위치
+
+        Returns:
+            현재보다 거리가 작은 이웃 좌표 리스트
+        """
+        current = self.distance_at(x, y)
+        if current is None or current == 0:
+            return []
+
+        steps = []
+        for dx, dy in CARDINAL_DIRECTIONS:
+            neighbor = self.distance_at(x + dx, y + dy)
+            if neighbor is not None and neighbor < current:
+                steps.append((neighbor, (x + dx, y + dy)))
+
+        steps.sort(key=lambda step: step[0])
+        return [pos for _, pos in steps]
+
+
+class PathfindingService:
+    """
+    던전 하나에 대한 공유 흐름장 서비스
+
+    ExplorationSystem이 층마다 하나 생성하며, 모든 적이 같은 거리 맵을 참조합니다.
+    """
+
+    def __init__(self, dungeon: DungeonMap):
+        self.dungeon = dungeon
+        self._version = -1
+        self._cost: Optional[np.ndarray] = None
+        self._fields: Dict[Position, FlowField] = {}
+        self._player_goal: Optional[Position] = None
+
+    def invalidate(self) -> None:
+        """모든 거리 맵 무효화"""
+        self._version = -1
+        self._cost = None
+        self._fields.clear()
+        self._player_goal = None
+
+    def _sync(self) -> None:
+        """지형이 바뀌었으면 캐시 초기화"""
+        grid = self.dungeon.grid
+        if self._version != grid.version:
+            self._fields.clear()
+            self._player_goal = None
+            self._cost = (grid.walkable & ~grid.locked).astype(np.int32)
+            self._version = grid.version
+
+    def _compute(self, goal: Position) -> FlowField:
+        """목표 지점 거리 맵 계산"""
+        distance = tcod.path.maxarray(self._cost.shape, dtype=np.int32)
+        unreachable = int(distance[0, 0])
+        goal_x, goal_y = goal
+        if 0 <= goal_x < self.dungeon.width and 0 <= goal_y < self.dungeon.height:
+            distance[goal_y, goal_x] = 0
+            tcod.path.dijkstra2d(distance, self._cost, 1, None, out=distance)
+        return FlowField(goal, distance, unreachable)
+
+    def field_to(self, goal: Position) -> FlowField:
+        """
+        목표 지점까지의 흐름장 (캐시)
+
+        Args:
+            goal: 목표 좌표 (x, y)
+
+        Returns:
+            FlowField
+        """
+        self._sync()
+        field = self._fields.get(goal)
+        if field is None:
+            field = self._compute(goal)
+            self._fields[goal] = field
+        return field
+
+    def player_field(self, player_x: int, player_y: int) -> FlowField:
+        """
+        플레이어 추적용 흐름장 (플레이어가 움직이면 이전 맵은 폐기)
+
+        Args:
+            player_x, player_y: 플레이어 위치
+
+        Returns:
+            FlowField
+        """
+        self._sync()
+        goal = (player_x, player_y)
+        if self._player_goal is not None and self._player_goal != goal:
+            self._fields.pop(self._player_goal, None)
+        self._player_goal = goal
+        return self.field_to(goal)
+
+    def warm_spawn_fields(self, spawn_points: Iterable[Position]) -> None:
+        """생성 위치 거리 맵 미리 계산"""
+        for spawn in spawn_points:
+            self.field_to(spawn)
+
+    def next_step(
+        self,
+        field: FlowField,
+        x: int,
+        y: int,
+        blocked: Optional[Any] = None
+    ) -> Optional[Position]:
+        """
+        흐름장을 따라 다음 칸 선택
+
+        Args:
+            field: 따라갈 흐름장
+            x, y: 현재 위치
+            blocked: (x, y) -> bool, 막힌 칸 판정 (다른 적, 플레이어 등)
+
+        Returns:
+            다음 좌표 (이동할 수 없으면 None)
+        """
+        for step in field.downhill_steps(x, y):
+            if blocked is None or not blocked(*step):
+                return step
+        return None
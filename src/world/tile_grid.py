@@ -0,0 +1,386 @@
+"""
+타일 그리드 - 배열 기반 타일 저장소
+
+DungeonMap 타일을 Tile 객체 2차원 리스트 대신 NumPy 배열(Struct-of-Arrays)로 보관합니다.
+- 타일 타입: uint8 그리드 (TILE_TYPES 인덱스)
+- walkable/transparent/explored/visible/locked: bool 마스크
+- key_id, trap_damage, teleport_target, loot_id 등 드문 속성: 좌표 키 희소 dict
+
+get_tile 호출자는 TileView(배열에 바로 읽고 쓰는 가벼운 뷰)를 받으므로
+기존 Tile 속성 접근 코드가 그대로 동작합니다.
+"""
+
+from typing import Dict, Tuple, Optional, Any, Iterator
+
+import numpy as np
+
+from src.world.tile import Tile, TileType
+
+
+# 타일 타입 <-> uint8 인덱스
+TILE_TYPES: Tuple[TileType, ...] = tuple(TileType)
+TILE_TYPE_INDEX: Dict[TileType, int] = {tile_type: i for i, tile_type in enumerate(TILE_TYPES)}
+
+VOID_INDEX = TILE_TYPE_INDEX[TileType.VOID]
+
+# 타입별 기본 속성 (Tile.__post_init__ 기준)
+_TYPE_DEFAULTS: Tuple[Tile, ...] = tuple(Tile(tile_type, 0, 0) for tile_type in TILE_TYPES)
+
+DEFAULT_WALKABLE = np.array([t.walkable for t in _TYPE_DEFAULTS], dtype=bool)
+DEFAULT_TRANSPARENT = np.array([t.transparent for t in _TYPE_DEFAULTS], dtype=bool)
+CHAR_CODES = np.array([ord(t.char) for t in _TYPE_DEFAULTS], dtype=np.int32)
+FG_COLORS = np.array([t.fg_color for t in _TYPE_DEFAULTS], dtype=np.uint8)
+BG_COLORS = np.array([t.bg_color for t in _TYPE_DEFAULTS], dtype=np.uint8)
+
+Position = Tuple[int, int]
+
+
+class TileGrid:
+    """
+    배열 기반 타일 저장소
+
+    배열은 [y, x] 순서로 인덱싱합니다.
+    version은 지형(타입/이동/시야/잠금)이 바뀔 때마다 증가하므로
+    FOV, 경로 탐색 등의 캐시 무효화에 사용할 수 있습니다.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+
+        shape = (height, width)
+        self.types = np.full(shape, VOID_INDEX, dtype=np.uint8)
+        self.walkable = np.zeros(shape, dtype=bool)
+        self.transparent = np.zeros(shape, dtype=bool)
+        self.explored = np.zeros(shape, dtype=bool)
+        self.visible = np.zeros(shape, dtype=bool)
+        self.locked = np.zeros(shape, dtype=bool)
+
+        # 희소 속성
+        self.key_ids: Dict[Position, str] = {}
+        self.trap_damage: Dict[Position, int] = {}
+        self.teleport_targets: Dict[Position, Position] = {}
+        self.loot_ids: Dict[Position, str] = {}
+
+        # 타입 기본값과 다른 표시 속성 (char, fg_color, bg_color)
+        self.visual_overrides: Dict[Position, Dict[str, Any]] = {}
+
+        self.version = 0
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """범위 확인"""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def get_type(self, x: int, y: int) -> TileType:
+        """타일 타입"""
+        return TILE_TYPES[self.types[y, x]]
+
+    def set(self, x: int, y: int, tile_type: TileType, **kwargs) -> None:
+        """
+        타일 설정 (Tile(tile_type, x, y, **kwargs)와 동일한 속성 결과)
+
+        Args:
+            x, y: 좌표
+            tile_type: 타일 타입
+            **kwargs: Tile 필드 (locked, key_id, trap_damage, teleport_target, loot_id 등)
+        """
+        if kwargs:
+            # 추가 속성이 있으면 Tile 규칙(__post_init__ 기본값 우선)을 그대로 적용
+            source = Tile(tile_type, x, y, **kwargs)
+        else:
+            source = _TYPE_DEFAULTS[TILE_TYPE_INDEX[tile_type]]
+
+        self.types[y, x] = TILE_TYPE_INDEX[tile_type]
+        self.walkable[y, x] = source.walkable
+        self.transparent[y, x] = source.transparent
+        self.explored[y, x] = source.explored
+        self.visible[y, x] = source.visible
+        self.locked[y, x] = source.locked
+
+        pos = (x, y)
+        _set_sparse(self.key_ids, pos, source.key_id)
+        _set_sparse(self.trap_damage, pos, source.trap_damage or None)
+        _set_sparse(self.teleport_targets, pos, source.teleport_target)
+        _set_sparse(self.loot_ids, pos, source.loot_id)
+
+        self.visual_overrides.pop(pos, None)
+        if kwargs:
+            default = _TYPE_DEFAULTS[TILE_TYPE_INDEX[tile_type]]
+            for name in ("char", "fg_color", "bg_color"):
+                if getattr(source, name) != getattr(default, name):
+                    self.visual_overrides.setdefault(pos, {})[name] = getattr(source, name)
+
+        self.version += 1
+
+    def view(self, x: int, y: int) -> "TileView":
+        """좌표의 타일 뷰"""
+        return TileView(self, x, y)
+
+    def clear_visible(self) -> None:
+        """현재 가시성 초기화"""
+        self.visible[:] = False
+
+    def mark_visible(self, positions: Any) -> None:
+        """
+        좌표 집합을 보이는/탐험된 상태로 표시
+
+        Args:
+            positions: (x, y) 좌표 반복 가능 객체
+        """
+        xs, ys = self._coords(positions)
+        self.visible[ys, xs] = True
+        self.explored[ys, xs] = True
+
+    def mark_hidden(self, positions: Any) -> None:
+        """
+        좌표 집합을 보이지 않는 상태로 표시 (탐험 여부는 유지)
+
+        Args:
+            positions: (x, y) 좌표 반복 가능 객체
+        """
+        xs, ys = self._coords(positions)
+        self.visible[ys, xs] = False
+
+    def _coords(self, positions: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """(x, y) 좌표들을 범위 안의 (xs, ys) 인덱스 배열로 변환"""
+        coords = np.array(list(positions), dtype=np.intp).reshape(-1, 2)
+        xs, ys = coords[:, 0], coords[:, 1]
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        return xs[inside], ys[inside]
+
+    def char_codes(self, y_slice: slice, x_slice: slice) -> np.ndarray:
+        """영역의 표시 문자 코드 배열"""
+        codes = CHAR_CODES[self.types[y_slice, x_slice]]
+        self._apply_overrides(codes, "char", y_slice, x_slice, ord)
+        return codes
+
+    def colors(self, y_slice: slice, x_slice: slice) -> Tuple[np.ndarray, np.ndarray]:
+        """영역의 (전경색, 배경색) 배열"""
+        types = self.types[y_slice, x_slice]
+        fg = FG_COLORS[types]
+        bg = BG_COLORS[types]
+        self._apply_overrides(fg, "fg_color", y_slice, x_slice)
+        self._apply_overrides(bg, "bg_color", y_slice, x_slice)
+        return fg, bg
+
+    def _apply_overrides(
+        self,
+        target: np.ndarray,
+        name: str,
+        y_slice: slice,
+        x_slice: slice,
+        convert: Any = None
+    ) -> None:
+        """영역 배열에 희소 표시 속성 반영"""
+        if not self.visual_overrides:
+            return
+        y0, y1, _ = y_slice.indices(self.height)
+        x0, x1, _ = x_slice.indices(self.width)
+        for (x, y), overrides in self.visual_overrides.items():
+            if name in overrides and y0 <= y < y1 and x0 <= x < x1:
+                value = overrides[name]
+                target[y - y0, x - x0] = convert(value) if convert else value
+
+
+def _set_sparse(table: Dict[Position, Any], pos: Position, value: Any) -> None:
+    """희소 dict 갱신 (None이면 삭제)"""
+    if value is None:
+        table.pop(pos, None)
+    else:
+        table[pos] = value
+
+
+class TileView:
+    """
+    TileGrid 한 칸에 대한 가벼운 뷰
+
+    Tile과 같은 속성을 제공하며, 값을 쓰면 그리드 배열에 바로 반영됩니다.
+    """
+
+    __slots__ = ("_grid", "x", "y")
+
+    def __init__(self, grid: TileGrid, x: int, y: int):
+        self._grid = grid
+        self.x = x
+        self.y = y
+
+    def __repr__(self) -> str:
+        return f"TileView({self.tile_type}, x={self.x}, y={self.y})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TileView):
+            return NotImplemented
+        return self._grid is other._grid and self.x == other.x and self.y == other.y
+
+    def __hash__(self) -> int:
+        return hash((id(self._grid), self.x, self.y))
+
+    @property
+    def tile_type(self) -> TileType:
+        return TILE_TYPES[self._grid.types[self.y, self.x]]
+
+    @tile_type.setter
+    def tile_type(self, value: TileType) -> None:
+        # Tile과 동일하게 타입만 바꾸고 이동/시야 속성은 유지 (표시는 새 타입 기준)
+        self._grid.types[self.y, self.x] = TILE_TYPE_INDEX[value]
+        self._grid.visual_overrides.pop((self.x, self.y), None)
+        self._grid.version += 1
+
+    @property
+    def walkable(self) -> bool:
+        return bool(self._grid.walkable[self.y, self.x])
+
+    @walkable.setter
+    def walkable(self, value: bool) -> None:
+        self._grid.walkable[self.y, self.x] = value
+        self._grid.version += 1
+
+    @property
+    def transparent(self) -> bool:
+        return bool(self._grid.transparent[self.y, self.x])
+
+    @transparent.setter
+    def transparent(self, value: bool) -> None:
+        self._grid.transparent[self.y, self.x] = value
+        self._grid.version += 1
+
+    @property
+    def explored(self) -> bool:
+        return bool(self._grid.explored[self.y, self.x])
+
+    @explored.setter
+    def explored(self, value: bool) -> None:
+        self._grid.explored[self.y, self.x] = value
+
+    @property
+    def visible(self) -> bool:
+        return bool(self._grid.visible[self.y, self.x])
+
+    @visible.setter
+    def visible(self, value: bool) -> None:
+        self._grid.visible[self.y, self.x] = value
+
+    @property
+    def locked(self) -> bool:
+        return bool(self._grid.locked[self.y, self.x])
+
+    @locked.setter
+    def locked(self, value: bool) -> None:
+        self._grid.locked[self.y, self.x] = value
+        self._grid.version += 1
+
+    @property
+    def key_id(self) -> Optional[str]:
+        return self._grid.key_ids.get((self.x, self.y))
+
+    @key_id.setter
+    def key_id(self, value: Optional[str]) -> None:
+        _set_sparse(self._grid.key_ids, (self.x, self.y), value)
+
+    @property
+    def trap_damage(self) -> int:
+        return self._grid.trap_damage.get((self.x, self.y), 0)
+
+    @trap_damage.setter
+    def trap_damage(self, value: int) -> None:
+        _set_sparse(self._grid.trap_damage, (self.x, self.y), value or None)
+
+    @property
+    def teleport_target(self) -> Optional[Position]:
+        return self._grid.teleport_targets.get((self.x, self.y))
+
+    @teleport_target.setter
+    def teleport_target(self, value: Optional[Position]) -> None:
+        _set_sparse(self._grid.teleport_targets, (self.x, self.y), value)
+
+    @property
+    def loot_id(self) -> Optional[str]:
+        return self._grid.loot_ids.get((self.x, self.y))
+
+    @loot_id.setter
+    def loot_id(self, value: Optional[str]) -> None:
+        _set_sparse(self._grid.loot_ids, (self.x, self.y), value)
+
+    def _get_visual(self, name: str) -> Any:
+        overrides = self._grid.visual_overrides.get((self.x, self.y))
+        if overrides and name in overrides:
+            return overrides[name]
+        return getattr(_TYPE_DEFAULTS[self._grid.types[self.y, self.x]], name)
+
+    def _set_visual(self, name: str, value: Any) -> None:
+        self._grid.visual_overrides.setdefault((self.x, self.y), {})[name] = value
+
+    @property
+    def char(self) -> str:
+        return self._get_visual("char")
+
+    @char.setter
+    def char(self, value: str) -> None:
+        self._set_visual("char", value)
+
+    @property
+    def fg_color(self) -> Tuple[int, int, int]:
+        return self._get_visual("fg_color")
+
+    @fg_color.setter
+    def fg_color(self, value: Tuple[int, int, int]) -> None:
+        self._set_visual("fg_color", value)
+
+    @property
+    def bg_color(self) -> Tuple[int, int, int]:
+        return self._get_visual("bg_color")
+
+    @bg_color.setter
+    def bg_color(self, value: Tuple[int, int, int]) -> None:
+        self._set_visual("bg_color", value)
+
+    def unlock(self):
+        """문 잠금 해제"""
+        if self.locked:
+            self.locked = False
+            self.walkable = True
+            if self.tile_type == TileType.LOCKED_DOOR:
+                self.tile_type = TileType.DOOR
+
+
+class TileRows:
+    """dungeon.tiles[y][x] 호환 접근자 (행마다 TileView 생성)"""
+
+    __slots__ = ("_grid",)
+
+    def __init__(self, grid: TileGrid):
+        self._grid = grid
+
+    def __len__(self) -> int:
+        return self._grid.height
+
+    def __getitem__(self, y: int) -> "_TileRow":
+        if not 0 <= y < self._grid.height:
+            raise IndexError(y)
+        return _TileRow(self._grid, y)
+
+    def __iter__(self) -> Iterator["_TileRow"]:
+        for y in range(self._grid.height):
+            yield _TileRow(self._grid, y)
+
+
+class _TileRow:
+    """타일 한 행"""
+
+    __slots__ = ("_grid", "_y")
+
+    def __init__(self, grid: TileGrid, y: int):
+        self._grid = grid
+        self._y = y
+
+    def __len__(self) -> int:
+        return self._grid.width
+
+    def __getitem__(self, x: int) -> TileView:
+        if not 0 <= x < self._grid.width:
+            raise IndexError(x)
+        return TileView(self._grid, x, self._y)
+
+    def __iter__(self) -> Iterator[TileView]:
+        for x in range(self._grid.width):
+            yield TileView(self._grid, x, self._y)
@@ -16,6 +16,10 @@ def setup_config():
 @pytest.fixture(autouse=True)
 def reset_systems():
     """각 테스트 전후로 시스템 초기화"""
+    # 난수 스트림을 고정 시드로 초기화 (테스트 실행 순서와 무관하게 재현)
+    from src.core.rng import set_run_seed
+    set_run_seed(0)
+
     yield
 
     # 전역 시스템 리셋
@@ -0,0 +1,32 @@
+"""
+벤치마크 하네스 테스트
+"""
+
+from benchmarks.harness import BenchmarkResult, measure, save_results, load_results, compare, format_comparison
+
+
+def _result(name, ops):
+    return BenchmarkResult(name=name, ops_per_sec=ops, mean_us=1e6 / ops, peak_kib=1.0, iterations=10, rounds=3)
+
+
+def test_measure_counts_operations():
+    calls = []
+    result = measure(lambda: calls.append(1), min_time=0.01, rounds=3)
+
+    assert result.iterations >= 1
+    assert len(calls) >= result.iterations * 3
+    assert result.ops_per_sec > 0
+
+
+def test_baseline_round_trip_and_regression(tmp_path):
+    path = save_results([_result("fast", 1000.0), _result("slow", 100.0)], tmp_path / "baseline.json")
+    baseline = load_results(path)
+
+    rows = {row["name"]: row for row in compare(
+        [_result("fast", 800.0), _result("slow", 95.0), _result("new", 10.0)], baseline, threshold=0.15
+    )}
+
+    assert rows["fast"]["regressed"] and round(rows["fast"]["change"], 2) == -0.20
+    assert not rows["slow"]["regressed"]
+    assert rows["new"]["baseline_ops"] is None and not rows["new"]["regressed"]
+    assert "회귀" in format_comparison(list(rows.values()))
@@ -0,0 +1,49 @@
+"""
+지연 스킬 레지스트리 테스트
+"""
+
+import sys
+
+from src.character.skills import skill_index
+from src.character.skills.skill_index import JOB_SKILL_IDS, build_skill_index, find_job
+from src.character.skills.skill_manager import SkillManager
+
+
+def test_index_matches_registered_skills():
+    """색인이 직업 모듈의 실제 등록 결과와 일치 (다르면 build_skill_index() 결과로 갱신)"""
+    assert build_skill_index() == JOB_SKILL_IDS
+
+
+def test_find_job():
+    assert find_job("warrior_power_strike") == "warrior"
+    assert find_job("dark_knight_new_skill") == "dark_knight"
+    assert find_job("unknown_skill") is None
+
+
+def test_get_skill_loads_only_that_job(monkeypatch):
+    loaded = []
+    original = skill_index.load_register_function
+
+    def tracking(job):
+        loaded.append(job)
+        return original(job)
+
+    monkeypatch.setattr("src.character.skills.skill_manager.load_register_function", tracking)
+    manager = SkillManager()
+
+    skill = manager.get_skill("warrior_power_strike")
+    assert skill is not None and skill.skill_id == "warrior_power_strike"
+    assert manager.get_skill("warrior_shield_bash") is not None
+    assert manager.get_skill("no_such_skill") is None
+    assert loaded == ["warrior"]
+    assert set(manager._skills) == set(JOB_SKILL_IDS["warrior"])
+
+    assert manager.get_skill_ids("archer_") == list(JOB_SKILL_IDS["archer"])
+    assert loaded == ["warrior", "archer"]
+
+
+def test_load_all_registers_every_job():
+    manager = SkillManager()
+    total = manager.load_all()
+    assert total == sum(len(ids) for ids in JOB_SKILL_IDS.values())
+    assert "src.character.skills.job_skills.warrior_skills" in sys.modules
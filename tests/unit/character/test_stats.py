@@ -0,0 +1,130 @@
+"""
+스탯 캐시/버전 테스트
+"""
+
+import pytest
+
+from src.character.stats import Stat, StatManager, Stats
+
+
+def _manager() -> StatManager:
+    return StatManager({
+        Stats.STRENGTH: {"base_value": 10},
+        Stats.SPEED: {"base_value": 5, "max_value": 20},
+    })
+
+
+def test_total_value_cached_until_change():
+    """총 값은 기본값/보너스 변경 시에만 다시 계산"""
+    stat = Stat("strength", 10)
+    assert stat.total_value == 10
+    version = stat.version
+
+    stat.add_bonus("equipment_weapon", 5)
+    assert stat.total_value == 15
+    assert stat.version > version
+
+    stat.base_value = 20
+    assert stat.total_value == 25
+
+    stat.remove_bonus("equipment_weapon")
+    assert stat.total_value == 20
+
+    stat.add_bonus("buff", -50)
+    assert stat.total_value == 0  # min_value로 제한
+
+    stat.clear_bonuses()
+    assert stat.total_value == 20
+
+
+def test_remove_missing_bonus_keeps_version():
+    """없는 보너스 제거는 버전을 바꾸지 않음"""
+    stat = Stat("strength", 10)
+    version = stat.version
+    stat.remove_bonus("missing")
+    assert stat.version == version
+
+
+def test_manager_version_tracks_all_changes():
+    """매니저 버전은 어느 스탯이 바뀌어도 증가"""
+    manager = _manager()
+
+    version = manager.version
+    manager.add_bonus(Stats.STRENGTH, "equipment_weapon", 3)
+    assert manager.version > version
+
+    version = manager.version
+    manager.get(Stats.SPEED).add_bonus("buff", 2)
+    assert manager.version > version
+
+    version = manager.version
+    manager.set_base_value(Stats.STRENGTH, 12)
+    manager.apply_level_up(2)
+    manager.add_stat(Stats.LUCK, 7)
+    manager.remove_stat(Stats.LUCK)
+    assert manager.version >= version + 4
+
+
+def test_snapshot_reused_until_version_changes():
+    """스냅샷은 버전이 같으면 같은 객체"""
+    manager = _manager()
+    first = manager.snapshot()
+    assert first == {Stats.STRENGTH: 10, Stats.SPEED: 5}
+    assert manager.snapshot() is first
+
+    with pytest.raises(TypeError):
+        first[Stats.STRENGTH] = 99
+
+    manager.add_bonus(Stats.SPEED, "buff", 100)
+    second = manager.snapshot()
+    assert second is not first
+    assert second[Stats.SPEED] == 20  # max_value로 제한
+    assert manager.get_all_stats() == dict(second)
+
+
+def test_from_dict_restores_versioned_manager():
+    """저장 데이터에서 복원한 매니저도 변경이 캐시에 반영"""
+    manager = _manager()
+    manager.add_bonus(Stats.STRENGTH, "equipment_weapon", 4)
+
+    restored = StatManager.from_dict(manager.to_dict())
+    assert restored.get_value(Stats.STRENGTH) == 14
+
+    version = restored.version
+    restored.remove_bonus(Stats.STRENGTH, "equipment_weapon")
+    assert restored.version > version
+    assert restored.snapshot()[Stats.STRENGTH] == 10
+
+
+def test_character_stat_snapshot_matches_properties():
+    """캐릭터 스냅샷은 스탯 프로퍼티와 같은 값이며 변경 시 갱신"""
+    from src.character.character import Character
+
+    character = Character("전사", "warrior")
+    snapshot = character.stat_snapshot()
+    for name in ("max_hp", "max_mp", "init_brv", "max_brv", "strength", "defense",
+                 "magic", "spirit", "speed", "luck", "accuracy", "evasion"):
+        assert snapshot[name] == getattr(character, name)
+    assert character.stat_snapshot() is snapshot
+
+    character.stat_manager.add_bonus(Stats.SPEED, "buff", 10)
+    updated = character.stat_snapshot()
+    assert updated is not snapshot
+    assert updated["speed"] == snapshot["speed"] + 10 == character.speed
+
+
+def test_character_stat_snapshot_after_manager_replaced():
+    """stat_manager를 교체하면 version이 같아도 스냅샷을 다시 계산 (세이브 불러오기)"""
+    from src.character.character import Character
+
+    character = Character("전사", "warrior")
+    snapshot = character.stat_snapshot()
+
+    replacement = StatManager.from_dict(character.stat_manager.to_dict())
+    replacement.add_bonus(Stats.SPEED, "buff", 10)
+    replacement.version = character.stat_manager.version
+    character.stat_manager = replacement
+
+    updated = character.stat_snapshot()
+    assert updated is not snapshot
+    assert updated["speed"] == snapshot["speed"] + 10 == character.speed
@@ -0,0 +1,126 @@
+"""
+특성 효과 색인 테스트
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.character.trait_effects import (
+    TraitEffect, TraitEffectManager, TraitEffectType, TraitIndex,
+)
+
+
+def _effect(trait_id, effect_type, value, target_stat=None, condition=None):
+    return TraitEffect(trait_id=trait_id, effect_type=effect_type, value=value,
+                       target_stat=target_stat, condition=condition)
+
+
+@pytest.fixture
+def manager():
+    manager = TraitEffectManager()
+    manager.trait_definitions = {
+        "flat_then_mult": [
+            _effect("flat_then_mult", TraitEffectType.STAT_FLAT, 10, "speed"),
+            _effect("flat_then_mult", TraitEffectType.STAT_MULTIPLIER, 1.5, "speed"),
+        ],
+        "low_hp_speed": [
+            _effect("low_hp_speed", TraitEffectType.STAT_MULTIPLIER, 2.0, "speed", "hp_below_50"),
+        ],
+        "all_stats": [_effect("all_stats", TraitEffectType.STAT_FLAT, 1)],
+        "physical": [_effect("physical", TraitEffectType.DAMAGE_MULTIPLIER, 1.2, "physical")],
+        "elemental": [_effect("elemental", TraitEffectType.DAMAGE_MULTIPLIER, 1.5, "elemental")],
+        "any_damage": [_effect("any_damage", TraitEffectType.DAMAGE_MULTIPLIER, 1.1)],
+        "skill_damage": [
+            _effect("skill_damage", TraitEffectType.DAMAGE_MULTIPLIER, 2.0, "physical", "skill_cast"),
+        ],
+        "mp_saver": [
+            _effect("mp_saver", TraitEffectType.MP_COST_REDUCTION, 0.2),
+            _effect("mp_saver", TraitEffectType.MP_COST_REDUCTION, 0.3, condition="skill_cast"),
+        ],
+        "crit": [_effect("crit", TraitEffectType.CRITICAL_BONUS, 0.1, condition="on_hit")],
+        "break": [_effect("break", TraitEffectType.BREAK_BONUS, 0.5)],
+    }
+    return manager
+
+
+def _character(*traits, hp=100):
+    return SimpleNamespace(active_traits=list(traits), current_hp=hp, max_hp=100)
+
+
+def test_stat_bonus_keeps_effect_order(manager):
+    """고정값과 배율이 특성 순서대로 적용됨"""
+    character = _character("all_stats", "flat_then_mult")
+    # ((10 + 1) + 10) * 1.5
+    assert manager.calculate_stat_bonus(character, "speed", 10) == pytest.approx(31.5)
+    # 대상 스탯이 없는 효과만 적용
+    assert manager.calculate_stat_bonus(character, "strength", 10) == 11
+
+
+def test_conditional_stat_bonus_evaluated_per_call(manager):
+    """조건부 효과는 호출할 때마다 조건 확인"""
+    character = _character("flat_then_mult", "low_hp_speed")
+    assert manager.calculate_stat_bonus(character, "speed", 10) == pytest.approx(30.0)
+
+    character.current_hp = 20
+    assert manager.calculate_stat_bonus(character, "speed", 10) == pytest.approx(60.0)
+
+
+def test_damage_multiplier_targets(manager):
+    """데미지 대상별 배율과 속성 보너스"""
+    character = _character("physical", "elemental", "any_damage")
+    assert manager.calculate_damage_multiplier(character, "physical") == pytest.approx(1.2 * 1.1)
+    assert manager.calculate_damage_multiplier(character, "magic") == pytest.approx(1.1)
+    assert manager.calculate_damage_multiplier(character, "magic", is_elemental=True) == pytest.approx(1.5 * 1.1)
+    assert manager.calculate_damage_multiplier(character, "elemental") == pytest.approx(1.5 * 1.1)
+
+
+def test_conditional_damage_and_mp(manager):
+    """조건부 데미지/MP 효과는 컨텍스트에 따라 적용"""
+    character = _character("skill_damage", "mp_saver")
+    assert manager.calculate_damage_multiplier(character, "physical") == 1.0
+    assert manager.calculate_damage_multiplier(character, "physical", is_skill=True) == 2.0
+    assert manager.calculate_damage_multiplier(character, "magic", is_skill=True) == 1.0
+
+    assert manager.calculate_mp_cost(character, 100) == 80
+    assert manager.calculate_mp_cost(character, 100, is_skill=True) == 50
+
+
+def test_critical_and_break_bonus(manager):
+    character = _character("crit", "break")
+    assert manager.calculate_critical_bonus(character) == pytest.approx(0.1)
+    assert manager.calculate_break_bonus(character) == pytest.approx(0.5)
+    assert manager.calculate_critical_bonus(SimpleNamespace()) == 0.0
+
+
+def test_index_reused_and_rebuilt(manager):
+    """색인은 재사용되고, 특성 목록이 바뀌면 다시 컴파일"""
+    character = _character("physical")
+    index = manager.get_trait_index(character)
+    assert isinstance(index, TraitIndex)
+    assert manager.get_trait_index(character) is index
+    assert index.effects[(TraitEffectType.DAMAGE_MULTIPLIER, "physical")][0].value == 1.2
+
+    character.active_traits.append("any_damage")
+    assert manager.calculate_damage_multiplier(character, "physical") == pytest.approx(1.2 * 1.1)
+
+    character.active_traits = [{"id": "elemental"}]
+    assert manager.calculate_damage_multiplier(character, "elemental") == pytest.approx(1.5)
+
+
+def test_character_activation_compiles_index():
+    """Character.activate_trait/deactivate_trait 시 색인 갱신"""
+    from src.character.character import Character
+    from src.character.trait_effects import get_trait_effect_manager
+
+    trait_manager = get_trait_effect_manager()
+    character = Character("전사", "warrior")
+    assert character.activate_trait("physical_power")
+    index = character._trait_index
+    assert index is trait_manager.get_trait_index(character)
+    multiplier = trait_manager.calculate_damage_multiplier(character, "physical")
+    assert multiplier > 1.0
+
+    assert character.deactivate_trait("physical_power")
+    assert character._trait_index is not index
+    assert trait_manager.calculate_damage_multiplier(character, "physical") == 1.0
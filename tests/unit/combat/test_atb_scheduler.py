@@ -0,0 +1,127 @@
+"""
+ATB Scheduler 테스트
+"""
+
+import math
+import pytest
+from src.combat.atb_system import ATBSystem
+from src.combat.atb_scheduler import ATBScheduler
+from src.core.event_bus import event_bus
+
+
+class MockCharacter:
+    """테스트용 캐릭터"""
+    def __init__(self, name: str, speed: int = 10):
+        self.name = name
+        self.speed = speed
+        self.is_enemy = False
+
+
+@pytest.fixture
+def atb():
+    system = ATBSystem()
+    yield system
+    system.clear()
+    event_bus.unsubscribe("brave.break", system._on_break)
+
+
+def test_advance_to_next_jumps_to_fastest(atb):
+    """가장 빠른 전투원까지 한 번에 진행 테스트"""
+    fast = MockCharacter("Fast", 20)
+    slow = MockCharacter("Slow", 10)
+    atb.register_combatant(fast)
+    atb.register_combatant(slow)
+
+    scheduler = ATBScheduler(atb)
+    elapsed = scheduler.advance_to_next()
+
+    # 1000 / (20 / 5.0) = 250
+    assert elapsed == pytest.approx(250.0)
+    assert atb.get_action_order() == [fast]
+    assert atb.get_gauge(slow).current == pytest.approx(500.0)
+
+
+def test_matches_frame_based_update(atb):
+    """프레임 기반 update와 같은 시각에 행동 가능 테스트"""
+    char = MockCharacter("Test", 10)
+    atb.register_combatant(char)
+
+    frames = 0
+    while not atb.get_action_order():
+        atb.update(delta_time=1.0)
+        frames += 1
+
+    atb.reset_all()
+    scheduler = ATBScheduler(atb)
+    assert scheduler.time_to_ready(char) == pytest.approx(frames)
+
+
+def test_recompute_on_haste(atb):
+    """헤이스트 적용 시 재계산 테스트"""
+    char = MockCharacter("Test", 10)
+    atb.register_combatant(char)
+    scheduler = ATBScheduler(atb)
+
+    assert scheduler.time_to_ready(char) == pytest.approx(500.0)
+
+    atb.apply_status_effect(char, "haste")
+    assert scheduler.time_to_ready(char) == pytest.approx(500.0 / 1.5)
+
+
+def test_stun_blocks_and_recovers(atb):
+    """기절 시 도달 불가, 해제 시 재계산 테스트"""
+    char = MockCharacter("Test", 10)
+    atb.register_combatant(char)
+    scheduler = ATBScheduler(atb)
+
+    atb.apply_status_effect(char, "stun")
+    assert scheduler.time_to_ready(char) == math.inf
+    assert scheduler.advance_to_next() is None
+    assert scheduler.stalled
+
+    atb.remove_status_effect(char, "stun")
+    assert scheduler.time_to_ready(char) == pytest.approx(500.0)
+
+
+def test_recompute_on_break_reset(atb):
+    """BREAK로 게이지 리셋 시 재계산 테스트"""
+    attacker = MockCharacter("Attacker", 10)
+    defender = MockCharacter("Defender", 10)
+    atb.register_combatant(attacker)
+    atb.register_combatant(defender)
+    scheduler = ATBScheduler(atb)
+
+    scheduler.advance(250.0)
+    assert scheduler.time_to_ready(defender) == pytest.approx(250.0)
+
+    atb._on_break({"attacker": attacker, "defender": defender})
+    assert scheduler.time_to_ready(defender) == pytest.approx(500.0)
+
+
+def test_predicted_gauge_for_interpolation(atb):
+    """UI 보간용 예상 게이지 테스트"""
+    char = MockCharacter("Test", 10)
+    atb.register_combatant(char)
+    scheduler = ATBScheduler(atb)
+
+    assert scheduler.predicted_gauge(char, 100.0) == pytest.approx(200.0)
+
+
+def test_casting_completion_is_scheduled(atb):
+    """캐스팅 완료 시각으로 진행 테스트"""
+    from src.combat.casting_system import get_casting_system
+
+    caster = MockCharacter("Caster", 10)
+    atb.register_combatant(caster)
+    casting_system = get_casting_system()
+    casting_system.clear()
+    casting_system.start_cast(caster, skill=None, target=None, cast_time_ratio=0.5)
+
+    scheduler = ATBScheduler(atb)
+    elapsed = scheduler.advance_to_next()
+
+    # 500 / (10 / 5.0) = 250
+    assert elapsed == pytest.approx(250.0)
+    assert not casting_system.is_casting(caster)
+    assert len(casting_system.get_completed_casts()) == 1
+    assert atb.get_gauge(caster).current == 0
@@ -0,0 +1,208 @@
+"""
+전투 리플레이 기록/재생 테스트
+"""
+
+import pytest
+
+from src.audio import use_null_audio
+from src.core.rng import set_run_seed
+from src.character.character import Character
+from src.character.skills.skill_manager import get_skill_manager
+from src.combat.casting_system import get_casting_system
+from src.combat.combat_manager import ActionType, CombatManager
+from src.combat.combat_replay import (
+    CAST_ACTION,
+    CHECKSUM,
+    CombatJournal,
+    ReplayError,
+    ReplayPlayer,
+    replay,
+    run_corpus,
+)
+from src.combat.combat_simulator import CombatSimulator
+from src.world.enemy_generator import ENEMY_TEMPLATES, SimpleEnemy
+
+
+@pytest.fixture(autouse=True)
+def null_audio():
+    use_null_audio()
+
+
+class MockCombatant:
+    """테스트용 전투원 (스냅샷으로 복원할 수 없는 객체)"""
+    def __init__(self, name: str, hp: int = 100, speed: int = 10):
+        self.name = name
+        self.speed = speed
+        self.level = 1
+        self.physical_attack = 30
+        self.physical_defense = 10
+        self.magic_attack = 15
+        self.magic_defense = 8
+        self.luck = 5
+        self.accuracy = 60
+        self.evasion = 10
+        self.current_hp = hp
+        self.max_hp = hp
+        self.current_mp = 50
+        self.max_mp = 50
+        self.init_brv = 100
+        self.max_brv = 300
+        self.is_alive = True
+
+    def take_damage(self, damage: int) -> int:
+        actual = min(damage, self.current_hp)
+        self.current_hp -= actual
+        if self.current_hp <= 0:
+            self.is_alive = False
+        return actual
+
+
+def _party():
+    return [Character("전사", "warrior"), Character("대마법사", "archmage")]
+
+
+def _enemies():
+    return [SimpleEnemy(ENEMY_TEMPLATES["goblin"]), SimpleEnemy(ENEMY_TEMPLATES["wolf"], 1.5)]
+
+
+def _recorded_battle(seed: int = 3) -> CombatJournal:
+    set_run_seed(seed)
+    result = CombatSimulator(record=True, max_turns=200).run(_party(), _enemies())
+    assert result.journal is not None
+    return CombatJournal.from_dict(result.journal)
+
+
+def test_recorded_battle_replays_exactly():
+    """기록한 전투를 다른 런 시드 상태에서 재생해도 체크섬 일치"""
+    journal = _recorded_battle()
+    assert journal.actions
+    assert journal.final_state in ("victory", "defeat", None)
+
+    set_run_seed(999)
+    result = ReplayPlayer(journal).run()
+    assert result.ok
+    assert result.first_mismatch is None
+    assert result.actions_replayed == len(journal.actions)
+    assert result.final_state == journal.final_state
+
+
+def test_same_run_seed_same_journal():
+    """런 시드가 같으면 전투 시드와 행동 기록이 같음"""
+    first, second = _recorded_battle(7), _recorded_battle(7)
+    assert first.seed == second.seed
+    assert first.actions == second.actions
+
+
+def test_step_by_step_replay():
+    """한 단계씩 재생하며 단계별 체크섬 확인"""
+    journal = _recorded_battle()
+    player = ReplayPlayer(journal)
+
+    steps = [player.step() for _ in range(len(journal.actions))]
+    assert all(step.matches for step in steps)
+    assert [step.index for step in steps] == list(range(len(journal.actions)))
+    assert player.finished
+    with pytest.raises(ReplayError):
+        player.step()
+
+
+def test_divergence_reported():
+    """기록과 다르게 진행되면 처음 달라진 행동 인덱스를 보고"""
+    journal = _recorded_battle()
+    journal.actions[2][CHECKSUM] ^= 1
+
+    result = ReplayPlayer(journal).run()
+    assert not result.ok
+    assert result.first_mismatch == 2
+
+    stopped = ReplayPlayer(journal).run(stop_on_mismatch=True)
+    assert stopped.actions_replayed == 3
+
+
+def test_changed_initial_state_detected():
+    """시작 상태 스냅샷이 달라지면 시작 시점(-1) 불일치"""
+    journal = _recorded_battle()
+    journal.enemies[0]["stats"]["current_hp"] -= 1
+
+    result = ReplayPlayer(journal).run()
+    assert not result.ok
+    assert result.first_mismatch == -1
+
+
+def test_journal_file_round_trip(tmp_path):
+    """gzip 저널 저장/불러오기 후에도 재생 가능 (코퍼스 실행)"""
+    journal = _recorded_battle()
+    path = journal.save(tmp_path / "battle.replay.json.gz")
+    assert path.stat().st_size < len(journal.to_json()) / 3
+
+    assert CombatJournal.load(path) == journal
+    assert replay(path).ok
+
+    results = run_corpus([tmp_path])
+    assert list(results) == [str(path)]
+    assert all(result.ok for result in results.values())
+
+
+def test_unsupported_version_rejected():
+    data = _recorded_battle().to_dict()
+    data["version"] = 999
+    with pytest.raises(ReplayError):
+        CombatJournal.from_dict(data)
+
+
+def test_cast_completion_replayed():
+    """캐스팅 스킬은 완료 시점이 기록되고 ATB 없이 재생됨"""
+    set_run_seed(5)
+    mage, warrior = Character("대마법사", "archmage"), Character("전사", "warrior")
+    enemies = [SimpleEnemy(ENEMY_TEMPLATES["orc"])]
+
+    manager = CombatManager()
+    manager.start_combat([mage, warrior], enemies, record=True)
+    skill = get_skill_manager().get_skill("archmage_ice_storm")
+    manager.execute_action(mage, ActionType.SKILL, target=enemies[0], skill=skill)
+    assert get_casting_system().is_casting(mage)
+
+    for _ in range(100):
+        ready = manager.advance_to_next_action()
+        if len(manager.journal.actions) >= 8:
+            break
+        if ready:
+            actor = ready[0]
+            manager.execute_action(
+                actor, ActionType.BRV_ATTACK, target=manager.get_valid_targets(actor, ActionType.BRV_ATTACK)[0]
+            )
+    manager.atb.clear()
+
+    journal = manager.journal
+    assert [entry[:4] for entry in journal.actions[:2]] == [
+        [0, "skill", 2, "archmage_ice_storm"],
+        [0, CAST_ACTION, 2, "archmage_ice_storm"],
+    ]
+    assert ReplayPlayer(CombatJournal.from_json(journal.to_json())).run().ok
+
+
+def test_custom_combatants_need_explicit_objects():
+    """스냅샷으로 복원할 수 없는 전투원은 재생 시 직접 전달"""
+    def combatants():
+        return [MockCombatant("아군", hp=300, speed=12)], [MockCombatant("적", hp=150)]
+
+    set_run_seed(11)
+    allies, enemies = combatants()
+    result = CombatSimulator(record=True, enemy_policy=_attack_first, max_turns=100).run(allies, enemies)
+    journal = CombatJournal.from_dict(result.journal)
+
+    with pytest.raises(ReplayError):
+        ReplayPlayer(journal).start()
+    assert ReplayPlayer(journal, combatants=combatants()).run().ok
+
+
+def _attack_first(manager, actor):
+    targets = manager.get_valid_targets(actor, ActionType.BRV_ATTACK)
+    return ActionType.BRV_ATTACK, targets[0], None
+
+
+def test_recording_disabled_by_default():
+    manager = CombatManager()
+    manager.start_combat(_party(), _enemies())
+    assert manager.journal is None
+    manager.atb.clear()
@@ -0,0 +1,111 @@
+"""
+Combat Simulator 테스트
+"""
+
+import pytest
+from src.audio import use_null_audio, get_audio_manager, NullAudioManager
+from src.combat.combat_simulator import (
+    CombatSimulator,
+    SimulationResult,
+    run_batch,
+    simulate_battle,
+    summarize,
+)
+
+
+class MockCombatant:
+    """테스트용 전투원"""
+    def __init__(self, name: str, hp: int = 100, speed: int = 10, is_enemy: bool = False):
+        self.name = name
+        self.speed = speed
+        self.level = 1
+        self.is_enemy = is_enemy
+
+        self.physical_attack = 30
+        self.physical_defense = 10
+        self.magic_attack = 15
+        self.magic_defense = 8
+        self.luck = 5
+        self.accuracy = 200  # 항상 명중
+        self.evasion = 0
+
+        self.current_hp = hp
+        self.max_hp = hp
+        self.current_mp = 50
+        self.max_mp = 50
+
+        self.init_brv = 100
+        self.max_brv = 300
+        self.is_alive = True
+
+    def take_damage(self, damage: int) -> int:
+        actual_damage = min(damage, self.current_hp)
+        self.current_hp -= actual_damage
+        if self.current_hp <= 0:
+            self.is_alive = False
+        return actual_damage
+
+
+def make_allies():
+    return [MockCombatant("Hero", hp=500, speed=20)]
+
+
+def make_enemies():
+    return [MockCombatant("Slime", hp=50, speed=5, is_enemy=True)]
+
+
+@pytest.fixture(autouse=True)
+def null_audio():
+    use_null_audio()
+    yield
+
+
+def test_null_audio_sink():
+    """무음 오디오 싱크 테스트"""
+    audio = get_audio_manager()
+    assert isinstance(audio, NullAudioManager)
+    assert audio.play_sfx("combat", "attack_physical") is False
+
+
+def test_simulate_battle_victory():
+    """헤드리스 전투 승리 테스트"""
+    result = simulate_battle(make_allies(), make_enemies(), seed=42)
+
+    assert isinstance(result, SimulationResult)
+    assert result.winner == "allies"
+    assert result.turns > 0
+    assert result.ally_hp_damage > 0
+    assert result.enemies_alive == 0
+    assert result.allies_alive == 1
+
+
+def test_simulate_battle_timeout():
+    """최대 턴 초과 시 timeout 테스트"""
+    allies = [MockCombatant("Hero", hp=10000)]
+    enemies = [MockCombatant("Wall", hp=10000, is_enemy=True)]
+
+    result = CombatSimulator(max_turns=3).run(allies, enemies)
+
+    assert result.winner == "timeout"
+    assert result.turns == 3
+
+
+def test_simulate_battle_is_reproducible():
+    """같은 시드는 같은 결과 테스트"""
+    first = simulate_battle(make_allies(), make_enemies(), seed=7)
+    second = simulate_battle(make_allies(), make_enemies(), seed=7)
+
+    assert first == second
+
+
+def test_run_batch_and_summarize():
+    """대량 시뮬레이션 및 요약 테스트"""
+    results = run_batch(make_allies, make_enemies, battles=5, base_seed=100)
+
+    assert len(results) == 5
+    assert [r.seed for r in results] == [100, 101, 102, 103, 104]
+
+    summary = summarize(results)
+    assert summary["battles"] == 5
+    assert summary["win_rate"] == 1.0
+    assert summary["avg_turns"] > 0
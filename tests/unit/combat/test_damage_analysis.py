@@ -0,0 +1,148 @@
+"""
+몬테카를로 데미지 분석기 테스트
+"""
+
+import dataclasses
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.core.config import get_config
+from src.combat.damage_analysis import (
+    StatVector,
+    analyze_matchups,
+    make_generator,
+    sample_actions_to_kill,
+    sample_brv_damage,
+    sample_hp_damage,
+    summarize,
+)
+from src.combat.damage_calculator import DamageCalculator
+
+
+def _combatant(name="unit", attack=40, defense=10, accuracy=200, evasion=0, luck=0,
+               max_hp=500, max_brv=300, init_brv=100):
+    return SimpleNamespace(
+        name=name, physical_attack=attack, physical_defense=defense,
+        magic_attack=attack // 2, magic_defense=defense // 2,
+        accuracy=accuracy, evasion=evasion, luck=luck,
+        max_hp=max_hp, current_hp=max_hp, max_brv=max_brv, init_brv=init_brv, current_brv=init_brv,
+    )
+
+
+def _vector(*combatants):
+    return StatVector.from_combatants(combatants)
+
+
+@pytest.fixture
+def no_crit():
+    """크리티컬이 나오지 않는 설정 스냅샷"""
+    return dataclasses.replace(get_config().snapshot, critical_base_chance=0.0)
+
+
+def test_brv_damage_within_variance(no_crit):
+    """BRV 데미지는 기본 데미지의 0.9~1.1배 범위"""
+    attacker, defender = _combatant(), _combatant()
+    damage = sample_brv_damage(
+        _vector(attacker), _vector(defender), 1.0, 50000, rng=make_generator(1), snapshot=no_crit,
+        ignore_evasion=True
+    )
+    base = max(1, int(40 / 11 * no_crit.brv_damage_multiplier))
+    assert damage.shape == (1, 50000)
+    assert damage.min() >= int(base * 0.9)
+    assert damage.max() <= int(base * 1.1)
+    assert damage.mean() == pytest.approx(base - 0.5, rel=0.01)  # 정수 절사로 평균 0.5 감소
+
+
+def test_brv_damage_matches_scalar_calculator():
+    """배치 샘플 평균이 DamageCalculator 반복 호출 평균과 일치"""
+    attacker = _combatant(accuracy=70, evasion=0, luck=10)
+    defender = _combatant(evasion=20)
+
+    calc = DamageCalculator()
+    scalar = [calc.calculate_brv_damage(attacker, defender, 1.5).final_damage for _ in range(20000)]
+
+    batch = sample_brv_damage(_vector(attacker), _vector(defender), 1.5, 200000, rng=make_generator(2))
+    assert batch.mean() == pytest.approx(np.mean(scalar), rel=0.03)
+    assert (batch == 0).mean() == pytest.approx(0.5, abs=0.01)  # 명중률 70 - 20
+
+
+def test_hit_chance_clamped():
+    """명중률은 5%~95%로 제한"""
+    rng = make_generator(3)
+    never = sample_brv_damage(_vector(_combatant(accuracy=0)), _vector(_combatant(evasion=50)), samples=40000, rng=rng)
+    always = sample_brv_damage(_vector(_combatant(accuracy=500)), _vector(_combatant()), samples=40000, rng=rng)
+    assert (never > 0).mean() == pytest.approx(0.05, abs=0.01)
+    assert (always > 0).mean() == pytest.approx(0.95, abs=0.01)
+
+
+def test_hp_damage_matches_scalar_formula(no_crit):
+    """크리티컬이 없으면 HP 데미지는 결정적이며 DamageCalculator와 같음"""
+    attacker, defender = _combatant(attack=55), _combatant(defense=17)
+    calc = DamageCalculator()
+    calc.apply_config(no_crit)
+
+    for is_break in (False, True):
+        for damage_type in ("physical", "magical"):
+            expected, _ = calc.calculate_hp_damage(attacker, defender, 237, 1.2, is_break, damage_type)
+            batch = sample_hp_damage(
+                _vector(attacker), _vector(defender), 237, 1.2, is_break, damage_type,
+                samples=100, rng=make_generator(4), snapshot=no_crit
+            )
+            assert (batch == expected.final_damage).all()
+
+
+def test_hp_damage_critical_rate():
+    """크리티컬 확률은 기본 확률 + 행운/100"""
+    snapshot = get_config().snapshot
+    damage = sample_hp_damage(
+        _vector(_combatant(luck=20)), _vector(_combatant()), 1000, samples=50000, rng=make_generator(5)
+    )
+    assert (damage > damage.min()).mean() == pytest.approx(snapshot.critical_base_chance + 0.2, abs=0.01)
+
+
+def test_rows_broadcast_against_single_defender(no_crit):
+    """방어자가 하나면 모든 공격자 행에 적용"""
+    attackers = _vector(_combatant("weak", attack=20), _combatant("strong", attack=80))
+    damage = sample_brv_damage(
+        attackers, _vector(_combatant()), samples=1000, rng=make_generator(6), snapshot=no_crit, ignore_evasion=True
+    )
+    assert damage.shape == (2, 1000)
+    assert damage[1].mean() > damage[0].mean() * 3
+
+
+def test_actions_to_kill():
+    """처치 행동 수: 약한 상대일수록 적고, 처치 불가면 inf"""
+    attacker = _vector(_combatant(attack=60))
+    easy = sample_actions_to_kill(attacker, _vector(_combatant(max_hp=50)), samples=500, rng=make_generator(7))
+    hard = sample_actions_to_kill(attacker, _vector(_combatant(max_hp=5000)), samples=500, rng=make_generator(7))
+    assert np.isfinite(easy).all() and np.isfinite(hard).all()
+    assert easy.mean() < hard.mean()
+
+    never = sample_actions_to_kill(
+        attacker, _vector(_combatant(max_hp=10 ** 9)), samples=10, max_actions=5, rng=make_generator(7)
+    )
+    assert np.isinf(never).all()
+
+
+def test_summarize_ignores_unfinished():
+    """요약은 inf를 제외하고 집계"""
+    rows = np.array([[1.0, 2.0, 3.0, np.inf], [np.inf, np.inf, np.inf, np.inf]])
+    first, second = summarize(rows, percentiles=(50,))
+    assert first.mean == pytest.approx(2.0)
+    assert first.percentiles == {"p50": 2.0}
+    assert np.isnan(second.mean)
+
+
+def test_analyze_matchups_reproducible():
+    """직업 x 적 대진 분석은 시드가 같으면 같은 결과"""
+    kwargs = dict(jobs=["warrior", "archmage"], enemies=["goblin", "slime"], samples=2000, ttk_samples=100, seed=11)
+    results = analyze_matchups(**kwargs)
+
+    assert [(r.attacker, r.defender) for r in results] == [
+        ("warrior", "goblin"), ("warrior", "slime"), ("archmage", "goblin"), ("archmage", "slime"),
+    ]
+    assert all(r.brv_damage.mean > 0 and 0 < r.hit_rate <= 0.95 for r in results)
+    assert results[0].to_dict()["brv_damage"]["percentiles"].keys() == {"p5", "p25", "p50", "p75", "p95"}
+    assert [r.to_dict() for r in analyze_matchups(**kwargs)] == [r.to_dict() for r in results]
@@ -0,0 +1,76 @@
+"""
+전투 지연 이벤트 모드 테스트
+"""
+
+import pytest
+
+from src.audio import use_null_audio
+from src.core.config import get_config
+from src.core.event_bus import event_bus, Events
+from src.combat.combat_manager import CombatManager, ActionType
+
+
+class MockCombatant:
+    """테스트용 전투원"""
+    def __init__(self, name: str, speed: int = 10):
+        self.name = name
+        self.speed = speed
+        self.level = 1
+        self.physical_attack = 30
+        self.physical_defense = 10
+        self.magic_attack = 15
+        self.magic_defense = 8
+        self.luck = 5
+        self.accuracy = 200  # 항상 명중
+        self.evasion = 0
+        self.current_hp = 500
+        self.max_hp = 500
+        self.current_mp = 50
+        self.max_mp = 50
+        self.init_brv = 100
+        self.max_brv = 300
+        self.is_alive = True
+
+    def take_damage(self, damage: int) -> int:
+        actual_damage = min(damage, self.current_hp)
+        self.current_hp -= actual_damage
+        return actual_damage
+
+
+@pytest.fixture
+def deferred_manager():
+    use_null_audio()
+    config = get_config()
+    previous = config.get("combat.deferred_events", False)
+    config.set("combat.deferred_events", True)
+    try:
+        yield CombatManager()
+    finally:
+        config.set("combat.deferred_events", previous)
+        event_bus.clear_coalescing(Events.CHARACTER_BRV_CHANGE)
+
+
+def test_events_flushed_once_at_turn_end(deferred_manager):
+    """행동 중 이벤트는 턴 종료 시 한 번에, 캐릭터별 BRV 변화는 병합되어 전달"""
+    hero, slime = MockCombatant("Hero", speed=20), MockCombatant("Slime")
+    deferred_manager.start_combat([hero], [slime])
+
+    received = []
+    on_brv = lambda data: received.append(("brv", data["character"].name, data["current"]))
+    on_turn_end = lambda data: received.append(("turn_end", data["actor"].name))
+    event_bus.subscribe(Events.CHARACTER_BRV_CHANGE, on_brv)
+    event_bus.subscribe(Events.COMBAT_TURN_END, on_turn_end)
+    try:
+        deferred_manager.execute_action(hero, ActionType.BRV_ATTACK, target=slime)
+    finally:
+        event_bus.unsubscribe(Events.CHARACTER_BRV_CHANGE, on_brv)
+        event_bus.unsubscribe(Events.COMBAT_TURN_END, on_turn_end)
+
+    brv_events = [event for event in received if event[0] == "brv"]
+    assert sorted(name for _, name, _ in brv_events) == ["Hero", "Slime"]
+    # 병합된 이벤트는 최종 BRV를 담음
+    assert dict((name, current) for _, name, current in brv_events) == {
+        "Hero": hero.current_brv, "Slime": slime.current_brv
+    }
+    assert received[-1] == ("turn_end", "Hero")
+    assert not event_bus.is_deferred
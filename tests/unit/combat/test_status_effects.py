@@ -4,6 +4,9 @@ Status Effects 테스트
 상태 효과 시스템의 주요 기능을 테스트합니다.
 """
 
+import copy
+import pickle
+
 import pytest
 from src.combat.status_effects import (
     StatusEffect,
@@ -525,3 +528,96 @@ class TestEdgeCases:
         # duration이 음수가 되어 만료됨
         assert len(expired) == 1
         assert len(manager.status_effects) == 0
+
+
+class TestModifierCache:
+    """스탯 배율 캐시 테스트"""
+
+    def test_cache_invalidated_on_add_remove_expire(self):
+        """추가/제거/만료 시 배율 재계산"""
+        manager = StatusManager("TestChar")
+        assert manager.get_stat_modifier('speed') == 1.0
+
+        manager.add_status(create_status_effect("가속", StatusType.HASTE, 1))
+        assert manager.get_stat_modifier('speed') == 1.5
+
+        manager.add_status(create_status_effect("둔화", StatusType.SLOW, 3))
+        assert manager.get_stat_modifier('speed') == pytest.approx(0.9)
+
+        manager.update_duration()  # 가속 만료
+        assert manager.get_stat_modifier('speed') == 0.6
+
+        manager.remove_status(StatusType.SLOW)
+        assert manager.get_stat_modifier('speed') == 1.0
+
+    def test_cache_invalidated_on_stack_and_refresh(self):
+        """스택 추가와 강도 갱신 시 배율 재계산"""
+        manager = StatusManager("TestChar")
+        manager.add_status(create_status_effect(
+            "공격력 강화", StatusType.BOOST_ATK, 3, is_stackable=True, max_stacks=3
+        ))
+        assert manager.get_stat_modifier('physical_attack') == pytest.approx(1.2)
+
+        manager.add_status(create_status_effect(
+            "공격력 강화", StatusType.BOOST_ATK, 3, is_stackable=True, max_stacks=3
+        ))
+        assert manager.get_stat_modifier('physical_attack') == pytest.approx(1.4)
+
+        manager.add_status(create_status_effect("방어력 감소", StatusType.REDUCE_DEF, 3, intensity=1.0))
+        manager.add_status(create_status_effect("방어력 감소", StatusType.REDUCE_DEF, 3, intensity=2.0))
+        assert manager.get_stat_modifier('physical_defense') == pytest.approx(0.6)
+
+    def test_returned_modifiers_are_copies(self):
+        """반환된 딕셔너리를 수정해도 캐시는 그대로"""
+        manager = StatusManager("TestChar")
+        manager.add_status(create_status_effect("가속", StatusType.HASTE, 3))
+
+        modifiers = manager.get_stat_modifiers()
+        modifiers['speed'] = 99.0
+
+        assert manager.get_stat_modifiers()['speed'] == 1.5
+
+    def test_removed_effect_no_longer_invalidates(self):
+        """제거된 효과를 수정해도 관리자 배율에 영향 없음"""
+        manager = StatusManager("TestChar")
+        effect = create_status_effect("공격력 강화", StatusType.BOOST_ATK, 3)
+        manager.add_status(effect)
+        manager.remove_status(StatusType.BOOST_ATK)
+
+        effect.stack_count = 5
+
+        assert manager.get_stat_modifier('physical_attack') == 1.0
+        assert manager.status_effects == []
+
+    def test_direct_edit_recomputed(self):
+        """보유 중인 효과의 강도를 직접 바꿔도 배율 재계산"""
+        manager = StatusManager("TestChar")
+        effect = create_status_effect("공격력 강화", StatusType.BOOST_ATK, 3)
+        manager.add_status(effect)
+        assert manager.get_stat_modifier('physical_attack') == pytest.approx(1.2)
+
+        effect.intensity = 2.0
+        assert manager.get_stat_modifier('physical_attack') == pytest.approx(1.4)
+
+    def test_deepcopy_has_independent_cache(self):
+        """deepcopy한 관리자는 원본과 캐시를 공유하지 않음"""
+        manager = StatusManager("TestChar")
+        manager.add_status(create_status_effect("공격력 강화", StatusType.BOOST_ATK, 3))
+        assert manager.get_stat_modifier('physical_attack') == pytest.approx(1.2)
+
+        copied = copy.deepcopy(manager)
+        copied.get_status(StatusType.BOOST_ATK).intensity = 2.0
+
+        assert copied.get_stat_modifier('physical_attack') == pytest.approx(1.4)
+        assert manager.get_stat_modifier('physical_attack') == pytest.approx(1.2)
+
+    def test_pickle_round_trip(self):
+        """관리자를 pickle로 저장/복원해도 배율 유지"""
+        manager = StatusManager("TestChar")
+        manager.add_status(create_status_effect("가속", StatusType.HASTE, 3))
+        manager.get_stat_modifiers()
+
+        restored = pickle.loads(pickle.dumps(manager))
+        assert restored.get_stat_modifier('speed') == 1.5
+        restored.remove_status(StatusType.HASTE)
+        assert restored.get_stat_modifier('speed') == 1.0
@@ -0,0 +1,94 @@
+"""
+설정 스냅샷 / 핫 리로드 테스트
+"""
+
+import os
+
+import pytest
+
+from src.core.config import Config, ConfigSnapshot, ConfigWatcher
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    _write(path, "combat:\n  atb:\n    max_gauge: 3000\n    base_rate: 40\naudio:\n  sfx:\n    ui:\n      click: click.wav\n")
+    return path
+
+
+def test_flattened_get_and_typed_snapshot(config_file):
+    config = Config(str(config_file))
+
+    assert config.get("combat.atb.max_gauge") == 3000
+    assert config.get("audio.sfx.ui.click") == "click.wav"
+    assert config.get("combat.atb") == {"max_gauge": 3000, "base_rate": 40}
+    assert config.get("combat.atb.missing", 7) == 7
+    assert config.get("audio.sfx.ui.click.extra") is None
+
+    snapshot = config.snapshot
+    assert snapshot.atb_max_gauge == 3000
+    assert snapshot.atb_base_rate == 40.0 and isinstance(snapshot.atb_base_rate, float)
+    # 파일에 없는 값은 기존 기본값
+    assert snapshot.atb_action_threshold == 1000
+    with pytest.raises(AttributeError):
+        snapshot.atb_max_gauge = 1
+
+
+def test_set_swaps_snapshot_and_survives_reload(config_file):
+    config = Config(str(config_file))
+    before = config.snapshot
+
+    config.set("development.enabled", True)
+    assert config.development_mode is True
+    assert config.snapshot is not before
+    assert before.development_mode is False
+
+    config.reload()
+    assert config.get("development.enabled") is True
+
+
+def test_reload_notifies_subscribers(config_file):
+    config = Config(str(config_file))
+
+    class Subsystem:
+        def __init__(self):
+            self.max_gauge = None
+
+        def apply_config(self, snapshot: ConfigSnapshot):
+            self.max_gauge = snapshot.atb_max_gauge
+
+    subsystem = Subsystem()
+    config.subscribe(subsystem.apply_config)
+    _write(config_file, "combat:\n  atb:\n    max_gauge: 5000\n")
+
+    config.reload()
+    assert subsystem.max_gauge == 5000
+
+    # 바운드 메서드는 약한 참조 - 객체가 사라지면 해제
+    del subsystem
+    config.reload()
+    assert config._subscribers == []
+
+
+def test_watcher_reloads_on_change_and_keeps_snapshot_on_error(config_file):
+    config = Config(str(config_file))
+    watcher = ConfigWatcher(config)
+    assert not watcher.check()
+
+    _write(config_file, "combat:\n  atb:\n    max_gauge: 4000\n")
+    os.utime(config_file, ns=(1, 1))
+    assert watcher.check()
+    assert config.snapshot.atb_max_gauge != 4000  # 게임 루프에서 적용할 때까지 대기
+    assert config.apply_pending()
+    assert config.snapshot.atb_max_gauge == 4000
+    assert not config.apply_pending()
+
+    _write(config_file, "combat: [\n")
+    os.utime(config_file, ns=(2, 2))
+    assert not watcher.check()
+    assert not config.apply_pending()
+    assert config.snapshot.atb_max_gauge == 4000
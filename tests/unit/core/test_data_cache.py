@@ -0,0 +1,69 @@
+"""
+컴파일된 데이터 캐시 테스트
+"""
+
+import os
+
+from src.core.data_cache import DataCache
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_loads_all_yaml(tmp_path):
+    """data/ 아래 YAML을 상대 경로 키로 한 번에 로드"""
+    data_dir = tmp_path / "data"
+    _write(data_dir / "characters" / "warrior.yaml", "class_name: 전사\n")
+    _write(data_dir / "characters" / "archer.yaml", "class_name: 궁수\n")
+    _write(data_dir / "passives.yaml", "passives: []\n")
+
+    cache = DataCache(data_dir, tmp_path / "cache.pickle", enabled=True)
+
+    assert cache.get("characters/warrior.yaml") == {"class_name": "전사"}
+    assert cache.get("missing.yaml") is None
+    assert list(cache.get_directory("characters")) == ["archer", "warrior"]
+    assert cache.parsed == 3
+
+
+def test_reuses_cache_file_and_rebuilds_changed(tmp_path):
+    """다음 실행은 캐시 파일을 재사용하고, 바뀐 파일만 다시 파싱"""
+    data_dir = tmp_path / "data"
+    _write(data_dir / "a.yaml", "value: 1\n")
+    _write(data_dir / "b.yaml", "value: 2\n")
+    cache_path = tmp_path / "cache.pickle"
+    DataCache(data_dir, cache_path, enabled=True).refresh()
+
+    cache = DataCache(data_dir, cache_path, enabled=True)
+    cache.refresh()
+    assert (cache.reused, cache.parsed) == (2, 0)
+
+    # 내용 변경 -> 해당 파일만 재파싱
+    _write(data_dir / "a.yaml", "value: 10\n")
+    stat = (data_dir / "a.yaml").stat()
+    os.utime(data_dir / "a.yaml", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    # 수정 시각만 변경 -> 해시가 같으므로 재사용
+    stat = (data_dir / "b.yaml").stat()
+    os.utime(data_dir / "b.yaml", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+    cache = DataCache(data_dir, cache_path, enabled=True)
+    assert cache.get("a.yaml") == {"value": 10}
+    assert (cache.reused, cache.parsed) == (1, 1)
+
+    # 파일 삭제 반영
+    (data_dir / "b.yaml").unlink()
+    assert cache.refresh()
+    assert cache.get("b.yaml") is None
+
+
+def test_corrupt_cache_file_is_rebuilt(tmp_path):
+    """손상된 캐시 파일은 무시하고 다시 빌드"""
+    data_dir = tmp_path / "data"
+    _write(data_dir / "a.yaml", "value: 1\n")
+    cache_path = tmp_path / "cache.pickle"
+    cache_path.write_bytes(b"not a pickle")
+
+    cache = DataCache(data_dir, cache_path, enabled=True)
+    assert cache.get("a.yaml") == {"value": 1}
+    assert DataCache(data_dir, cache_path, enabled=True).get("a.yaml") == {"value": 1}
@@ -0,0 +1,166 @@
+"""
+이벤트 버스 테스트
+"""
+
+from src.core.event_bus import EventBus
+
+
+def test_publish_order_and_unsubscribe():
+    """구독 순서대로 전달되고, 해제 후에는 전달되지 않음"""
+    bus = EventBus()
+    calls = []
+    first = lambda data: calls.append(("first", data))
+    second = lambda data: calls.append(("second", data))
+
+    bus.subscribe("hit", first)
+    bus.subscribe("hit", second)
+    bus.subscribe("hit", first)  # 중복 구독 무시
+    bus.publish("hit", 1)
+    bus.unsubscribe("hit", first)
+    bus.publish("hit", 2)
+
+    assert calls == [("first", 1), ("second", 1), ("second", 2)]
+
+
+def test_unknown_event_creates_nothing():
+    """구독자 없는 이벤트 발행/해제는 내부 테이블을 늘리지 않음"""
+    bus = EventBus()
+    bus.publish("nobody.listens", {})
+    bus.unsubscribe("nobody.listens", print)
+
+    assert not bus.has_subscribers("nobody.listens")
+    assert bus._subscribers == {} and bus._dispatch == {}
+
+
+def test_failing_callback_does_not_stop_others():
+    """콜백 하나가 실패해도 나머지 구독자에게 전달"""
+    bus = EventBus()
+    calls = []
+
+    def broken(data):
+        raise ValueError("boom")
+
+    bus.subscribe("hit", broken)
+    bus.subscribe("hit", calls.append)
+    bus.publish("hit", 3)
+
+    assert calls == [3]
+
+
+def test_unsubscribe_during_publish_uses_snapshot():
+    """발행 중 구독 해제해도 이번 발행은 시작 시점의 구독자에게 전달"""
+    bus = EventBus()
+    calls = []
+
+    def first(data):
+        calls.append("first")
+        bus.unsubscribe("hit", second)
+
+    def second(data):
+        calls.append("second")
+
+    bus.subscribe("hit", first)
+    bus.subscribe("hit", second)
+    bus.publish("hit")
+    bus.publish("hit")
+
+    assert calls == ["first", "second", "first"]
+
+
+def test_history_ring_buffer_and_disable():
+    """히스토리는 최근 N개만 보관하고, 0이면 기록하지 않음"""
+    bus = EventBus(max_history=3)
+    for i in range(5):
+        bus.publish("tick", i)
+
+    assert [data for _, data in bus.get_event_history()] == [2, 3, 4]
+    assert bus.get_event_history("other") == []
+
+    bus.set_history_size(0)
+    bus.publish("tick", 5)
+    assert not bus.history_enabled
+    assert bus.get_event_history() == []
+
+
+def test_deferred_delivery_order_and_coalescing():
+    """지연 모드: flush 때 발행 순서대로 전달, 병합 이벤트는 첫 위치에서 한 번"""
+    from src.core.event_bus import merge_value_change
+
+    bus = EventBus()
+    calls = []
+    bus.subscribe("brv", lambda data: calls.append(("brv", data["who"], data["change"], data["current"])))
+    bus.subscribe("hit", lambda data: calls.append(("hit", data)))
+    bus.set_coalescing("brv", key=lambda data: data["who"], merge=merge_value_change)
+
+    with bus.deferred():
+        bus.publish("brv", {"who": "a", "change": 10, "current": 10})
+        bus.publish("hit", 1)
+        bus.publish("brv", {"who": "b", "change": -10, "current": 0})
+        bus.publish("brv", {"who": "a", "change": 5, "current": 15})
+        assert calls == []
+
+    assert calls == [
+        ("brv", "a", 15, 15),
+        ("hit", 1),
+        ("brv", "b", -10, 0),
+    ]
+    # 히스토리는 병합 전 원본
+    assert len(bus.get_event_history("brv")) == 3
+
+
+def test_nested_deferred_and_publish_during_flush():
+    """중첩 지연은 가장 바깥에서 전달, 전달 중 발행된 이벤트도 같은 흐름에서 전달"""
+    bus = EventBus()
+    calls = []
+    bus.subscribe("first", lambda data: (calls.append("first"), bus.publish("second")))
+    bus.subscribe("second", lambda data: calls.append("second"))
+
+    bus.begin_deferred()
+    bus.begin_deferred()
+    bus.publish("first")
+    bus.end_deferred()
+    assert calls == [] and bus.is_deferred
+    bus.end_deferred()
+
+    assert calls == ["first", "second"]
+    assert not bus.is_deferred
+
+
+def test_profiling_records_events_and_callbacks(tmp_path):
+    """프로파일링: 이벤트/구독자별 호출 수, 시간, fan-out 기록 및 덤프"""
+    import csv
+    import json
+
+    ticks = iter(range(1000))
+    from src.core.event_profiler import EventProfiler
+
+    bus = EventBus()
+    profiler = bus.enable_profiling(EventProfiler(clock=lambda: float(next(ticks))))
+
+    def slow(data):
+        pass
+
+    bus.subscribe("hit", slow)
+    bus.subscribe("hit", lambda data: None)
+    bus.publish("hit")
+    bus.publish("hit")
+    bus.publish("nobody")
+
+    report = profiler.report()
+    assert report["events"]["hit"]["count"] == 2
+    assert report["events"]["hit"]["fan_out_mean"] == 2
+    assert report["events"]["nobody"]["fan_out_max"] == 0
+    slow_name = next(name for name in report["callbacks"] if name.endswith("slow"))
+    assert report["callbacks"][slow_name]["count"] == 2
+    assert report["callbacks"][slow_name]["p99_ms"] == 1000.0
+
+    assert json.loads(profiler.dump_json(str(tmp_path / "p.json")).read_text(encoding="utf-8"))["events"]
+    with open(profiler.dump_csv(str(tmp_path / "p.csv")), encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert {row["kind"] for row in rows} == {"event", "callback"}
+    assert "hit" in profiler.summary_table()
+
+    # 끄면 기록하지 않음
+    bus.disable_profiling()
+    bus.publish("hit")
+    assert profiler.report()["events"]["hit"]["count"] == 2
@@ -0,0 +1,66 @@
+"""
+로그 파일 관리 테스트
+"""
+
+import gzip
+import os
+
+from src.core.log_files import list_log_files, tail_lines, prune_session_logs, gzip_file
+
+
+def test_tail_lines_reads_from_end(tmp_path):
+    """블록 경계와 무관하게 마지막 줄들을 반환"""
+    path = tmp_path / "game.log"
+    lines = [f"줄 {i} " + "x" * 100 for i in range(1000)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    assert tail_lines(path, 3) == lines[-3:]
+    assert tail_lines(path, 50) == lines[-50:]
+    assert tail_lines(path, 5000) == lines
+
+    short = tmp_path / "short.log"
+    short.write_text("a\nb", encoding="utf-8")
+    assert tail_lines(short, 5) == ["a", "b"]
+
+
+def test_tail_lines_gzip_segment(tmp_path):
+    source = tmp_path / "combat_1.log.rotating"
+    source.write_text("".join(f"{i}\n" for i in range(100)), encoding="utf-8")
+    dest = tmp_path / "combat_1.log.1.gz"
+    gzip_file(str(source), str(dest))
+
+    assert not source.exists()
+    assert gzip.decompress(dest.read_bytes()).startswith(b"0\n1\n")
+    assert tail_lines(dest, 2) == ["98", "99"]
+
+
+def test_list_log_files_recent_first(tmp_path):
+    for i, name in enumerate(["a_1.log", "b_1.log.1.gz", "c_1.log", "index.json", "d_1.log.1.gz.tmp"]):
+        path = tmp_path / name
+        path.write_text("x")
+        os.utime(path, (1000 + i, 1000 + i))
+
+    assert [p.name for p in list_log_files(tmp_path)] == ["c_1.log", "b_1.log.1.gz", "a_1.log"]
+    assert [p.name for p in list_log_files(tmp_path, limit=1)] == ["c_1.log"]
+
+
+def test_prune_session_logs_keeps_recent_sessions(tmp_path):
+    names = [
+        "combat_20250101_000000.log",
+        "combat_20250101_000000.log.1.gz",
+        "combat_20250102_000000.log",
+        "combat_20250103_000000.log",
+        "combat_20250104_000000.log",
+        "combat_ai_20250101_000000.log",
+    ]
+    for name in names:
+        (tmp_path / name).write_text("x")
+
+    removed = prune_session_logs(tmp_path, "combat", keep=1, current_session="20250104_000000")
+
+    assert removed == 3
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "combat_20250103_000000.log",
+        "combat_20250104_000000.log",
+        "combat_ai_20250101_000000.log",
+    ]
@@ -0,0 +1,106 @@
+"""
+큐 기반 로거 테스트
+"""
+
+import logging
+
+import pytest
+
+from src.core import logger as logger_module
+from src.core.logger import Logger, configure_logging, flush_logging
+
+
+class FakeConfig:
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+class CountingArg:
+    """str() 호출 횟수 기록"""
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "arg"
+
+
+@pytest.fixture
+def restore_settings():
+    saved = dict(logger_module._settings)
+    yield
+    logger_module._settings.update(saved)
+    for existing in logger_module._loggers.values():
+        existing.apply_settings()
+
+
+def _read_log(log):
+    flush_logging()
+    path = log.log_dir / f"{log.name}_{log.session_id}.log"
+    return path.read_text(encoding="utf-8") if path.exists() else ""
+
+
+def test_lazy_arguments_written_by_listener(tmp_path):
+    """%-스타일 인자는 기록 시 포맷되고, 기존 dict extra 형태도 유지"""
+    log = Logger("test_lazy", log_dir=str(tmp_path))
+    log.info("피해 %d (%s)", 42, "치명타")
+    log.info("상태", {"hp": 10})
+    log.info("진행률 100%", {"step": 1})
+
+    text = _read_log(log)
+    assert "피해 42 (치명타)" in text
+    assert "상태 | {'hp': 10}" in text
+    assert "진행률 100% | {'step': 1}" in text
+
+
+def test_disabled_level_and_category_skip_formatting(tmp_path, restore_settings):
+    """꺼진 레벨/카테고리는 인자를 포맷하지 않음"""
+    configure_logging(FakeConfig({
+        "logging.levels.console": "WARNING",
+        "logging.levels.file": "INFO",
+        "logging.categories": {"test_muted": False, "error": True},
+    }))
+    log = Logger("test_levels", log_dir=str(tmp_path))
+    muted = Logger("test_muted", log_dir=str(tmp_path))
+
+    arg = CountingArg()
+    log.debug("숨김 %s", arg)
+    muted.warning("숨김 %s", arg)
+    assert arg.calls == 0
+    assert not log.is_enabled_for(logging.DEBUG)
+
+    muted.error("에러는 기록 %s", arg)
+    assert "에러는 기록 arg" in _read_log(muted)
+    assert arg.calls > 0
+
+
+def test_logging_disabled(tmp_path, restore_settings):
+    """logging.enabled가 false면 아무것도 기록하지 않음"""
+    configure_logging(FakeConfig({"logging.enabled": False}))
+    log = Logger("test_disabled", log_dir=str(tmp_path))
+    log.critical("기록 안 됨")
+
+    assert _read_log(log) == ""
+
+
+def test_rotation_compresses_segments(tmp_path, restore_settings):
+    """파일이 max_size_mb를 넘으면 gzip 세그먼트로 로테이션하고 max_files개만 유지"""
+    configure_logging(FakeConfig({
+        "logging.rotation.enabled": True,
+        "logging.rotation.max_size_mb": 0.001,
+        "logging.rotation.max_files": 3,
+    }))
+    log = Logger("test_rotation", log_dir=str(tmp_path))
+    for i in range(100):
+        log.info("줄 %d %s", i, "x" * 40)
+    flush_logging()
+    logger_module._router.set_handlers(log.name, [])
+
+    names = sorted(p.name for p in tmp_path.iterdir())
+    base = f"{log.name}_{log.session_id}.log"
+    assert names == [base, f"{base}.1.gz", f"{base}.2.gz"]
+    assert (tmp_path / base).stat().st_size <= 1100
+    assert "줄 99" in (tmp_path / base).read_text(encoding="utf-8")
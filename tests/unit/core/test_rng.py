@@ -0,0 +1,103 @@
+"""
+결정적 난수 서비스 테스트
+"""
+
+import json
+
+from src.core.rng import RNGService, RNGStreams, get_rng, set_run_seed
+from src.world.dungeon_generator import DungeonGenerator
+from src.persistence.save_system import serialize_dungeon
+
+
+def _draw(rng, count=5):
+    return [rng.random() for _ in range(count)]
+
+
+def test_same_seed_same_streams():
+    """같은 런 시드면 스트림별 난수열이 같음"""
+    a, b = RNGService(42), RNGService(42)
+    assert _draw(a.stream(RNGStreams.COMBAT)) == _draw(b.stream(RNGStreams.COMBAT))
+    assert _draw(a.stream(RNGStreams.COMBAT)) != _draw(RNGService(43).stream(RNGStreams.COMBAT))
+
+
+def test_streams_are_independent():
+    """한 스트림을 더 사용해도 다른 스트림 결과는 그대로"""
+    a, b = RNGService(7), RNGService(7)
+    _draw(a.stream(RNGStreams.LOOT), 100)
+    assert _draw(a.stream(RNGStreams.COMBAT)) == _draw(b.stream(RNGStreams.COMBAT))
+    assert _draw(RNGService(7).stream(RNGStreams.AI)) != _draw(RNGService(7).stream(RNGStreams.COMBAT))
+
+
+def test_derive_restarts_per_key():
+    """derive는 키별로 항상 처음부터 같은 난수열"""
+    service = RNGService(3)
+    first = _draw(service.derive(RNGStreams.DUNGEON, 1))
+    _draw(service.stream(RNGStreams.DUNGEON), 10)
+    assert _draw(service.derive(RNGStreams.DUNGEON, 1)) == first
+    assert _draw(service.derive(RNGStreams.DUNGEON, 2)) != first
+
+
+def test_reseed_keeps_stream_objects():
+    """reseed 후에도 보관한 스트림 참조가 새 시드를 따름"""
+    service = RNGService(1)
+    held = service.stream(RNGStreams.COMBAT)
+    _draw(held, 3)
+    service.reseed(99)
+    assert service.stream(RNGStreams.COMBAT) is held
+    assert _draw(held) == _draw(RNGService(99).stream(RNGStreams.COMBAT))
+
+
+def test_spawn_is_isolated():
+    """하위 서비스는 부모 스트림 상태를 공유하지 않음"""
+    parent = RNGService(5)
+    child = parent.spawn("worker-1")
+    before = _draw(RNGService(5).stream(RNGStreams.COMBAT))
+    _draw(child.stream(RNGStreams.COMBAT), 50)
+    assert _draw(parent.stream(RNGStreams.COMBAT)) == before
+    assert child.seed == RNGService(5).spawn("worker-1").seed
+
+
+def test_dungeon_reproducible_from_run_seed():
+    """같은 런 시드와 층이면 같은 던전"""
+    set_run_seed(1234)
+    first = serialize_dungeon(DungeonGenerator(width=60, height=40).generate(3), compact=True)
+    _draw(get_rng().stream(RNGStreams.COMBAT), 20)
+    set_run_seed(1234)
+    second = serialize_dungeon(DungeonGenerator(width=60, height=40).generate(3), compact=True)
+    assert first == second
+
+    set_run_seed(1235)
+    other = serialize_dungeon(DungeonGenerator(width=60, height=40).generate(3), compact=True)
+    assert other != first
+
+
+def test_reseed_streams_only_named():
+    """reseed_streams는 지정한 스트림만 다시 시작"""
+    service = RNGService(8)
+    loot = service.stream(RNGStreams.LOOT)
+    _draw(loot, 3)
+    expected_loot = _draw(RNGService(8).stream(RNGStreams.LOOT), 8)[3:]
+
+    service.reseed_streams(77, RNGStreams.COMBAT)
+    assert service.seed == 8
+    assert _draw(service.stream(RNGStreams.COMBAT)) == _draw(RNGService(77).stream(RNGStreams.COMBAT))
+    assert _draw(loot) == expected_loot
+
+
+def test_state_round_trip_continues_sequence():
+    """get_state/set_state(JSON 경유)로 복원하면 저장 시점의 난수열에서 이어짐"""
+    service = RNGService(31)
+    _draw(service.stream(RNGStreams.COMBAT), 17)
+    service.stream(RNGStreams.LOOT).gauss(0, 1)  # gauss_next 캐시 포함
+    state = json.loads(json.dumps(service.get_state()))
+
+    expected_combat = _draw(service.stream(RNGStreams.COMBAT))
+    expected_loot = [service.stream(RNGStreams.LOOT).gauss(0, 1) for _ in range(3)]
+
+    restored = RNGService(999)
+    _draw(restored.stream(RNGStreams.AI))
+    restored.set_state(state)
+    assert restored.seed == 31
+    assert _draw(restored.stream(RNGStreams.COMBAT)) == expected_combat
+    assert [restored.stream(RNGStreams.LOOT).gauss(0, 1) for _ in range(3)] == expected_loot
+    assert _draw(restored.stream(RNGStreams.AI)) == _draw(RNGService(31).stream(RNGStreams.AI))
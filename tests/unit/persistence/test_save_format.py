@@ -0,0 +1,114 @@
+"""
+바이너리 세이브 포맷 테스트
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.persistence.save_format import (
+    encode_save, decode_save, read_metadata, SaveFormatError, MAGIC
+)
+from src.persistence.save_system import SaveSystem, serialize_dungeon, deserialize_dungeon
+from src.world.dungeon_generator import DungeonGenerator
+from src.world.fov import FOVSystem
+from src.core.rng import set_run_seed
+
+
+@pytest.fixture
+def dungeon():
+    set_run_seed(21)
+    dungeon = DungeonGenerator().generate(4)
+    FOVSystem(default_radius=6).compute_fov(dungeon, *dungeon.stairs_up)
+    return dungeon
+
+
+def _game_state(dungeon, compact=True):
+    return {
+        "party": [{"name": "테스트"}],
+        "floor_number": 4,
+        "dungeon": serialize_dungeon(dungeon, compact=compact),
+        "player_position": {"x": dungeon.stairs_up[0], "y": dungeon.stairs_up[1]},
+        "keys": ["red"],
+    }
+
+
+def _assert_same_dungeon(a, b):
+    for name in ("types", "walkable", "transparent", "explored", "visible", "locked"):
+        assert np.array_equal(getattr(a.grid, name), getattr(b.grid, name)), name
+    assert a.grid.key_ids == b.grid.key_ids
+    assert a.grid.teleport_targets == b.grid.teleport_targets
+    assert a.grid.loot_ids == b.grid.loot_ids
+    assert a.stairs_up == b.stairs_up
+    assert a.stairs_down == b.stairs_down
+    assert a.teleporters == b.teleporters
+    assert [tuple(k) for k in a.keys] == [tuple(k) for k in b.keys]
+
+
+def test_binary_roundtrip(dungeon):
+    """인코딩 후 디코딩하면 던전과 메타 정보가 그대로 복원됨"""
+    data = encode_save(_game_state(dungeon))
+
+    assert data.startswith(MAGIC)
+    state = decode_save(data)
+    assert state["floor_number"] == 4
+    assert state["keys"] == ["red"]
+    _assert_same_dungeon(dungeon, deserialize_dungeon(state["dungeon"]))
+
+    assert "dungeon" not in read_metadata(data)
+
+
+def test_binary_smaller_than_json(dungeon):
+    """바이너리 세이브가 JSON보다 훨씬 작음"""
+    binary = encode_save(_game_state(dungeon))
+    legacy = json.dumps(_game_state(dungeon, compact=False), indent=2, ensure_ascii=False).encode("utf-8")
+
+    assert len(binary) * 10 < len(legacy)
+
+
+def test_rejects_corrupt_and_future_saves(dungeon):
+    """손상되거나 새 버전 파일은 SaveFormatError"""
+    data = encode_save(_game_state(dungeon))
+
+    with pytest.raises(SaveFormatError):
+        decode_save(data[:40])
+
+    future = data[:4] + (99).to_bytes(2, "little") + data[6:]
+    with pytest.raises(SaveFormatError):
+        decode_save(future)
+
+
+def test_save_system_loads_legacy_json(dungeon, tmp_path):
+    """구 JSON 세이브도 로드되며 텔레포터 키를 eval 없이 복원"""
+    legacy_state = _game_state(dungeon, compact=False)
+    dungeon.teleporters[(3, 4)] = (10, 12)
+    legacy_state["dungeon"]["teleporters"] = {str(k): v for k, v in dungeon.teleporters.items()}
+    with open(tmp_path / "old_slot.json", "w", encoding="utf-8") as f:
+        json.dump(legacy_state, f)
+
+    save_system = SaveSystem(str(tmp_path))
+    state = save_system.load_game("old_slot")
+    restored = deserialize_dungeon(state["dungeon"])
+
+    assert restored.teleporters[(3, 4)] == (10, 12)
+    assert np.array_equal(restored.grid.explored, dungeon.grid.explored)
+
+
+def test_save_system_binary_and_export(dungeon, tmp_path):
+    """바이너리 저장 시 같은 이름의 JSON을 대체하고, JSON 내보내기 가능"""
+    (tmp_path / "slot.json").write_text("{}", encoding="utf-8")
+    save_system = SaveSystem(str(tmp_path))
+
+    assert save_system.save_game("slot", _game_state(dungeon))
+    assert (tmp_path / "slot.sav").exists()
+    assert not (tmp_path / "slot.json").exists()
+
+    saves = save_system.list_saves()
+    assert [s["name"] for s in saves] == ["slot"]
+    assert saves[0]["floor"] == 4
+
+    export_path = save_system.export_json("slot")
+    exported = json.loads(export_path.read_text(encoding="utf-8"))
+    assert isinstance(exported["dungeon"]["tiles"], list)
+    _assert_same_dungeon(dungeon, deserialize_dungeon(exported["dungeon"]))
@@ -0,0 +1,73 @@
+"""
+세이브 매니페스트 테스트
+"""
+
+import json
+
+from src.persistence import save_manifest
+from src.persistence.save_manifest import SaveManifest, MANIFEST_NAME, format_playtime
+from src.persistence.save_system import SaveSystem
+
+
+def _state(floor: int, playtime: float = 0):
+    return {
+        "party": [{"name": "전사", "job_name": "Warrior", "level": 5}, {"name": "궁수", "job_name": "Archer", "level": 4}],
+        "floor_number": floor,
+        "playtime": playtime,
+    }
+
+
+def test_save_updates_manifest(tmp_path):
+    """저장 시 index.json에 요약이 기록되고, 삭제 시 제거됨"""
+    save_system = SaveSystem(str(tmp_path), backup_enabled=False)
+    assert save_system.save_game("slot", _state(3, playtime=3725))
+
+    manifest = json.loads((tmp_path / MANIFEST_NAME).read_text(encoding="utf-8"))
+    entry = manifest["saves"]["slot"]
+    assert entry["file"] == "slot.sav"
+    assert entry["floor"] == 3
+    assert entry["playtime"] == 3725
+    assert entry["party"][0] == {"name": "전사", "job_name": "Warrior", "level": 5}
+
+    assert save_system.delete_save("slot")
+    manifest = json.loads((tmp_path / MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert manifest["saves"] == {}
+
+
+def test_list_saves_reads_only_manifest(tmp_path, monkeypatch):
+    """매니페스트가 최신이면 세이브 파일을 열지 않음"""
+    save_system = SaveSystem(str(tmp_path), backup_enabled=False)
+    save_system.save_game("a", _state(1))
+    save_system.save_game("b", _state(2))
+
+    def fail_read(save_file):
+        raise AssertionError(f"세이브 본문을 읽으면 안 됨: {save_file}")
+
+    monkeypatch.setattr(save_manifest, "read_save_summary", fail_read)
+    saves = save_system.list_saves()
+
+    assert [s["name"] for s in saves] == ["b", "a"]
+    assert saves[0]["party_size"] == 2
+
+
+def test_manifest_rebuilds_stale_and_missing(tmp_path):
+    """매니페스트가 없거나 파일과 맞지 않으면 해당 세이브만 다시 읽음"""
+    (tmp_path / "legacy.json").write_text(json.dumps(_state(7)), encoding="utf-8")
+    save_system = SaveSystem(str(tmp_path), backup_enabled=False)
+    save_system.save_game("slot", _state(1))
+
+    # 매니페스트를 거치지 않은 덮어쓰기 (외부 복사 등)
+    other = SaveSystem(str(tmp_path / "other"), backup_enabled=False)
+    other.save_game("slot", _state(9))
+    (tmp_path / "slot.sav").write_bytes((tmp_path / "other" / "slot.sav").read_bytes())
+
+    floors = {s["name"]: s["floor"] for s in save_system.list_saves()}
+    assert floors == {"slot": 9, "legacy": 7}
+
+    (tmp_path / MANIFEST_NAME).unlink()
+    assert {s["name"] for s in SaveManifest(tmp_path).entries()} == {"slot", "legacy"}
+
+
+def test_format_playtime():
+    assert format_playtime(0) == "0:00:00"
+    assert format_playtime(3725.9) == "1:02:05"
@@ -0,0 +1,135 @@
+"""
+백그라운드 저장 / 자동 저장 테스트
+"""
+
+import threading
+
+import pytest
+
+from src.persistence import save_system as save_system_module
+from src.persistence.save_system import SaveSystem
+from src.persistence.save_worker import AutoSaveManager, SaveWorker
+
+
+def _state(floor: int):
+    return {"party": [], "floor_number": floor}
+
+
+def test_backups_rotate_on_overwrite(tmp_path):
+    """덮어쓸 때마다 이전 세이브가 .1, .2 ... 로 회전"""
+    save_system = SaveSystem(str(tmp_path), backup_enabled=True, max_backups=2)
+
+    for floor in range(1, 5):
+        assert save_system.save_game("slot", _state(floor))
+
+    assert save_system.load_game("slot")["floor_number"] == 4
+    backups = save_system.get_backups("slot")
+    assert [b.name for b in backups] == ["slot.sav.1", "slot.sav.2"]
+    assert not (tmp_path / "slot.sav.3").exists()
+    assert not list(tmp_path.glob("*.tmp"))
+    assert [s["name"] for s in save_system.list_saves()] == ["slot"]
+
+
+def test_failed_write_keeps_previous_save(tmp_path, monkeypatch):
+    """직렬화/기록 도중 실패해도 기존 세이브는 손상되지 않음"""
+    save_system = SaveSystem(str(tmp_path), backup_enabled=False)
+    assert save_system.save_game("slot", _state(1))
+
+    def broken_encode(state):
+        raise IOError("disk full")
+
+    monkeypatch.setattr(save_system_module, "encode_save", broken_encode)
+    assert not save_system.save_game("slot", _state(2))
+
+    monkeypatch.undo()
+    assert save_system.load_game("slot")["floor_number"] == 1
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_async_save_uses_snapshot(tmp_path):
+    """비동기 저장은 호출 시점의 스냅샷을 기록"""
+    save_system = SaveSystem(str(tmp_path), backup_enabled=False)
+    worker = SaveWorker()
+    state = _state(3)
+
+    from src.persistence import save_worker
+    previous = save_worker._save_worker
+    save_worker._save_worker = worker
+    try:
+        job = save_system.save_game_async("slot", state)
+        state["floor_number"] = 99
+        assert job.wait(timeout=10)
+    finally:
+        worker.shutdown()
+        save_worker._save_worker = previous
+
+    assert save_system.load_game("slot")["floor_number"] == 3
+
+
+def test_pending_requests_coalesce(tmp_path):
+    """같은 세이브에 밀린 요청은 최신 스냅샷 하나로 합쳐짐"""
+    save_system = SaveSystem(str(tmp_path), backup_enabled=False)
+    worker = SaveWorker()
+    writes = []
+
+    original = save_system.write_save
+
+    def counting_write(name, state):
+        writes.append(state["floor_number"])
+        return original(name, state)
+
+    save_system.write_save = counting_write
+
+    with worker._lock:
+        # 워커가 꺼내기 전에 여러 요청 등록
+        jobs = [worker.submit(save_system, "slot", _state(floor)) for floor in (1, 2, 3)]
+    assert worker.flush(timeout=10)
+    worker.shutdown()
+
+    assert all(job.success for job in jobs)
+    assert writes == [3]
+
+
+def test_autosave_interval(tmp_path):
+    """설정 간격이 지나야 자동 저장"""
+    now = [0.0]
+    save_system = SaveSystem(str(tmp_path), backup_enabled=False)
+    autosave = AutoSaveManager(save_system, interval=300, enabled=True, clock=lambda: now[0])
+
+    assert autosave.tick("autosave", lambda: _state(1)) is None
+
+    now[0] = 301.0
+    job = autosave.tick("autosave", lambda: _state(2))
+    assert job is not None and job.wait(timeout=10)
+    assert save_system.load_game("autosave")["floor_number"] == 2
+
+    now[0] = 400.0
+    assert autosave.tick("autosave", lambda: _state(3)) is None
+
+
+def test_autosave_disabled(tmp_path):
+    """비활성화 시 저장하지 않음"""
+    autosave = AutoSaveManager(SaveSystem(str(tmp_path)), interval=0, enabled=False)
+    assert autosave.tick("autosave", lambda: pytest.fail("snapshot 호출되면 안 됨")) is None
+
+
+def test_concurrent_writes_same_slot(tmp_path):
+    """게임 스레드와 워커 스레드가 같은 슬롯을 동시에 저장해도 임시 파일/백업이 충돌하지 않음"""
+    save_system = SaveSystem(str(tmp_path), backup_enabled=True, max_backups=3)
+    errors = []
+
+    def writer(floor_base):
+        for floor in range(floor_base, floor_base + 20):
+            if not save_system.save_game("slot", _state(floor)):
+                errors.append(floor)
+
+    threads = [threading.Thread(target=writer, args=(base,)) for base in (0, 100, 200)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert save_system.load_game("slot")["floor_number"] is not None
+    assert len(save_system.get_backups("slot")) == 3
+    assert not list(tmp_path.glob("*.tmp"))
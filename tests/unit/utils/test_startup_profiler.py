@@ -0,0 +1,55 @@
+"""
+시작 시간 프로파일러 테스트
+"""
+
+import builtins
+import json
+import sys
+
+from src.utils.startup_profiler import StartupProfiler
+
+
+def test_phases_and_nested_imports(tmp_path, monkeypatch):
+    """단계별 시간과 새로 로드된 모듈의 포함/자체 시간 기록"""
+    (tmp_path / "sp_outer.py").write_text("import sp_inner\n", encoding="utf-8")
+    (tmp_path / "sp_inner.py").write_text("VALUE = 1\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ("sp_outer", "sp_inner"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    original_import = builtins.__import__
+    profiler = StartupProfiler(track_memory=False).start()
+    try:
+        with profiler.phase("load"):
+            import sp_outer
+            # 이미 로드된 모듈은 기록하지 않음
+            import sp_outer
+        with profiler.phase("idle"):
+            pass
+    finally:
+        profiler.stop()
+    assert builtins.__import__ is original_import
+
+    modules = {entry["module"]: entry for entry in profiler.imports}
+    assert set(modules) == {"sp_outer", "sp_inner"}
+    assert modules["sp_outer"]["depth"] == 0 and modules["sp_inner"]["depth"] == 1
+    assert modules["sp_outer"]["inclusive_s"] >= modules["sp_inner"]["inclusive_s"]
+    assert modules["sp_outer"]["phase"] == "load"
+
+    report = profiler.report()
+    assert [p["name"] for p in report["phases"]] == ["load", "idle"]
+    assert report["phases"][0]["imports"] == 2
+    assert [e["module"] for e in report["top_level_imports"]] == ["sp_outer"]
+
+    path = profiler.dump_json(str(tmp_path / "startup.json"))
+    assert json.loads(path.read_text(encoding="utf-8"))["phases"][0]["name"] == "load"
+    assert "sp_outer" in profiler.summary_table()
+
+
+def test_disabled_profiler_is_noop():
+    original_import = builtins.__import__
+    profiler = StartupProfiler(enabled=False).start()
+    with profiler.phase("config"):
+        pass
+    assert builtins.__import__ is original_import
+    assert profiler.phases == []
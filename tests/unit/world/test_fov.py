@@ -0,0 +1,82 @@
+"""
+FOV 시스템 테스트
+"""
+
+import numpy as np
+
+from src.world.dungeon_generator import DungeonMap, DungeonGenerator
+from src.world.fov import FOVSystem, compute_fov_from_array
+from src.world.tile import TileType
+from src.core.rng import set_run_seed
+
+
+def _open_room(width: int = 20, height: int = 20) -> DungeonMap:
+    """벽으로 둘러싸인 빈 방"""
+    dungeon = DungeonMap(width, height)
+    for y in range(height):
+        for x in range(width):
+            edge = x in (0, width - 1) or y in (0, height - 1)
+            dungeon.set_tile(x, y, TileType.WALL if edge else TileType.FLOOR)
+    return dungeon
+
+
+def test_array_fast_path_matches_dungeon():
+    """투명도 배열 경로와 던전 경로의 결과가 같음"""
+    set_run_seed(5)
+    dungeon = DungeonGenerator().generate(1)
+    x, y = dungeon.stairs_up
+
+    expected = compute_fov_from_array(dungeon.grid.transparent, x, y, 6)
+    assert FOVSystem(cache_size=0).compute_fov(dungeon, x, y, 6) == expected
+
+
+def test_wall_blocks_sight():
+    """벽 뒤는 보이지 않음"""
+    transparent = np.ones((9, 9), dtype=bool)
+    transparent[4, 5] = False
+
+    visible = compute_fov_from_array(transparent, 4, 4, 4)
+
+    assert (5, 4) in visible
+    assert (7, 4) not in visible
+    assert (4, 7) in visible
+
+
+def test_moving_toggles_only_difference():
+    """이동 시 이전 시야는 숨겨지고 탐험 기록은 유지"""
+    dungeon = _open_room()
+    fov = FOVSystem(default_radius=3)
+
+    first = fov.compute_fov(dungeon, 5, 5)
+    second = fov.compute_fov(dungeon, 12, 12)
+
+    visible_now = set(zip(*np.nonzero(dungeon.grid.visible)[::-1]))
+    assert visible_now == second
+    assert all(dungeon.get_tile(x, y).explored for x, y in first | second)
+
+
+def test_cache_reused_until_map_changes():
+    """같은 칸은 캐시를 쓰고, 지형이 바뀌면 다시 계산"""
+    dungeon = _open_room()
+    fov = FOVSystem(default_radius=5)
+
+    fov.compute_fov(dungeon, 5, 5)
+    cached = fov._cache[(5, 5, 5)]
+    fov.compute_fov(dungeon, 10, 10)
+    fov.compute_fov(dungeon, 5, 5)
+    assert fov._cache[(5, 5, 5)] is cached
+
+    dungeon.set_tile(6, 5, TileType.WALL)
+    visible = fov.compute_fov(dungeon, 5, 5)
+    assert (9, 5) not in visible
+    assert not dungeon.get_tile(9, 5).visible
+
+
+def test_stale_visibility_cleared_on_new_map():
+    """불러온 맵에 남아 있던 visible 플래그는 첫 계산 때 정리"""
+    dungeon = _open_room()
+    dungeon.get_tile(15, 15).visible = True
+
+    FOVSystem(default_radius=2).compute_fov(dungeon, 3, 3)
+
+    assert not dungeon.get_tile(15, 15).visible
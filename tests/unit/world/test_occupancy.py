@@ -0,0 +1,64 @@
+"""
+점유 인덱스 테스트
+"""
+
+from src.world.dungeon_generator import DungeonGenerator
+from src.world.exploration import ExplorationSystem, Enemy
+from src.world.occupancy import OccupancyIndex
+from src.core.rng import set_run_seed
+
+
+def test_index_add_move_remove():
+    """등록, 이동, 제거가 인덱스에 반영됨"""
+    a = Enemy(x=1, y=1, level=1)
+    b = Enemy(x=1, y=1, level=2)
+    index = OccupancyIndex([a, b])
+
+    assert index.get(1, 1) is a
+    assert index.get_all(1, 1) == [a, b]
+
+    index.move(a, 2, 3)
+    assert (a.x, a.y) == (2, 3)
+    assert index.get(2, 3) is a
+    assert index.get(1, 1) is b
+
+    assert index.remove(b)
+    assert not index.remove(b)
+    assert (1, 1) not in index
+    assert len(index) == 1
+
+
+def test_exploration_enemy_lookup_follows_moves():
+    """적 이동/제거 후에도 get_enemy_at이 실제 위치와 일치"""
+    set_run_seed(4)
+    dungeon = DungeonGenerator().generate(2)
+    exploration = ExplorationSystem(dungeon, party=[], floor_number=2)
+
+    for enemy in exploration.enemies:
+        enemy.detection_range = 100
+        enemy.max_chase_distance = 200
+
+    for _ in range(5):
+        exploration._move_all_enemies()
+
+    for enemy in exploration.enemies:
+        assert exploration.get_enemy_at(enemy.x, enemy.y) is enemy
+
+    removed = exploration.enemies[0]
+    exploration.remove_enemy(removed)
+    assert exploration.get_enemy_at(removed.x, removed.y) is None
+
+
+def test_harvestables_indexed_by_position():
+    """채집 오브젝트를 좌표로 조회"""
+    set_run_seed(9)
+    dungeon = DungeonGenerator().generate(1)
+
+    for harvestable in dungeon.harvestables:
+        found = dungeon.get_harvestable_at(harvestable.x, harvestable.y)
+        assert found is not None
+        assert (found.x, found.y) == (harvestable.x, harvestable.y)
+
+    target = dungeon.harvestables[0]
+    dungeon.remove_harvestable(target)
+    assert target not in dungeon.harvestable_index.get_all(target.x, target.y)
@@ -0,0 +1,105 @@
+"""
+경로 탐색(흐름장) 테스트
+"""
+
+from src.core.rng import set_run_seed
+from src.world.dungeon_generator import DungeonGenerator, DungeonMap
+from src.world.exploration import ExplorationSystem
+from src.world.pathfinding import PathfindingService
+from src.world.tile import TileType
+
+
+def _room_with_wall() -> DungeonMap:
+    """
+    가운데 세로 벽이 있는 방 (아래쪽만 뚫려 있음)
+
+    ##########
+    #...#....#
+    #...#....#
+    #...#....#
+    #........#
+    ##########
+    """
+    dungeon = DungeonMap(10, 6)
+    for y in range(1, 5):
+        for x in range(1, 9):
+            dungeon.set_tile(x, y, TileType.FLOOR)
+    for y in range(1, 4):
+        dungeon.set_tile(4, y, TileType.WALL)
+    return dungeon
+
+
+def _walk(service: PathfindingService, field, x: int, y: int, limit: int = 50):
+    """흐름장을 따라 목표까지 이동한 경로"""
+    path = [(x, y)]
+    for _ in range(limit):
+        step = service.next_step(field, x, y)
+        if step is None:
+            break
+        x, y = step
+        path.append(step)
+    return path
+
+
+def test_flow_field_goes_around_wall():
+    """벽에 막히지 않고 돌아서 목표에 도달"""
+    dungeon = _room_with_wall()
+    service = PathfindingService(dungeon)
+
+    field = service.player_field(6, 1)
+    path = _walk(service, field, 2, 1)
+
+    assert path[-1] == (6, 1)
+    assert len(path) - 1 == field.distance_at(2, 1) == 10
+    assert all(dungeon.is_walkable(x, y) for x, y in path)
+
+
+def test_blocked_step_uses_alternative():
+    """가장 좋은 칸이 막혀 있으면 다른 내리막 칸 선택"""
+    dungeon = _room_with_wall()
+    service = PathfindingService(dungeon)
+    field = service.field_to((8, 4))
+
+    assert service.next_step(field, 6, 2) in [(7, 2), (6, 3)]
+    step = service.next_step(field, 6, 2, blocked=lambda x, y: (x, y) == (7, 2))
+    assert step == (6, 3)
+
+
+def test_fields_cached_until_terrain_changes():
+    """거리 맵은 캐시되고 문이 열리면 무효화"""
+    dungeon = _room_with_wall()
+    dungeon.set_tile(4, 2, TileType.LOCKED_DOOR, key_id="red")
+    service = PathfindingService(dungeon)
+
+    field = service.field_to((6, 2))
+    assert service.field_to((6, 2)) is field
+    assert field.distance_at(2, 2) == 8
+
+    dungeon.get_tile(4, 2).unlock()
+    reopened = service.field_to((6, 2))
+
+    assert reopened is not field
+    assert reopened.distance_at(2, 2) == 4
+
+
+def test_player_field_replaced_when_player_moves():
+    """플레이어 거리 맵은 플레이어 위치마다 하나만 유지"""
+    dungeon = _room_with_wall()
+    service = PathfindingService(dungeon)
+
+    first = service.player_field(1, 1)
+    assert service.player_field(1, 1) is first
+
+    second = service.player_field(2, 1)
+    assert second is not first
+    assert (1, 1) not in service._fields
+
+
+def test_spawn_fields_warmed_on_enemy_spawn():
+    """적 배치 시 생성 위치 거리 맵을 미리 계산"""
+    set_run_seed(6)
+    exploration = ExplorationSystem(DungeonGenerator().generate(3), party=[], floor_number=3)
+
+    assert exploration.enemies
+    for enemy in exploration.enemies:
+        assert (enemy.spawn_x, enemy.spawn_y) in exploration.pathfinding._fields
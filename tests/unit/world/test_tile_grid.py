@@ -0,0 +1,102 @@
+"""
+TileGrid (배열 기반 타일 저장소) 테스트
+"""
+
+from src.world.dungeon_generator import DungeonMap, DungeonGenerator
+from src.world.fov import FOVSystem
+from src.world.tile import Tile, TileType
+from src.core.rng import set_run_seed
+
+
+def test_new_map_is_void():
+    """새 맵은 전부 VOID"""
+    dungeon = DungeonMap(10, 8)
+
+    assert dungeon.grid.types.shape == (8, 10)
+    assert dungeon.get_tile(3, 4).tile_type == TileType.VOID
+    assert not dungeon.is_walkable(3, 4)
+    assert dungeon.get_tile(10, 0) is None
+    assert dungeon.get_tile(-1, 0) is None
+
+
+def test_set_tile_matches_tile_dataclass():
+    """set_tile 결과가 Tile 데이터클래스와 같은 속성을 가짐"""
+    dungeon = DungeonMap(10, 10)
+    fields = ("tile_type", "walkable", "transparent", "locked", "key_id",
+              "trap_damage", "teleport_target", "loot_id", "char", "fg_color", "bg_color")
+
+    cases = [
+        (TileType.FLOOR, {}),
+        (TileType.LOCKED_DOOR, {"key_id": "red"}),
+        (TileType.TRAP, {"trap_damage": 30}),
+        (TileType.TELEPORTER, {"teleport_target": (1, 2)}),
+        (TileType.CHEST, {"loot_id": "gold"}),
+    ]
+    for i, (tile_type, kwargs) in enumerate(cases):
+        dungeon.set_tile(i, 0, tile_type, **kwargs)
+        expected = Tile(tile_type, i, 0, **kwargs)
+        view = dungeon.get_tile(i, 0)
+        for name in fields:
+            assert getattr(view, name) == getattr(expected, name), (tile_type, name)
+
+
+def test_tile_view_writes_through():
+    """뷰에 쓴 값이 배열과 희소 dict에 반영됨"""
+    dungeon = DungeonMap(5, 5)
+    dungeon.set_tile(2, 2, TileType.CHEST, loot_id="potion")
+
+    tile = dungeon.get_tile(2, 2)
+    tile.explored = True
+    tile.tile_type = TileType.FLOOR
+    tile.loot_id = None
+
+    assert dungeon.grid.explored[2, 2]
+    assert dungeon.get_tile(2, 2).tile_type == TileType.FLOOR
+    assert dungeon.get_tile(2, 2).char == "."
+    assert (2, 2) not in dungeon.grid.loot_ids
+    assert dungeon.tiles[2][2] == tile
+
+
+def test_unlock_locked_door():
+    """잠긴 문 해제"""
+    dungeon = DungeonMap(5, 5)
+    dungeon.set_tile(1, 1, TileType.LOCKED_DOOR, key_id="blue")
+    assert not dungeon.is_walkable(1, 1)
+
+    version = dungeon.grid.version
+    dungeon.get_tile(1, 1).unlock()
+
+    assert dungeon.is_walkable(1, 1)
+    assert dungeon.get_tile(1, 1).tile_type == TileType.DOOR
+    assert dungeon.get_tile(1, 1).char == "+"
+    assert dungeon.grid.version > version
+
+
+def test_fov_marks_and_clears_visibility():
+    """FOV 결과가 explored/visible 마스크에 반영되고 초기화됨"""
+    set_run_seed(7)
+    dungeon = DungeonGenerator().generate(1)
+    fov = FOVSystem(default_radius=5)
+    x, y = dungeon.stairs_up
+
+    visible = fov.compute_fov(dungeon, x, y)
+
+    assert int(dungeon.grid.visible.sum()) == len(visible)
+    assert all(dungeon.get_tile(vx, vy).explored for vx, vy in visible)
+
+    fov.clear_visibility(dungeon)
+    assert not dungeon.grid.visible.any()
+    assert dungeon.get_tile(x, y).explored
+
+
+def test_generated_walls_surround_floor():
+    """생성된 바닥의 상하좌우에 VOID가 없음"""
+    set_run_seed(11)
+    dungeon = DungeonGenerator().generate(2)
+
+    for y in range(dungeon.height):
+        for x in range(dungeon.width):
+            if dungeon.get_tile_type(x, y) != TileType.FLOOR:
+                continue
+            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                assert dungeon.get_tile_type(x + dx, y + dy) not in (TileType.VOID,)